@@ -9,82 +9,93 @@ import gc
 
 import warp as wp
 
+from .devices import DEVICES, init_device
+
 N = 8192
 
 
 class ArrayAlloc:
+    params = DEVICES
+    param_names = ["device"]
+
     repeat = 1000
     number = 1
     rounds = 4
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
+        init_device(device)
         self.allocs = [None] * 10
         gc.disable()
 
-    def teardown(self):
+    def teardown(self, device):
         gc.enable()
         self.allocs = [None] * 10
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
-    def time_ten_empty(self):
+    def time_ten_empty(self, device):
         for i in range(len(self.allocs)):
-            self.allocs[i] = wp.empty(N, dtype=float, device="cuda:0")
+            self.allocs[i] = wp.empty(N, dtype=float, device=device)
 
-    def time_ten_empty_sync(self):
+    def time_ten_empty_sync(self, device):
         for i in range(len(self.allocs)):
-            self.allocs[i] = wp.empty(N, dtype=float, device="cuda:0")
-        wp.synchronize_device("cuda:0")
+            self.allocs[i] = wp.empty(N, dtype=float, device=device)
+        wp.synchronize_device(device)
 
 
 class ArrayFree:
+    params = DEVICES
+    param_names = ["device"]
+
     repeat = 1000
     number = 1
     rounds = 4
 
-    def setup(self):
-        wp.init()
-        self.test_array = wp.empty(N, dtype=float, device="cuda:0")
+    def setup(self, device):
+        init_device(device)
+        self.test_array = wp.empty(N, dtype=float, device=device)
         self.allocs = [None] * 10
         for i in range(len(self.allocs)):
-            self.allocs[i] = wp.empty(N, dtype=float, device="cuda:0")
-        wp.synchronize_device("cuda:0")
+            self.allocs[i] = wp.empty(N, dtype=float, device=device)
+        wp.synchronize_device(device)
         gc.disable()
 
-    def teardown(self):
+    def teardown(self, device):
         gc.enable()
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
-    def time_ten_free(self):
+    def time_ten_free(self, device):
         for i in range(len(self.allocs)):
             self.allocs[i] = None
 
-    def time_ten_free_sync(self):
+    def time_ten_free_sync(self, device):
         for i in range(len(self.allocs)):
             self.allocs[i] = None
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
 
 class ArrayZeros:
+    params = DEVICES
+    param_names = ["device"]
+
     repeat = 1000
     number = 1
     rounds = 4
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
+        init_device(device)
         self.allocs = [None] * 10
         gc.disable()
 
-    def teardown(self):
+    def teardown(self, device):
         gc.enable()
         self.allocs = [None] * 10
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
-    def time_ten_zeros(self):
+    def time_ten_zeros(self, device):
         for i in range(len(self.allocs)):
-            self.allocs[i] = wp.zeros(N, dtype=float, device="cuda:0")
+            self.allocs[i] = wp.zeros(N, dtype=float, device=device)
 
-    def time_ten_zeros_sync(self):
+    def time_ten_zeros_sync(self, device):
         for i in range(len(self.allocs)):
-            self.allocs[i] = wp.zeros(N, dtype=float, device="cuda:0")
-        wp.synchronize_device("cuda:0")
+            self.allocs[i] = wp.zeros(N, dtype=float, device=device)
+        wp.synchronize_device(device)
@@ -7,6 +7,8 @@
 
 import warp as wp
 
+from ..devices import DEVICES, init_device
+
 
 @wp.kernel
 def component_assignment(a: wp.array(dtype=wp.mat44)):
@@ -22,15 +24,15 @@ def component_assignment(a: wp.array(dtype=wp.mat44)):
 
 
 class ComponentAssignment:
-    def setup(self):
-        wp.init()
+    params = DEVICES
+    param_names = ["device"]
+
+    def setup(self, device):
+        init_device(device)
         wp.build.clear_kernel_cache()
 
-    def teardown(self):
+    def teardown(self, device):
         component_assignment.module.unload()
 
-    def time_cuda_codegen(self):
-        wp.load_module(device="cuda:0")
-
-    def time_cpu_codegen(self):
-        wp.load_module(device="cpu")
+    def time_codegen(self, device):
+        wp.load_module(device=device)
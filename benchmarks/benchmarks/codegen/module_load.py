@@ -5,22 +5,73 @@
 # distribution of this software and related documentation without an express
 # license agreement from NVIDIA CORPORATION is strictly prohibited.
 
+import importlib
+
 import warp as wp
 
+from ..devices import DEVICES, init_device
+
 
 class SimModules:
-    timeout = 120
+    """Time loading a module with a cold kernel cache (code generation and compilation)
+    and with a warm kernel cache (loading the cached binaries)."""
+
+    params = (["cold", "warm"], DEVICES)
+    param_names = ["cache", "device"]
+
+    timeout = 600
     warmup_time = 0
     rounds = 4
     number = 1
 
-    def setup(self):
-        wp.init()
+    def setup(self, cache, device):
+        init_device(device)
         wp.build.clear_kernel_cache()
         import warp.sim.collide  # noqa: F401
 
-    def time_warp_sim_collide_cuda(self):
-        wp.load_module(module="warp.sim.collide", device="cuda:0")
+        if cache == "warm":
+            wp.load_module(module="warp.sim.collide", device=device)
+            wp.get_module("warp.sim.collide").unload()
+
+    def time_warp_sim_collide(self, cache, device):
+        wp.load_module(module="warp.sim.collide", device=device)
 
-    def teardown(self):
+    def teardown(self, cache, device):
         wp.get_module("warp.sim.collide").unload()
+
+
+class SimModulesIndex:
+    """Time loading modules with a warm kernel cache, either hashing the modules in full or looking up their
+    hashes in the kernel cache index (see ``wp.config.kernel_cache_index``)."""
+
+    params = ([False, True], DEVICES)
+    param_names = ["kernel_cache_index", "device"]
+
+    timeout = 600
+    warmup_time = 0
+    rounds = 4
+    number = 1
+
+    modules = ("warp.sim.collide", "warp.sim.integrator_featherstone", "warp.sim.integrator_xpbd")
+
+    def setup(self, kernel_cache_index, device):
+        init_device(device)
+        wp.build.clear_kernel_cache()
+
+        self.kernel_cache_index = wp.config.kernel_cache_index
+        wp.config.kernel_cache_index = kernel_cache_index
+
+        for module in self.modules:
+            importlib.import_module(module)
+            wp.load_module(module=module, device=device)
+            wp.get_module(module).unload()
+
+    def time_warp_sim_modules(self, kernel_cache_index, device):
+        for module in self.modules:
+            wp.load_module(module=module, device=device)
+
+    def teardown(self, kernel_cache_index, device):
+        for module in self.modules:
+            wp.get_module(module).unload()
+
+        wp.config.kernel_cache_index = self.kernel_cache_index
@@ -0,0 +1,71 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+import numpy as np
+
+import warp as wp
+
+wp.set_module_options({"enable_backward": False})
+
+N = 1 << 22
+
+
+@wp.kernel
+def saxpy(x: wp.array(dtype=float), y: wp.array(dtype=float), a: float, out: wp.array(dtype=float)):
+    i = wp.tid()
+    out[i] = a * x[i] + y[i]
+
+
+@wp.kernel
+def vec3_update(
+    x: wp.array(dtype=wp.vec3), v: wp.array(dtype=wp.vec3), dt: float, damping: float, out: wp.array(dtype=wp.vec3)
+):
+    i = wp.tid()
+    out[i] = x[i] + v[i] * dt * damping
+
+
+class CpuVectorize:
+    """Compare the scalar and the vectorized (``cpu_vectorize``) CPU code paths on element-wise kernels."""
+
+    params = [False, True]
+    param_names = ["cpu_vectorize"]
+
+    number = 20
+
+    def setup(self, cpu_vectorize):
+        wp.init()
+        wp.build.clear_kernel_cache()
+        wp.set_module_options({"cpu_vectorize": cpu_vectorize})
+        wp.load_module(device="cpu")
+
+        rng = np.random.default_rng(42)
+
+        self.x = wp.array(rng.random(N, dtype=np.float32), dtype=float, device="cpu")
+        self.y = wp.array(rng.random(N, dtype=np.float32), dtype=float, device="cpu")
+        self.out = wp.empty(N, dtype=float, device="cpu")
+
+        self.x_vec3 = wp.array(rng.random((N, 3), dtype=np.float32), dtype=wp.vec3, device="cpu")
+        self.v_vec3 = wp.array(rng.random((N, 3), dtype=np.float32), dtype=wp.vec3, device="cpu")
+        self.out_vec3 = wp.empty(N, dtype=wp.vec3, device="cpu")
+
+        self.saxpy_cmd = wp.launch(
+            saxpy, N, inputs=[self.x, self.y, 2.0], outputs=[self.out], device="cpu", record_cmd=True
+        )
+        self.vec3_cmd = wp.launch(
+            vec3_update,
+            N,
+            inputs=[self.x_vec3, self.v_vec3, 0.01, 0.99],
+            outputs=[self.out_vec3],
+            device="cpu",
+            record_cmd=True,
+        )
+
+    def time_saxpy(self, cpu_vectorize):
+        self.saxpy_cmd.launch()
+
+    def time_vec3_update(self, cpu_vectorize):
+        self.vec3_cmd.launch()
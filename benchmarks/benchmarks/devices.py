@@ -0,0 +1,28 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+"""Devices the benchmarks are parameterized over.
+
+Benchmarks take the device as an asv parameter so that the same suite can track CPU-only machines and GPU machines.
+Benchmarks on devices that are not available are skipped.
+"""
+
+import warp as wp
+
+DEVICES = ["cpu", "cuda:0"]
+
+
+def init_device(device):
+    """Initializes Warp and checks that ``device`` is available.
+
+    Raises ``NotImplementedError``, which asv reports as a skipped benchmark, if the device is not available.
+    """
+
+    wp.init()
+
+    if device not in [str(d) for d in wp.get_devices()]:
+        raise NotImplementedError(f"Device {device} is not available")
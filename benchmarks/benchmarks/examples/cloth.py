@@ -9,6 +9,8 @@ import numpy as np
 
 import warp as wp
 
+from ..devices import DEVICES, init_device
+
 
 @wp.kernel
 def eval_springs(
@@ -87,13 +89,16 @@ def integrate_particles(
 
 
 class Cloth:
-    params = [32, 64, 128]
+    params = ([32, 64, 128], DEVICES)
+    param_names = ["res", "device"]
+
     number = 100
+    timeout = 600
 
-    def setup(self, n):
-        wp.init()
+    def setup(self, n, device):
+        init_device(device)
         wp.build.clear_kernel_cache()
-        wp.load_module("cuda:0")
+        wp.load_module(device=device)
 
         lower = (0.0, 0.0, 0.0)
         dx = n
@@ -186,14 +191,14 @@ class Cloth:
         self.num_particles = len(self.positions)
         self.num_springs = len(self.spring_lengths)
 
-        self.positions_wp = wp.from_numpy(self.positions, dtype=wp.vec3, device="cuda:0")
-        self.velocities_wp = wp.zeros(self.num_particles, dtype=wp.vec3, device="cuda:0")
-        self.invmass_wp = wp.from_numpy(self.inv_masses, dtype=float, device="cuda:0")
-        self.spring_indices_wp = wp.from_numpy(self.spring_indices, dtype=int, device="cuda:0")
-        self.spring_lengths_wp = wp.from_numpy(self.spring_lengths, dtype=float, device="cuda:0")
-        self.spring_stiffness_wp = wp.from_numpy(self.spring_stiffness, dtype=float, device="cuda:0")
-        self.spring_damping_wp = wp.from_numpy(self.spring_damping, dtype=float, device="cuda:0")
-        self.forces_wp = wp.zeros(self.num_particles, dtype=wp.vec3, device="cuda:0")
+        self.positions_wp = wp.from_numpy(self.positions, dtype=wp.vec3, device=device)
+        self.velocities_wp = wp.zeros(self.num_particles, dtype=wp.vec3, device=device)
+        self.invmass_wp = wp.from_numpy(self.inv_masses, dtype=float, device=device)
+        self.spring_indices_wp = wp.from_numpy(self.spring_indices, dtype=int, device=device)
+        self.spring_lengths_wp = wp.from_numpy(self.spring_lengths, dtype=float, device=device)
+        self.spring_stiffness_wp = wp.from_numpy(self.spring_stiffness, dtype=float, device=device)
+        self.spring_damping_wp = wp.from_numpy(self.spring_damping, dtype=float, device=device)
+        self.forces_wp = wp.zeros(self.num_particles, dtype=wp.vec3, device=device)
 
         sim_fps = 60.0
         sim_substeps = 16
@@ -201,7 +206,7 @@ class Cloth:
         sim_frames = int(sim_duration * sim_fps)
         sim_dt = (1.0 / sim_fps) / sim_substeps
 
-        with wp.ScopedCapture() as capture:
+        with wp.ScopedCapture(device=device) as capture:
             for _i in range(sim_frames):
                 for _s in range(sim_substeps):
                     wp.launch(
@@ -216,7 +221,7 @@ class Cloth:
                             self.spring_damping_wp,
                             self.forces_wp,
                         ],
-                        device="cuda:0",
+                        device=device,
                     )
 
                     # integrate
@@ -224,7 +229,7 @@ class Cloth:
                         kernel=integrate_particles,
                         dim=self.num_particles,
                         inputs=[self.positions_wp, self.velocities_wp, self.forces_wp, self.invmass_wp, sim_dt],
-                        device="cuda:0",
+                        device=device,
                     )
 
         self.graph = capture.graph
@@ -232,10 +237,8 @@ class Cloth:
         for _warmup in range(5):
             wp.capture_launch(self.graph)
 
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
-    def time_simulate(self, n):
+    def time_simulate(self, n, device):
         wp.capture_launch(self.graph)
-        wp.synchronize_device("cuda:0")
-
-    time_simulate.param_names = ["res"]
+        wp.synchronize_device(device)
@@ -9,6 +9,8 @@ import os
 
 import warp as wp
 
+from ..devices import DEVICES, init_device
+
 
 def get_asset_directory():
     return os.path.join(os.path.realpath(os.path.dirname(__file__)), "..", "..", "..", "warp", "examples", "assets")
@@ -88,11 +90,14 @@ def init_xforms(kernel_seed: int, xforms: wp.array(dtype=wp.transform)):
 
 
 class MeshIntersect:
+    params = DEVICES
+    param_names = ["device"]
+
     number = 500
 
-    def setup(self):
-        wp.init()
-        wp.load_module("cuda:0")
+    def setup(self, device):
+        init_device(device)
+        wp.load_module(device=device)
         wp.build.clear_kernel_cache()
 
         self.query_count = 1024
@@ -101,24 +106,24 @@ class MeshIntersect:
         self.path_0 = os.path.join(get_asset_directory(), "cube.usd")
         self.path_1 = os.path.join(get_asset_directory(), "sphere.usd")
 
-        self.mesh_0 = self.load_mesh(self.path_0, "/root/cube")
-        self.mesh_1 = self.load_mesh(self.path_1, "/root/sphere")
+        self.mesh_0 = self.load_mesh(self.path_0, "/root/cube", device)
+        self.mesh_1 = self.load_mesh(self.path_1, "/root/sphere", device)
 
         self.query_num_faces = int(len(self.mesh_0.indices) / 3)
         self.query_num_points = len(self.mesh_0.points)
 
-        self.array_result = wp.zeros(self.query_count, dtype=int, device="cuda:0")
-        self.array_xforms = wp.empty(self.query_count, dtype=wp.transform, device="cuda:0")
+        self.array_result = wp.zeros(self.query_count, dtype=int, device=device)
+        self.array_xforms = wp.empty(self.query_count, dtype=wp.transform, device=device)
 
         # generate random relative transforms
-        wp.launch(init_xforms, (self.query_count,), inputs=[42, self.array_xforms], device="cuda:0")
+        wp.launch(init_xforms, (self.query_count,), inputs=[42, self.array_xforms], device=device)
 
-        with wp.ScopedCapture() as capture:
+        with wp.ScopedCapture(device=device) as capture:
             wp.launch(
                 kernel=intersect,
                 dim=self.query_num_faces * self.query_count,
                 inputs=[self.mesh_0.id, self.mesh_1.id, self.query_num_faces, self.array_xforms, self.array_result],
-                device="cuda:0",
+                device=device,
             )
 
         self.graph = capture.graph
@@ -126,22 +131,22 @@ class MeshIntersect:
         for _warmup in range(5):
             wp.capture_launch(self.graph)
 
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
     # create collision meshes
-    def load_mesh(self, path, prim):
+    def load_mesh(self, path, prim, device):
         from pxr import Usd, UsdGeom
 
         usd_stage = Usd.Stage.Open(path)
         usd_geom = UsdGeom.Mesh(usd_stage.GetPrimAtPath(prim))
 
         mesh = wp.Mesh(
-            points=wp.array(usd_geom.GetPointsAttr().Get(), dtype=wp.vec3, device="cuda:0"),
-            indices=wp.array(usd_geom.GetFaceVertexIndicesAttr().Get(), dtype=int, device="cuda:0"),
+            points=wp.array(usd_geom.GetPointsAttr().Get(), dtype=wp.vec3, device=device),
+            indices=wp.array(usd_geom.GetFaceVertexIndicesAttr().Get(), dtype=int, device=device),
         )
 
         return mesh
 
-    def time_intersect(self):
+    def time_intersect(self, device):
         wp.capture_launch(self.graph)
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
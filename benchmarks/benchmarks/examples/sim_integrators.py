@@ -0,0 +1,83 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+import math
+
+import warp as wp
+import warp.sim
+
+from ..devices import DEVICES, init_device
+
+
+class ClothIntegrators:
+    """Time simulating one frame of a cloth grid falling onto the ground with the ``warp.sim`` integrators."""
+
+    params = (["euler", "xpbd", "vbd"], [32, 64], DEVICES)
+    param_names = ["integrator", "res", "device"]
+
+    number = 5
+    timeout = 300
+
+    sim_substeps = 16
+
+    def setup(self, integrator, res, device):
+        init_device(device)
+
+        with wp.ScopedDevice(device):
+            builder = wp.sim.ModelBuilder()
+
+            cloth_args = {
+                "pos": wp.vec3(0.0, 4.0, 0.0),
+                "rot": wp.quat_from_axis_angle(wp.vec3(1.0, 0.0, 0.0), math.pi * 0.5),
+                "vel": wp.vec3(0.0, 0.0, 0.0),
+                "dim_x": res,
+                "dim_y": res,
+                "cell_x": 0.1,
+                "cell_y": 0.1,
+                "mass": 0.1,
+                "fix_left": True,
+            }
+
+            if integrator == "euler":
+                builder.add_cloth_grid(**cloth_args, tri_ke=1.0e3, tri_ka=1.0e3, tri_kd=1.0e1)
+            elif integrator == "xpbd":
+                builder.add_cloth_grid(**cloth_args, edge_ke=1.0e2, add_springs=True, spring_ke=1.0e3, spring_kd=0.0)
+            else:
+                builder.add_cloth_grid(**cloth_args, tri_ke=1.0e4, tri_ka=1.0e4, tri_kd=1.0e-5, edge_ke=100)
+                builder.color()
+
+            self.model = builder.finalize()
+            self.model.ground = True
+
+            if integrator == "euler":
+                self.integrator = wp.sim.SemiImplicitIntegrator()
+            elif integrator == "xpbd":
+                self.integrator = wp.sim.XPBDIntegrator(iterations=1)
+            else:
+                self.integrator = wp.sim.VBDIntegrator(self.model, iterations=1)
+
+            self.state_0 = self.model.state()
+            self.state_1 = self.model.state()
+
+            self.sim_dt = 1.0 / 60.0 / self.sim_substeps
+
+            # compile and load the kernels outside of the timed region
+            self.simulate()
+            wp.synchronize_device(device)
+
+    def simulate(self):
+        wp.sim.collide(self.model, self.state_0)
+
+        for _ in range(self.sim_substeps):
+            self.state_0.clear_forces()
+            self.integrator.simulate(self.model, self.state_0, self.state_1, self.sim_dt)
+            (self.state_0, self.state_1) = (self.state_1, self.state_0)
+
+    def time_simulate_frame(self, integrator, res, device):
+        with wp.ScopedDevice(device):
+            self.simulate()
+        wp.synchronize_device(device)
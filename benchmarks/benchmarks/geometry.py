@@ -0,0 +1,197 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+import numpy as np
+
+import warp as wp
+
+from .devices import DEVICES, init_device
+
+wp.set_module_options({"enable_backward": False})
+
+NUM_QUERIES = 1 << 16
+
+
+@wp.kernel
+def count_neighbors(grid: wp.uint64, points: wp.array(dtype=wp.vec3), radius: float, counts: wp.array(dtype=int)):
+    tid = wp.tid()
+    i = wp.hash_grid_point_id(grid, tid)
+    p = points[i]
+
+    count = int(0)
+    for index in wp.hash_grid_query(grid, p, radius):
+        if wp.length(points[index] - p) <= radius:
+            count += 1
+
+    counts[i] = count
+
+
+@wp.kernel
+def query_closest_points(
+    mesh: wp.uint64, query_points: wp.array(dtype=wp.vec3), max_dist: float, closest: wp.array(dtype=wp.vec3)
+):
+    tid = wp.tid()
+    query = wp.mesh_query_point_no_sign(mesh, query_points[tid], max_dist)
+
+    if query.result:
+        closest[tid] = wp.mesh_eval_position(mesh, query.face, query.u, query.v)
+
+
+@wp.kernel
+def count_overlaps(
+    bvh: wp.uint64, lowers: wp.array(dtype=wp.vec3), uppers: wp.array(dtype=wp.vec3), counts: wp.array(dtype=int)
+):
+    tid = wp.tid()
+    query = wp.bvh_query_aabb(bvh, lowers[tid], uppers[tid])
+
+    count = int(0)
+    index = int(0)
+    while wp.bvh_query_next(query, index):
+        count += 1
+
+    counts[tid] = count
+
+
+def grid_mesh(n):
+    """Returns the points and triangle indices of a wavy height field with ``n * n`` vertices."""
+
+    x, y = np.meshgrid(np.linspace(0.0, 1.0, n), np.linspace(0.0, 1.0, n))
+    z = 0.05 * np.sin(8.0 * x) * np.cos(8.0 * y)
+    points = np.stack([x, z, y], axis=-1).reshape(-1, 3).astype(np.float32)
+
+    cells = np.arange(n * n).reshape(n, n)[:-1, :-1].flatten()
+    indices = np.stack([cells, cells + 1, cells + n, cells + 1, cells + n + 1, cells + n], axis=-1)
+
+    return points, indices.flatten().astype(np.int32)
+
+
+class HashGridBuildQuery:
+    params = ([1 << 14, 1 << 17, 1 << 20], DEVICES)
+    param_names = ["num_points", "device"]
+
+    number = 10
+    timeout = 120
+
+    def setup(self, num_points, device):
+        init_device(device)
+        wp.load_module(device=device)
+
+        rng = np.random.default_rng(42)
+
+        # about 8 points per cell of size radius
+        self.radius = 0.5 * (1.0 / num_points) ** (1.0 / 3.0)
+        self.points = wp.array(rng.random((num_points, 3), dtype=np.float32), dtype=wp.vec3, device=device)
+        self.counts = wp.empty(num_points, dtype=int, device=device)
+
+        self.grid = wp.HashGrid(128, 128, 128, device=device)
+        self.grid.build(self.points, self.radius)
+
+        wp.synchronize_device(device)
+
+    def time_build(self, num_points, device):
+        self.grid.build(self.points, self.radius)
+        wp.synchronize_device(device)
+
+    def time_query(self, num_points, device):
+        wp.launch(
+            count_neighbors,
+            dim=num_points,
+            inputs=[self.grid.id, self.points, self.radius, self.counts],
+            device=device,
+        )
+        wp.synchronize_device(device)
+
+
+class MeshBuildQuery:
+    params = ([64, 256, 1024], DEVICES)
+    param_names = ["res", "device"]
+
+    number = 10
+    timeout = 120
+
+    def setup(self, res, device):
+        init_device(device)
+        wp.load_module(device=device)
+
+        points, indices = grid_mesh(res)
+        self.points = wp.array(points, dtype=wp.vec3, device=device)
+        self.indices = wp.array(indices, dtype=int, device=device)
+        self.mesh = wp.Mesh(points=self.points, indices=self.indices)
+
+        rng = np.random.default_rng(42)
+
+        # query points close to the surface
+        query_points = rng.random((NUM_QUERIES, 3), dtype=np.float32)
+        query_points[:, 1] = 0.2 * query_points[:, 1] - 0.1
+        self.query_points = wp.array(query_points, dtype=wp.vec3, device=device)
+        self.closest = wp.empty(NUM_QUERIES, dtype=wp.vec3, device=device)
+
+        wp.synchronize_device(device)
+
+    def time_build(self, res, device):
+        wp.Mesh(points=self.points, indices=self.indices)
+        wp.synchronize_device(device)
+
+    def time_refit(self, res, device):
+        self.mesh.refit()
+        wp.synchronize_device(device)
+
+    def time_query(self, res, device):
+        wp.launch(
+            query_closest_points,
+            dim=NUM_QUERIES,
+            inputs=[self.mesh.id, self.query_points, 0.2, self.closest],
+            device=device,
+        )
+        wp.synchronize_device(device)
+
+
+class BvhBuildQuery:
+    params = (["sah", "sah_binned", "median", "lbvh"], [1 << 14, 1 << 18], DEVICES)
+    param_names = ["constructor", "num_bounds", "device"]
+
+    number = 10
+    timeout = 120
+
+    def setup(self, constructor, num_bounds, device):
+        init_device(device)
+
+        if constructor == "lbvh" and not wp.get_device(device).is_cuda:
+            raise NotImplementedError("The LBVH constructor is only available on CUDA devices")
+
+        wp.load_module(device=device)
+
+        rng = np.random.default_rng(42)
+
+        centers = rng.random((num_bounds, 3), dtype=np.float32)
+        extents = 0.5 * (1.0 / num_bounds) ** (1.0 / 3.0) * rng.random((num_bounds, 3), dtype=np.float32)
+
+        self.constructor = constructor
+        self.lowers = wp.array(centers - extents, dtype=wp.vec3, device=device)
+        self.uppers = wp.array(centers + extents, dtype=wp.vec3, device=device)
+        self.counts = wp.empty(num_bounds, dtype=int, device=device)
+
+        self.bvh = wp.Bvh(self.lowers, self.uppers, constructor=constructor)
+
+        wp.synchronize_device(device)
+
+    def time_build(self, constructor, num_bounds, device):
+        wp.Bvh(self.lowers, self.uppers, constructor=self.constructor)
+        wp.synchronize_device(device)
+
+    def time_refit(self, constructor, num_bounds, device):
+        self.bvh.refit()
+        wp.synchronize_device(device)
+
+    def time_query(self, constructor, num_bounds, device):
+        wp.launch(
+            count_overlaps,
+            dim=self.counts.shape[0],
+            inputs=[self.bvh.id, self.lowers, self.uppers, self.counts],
+            device=device,
+        )
+        wp.synchronize_device(device)
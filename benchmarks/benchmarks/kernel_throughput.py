@@ -0,0 +1,81 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+import numpy as np
+
+import warp as wp
+
+from .devices import DEVICES, init_device
+
+wp.set_module_options({"enable_backward": False})
+
+
+@wp.kernel
+def saxpy(x: wp.array(dtype=float), y: wp.array(dtype=float), a: float, out: wp.array(dtype=float)):
+    i = wp.tid()
+    out[i] = a * x[i] + y[i]
+
+
+@wp.kernel
+def transform_points(xform: wp.transform, points: wp.array(dtype=wp.vec3), out: wp.array(dtype=wp.vec3)):
+    i = wp.tid()
+    p = wp.transform_point(xform, points[i])
+    out[i] = p * wp.sin(wp.length(p))
+
+
+@wp.kernel
+def reduce_sum(x: wp.array(dtype=float), out: wp.array(dtype=float)):
+    i = wp.tid()
+    wp.atomic_add(out, 0, x[i])
+
+
+class KernelThroughput:
+    """Time kernels over large arrays: a bandwidth-bound, a compute-bound and an atomic reduction kernel."""
+
+    params = ([1 << 16, 1 << 20, 1 << 24], DEVICES)
+    param_names = ["n", "device"]
+
+    number = 10
+    timeout = 120
+
+    def setup(self, n, device):
+        init_device(device)
+        wp.load_module(device=device)
+
+        rng = np.random.default_rng(42)
+
+        self.x = wp.array(rng.random(n, dtype=np.float32), dtype=float, device=device)
+        self.y = wp.array(rng.random(n, dtype=np.float32), dtype=float, device=device)
+        self.out = wp.empty(n, dtype=float, device=device)
+        self.sum = wp.zeros(1, dtype=float, device=device)
+
+        self.points = wp.array(rng.random((n, 3), dtype=np.float32), dtype=wp.vec3, device=device)
+        self.out_points = wp.empty(n, dtype=wp.vec3, device=device)
+
+        xform = wp.transform(wp.vec3(1.0, 2.0, 3.0), wp.quat_rpy(0.1, 0.2, 0.3))
+
+        self.saxpy_cmd = wp.launch(
+            saxpy, n, inputs=[self.x, self.y, 2.0], outputs=[self.out], device=device, record_cmd=True
+        )
+        self.transform_cmd = wp.launch(
+            transform_points, n, inputs=[xform, self.points], outputs=[self.out_points], device=device, record_cmd=True
+        )
+        self.reduce_cmd = wp.launch(reduce_sum, n, inputs=[self.x], outputs=[self.sum], device=device, record_cmd=True)
+
+        wp.synchronize_device(device)
+
+    def time_saxpy(self, n, device):
+        self.saxpy_cmd.launch()
+        wp.synchronize_device(device)
+
+    def time_transform_points(self, n, device):
+        self.transform_cmd.launch()
+        wp.synchronize_device(device)
+
+    def time_reduce_sum(self, n, device):
+        self.reduce_cmd.launch()
+        wp.synchronize_device(device)
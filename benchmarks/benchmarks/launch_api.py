@@ -7,6 +7,8 @@
 
 import warp as wp
 
+from .devices import DEVICES, init_device
+
 wp.set_module_options({"enable_backward": False})
 
 N = 8192
@@ -19,44 +21,65 @@ def inc_kernel(a: wp.array(dtype=float)):
 
 
 class KernelLaunch:
+    params = DEVICES
+    param_names = ["device"]
+
     number = 10000
     rounds = 8
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
+        init_device(device)
         wp.build.clear_kernel_cache()
-        wp.load_module("cuda:0")
-        self.test_array = wp.zeros(N, dtype=float, device="cuda:0")
-        self.stream = wp.Stream("cuda:0")
-        self.cmd = wp.launch(inc_kernel, (N,), inputs=[self.test_array], record_cmd=True)
-        wp.synchronize_device("cuda:0")
+        wp.load_module(device=device)
+        self.test_array = wp.zeros(N, dtype=float, device=device)
+        self.cmd = wp.launch(inc_kernel, (N,), inputs=[self.test_array], device=device, record_cmd=True)
+        wp.synchronize_device(device)
 
-    def teardown(self):
-        wp.synchronize_device("cuda:0")
+    def teardown(self, device):
+        wp.synchronize_device(device)
 
-    def time_standard_launch(self):
+    def time_standard_launch(self, device):
         """Time a standard kernel launch.
 
         A synchronize at the end of the function is intentionally omitted.
         """
 
-        wp.launch(inc_kernel, (N,), inputs=[self.test_array])
+        wp.launch(inc_kernel, (N,), inputs=[self.test_array], device=device)
 
-    def time_launch_on_stream(self):
-        """Time a kernel launch on a specified stream.
+    def time_launch_object(self, device):
+        """Time a kernel launch from a stored launch object.
 
         A synchronize at the end of the function is intentionally omitted.
         """
 
-        wp.launch(inc_kernel, (N,), inputs=[self.test_array], stream=self.stream)
+        self.cmd.launch()
 
-    def time_launch_object(self):
-        """Time a kernel launch from a stored launch object.
+
+class KernelLaunchOnStream:
+    params = [device for device in DEVICES if device != "cpu"]
+    param_names = ["device"]
+
+    number = 10000
+    rounds = 8
+
+    def setup(self, device):
+        init_device(device)
+        wp.build.clear_kernel_cache()
+        wp.load_module(device=device)
+        self.test_array = wp.zeros(N, dtype=float, device=device)
+        self.stream = wp.Stream(device)
+        wp.synchronize_device(device)
+
+    def teardown(self, device):
+        wp.synchronize_device(device)
+
+    def time_launch_on_stream(self, device):
+        """Time a kernel launch on a specified stream.
 
         A synchronize at the end of the function is intentionally omitted.
         """
 
-        self.cmd.launch()
+        wp.launch(inc_kernel, (N,), inputs=[self.test_array], stream=self.stream)
 
 
 @wp.struct
@@ -108,18 +131,21 @@ def k0():
 
 
 class KernelLaunchParameters:
+    params = DEVICES
+    param_names = ["device"]
+
     number = 5000
     rounds = 8
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
+        init_device(device)
         wp.build.clear_kernel_cache()
-        wp.load_module("cuda:0")
+        wp.load_module(device=device)
 
         n = 1
-        self.a = wp.zeros(n, dtype=float, device="cuda:0")
-        self.b = wp.zeros(n, dtype=float, device="cuda:0")
-        self.c = wp.zeros(n, dtype=float, device="cuda:0")
+        self.a = wp.zeros(n, dtype=float, device=device)
+        self.b = wp.zeros(n, dtype=float, device=device)
+        self.c = wp.zeros(n, dtype=float, device=device)
         self.x = 17.0
         self.y = 42.0
         self.z = 99.0
@@ -141,40 +167,42 @@ class KernelLaunchParameters:
 
         self.s0 = S0()
 
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
-    def teardown(self):
-        wp.synchronize_device("cuda:0")
+    def teardown(self, device):
+        wp.synchronize_device(device)
 
-    def time_direct_full(self):
+    def time_direct_full(self, device):
         wp.launch(
-            kz, dim=1, inputs=[self.a, self.b, self.c, self.x, self.y, self.z, self.u, self.v, self.w], device="cuda:0"
+            kz, dim=1, inputs=[self.a, self.b, self.c, self.x, self.y, self.z, self.u, self.v, self.w], device=device
         )
 
-    def time_struct_full(self):
-        wp.launch(ksz, dim=1, inputs=[self.sz], device="cuda:0")
+    def time_struct_full(self, device):
+        wp.launch(ksz, dim=1, inputs=[self.sz], device=device)
 
-    def time_direct_empty(self):
-        wp.launch(k0, dim=1, inputs=[], device="cuda:0")
+    def time_direct_empty(self, device):
+        wp.launch(k0, dim=1, inputs=[], device=device)
 
-    def time_struct_empty(self):
-        wp.launch(ks0, dim=1, inputs=[self.s0], device="cuda:0")
+    def time_struct_empty(self, device):
+        wp.launch(ks0, dim=1, inputs=[self.s0], device=device)
 
 
 class GraphLaunch:
+    params = DEVICES
+    param_names = ["device"]
+
     number = 5000
     rounds = 8
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
+        init_device(device)
         wp.build.clear_kernel_cache()
-        wp.load_module("cuda:0")
-        self.test_array = wp.zeros(N, dtype=float, device="cuda:0")
-        self.stream = wp.Stream("cuda:0")
+        wp.load_module(device=device)
+        self.test_array = wp.zeros(N, dtype=float, device=device)
 
         # capture graph
-        with wp.ScopedCapture(device="cuda:0") as capture:
-            wp.launch(inc_kernel, (N,), inputs=[self.test_array])
+        with wp.ScopedCapture(device=device) as capture:
+            wp.launch(inc_kernel, (N,), inputs=[self.test_array], device=device)
 
         self.graph = capture.graph
 
@@ -182,15 +210,45 @@ class GraphLaunch:
         for _ in range(5):
             wp.capture_launch(self.graph)
 
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
-    def teardown(self):
-        wp.synchronize_device("cuda:0")
+    def teardown(self, device):
+        wp.synchronize_device(device)
 
-    def time_ten_graph(self):
+    def time_ten_graph(self, device):
         for _ in range(10):
             wp.capture_launch(self.graph)
 
-    def time_ten_graph_on_stream(self):
+
+class GraphLaunchOnStream:
+    params = [device for device in DEVICES if device != "cpu"]
+    param_names = ["device"]
+
+    number = 5000
+    rounds = 8
+
+    def setup(self, device):
+        init_device(device)
+        wp.build.clear_kernel_cache()
+        wp.load_module(device=device)
+        self.test_array = wp.zeros(N, dtype=float, device=device)
+        self.stream = wp.Stream(device)
+
+        # capture graph
+        with wp.ScopedCapture(device=device) as capture:
+            wp.launch(inc_kernel, (N,), inputs=[self.test_array], device=device)
+
+        self.graph = capture.graph
+
+        # Warmup
+        for _ in range(5):
+            wp.capture_launch(self.graph, stream=self.stream)
+
+        wp.synchronize_device(device)
+
+    def teardown(self, device):
+        wp.synchronize_device(device)
+
+    def time_ten_graph_on_stream(self, device):
         for _ in range(10):
             wp.capture_launch(self.graph, stream=self.stream)
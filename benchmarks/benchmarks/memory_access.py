@@ -7,11 +7,12 @@
 
 import warp as wp
 
+from .devices import DEVICES, init_device
+
 wp.set_module_options({"enable_backward": False})
 
 
 NUM_COMPONENTS = 19
-N = 256
 
 
 @wp.kernel
@@ -33,32 +34,38 @@ def kernel_soa(test_array: wp.array4d(dtype=float)):
 class ArrayOfStructures:
     """Benchmark for measuring read-and-write to data organized as an array of structures."""
 
+    params = ([64, 256], DEVICES)
+    param_names = ["n", "device"]
+
     number = 100
 
-    def setup(self):
-        wp.init()
+    def setup(self, n, device):
+        init_device(device)
         wp.build.clear_kernel_cache()
-        wp.load_module("cuda:0")
-        self.test_array = wp.ones((N, N, N, NUM_COMPONENTS), dtype=float, device="cuda:0")
-        self.cmd = wp.launch(kernel_aos, (N, N, N), inputs=[self.test_array], record_cmd=True, device="cuda:0")
+        wp.load_module(device=device)
+        self.test_array = wp.ones((n, n, n, NUM_COMPONENTS), dtype=float, device=device)
+        self.cmd = wp.launch(kernel_aos, (n, n, n), inputs=[self.test_array], record_cmd=True, device=device)
 
-    def time_kernels(self):
+    def time_kernels(self, n, device):
         self.cmd.launch()
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
 
 class StructureOfArrays:
     """Benchmark for measuring read-and-write to data organized as a structure of arrays."""
 
+    params = ([64, 256], DEVICES)
+    param_names = ["n", "device"]
+
     number = 100
 
-    def setup(self):
-        wp.init()
+    def setup(self, n, device):
+        init_device(device)
         wp.build.clear_kernel_cache()
-        wp.load_module("cuda:0")
-        self.test_array = wp.ones((NUM_COMPONENTS, N, N, N), dtype=float, device="cuda:0")
-        self.cmd = wp.launch(kernel_soa, (N, N, N), inputs=[self.test_array], record_cmd=True, device="cuda:0")
+        wp.load_module(device=device)
+        self.test_array = wp.ones((NUM_COMPONENTS, n, n, n), dtype=float, device=device)
+        self.cmd = wp.launch(kernel_soa, (n, n, n), inputs=[self.test_array], record_cmd=True, device=device)
 
-    def time_kernels(self):
+    def time_kernels(self, n, device):
         self.cmd.launch()
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
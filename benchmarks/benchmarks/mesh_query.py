@@ -11,6 +11,8 @@ import numpy as np
 
 import warp as wp
 
+from .devices import DEVICES, init_device
+
 wp.set_module_options({"enable_backward": False})
 
 NUM_QUERY_POINTS = 1000000
@@ -39,18 +41,19 @@ def sample_mesh_query_no_sign(
 
 
 class MeshQuery:
-    params = ["bunny", "bear", "cube", "rocks", "sphere"]
+    params = (["bunny", "bear", "cube", "rocks", "sphere"], DEVICES)
+    param_names = ["asset", "device"]
     rounds = 3
     number = 10
     timeout = 120
     warmup_time = 1.0
 
-    def setup(self, asset):
+    def setup(self, asset, device):
         from pxr import Usd, UsdGeom
 
-        wp.init()
+        init_device(device)
         wp.build.clear_kernel_cache()
-        wp.load_module("cuda:0")
+        wp.load_module(device=device)
 
         asset_stage = Usd.Stage.Open(os.path.join(get_asset_directory(), f"{asset}.usd"))
         mesh_geom = UsdGeom.Mesh(asset_stage.GetPrimAtPath(f"/root/{asset}"))
@@ -66,33 +69,31 @@ class MeshQuery:
         query_points_np = rng.uniform(bounding_box[0, :], bounding_box[1, :], size=(NUM_QUERY_POINTS, 3)).astype(
             np.float32
         )
-        self.query_points = wp.array(query_points_np, dtype=wp.vec3, device="cuda:0")
+        self.query_points = wp.array(query_points_np, dtype=wp.vec3, device=device)
 
         # create wp mesh
         self.mesh = wp.Mesh(
-            points=wp.array(points, dtype=wp.vec3, device="cuda:0"),
+            points=wp.array(points, dtype=wp.vec3, device=device),
             velocities=None,
-            indices=wp.array(indices, dtype=int, device="cuda:0"),
+            indices=wp.array(indices, dtype=int, device=device),
         )
 
-        self.query_closest_points = wp.empty_like(self.query_points, device="cuda:0")
+        self.query_closest_points = wp.empty_like(self.query_points, device=device)
 
-        with wp.ScopedCapture() as capture:
+        with wp.ScopedCapture(device=device) as capture:
             wp.launch(
                 sample_mesh_query_no_sign,
                 dim=(NUM_QUERY_POINTS,),
                 inputs=[self.mesh.id, self.query_points, 1.0e7, self.query_closest_points],
-                device="cuda:0",
+                device=device,
             )
         self.graph = capture.graph
 
         for _warmup in range(5):
             wp.capture_launch(self.graph)
 
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(device)
 
-    def time_mesh_query(self, asset):
+    def time_mesh_query(self, asset, device):
         wp.capture_launch(self.graph)
-        wp.synchronize_device("cuda:0")
-
-    time_mesh_query.param_names = ["asset"]
+        wp.synchronize_device(device)
@@ -0,0 +1,148 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+import numpy as np
+
+import warp as wp
+import warp.optim.linear
+import warp.sparse
+
+from .devices import DEVICES, init_device
+
+
+def laplacian_triplets(n):
+    """Returns the (row, column, value) triplets of the 5-point Laplacian on an ``n * n`` grid, plus the identity."""
+
+    index = np.arange(n * n).reshape(n, n)
+
+    rows = [index.flatten()]
+    cols = [index.flatten()]
+    vals = [np.full(n * n, 5.0)]
+
+    for src, dst in (
+        (index[1:, :], index[:-1, :]),
+        (index[:-1, :], index[1:, :]),
+        (index[:, 1:], index[:, :-1]),
+        (index[:, :-1], index[:, 1:]),
+    ):
+        rows.append(src.flatten())
+        cols.append(dst.flatten())
+        vals.append(np.full(src.size, -1.0))
+
+    return np.concatenate(rows).astype(np.int32), np.concatenate(cols).astype(np.int32), np.concatenate(vals)
+
+
+def laplacian(n, block_type, device):
+    rows, cols, vals = laplacian_triplets(n)
+
+    if block_type is float:
+        values = vals.astype(np.float32)
+    else:
+        # scale an identity block by the coefficients of the scalar matrix
+        values = vals[:, None, None] * np.eye(block_type._shape_[0], dtype=np.float32)
+
+    A = wp.sparse.bsr_zeros(n * n, n * n, block_type, device=device)
+    wp.sparse.bsr_set_from_triplets(
+        A,
+        wp.array(rows, dtype=int, device=device),
+        wp.array(cols, dtype=int, device=device),
+        wp.array(values, dtype=block_type, device=device),
+    )
+
+    return A
+
+
+class BsrMv:
+    params = ([64, 256, 1024], ["float", "mat33"], DEVICES)
+    param_names = ["res", "block", "device"]
+
+    number = 10
+    timeout = 120
+
+    def setup(self, res, block, device):
+        init_device(device)
+
+        block_type = float if block == "float" else wp.mat33
+        vec_type = float if block == "float" else wp.vec3
+
+        self.A = laplacian(res, block_type, device)
+        self.x = wp.ones(res * res, dtype=vec_type, device=device)
+        self.y = wp.zeros(res * res, dtype=vec_type, device=device)
+
+        # compile and load the kernels outside of the timed region
+        wp.sparse.bsr_mv(self.A, self.x, self.y)
+        wp.synchronize_device(device)
+
+    def time_bsr_mv(self, res, block, device):
+        wp.sparse.bsr_mv(self.A, self.x, self.y, alpha=1.0, beta=0.0)
+        wp.synchronize_device(device)
+
+
+class BsrMm:
+    params = ([32, 128, 256], ["float", "mat33"], DEVICES)
+    param_names = ["res", "block", "device"]
+
+    number = 5
+    timeout = 300
+
+    def setup(self, res, block, device):
+        init_device(device)
+
+        block_type = float if block == "float" else wp.mat33
+
+        self.A = laplacian(res, block_type, device)
+        self.work_arrays = wp.sparse.bsr_mm_work_arrays()
+
+        # compute the product topology once, the timed products reuse it
+        self.C = wp.sparse.bsr_mm(self.A, self.A, work_arrays=self.work_arrays)
+        wp.synchronize_device(device)
+
+    def time_bsr_mm(self, res, block, device):
+        wp.sparse.bsr_mm(self.A, self.A, work_arrays=self.work_arrays)
+        wp.synchronize_device(device)
+
+    def time_bsr_mm_reuse_topology(self, res, block, device):
+        wp.sparse.bsr_mm(self.A, self.A, self.C, work_arrays=self.work_arrays, reuse_topology=True)
+        wp.synchronize_device(device)
+
+
+class LinearSolvers:
+    """Time a fixed number of iterations of the iterative linear solvers on a Laplacian system."""
+
+    params = (["cg", "gmres"], [64, 256], DEVICES)
+    param_names = ["solver", "res", "device"]
+
+    number = 5
+    timeout = 300
+
+    iterations = 100
+
+    def setup(self, solver, res, device):
+        init_device(device)
+
+        self.A = laplacian(res, float, device)
+        self.b = wp.ones(res * res, dtype=float, device=device)
+        self.x = wp.zeros(res * res, dtype=float, device=device)
+        self.M = wp.optim.linear.preconditioner(self.A, ptype="diag")
+
+        self.run(solver)
+        wp.synchronize_device(device)
+
+    def run(self, solver):
+        self.x.zero_()
+
+        # a zero tolerance runs the maximum number of iterations
+        if solver == "cg":
+            wp.optim.linear.cg(self.A, self.b, self.x, tol=0.0, atol=0.0, maxiter=self.iterations, M=self.M)
+        else:
+            wp.optim.linear.gmres(
+                self.A, self.b, self.x, tol=0.0, atol=0.0, restart=32, maxiter=self.iterations, M=self.M
+            )
+
+    def time_solve(self, solver, res, device):
+        self.run(solver)
+        wp.synchronize_device(device)
@@ -0,0 +1,66 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+import numpy as np
+
+import warp as wp
+import warp.utils
+
+from .devices import DEVICES, init_device
+
+
+class RadixSortPairs:
+    params = ([1 << 16, 1 << 20, 1 << 24], DEVICES)
+    param_names = ["n", "device"]
+
+    number = 10
+    timeout = 120
+
+    def setup(self, n, device):
+        init_device(device)
+
+        rng = np.random.default_rng(42)
+
+        # keys and values arrays must be twice the size of the sorted range
+        self.keys_np = rng.integers(0, 1 << 30, size=2 * n, dtype=np.int32)
+        self.keys = wp.array(self.keys_np, dtype=wp.int32, device=device)
+        self.values = wp.array(np.arange(2 * n, dtype=np.int32), dtype=wp.int32, device=device)
+
+        wp.synchronize_device(device)
+
+    def time_radix_sort_pairs(self, n, device):
+        # the keys are sorted in place, restore them so every sample sorts the same input
+        self.keys.assign(self.keys_np)
+        wp.utils.radix_sort_pairs(self.keys, self.values, n)
+        wp.synchronize_device(device)
+
+
+class ArrayScan:
+    params = ([1 << 16, 1 << 20, 1 << 24], ["int32", "float32"], DEVICES)
+    param_names = ["n", "dtype", "device"]
+
+    number = 10
+    timeout = 120
+
+    def setup(self, n, dtype, device):
+        init_device(device)
+
+        rng = np.random.default_rng(42)
+
+        wp_dtype = wp.int32 if dtype == "int32" else wp.float32
+        self.input = wp.array(rng.integers(0, 100, size=n).astype(dtype), dtype=wp_dtype, device=device)
+        self.output = wp.empty_like(self.input)
+
+        wp.synchronize_device(device)
+
+    def time_inclusive_scan(self, n, dtype, device):
+        wp.utils.array_scan(self.input, self.output, inclusive=True)
+        wp.synchronize_device(device)
+
+    def time_exclusive_scan(self, n, dtype, device):
+        wp.utils.array_scan(self.input, self.output, inclusive=False)
+        wp.synchronize_device(device)
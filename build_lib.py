@@ -259,10 +259,14 @@ try:
         "native/sort.cpp",
         "native/sparse.cpp",
         "native/volume.cpp",
+        "native/volume_builder.cpp",
         "native/marching.cpp",
         "native/cutlass_gemm.cpp",
         "native/mathdx.cpp",
         "native/coloring.cpp",
+        "native/parallel.cpp",
+        "native/cpu_graph.cpp",
+        "native/cpu_timing.cpp",
     ]
     warp_cpp_paths = [os.path.join(build_path, cpp) for cpp in cpp_sources]
 
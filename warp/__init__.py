@@ -71,7 +71,7 @@ from warp.context import (
 )
 from warp.context import set_module_options, get_module_options, get_module
 from warp.context import capture_begin, capture_end, capture_launch
-from warp.context import Kernel, Function, Launch
+from warp.context import Kernel, Function, Launch, LaunchSequence
 from warp.context import Stream, get_stream, set_stream, wait_stream, synchronize_stream
 from warp.context import Event, record_event, wait_event, synchronize_event, get_event_elapsed_time
 from warp.context import RegisteredGLBuffer
@@ -81,11 +81,22 @@ from warp.context import is_mempool_access_supported, is_mempool_access_enabled,
 from warp.context import is_peer_access_supported, is_peer_access_enabled, set_peer_access_enabled
 
 from warp.tape import Tape
+from warp.fusion import fuse_kernels, fuse_launches
+from warp.scheduler import TaskGraph, ScopedSchedule
 from warp.utils import ScopedTimer, ScopedDevice, ScopedStream
 from warp.utils import ScopedMempool, ScopedMempoolAccess, ScopedPeerAccess
 from warp.utils import ScopedCapture
 from warp.utils import transform_expand, quat_between_vectors
-from warp.utils import TimingResult, timing_begin, timing_end, timing_print
+from warp.utils import (
+    RooflineResult,
+    TimingResult,
+    timing_begin,
+    timing_end,
+    timing_export_trace,
+    timing_print,
+    timing_print_roofline,
+    timing_roofline,
+)
 from warp.utils import (
     TIMING_KERNEL,
     TIMING_KERNEL_BUILTIN,
@@ -112,6 +123,7 @@ from warp.paddle import device_from_paddle, device_to_paddle
 from warp.paddle import stream_from_paddle
 
 from warp.build import clear_kernel_cache
+from warp.build import pack_kernel_cache
 
 from warp.constants import *
 
@@ -83,7 +83,7 @@ def load_cuda(input_path, device):
     return warp.context.runtime.core.cuda_load_module(device.context, input_path.encode("utf-8"))
 
 
-def build_cpu(obj_path, cpp_path, mode="release", verify_fp=False, fast_math=False, fuse_fp=True):
+def build_cpu(obj_path, cpp_path, mode="release", verify_fp=False, fast_math=False, fuse_fp=True, target_cpu="generic"):
     with open(cpp_path, "rb") as cpp:
         src = cpp.read()
         cpp_path = cpp_path.encode("utf-8")
@@ -91,7 +91,7 @@ def build_cpu(obj_path, cpp_path, mode="release", verify_fp=False, fast_math=Fal
         obj_path = obj_path.encode("utf-8")
 
         err = warp.context.runtime.llvm.compile_cpp(
-            src, cpp_path, inc_path, obj_path, mode == "debug", verify_fp, fuse_fp
+            src, cpp_path, inc_path, obj_path, mode == "debug", verify_fp, fuse_fp, target_cpu.encode("utf-8")
         )
         if err != 0:
             raise Exception(f"CPU kernel build failed with error code {err}")
@@ -137,3 +137,199 @@ def clear_kernel_cache() -> None:
         if os.path.isdir(item_path) and item.startswith("wp_"):
             # Remove the directory and its contents
             shutil.rmtree(item_path, ignore_errors=True)
+
+
+# name of the manifest describing the modules stored in a kernel cache archive
+KERNEL_CACHE_ARCHIVE_MANIFEST = "warp_kernel_cache.json"
+
+
+def pack_kernel_cache(
+    path: str,
+    modules=None,
+    devices=None,
+    block_dims=None,
+    options=None,
+    max_workers: int = 1,
+) -> None:
+    """Compile modules ahead of time and store the binaries in a relocatable kernel cache archive.
+
+    The archive can be used as a read-only kernel cache layer by setting ``warp.config.kernel_cache_archive`` to its
+    path. Modules loaded from the archive are copied into ``warp.config.kernel_cache_dir``, which also receives the
+    modules that are not found in the archive.
+
+    Generic kernels are compiled for the overloads that exist when this function is called, e.g. declared with
+    :func:`wp.overload() <warp.overload>`.
+
+    Args:
+        path: Path of the archive to create, a ZIP file containing the binaries without their sources.
+        modules: List of modules to compile, given as module objects or module names.
+          Submodules of the given modules are included. If ``None``, compile all imported modules.
+        devices: List of devices to compile the modules for. If ``None``, compile for all devices.
+        block_dims: List of block dimensions to compile the modules for. If ``None``, use the current block
+          dimension of each module.
+        options: Module options to compile the modules with, see :func:`wp.set_module_options() <warp.set_module_options>`.
+        max_workers: The maximum number of modules compiled concurrently, see :func:`wp.force_load() <warp.force_load>`.
+    """
+
+    import json
+    import zipfile
+
+    warp.context.init()
+
+    if modules is None:
+        selected = list(warp.context.user_modules.values())
+    else:
+        names = [m.__name__ if hasattr(m, "__name__") else getattr(m, "name", m) for m in modules]
+        selected = [
+            m
+            for name, m in warp.context.user_modules.items()
+            if any(name == prefix or name.startswith(prefix + ".") for prefix in names)
+        ]
+
+    if devices is None:
+        devices = warp.context.get_devices()
+    else:
+        devices = [warp.context.get_device(d) for d in devices]
+
+    # compile the modules, restoring their options afterwards
+    saved_options = [dict(m.options) for m in selected]
+    packed = {}
+
+    try:
+        for m in selected:
+            if options:
+                m.options.update(options)
+                m.mark_modified()
+
+        for block_dim in block_dims or [None]:
+            for m, saved in zip(selected, saved_options):
+                m.options["block_dim"] = block_dim if block_dim is not None else saved["block_dim"]
+
+            warp.context.force_load(device=devices, modules=selected, max_workers=max_workers)
+
+            # modules compiled per kernel are stored one kernel at a time
+            for unit in (unit for m in selected for unit in m.get_compile_units()):
+                module_hash = unit.hashers[unit.options["block_dim"]].get_module_hash()
+                module_dir_name = f"wp_{unit.name}_{module_hash.hex()[:7]}"
+                packed[module_dir_name] = {"module": unit.name, "hash": module_hash.hex()}
+    finally:
+        for m, saved in zip(selected, saved_options):
+            m.options.clear()
+            m.options.update(saved)
+            if options:
+                m.mark_modified()
+
+    # modules without kernels are not compiled
+    packed = {
+        name: entry for name, entry in packed.items() if os.path.isdir(os.path.join(warp.config.kernel_cache_dir, name))
+    }
+
+    manifest = {"version": warp.config.version, "modules": packed}
+
+    # write to a temporary file first to never leave a partial archive behind
+    tmp_path = f"{path}.p{os.getpid()}"
+
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(KERNEL_CACHE_ARCHIVE_MANIFEST, json.dumps(manifest, indent=2))
+
+        for module_dir_name in sorted(packed.keys()):
+            module_dir = os.path.join(warp.config.kernel_cache_dir, module_dir_name)
+
+            # binaries and metadata, sources are not needed to load the modules
+            for file_name in sorted(os.listdir(module_dir)):
+                if os.path.splitext(file_name)[1] in (".cpp", ".cu"):
+                    continue
+
+                archive.write(os.path.join(module_dir, file_name), f"{module_dir_name}/{file_name}")
+
+    os.replace(tmp_path, path)
+
+
+class KernelCacheArchive:
+    """Read-only kernel cache layer, a ZIP archive created by :func:`pack_kernel_cache` or its extracted contents."""
+
+    def __init__(self, path):
+        import json
+        import zipfile
+
+        self.path = path
+        self.zip = None
+        self.modules = {}
+
+        try:
+            if os.path.isdir(path):
+                with open(os.path.join(path, KERNEL_CACHE_ARCHIVE_MANIFEST), "r") as manifest_file:
+                    manifest = json.load(manifest_file)
+            else:
+                self.zip = zipfile.ZipFile(path, "r")
+                manifest = json.loads(self.zip.read(KERNEL_CACHE_ARCHIVE_MANIFEST))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            warp.utils.warn(f"Could not open the kernel cache archive '{path}', it will be ignored: {e}")
+            return
+
+        if manifest.get("version") != warp.config.version:
+            warp.utils.warn(
+                f"The kernel cache archive '{path}' was created by Warp {manifest.get('version')} and will be ignored, "
+                f"the current version is {warp.config.version}"
+            )
+            return
+
+        self.modules = manifest.get("modules", {})
+
+    def extract(self, module_dir_name, module_hash, file_names, module_dir) -> bool:
+        """Copy the given files of a module into the kernel cache if the archive contains all of them.
+
+        Returns ``True`` if the files were copied, ``False`` if the module is not in the archive.
+        """
+
+        entry = self.modules.get(module_dir_name)
+        if entry is None or entry.get("hash") != module_hash.hex():
+            return False
+
+        if self.zip is not None:
+            archive_files = set(self.zip.namelist())
+            if any(f"{module_dir_name}/{file_name}" not in archive_files for file_name in file_names):
+                return False
+        else:
+            if any(not os.path.exists(os.path.join(self.path, module_dir_name, f)) for f in file_names):
+                return False
+
+        os.makedirs(module_dir, exist_ok=True)
+
+        for file_name in file_names:
+            dst_path = os.path.join(module_dir, file_name)
+            if os.path.exists(dst_path):
+                continue
+
+            # write to a process unique file first, other processes may be reading the kernel cache
+            tmp_path = f"{dst_path}.p{os.getpid()}"
+
+            if self.zip is not None:
+                with open(tmp_path, "wb") as dst_file:
+                    dst_file.write(self.zip.read(f"{module_dir_name}/{file_name}"))
+            else:
+                import shutil
+
+                shutil.copyfile(os.path.join(self.path, module_dir_name, file_name), tmp_path)
+
+            os.replace(tmp_path, dst_path)
+
+        return True
+
+
+_kernel_cache_archive = None
+
+
+def get_kernel_cache_archive():
+    """Returns the :class:`KernelCacheArchive` selected by ``warp.config.kernel_cache_archive``, if any."""
+
+    global _kernel_cache_archive
+
+    path = warp.config.kernel_cache_archive
+    if path is None:
+        return None
+
+    if _kernel_cache_archive is None or _kernel_cache_archive.path != path:
+        _kernel_cache_archive = KernelCacheArchive(path)
+
+    return _kernel_cache_archive
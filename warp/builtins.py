@@ -4788,9 +4788,8 @@ def atomic_op_value_func(arg_types: Mapping[str, type], arg_values: Mapping[str,
 
 def atomic_op_dispatch_func(input_types: Mapping[str, type], return_type: Any, args: Mapping[str, Var]):
     # as this is a codegen callback, we can mark the fact that this func writes to an array here
-    if warp.config.verify_autograd_array_access:
-        arr = args["arr"]
-        arr.mark_write()
+    arr = args["arr"]
+    arr.mark_write()
 
     func_args = tuple(args.values())
     # we don't need to specify template arguments for atomic ops
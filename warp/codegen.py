@@ -685,9 +685,14 @@ class Var:
     def emit_adj(self):
         return self.emit("adj")
 
+    def is_tracked(self):
+        # arrays and structs, whose flags record the accesses to the arrays they hold
+        value_type = strip_reference(self.type)
+        return is_array(value_type) or isinstance(value_type, Struct)
+
     def mark_read(self):
-        """Marks this Var as having been read from in a kernel (array only)."""
-        if not is_array(self.type):
+        """Marks this Var as having been read from in a kernel (array or struct only)."""
+        if not self.is_tracked():
             return
 
         self.is_read = True
@@ -699,12 +704,15 @@ class Var:
             parent = parent.parent
 
     def mark_write(self, **kwargs):
-        """Marks this Var has having been written to in a kernel (array only)."""
-        if not is_array(self.type):
+        """Marks this Var has having been written to in a kernel (array or struct only)."""
+        if not self.is_tracked():
+            # references to array elements forward component stores to the array they point into
+            if self.parent is not None:
+                self.parent.mark_write(**kwargs)
             return
 
         # detect if we are writing to an array after reading from it within the same kernel
-        if self.is_read and warp.config.verify_autograd_array_access:
+        if self.is_read and warp.config.verify_autograd_array_access and is_array(self.type):
             if "kernel_name" and "filename" and "lineno" in kwargs:
                 print(
                     f"Warning: Array passed to argument {self.label} in kernel {kwargs['kernel_name']} at {kwargs['filename']}:{kwargs['lineno']} is being written to after it has been read from within the same kernel. This may corrupt gradient computation in the backward pass."
@@ -1324,6 +1332,21 @@ class Adjoint:
             if func.custom_replay_func:
                 adj.builder.deferred_functions.append(func.custom_replay_func)
 
+        # update arg read/write states according to what happens to that arg in the resolved overload
+        if not func.is_builtin():
+            for func_arg in func.adj.args:
+                arg = bound_args.get(func_arg.label)
+                if not isinstance(arg, Var):
+                    continue
+
+                if func_arg.is_write:
+                    kernel_name = adj.fun_name
+                    filename = adj.filename
+                    lineno = adj.lineno + adj.fun_lineno
+                    arg.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
+                if func_arg.is_read:
+                    arg.mark_read()
+
         # Resolve the return value based on the types and values of the given arguments.
         bound_arg_types = {k: get_arg_type(v) for k, v in bound_args.items()}
         bound_arg_values = {k: get_arg_value(v) for k, v in bound_args.items()}
@@ -1827,6 +1850,9 @@ class Adjoint:
                 else:
                     adj.add_forward(f"{attr.emit()} = &({aggregate.emit()}.{node.attr});")
 
+                # propagate the accesses to the arrays of a struct back to the struct Var
+                attr.parent = aggregate
+
                 if adj.is_differentiable_value_type(strip_reference(attr_type)):
                     adj.add_reverse(f"{aggregate.emit_adj()}.{node.attr} += {attr.emit_adj()};")
                 else:
@@ -2277,18 +2303,6 @@ class Adjoint:
         # add the call and build the callee adjoint if needed (func.adj)
         out = adj.add_call(func, args, kwargs, type_args, min_outputs=min_outputs)
 
-        if warp.config.verify_autograd_array_access:
-            # update arg read/write states according to what happens to that arg in the called function
-            if hasattr(func, "adj"):
-                for i, arg in enumerate(args):
-                    if func.adj.args[i].is_write:
-                        kernel_name = adj.fun_name
-                        filename = adj.filename
-                        lineno = adj.lineno + adj.fun_lineno
-                        arg.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
-                    if func.adj.args[i].is_read:
-                        arg.mark_read()
-
         return out
 
     def emit_Index(adj, node):
@@ -2368,20 +2382,21 @@ class Adjoint:
                 # handles array loads (where each dimension has an index specified)
                 out = adj.add_builtin_call("address", [target, *indices])
 
-                if warp.config.verify_autograd_array_access:
-                    target.mark_read()
+                # store reference to target Var to propagate stores through the element reference back to the array
+                out.parent = target
+
+                target.mark_read()
 
             else:
                 # handles array views (fewer indices than dimensions)
                 out = adj.add_builtin_call("view", [target, *indices])
 
-                if warp.config.verify_autograd_array_access:
-                    # store reference to target Var to propagate downstream read/write state back to root arg Var
-                    out.parent = target
+                # store reference to target Var to propagate downstream read/write state back to root arg Var
+                out.parent = target
 
-                    # view arg inherits target Var's read/write states
-                    out.is_read = target.is_read
-                    out.is_write = target.is_write
+                # view arg inherits target Var's read/write states
+                out.is_read = target.is_read
+                out.is_write = target.is_write
 
         elif is_tile(target_type):
             if len(indices) == len(target_type.shape):
@@ -2478,12 +2493,11 @@ class Adjoint:
             if is_array(target_type):
                 adj.add_builtin_call("array_store", [target, *indices, rhs])
 
-                if warp.config.verify_autograd_array_access:
-                    kernel_name = adj.fun_name
-                    filename = adj.filename
-                    lineno = adj.lineno + adj.fun_lineno
+                kernel_name = adj.fun_name
+                filename = adj.filename
+                lineno = adj.lineno + adj.fun_lineno
 
-                    target.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
+                target.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
 
             elif is_tile(target_type):
                 adj.add_builtin_call("assign", [target, *indices, rhs])
@@ -2507,6 +2521,12 @@ class Adjoint:
                     attr = adj.add_builtin_call("indexref", [target, *indices])
                     adj.add_builtin_call("store", [attr, rhs])
 
+                    kernel_name = adj.fun_name
+                    filename = adj.filename
+                    lineno = adj.lineno + adj.fun_lineno
+
+                    target.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
+
                     if warp.config.verbose and not adj.custom_reverse_mode:
                         lineno = adj.lineno + adj.fun_lineno
                         line = adj.source_lines[adj.lineno]
@@ -2567,6 +2587,12 @@ class Adjoint:
                 if is_reference(aggregate.type):
                     attr = adj.add_builtin_call("indexref", [aggregate, index])
                     adj.add_builtin_call("store", [attr, rhs])
+
+                    kernel_name = adj.fun_name
+                    filename = adj.filename
+                    lineno = adj.lineno + adj.fun_lineno
+
+                    aggregate.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
                 else:
                     if adj.builder_options.get("enable_backward", True):
                         out = adj.add_builtin_call("assign", [aggregate, index, rhs])
@@ -2584,6 +2610,12 @@ class Adjoint:
                 attr = adj.emit_Attribute(lhs)
                 if is_reference(attr.type):
                     adj.add_builtin_call("store", [attr, rhs])
+
+                    kernel_name = adj.fun_name
+                    filename = adj.filename
+                    lineno = adj.lineno + adj.fun_lineno
+
+                    attr.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
                 else:
                     adj.add_builtin_call("assign", [attr, rhs])
 
@@ -2668,14 +2700,12 @@ class Adjoint:
                 if isinstance(node.op, ast.Add):
                     adj.add_builtin_call("atomic_add", [target, *indices, rhs])
 
-                    if warp.config.verify_autograd_array_access:
-                        target.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
+                    target.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
 
                 elif isinstance(node.op, ast.Sub):
                     adj.add_builtin_call("atomic_sub", [target, *indices, rhs])
 
-                    if warp.config.verify_autograd_array_access:
-                        target.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
+                    target.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
                 else:
                     if warp.config.verbose:
                         print(f"Warning: in-place op {node.op} is not differentiable")
@@ -2691,6 +2721,12 @@ class Adjoint:
                     make_new_assign_statement()
                     return
 
+                kernel_name = adj.fun_name
+                filename = adj.filename
+                lineno = adj.lineno + adj.fun_lineno
+
+                target.mark_write(kernel_name=kernel_name, filename=filename, lineno=lineno)
+
             else:
                 raise WarpCodegenError("Can only subscript in-place assign array, vector, quaternion, and matrix types")
 
@@ -3158,6 +3194,35 @@ cpu_module_header = """
 
 """
 
+# prepended to the CPU module header when the "cpu_vectorize" module option is enabled
+cpu_module_header_vectorize = """
+#define WP_CPU_VECTORIZE
+
+// kernels that cannot be vectorized fall back to scalar code, don't report this as a warning
+#pragma clang diagnostic ignored "-Wpass-failed"
+"""
+
+# fast path placed in front of the task loop of CPU entry points when the "cpu_vectorize" module option is enabled,
+# threads of a Warp kernel only interact through atomics so the loop can be vectorized without dependency checks
+cpu_module_template_vectorized_loop = """    if ({condition})
+    {{
+        // 1-D launch over unit-stride arrays: constant strides and a 32-bit task index let the compiler
+        // process consecutive tasks in SIMD lanes, tasks left over after the last full batch run in a scalar tail
+        wp::launch_bounds_t dim_1d = dim;
+        dim_1d.ndim = 1;
+{views}
+        #pragma clang loop vectorize(assume_safety) interleave(enable)
+        for (wp::int32 task = static_cast<wp::int32>({task_begin}); task < static_cast<wp::int32>({task_end}); ++task)
+        {{
+            {name}_cpu_kernel_{direction}(
+                {params});
+        }}
+
+        return;
+    }}
+
+"""
+
 cuda_module_header = """
 #define WP_TILE_BLOCK_DIM {tile_size}
 #define WP_NO_CRT
@@ -3300,7 +3365,7 @@ extern "C" {{
 WP_API void {name}_cpu_forward(
     {forward_args})
 {{
-    for (size_t task_index = 0; task_index < dim.size; ++task_index)
+{forward_vectorized}    for (size_t task_index = 0; task_index < dim.size; ++task_index)
     {{
         {name}_cpu_kernel_forward(
             {forward_params});
@@ -3318,7 +3383,7 @@ extern "C" {{
 WP_API void {name}_cpu_backward(
     {reverse_args})
 {{
-    for (size_t task_index = 0; task_index < dim.size; ++task_index)
+{reverse_vectorized}    for (size_t task_index = 0; task_index < dim.size; ++task_index)
     {{
         {name}_cpu_kernel_backward(
             {reverse_params});
@@ -3329,6 +3394,52 @@ WP_API void {name}_cpu_backward(
 
 """
 
+cpu_module_template_forward_range = """
+
+extern "C" {{
+
+// Entry point for executing a chunk of the launch on the host worker pool or from a CPU graph,
+// args[0] points to the launch bounds followed by pointers to each kernel argument
+WP_API void {name}_cpu_forward_range(
+    size_t task_begin,
+    size_t task_end,
+    void** args)
+{{
+    const wp::launch_bounds_t dim = *static_cast<const wp::launch_bounds_t*>(args[0]);
+{forward_unpack}
+{forward_range_vectorized}    for (size_t task_index = task_begin; task_index < task_end; ++task_index)
+    {{
+        {name}_cpu_kernel_forward(
+            {forward_range_params});
+    }}
+}}
+
+}} // extern C
+
+"""
+
+cpu_module_template_backward_range = """
+
+extern "C" {{
+
+WP_API void {name}_cpu_backward_range(
+    size_t task_begin,
+    size_t task_end,
+    void** args)
+{{
+    const wp::launch_bounds_t dim = *static_cast<const wp::launch_bounds_t*>(args[0]);
+{reverse_unpack}
+{reverse_range_vectorized}    for (size_t task_index = task_begin; task_index < task_end; ++task_index)
+    {{
+        {name}_cpu_kernel_backward(
+            {reverse_range_params});
+    }}
+}}
+
+}} // extern C
+
+"""
+
 
 # converts a constant Python value to equivalent C-repr
 def constant_str(value):
@@ -3827,6 +3938,37 @@ def codegen_kernel(kernel, device, options):
     return s
 
 
+def codegen_vectorized_loop(name, direction, params, unit_stride_params, task_begin, task_end):
+    """Generates the SIMD fast path of a CPU entry point.
+
+    ``params`` are the kernel parameters following the launch bounds and task index, the ones listed
+    in ``unit_stride_params`` are 1-D arrays that are replaced by views with a compile-time stride.
+    """
+
+    condition = ["dim.ndim == 1", f"{task_end} <= 2147483647"]
+    views = []
+    call_params = ["dim_1d", "static_cast<size_t>(task)"]
+
+    for param in params:
+        if param in unit_stride_params:
+            # null arrays are never accessed and don't prevent the fast path
+            condition.append(f"({param}.strides[0] == sizeof(*{param}.data) || !{param}.data)")
+            views.append(f"const {unit_stride_params[param]} {param}_1d({param}.data, {param}.shape[0], {param}.grad);")
+            call_params.append(f"{param}_1d")
+        else:
+            call_params.append(param)
+
+    return cpu_module_template_vectorized_loop.format(
+        condition=" &&\n        ".join(condition),
+        views="".join(f"        {line}\n" for line in views),
+        task_begin=task_begin,
+        task_end=task_end,
+        name=name,
+        direction=direction,
+        params=indent(call_params, 4),
+    )
+
+
 def codegen_module(kernel, device, options):
     if device != "cpu":
         return ""
@@ -3855,18 +3997,51 @@ def codegen_module(kernel, device, options):
             forward_args.append(f"{arg.ctype()} var_{arg.label}")
             forward_params.append("var_" + arg.label)
 
+    # the range entry points used by the host worker pool receive all arguments by address
+    forward_unpack = []
+    forward_range_params = ["dim", "task_index"]
+
+    for i, arg in enumerate(adj.args):
+        forward_unpack.append(
+            f"const {arg.ctype()}& var_{arg.label} = *static_cast<const {arg.ctype()}*>(args[{i + 1}]);"
+        )
+        forward_range_params.append(f"var_{arg.label}")
+
     template_fmt_args.update(
         {
             "forward_args": indent(forward_args),
             "forward_params": indent(forward_params, 3),
+            "forward_unpack": "".join(f"    {line}\n" for line in forward_unpack),
+            "forward_range_params": indent(forward_range_params, 3),
+            "forward_vectorized": "",
+            "forward_range_vectorized": "",
         }
     )
+
+    if options["cpu_vectorize"]:
+        # 1-D arrays can be specialized for unit stride
+        unit_stride_params = {}
+        for arg in adj.args:
+            if isinstance(arg.type, array) and arg.type.ndim == 1:
+                unit_stride_params[f"var_{arg.label}"] = arg.ctype()
+
+        name = template_fmt_args["name"]
+        template_fmt_args["forward_vectorized"] = codegen_vectorized_loop(
+            name, "forward", forward_params[2:], unit_stride_params, "0", "dim.size"
+        )
+        template_fmt_args["forward_range_vectorized"] = codegen_vectorized_loop(
+            name, "forward", forward_range_params[2:], unit_stride_params, "task_begin", "task_end"
+        )
+
     template += cpu_module_template_forward
+    template += cpu_module_template_forward_range
 
     if options["enable_backward"]:
         # build reverse signature
         reverse_args = [*forward_args]
         reverse_params = [*forward_params]
+        reverse_unpack = [*forward_unpack]
+        reverse_range_params = [*forward_range_params]
 
         for arg in adj.args:
             if isinstance(arg.type, indexedarray):
@@ -3874,21 +4049,47 @@ def codegen_module(kernel, device, options):
                 _arg = Var(arg.label, array(dtype=arg.type.dtype, ndim=arg.type.ndim))
                 reverse_args.append(f"const {_arg.ctype()} adj_{arg.label}")
                 reverse_params.append(f"adj_{_arg.label}")
+                adj_ctype = _arg.ctype()
             elif hasattr(arg.type, "_wp_generic_type_str_"):
                 # vectors and matrices are passed from Python by pointer
                 reverse_args.append(f"const {arg.ctype()}* adj_{arg.label}")
                 reverse_params.append(f"*adj_{arg.label}")
+                adj_ctype = arg.ctype()
             else:
                 reverse_args.append(f"{arg.ctype()} adj_{arg.label}")
                 reverse_params.append(f"adj_{arg.label}")
+                adj_ctype = arg.ctype()
+
+            reverse_unpack.append(
+                f"const {adj_ctype}& adj_{arg.label} = *static_cast<const {adj_ctype}*>(args[{len(reverse_unpack) + 1}]);"
+            )
+            reverse_range_params.append(f"adj_{arg.label}")
 
         template_fmt_args.update(
             {
                 "reverse_args": indent(reverse_args),
                 "reverse_params": indent(reverse_params, 3),
+                "reverse_unpack": "".join(f"    {line}\n" for line in reverse_unpack),
+                "reverse_range_params": indent(reverse_range_params, 3),
+                "reverse_vectorized": "",
+                "reverse_range_vectorized": "",
             }
         )
+
+        if options["cpu_vectorize"]:
+            # gradients of 1-D arrays are 1-D arrays as well
+            for arg in adj.args:
+                if isinstance(arg.type, array) and arg.type.ndim == 1:
+                    unit_stride_params[f"adj_{arg.label}"] = arg.ctype()
+
+            template_fmt_args["reverse_vectorized"] = codegen_vectorized_loop(
+                name, "backward", reverse_params[2:], unit_stride_params, "0", "dim.size"
+            )
+            template_fmt_args["reverse_range_vectorized"] = codegen_vectorized_loop(
+                name, "backward", reverse_range_params[2:], unit_stride_params, "task_begin", "task_end"
+            )
         template += cpu_module_template_backward
+        template += cpu_module_template_backward_range
 
     s = template.format(**template_fmt_args)
     return s
@@ -48,6 +48,20 @@ cache_kernels: bool = True
 kernel_cache_dir: Optional[str] = None
 """Path to kernel cache directory, if `None`, a default path will be used."""
 
+kernel_cache_index: bool = False
+"""If `True`, the module and kernel hashes of modules loaded from the kernel cache are recorded in an index
+keyed by the modules' source files, their modification times, the values of the constants they reference and the
+module options. Subsequent application launches use the index to load modules whose sources did not change without
+hashing them.
+Modules with kernels or functions that capture variables from an enclosing scope are not indexed.
+"""
+
+kernel_cache_archive: Optional[str] = None
+"""Path to a kernel cache archive created by :func:`warp.pack_kernel_cache`, or to a directory with its extracted
+contents. Modules that are not in the kernel cache are looked up in the archive before being compiled.
+Modules found in the archive are copied into the kernel cache, which also stores the modules compiled at runtime.
+"""
+
 cuda_output: Optional[str] = None
 """Preferred CUDA output format for kernels (`"ptx"` or `"cubin"`), determined automatically if unspecified"""
 
@@ -68,3 +82,14 @@ enable_mempools_at_init: bool = True
 
 max_unroll: int = 16
 """Maximum unroll factor for loops."""
+
+compile_unit: str = "module"
+"""Default unit of compilation of the modules, `"module"` or `"kernel"`.
+If `"kernel"`, each kernel is compiled and cached separately along with the functions it calls when it is first
+launched, instead of compiling all the kernels of its module at once.
+"""
+
+cpu_num_threads: int = 1
+"""Number of threads used to execute kernels on the CPU device.
+If `1`, kernels run serially on the calling thread; if `0`, one thread per hardware thread is used.
+"""
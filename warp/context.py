@@ -16,6 +16,7 @@ import inspect
 import io
 import itertools
 import json
+import math
 import operator
 import os
 import platform
@@ -628,14 +629,44 @@ def call_builtin(func: Function, *params) -> Tuple[bool, Any]:
     return (True, value)
 
 
+# array access flags recorded in the module metadata for each kernel argument
+ARRAY_READ = 1
+ARRAY_WRITE = 2
+
+
 class KernelHooks:
-    def __init__(self, forward, backward, forward_smem_bytes=0, backward_smem_bytes=0):
+    def __init__(
+        self,
+        forward,
+        backward,
+        forward_smem_bytes=0,
+        backward_smem_bytes=0,
+        forward_range=None,
+        backward_range=None,
+        cpu_parallel=False,
+        array_access=None,
+    ):
         self.forward = forward
         self.backward = backward
 
         self.forward_smem_bytes = forward_smem_bytes
         self.backward_smem_bytes = backward_smem_bytes
 
+        # CPU entry points executing a sub-range of the launch, used by the host worker pool and CPU graphs
+        self.forward_range = forward_range
+        self.backward_range = backward_range
+
+        # callables for the range entry points, which take the addresses of the packed params
+        range_func = ctypes.CFUNCTYPE(None, ctypes.c_size_t, ctypes.c_size_t, ctypes.POINTER(ctypes.c_void_p))
+        self.forward_range_func = range_func(forward_range) if forward_range else None
+        self.backward_range_func = range_func(backward_range) if backward_range else None
+
+        # whether CPU launches may be split across the host worker pool
+        self.cpu_parallel = cpu_parallel
+
+        # ARRAY_READ / ARRAY_WRITE flags of each kernel argument found by codegen, None if unknown
+        self.array_access = array_access
+
 
 # caches source and compiled entry points for a kernel (will be populated after module loads)
 class Kernel:
@@ -678,6 +709,9 @@ class Kernel:
         # argument indices by name
         self.arg_indices = {a.label: i for i, a in enumerate(self.adj.args)}
 
+        # argument packers for launches, indexed by device context and argument value types
+        self.launch_packers = {}
+
         # hash will be computed when the module is built
         self.hash = None
 
@@ -727,6 +761,7 @@ class Kernel:
         ovl.adj = warp.codegen.Adjoint(self.func, overload_annotations)
         ovl.is_generic = False
         ovl.overloads = {}
+        ovl.launch_packers = {}
         ovl.sig = sig
         ovl.generic_parent = self
 
@@ -740,6 +775,15 @@ class Kernel:
         sig = warp.types.get_signature(arg_types, func_name=self.key)
         return self.overloads.get(sig)
 
+    def get_launch_packer(self, device, args):
+        key = (device.context, *map(type, args))
+        packer = self.launch_packers.get(key)
+        if packer is None:
+            packer = LaunchPacker(self, device, key[1:])
+            self.launch_packers[key] = packer
+
+        return packer
+
     def get_mangled_name(self):
         if self.hash is None:
             raise RuntimeError(f"Missing hash for kernel {self.key} in module {self.module.name}")
@@ -958,13 +1002,16 @@ def func_replay(forward_fn):
 
 # decorator to register kernel, @kernel, custom_name may be a string
 # that creates a kernel with a different name from the actual function
-def kernel(f=None, *, enable_backward=None):
+def kernel(f=None, *, enable_backward=None, cpu_parallel=None):
     def wrapper(f, *args, **kwargs):
         options = {}
 
         if enable_backward is not None:
             options["enable_backward"] = enable_backward
 
+        if cpu_parallel is not None:
+            options["cpu_parallel"] = cpu_parallel
+
         m = get_module(f.__module__)
         k = Kernel(
             func=f,
@@ -1566,7 +1613,8 @@ class ModuleHasher:
 
         return ch.digest()
 
-    def get_constant_bytes(self, value):
+    @staticmethod
+    def get_constant_bytes(value):
         if isinstance(value, int):
             # this also handles builtins.bool
             return bytes(ctypes.c_int(value))
@@ -1591,6 +1639,268 @@ class ModuleHasher:
         return self.unique_kernels.values()
 
 
+# The kernel cache index maps the source files and options of a module to the module and kernel hashes
+# computed by ModuleHasher, so that modules loaded from the kernel cache don't need to be hashed again
+# in subsequent processes (see warp.config.kernel_cache_index).
+# The index is stored in the kernel cache directory with one file per module.
+KERNEL_CACHE_INDEX_DIR = "wp_index"
+
+# maximum number of index entries per module, e.g. for different options or block dimensions
+KERNEL_CACHE_INDEX_MAX_ENTRIES = 16
+
+
+class ModuleIndexHasher:
+    """Module hash restored from the kernel cache index, used in place of a :class:`ModuleHasher`.
+
+    The module needs to be hashed by a :class:`ModuleHasher` before it can be built.
+    """
+
+    def __init__(self, module_hash):
+        self.module_hash = module_hash
+
+    def get_module_hash(self):
+        return self.module_hash
+
+
+def get_module_index_kernels(module):
+    """Returns the kernels and kernel overloads of a module that need to be hashed by index identifier,
+    or ``None`` if they can't be identified uniquely."""
+
+    kernels = {}
+
+    for kernel in module.live_kernels:
+        instances = kernel.overloads.values() if kernel.is_generic else (kernel,)
+
+        for instance in instances:
+            if instance.adj.skip_build:
+                continue
+
+            kernel_id = f"{instance.key}|{instance.sig}"
+
+            # several live kernels sharing the same key (e.g. redefined kernels) can't be told apart
+            if kernel_id in kernels:
+                return None
+
+            kernels[kernel_id] = instance
+
+    return kernels
+
+
+def get_code_references(func):
+    """Yields the global variables and module attributes referenced by the code of a Python function.
+
+    The references are found from the names used by the code object of the function, which is much cheaper
+    than walking its AST but may also yield unrelated attributes of the referenced modules.
+    """
+
+    names = func.__code__.co_names
+
+    modules = []
+    for name in names:
+        value = func.__globals__.get(name)
+        if isinstance(value, types.ModuleType):
+            modules.append((name, value))
+        elif value is not None:
+            yield name, value
+
+    # attributes of referenced modules, e.g.: wp.pi or module.CONSTANT
+    visited = set()
+    while modules:
+        path, m = modules.pop()
+        if m in visited:
+            continue
+
+        visited.add(m)
+
+        for name in names:
+            value = getattr(m, name, None)
+            if isinstance(value, types.ModuleType):
+                modules.append((f"{path}.{name}", value))
+            elif value is not None:
+                yield f"{path}.{name}", value
+
+
+def get_module_index_key(module, kernels):
+    """Returns a key identifying the sources and options a module is built from, or ``None`` if the module
+    can't be indexed.
+
+    Modules depend on the source files of their kernels and functions and of the functions of the modules
+    they reference, and on the values of the constants and types referenced by their code. Kernels and
+    functions that capture variables from an enclosing scope or that were not defined in a source file
+    can't be identified by their source files, so their modules are not indexed.
+    """
+
+    ch = hashlib.sha256()
+
+    ch.update(bytes(warp.config.version, "utf-8"))
+    ch.update(bytes(module.name, "utf-8"))
+
+    files = set()
+
+    def add_adjoint(adj):
+        func = adj.func
+        if func.__closure__ is not None:
+            return False
+
+        files.add(func.__code__.co_filename)
+
+        # values of referenced constants and types may be computed at runtime or defined in files without kernels
+        for name, value in get_code_references(func):
+            if warp.types.is_value(value):
+                ch.update(bytes(name, "utf-8"))
+                ch.update(ModuleHasher.get_constant_bytes(value))
+            elif isinstance(value, warp.codegen.Struct):
+                ch.update(bytes(name, "utf-8"))
+                ch.update(value.hash)
+            elif isinstance(value, type) and warp.types.type_is_value(value):
+                ch.update(bytes(f"{name}:{warp.types.get_type_code(value)}", "utf-8"))
+
+        # values of wp.static() expressions may be computed at runtime
+        for k, v in adj.static_expressions.items():
+            ch.update(bytes(k, "utf-8"))
+            if isinstance(v, Function):
+                ch.update(bytes(v.key, "utf-8"))
+            else:
+                ch.update(ModuleHasher.get_constant_bytes(v))
+
+        return True
+
+    # kernels, including their argument types which may be defined at runtime
+    for kernel_id in sorted(kernels.keys()):
+        kernel = kernels[kernel_id]
+
+        ch.update(bytes(kernel_id, "utf-8"))
+
+        if not add_adjoint(kernel.adj):
+            return None
+
+        for arg, arg_type in kernel.adj.arg_types.items():
+            ch.update(bytes(f"{arg}:{warp.types.get_type_code(arg_type)}", "utf-8"))
+
+        for opt in sorted(kernel.options.keys()):
+            ch.update(bytes(f"{opt}:{kernel.options[opt]}", "utf-8"))
+
+    # functions and structs of this module and the modules it references, the kernels of the referenced
+    # modules are not part of this module
+    visited = set()
+    stack = [module]
+    while stack:
+        m = stack.pop()
+        if m in visited:
+            continue
+
+        visited.add(m)
+        stack.extend(m.references)
+
+        for func in m.functions.values():
+            for ovl in itertools.chain((func,), func.user_overloads.values(), func.user_templates.values()):
+                if ovl.generic_parent is None and not add_adjoint(ovl.adj):
+                    return None
+
+        for struct in m.structs.values():
+            ch.update(struct.hash)
+
+    for path in sorted(files):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        ch.update(bytes(f"{path}:{stat.st_mtime_ns}:{stat.st_size}", "utf-8"))
+
+    # configuration parameters
+    for opt in sorted(module.options.keys()):
+        ch.update(bytes(f"{opt}:{module.options[opt]}", "utf-8"))
+
+    if warp.config.verify_fp:
+        ch.update(bytes("verify_fp", "utf-8"))
+
+    ch.update(bytes(warp.config.mode, "utf-8"))
+
+    return ch.hexdigest()
+
+
+def get_module_index_path(module):
+    return os.path.join(warp.config.kernel_cache_dir, KERNEL_CACHE_INDEX_DIR, f"wp_{module.name}.json")
+
+
+def read_module_index(module):
+    try:
+        with open(get_module_index_path(module), "r") as index_file:
+            return json.load(index_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_module_index_hasher(module):
+    """Looks up the module in the kernel cache index and assigns the kernel hashes.
+
+    Returns a :class:`ModuleIndexHasher` or ``None`` if the module is not in the index.
+    """
+
+    kernels = get_module_index_kernels(module)
+    if kernels is None:
+        return None
+
+    index_key = get_module_index_key(module, kernels)
+    if index_key is None:
+        return None
+
+    entry = read_module_index(module).get(index_key)
+    if entry is None:
+        return None
+
+    try:
+        kernel_hashes = {kernel_id: bytes.fromhex(entry["kernels"][kernel_id]) for kernel_id in kernels.keys()}
+        module_hash = bytes.fromhex(entry["module_hash"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    for kernel_id, kernel in kernels.items():
+        kernel.hash = kernel_hashes[kernel_id]
+
+    return ModuleIndexHasher(module_hash)
+
+
+def save_module_index(module, hasher):
+    """Records the module and kernel hashes of a :class:`ModuleHasher` in the kernel cache index."""
+
+    kernels = get_module_index_kernels(module)
+    if kernels is None:
+        return
+
+    index_key = get_module_index_key(module, kernels)
+    if index_key is None:
+        return
+
+    index = read_module_index(module)
+    if index_key in index:
+        return
+
+    index[index_key] = {
+        "module_hash": hasher.get_module_hash().hex(),
+        "kernels": {kernel_id: kernel.hash.hex() for kernel_id, kernel in kernels.items()},
+    }
+
+    # drop the oldest entries
+    while len(index) > KERNEL_CACHE_INDEX_MAX_ENTRIES:
+        del index[next(iter(index))]
+
+    # write to a process unique file first so that concurrent processes never read a partial index
+    index_path = get_module_index_path(module)
+    tmp_path = f"{index_path}.p{os.getpid()}"
+
+    try:
+        Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(tmp_path, "w") as index_file:
+            json.dump(index, index_file)
+
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        warp.utils.warn(f"Could not update the kernel cache index of module '{module.name}': {e}")
+
+
 class ModuleBuilder:
     def __init__(self, module, options, hasher=None):
         self.functions = {}
@@ -1677,6 +1987,11 @@ class ModuleBuilder:
             meta[name + "_cuda_kernel_forward_smem_bytes"] = kernel.adj.get_total_required_shared()
             meta[name + "_cuda_kernel_backward_smem_bytes"] = kernel.adj.get_total_required_shared() * 2
 
+            # arrays read and written by the kernel, used to estimate the memory traffic of CPU launches
+            meta[name + "_array_access"] = [
+                (ARRAY_READ if arg.is_read else 0) | (ARRAY_WRITE if arg.is_write else 0) for arg in kernel.adj.args
+            ]
+
         return meta
 
     def codegen(self, device):
@@ -1718,6 +2033,8 @@ class ModuleBuilder:
         # add headers
         if device == "cpu":
             source = warp.codegen.cpu_module_header.format(tile_size=self.options["block_dim"]) + source
+            if self.options["cpu_vectorize"]:
+                source = warp.codegen.cpu_module_header_vectorize + source
         else:
             source = warp.codegen.cuda_module_header.format(tile_size=self.options["block_dim"]) + source
 
@@ -1753,6 +2070,8 @@ class ModuleExec:
                 with self.device.context_guard:
                     runtime.core.cuda_unload_module(self.device.context, self.handle)
             else:
+                # kernels of the module may still be queued on asynchronous CPU streams
+                synchronize_cpu_streams()
                 runtime.llvm.unload_obj(self.handle.encode("utf-8"))
 
     # lookup and cache kernel entry points
@@ -1802,7 +2121,13 @@ class ModuleExec:
                     f"Warning: Failed to configure kernel dynamic shared memory for this device, tried to configure {backward_name} kernel for {backward_smem_bytes} bytes, but maximum available is {max_smem_bytes}"
                 )
 
-            hooks = KernelHooks(forward_kernel, backward_kernel, forward_smem_bytes, backward_smem_bytes)
+            hooks = KernelHooks(
+                forward_kernel,
+                backward_kernel,
+                forward_smem_bytes,
+                backward_smem_bytes,
+                array_access=self.meta.get(name + "_array_access"),
+            )
 
         else:
             func = ctypes.CFUNCTYPE(None)
@@ -1818,12 +2143,48 @@ class ModuleExec:
             else:
                 backward = None
 
-            hooks = KernelHooks(forward, backward)
+            # entry points for the host worker pool and CPU graphs
+            forward_range = (
+                runtime.llvm.lookup(self.handle.encode("utf-8"), (name + "_cpu_forward_range").encode("utf-8")) or None
+            )
+
+            if options["enable_backward"]:
+                backward_range = (
+                    runtime.llvm.lookup(self.handle.encode("utf-8"), (name + "_cpu_backward_range").encode("utf-8"))
+                    or None
+                )
+            else:
+                backward_range = None
+
+            hooks = KernelHooks(
+                forward,
+                backward,
+                forward_range=forward_range,
+                backward_range=backward_range,
+                cpu_parallel=options["cpu_parallel"],
+                array_access=self.meta.get(name + "_array_access"),
+            )
 
         self.kernel_hooks[kernel.adj] = hooks
         return hooks
 
 
+def resume_module_load(loader, error=None):
+    """Runs a module loader returned by :meth:`Module.load_steps` until it needs to compile the module.
+
+    Returns a tuple ``(compile_step, module_exec)`` with either a callable that compiles the module, after which the
+    loader must be resumed again, or the result of the load. If ``error`` is given, it is raised in the loader.
+    """
+
+    try:
+        if error is not None:
+            return loader.throw(error), None
+        else:
+            return loader.send(None), None
+    except StopIteration as e:
+        return None, e.value
+
+
 # -----------------------------------------------------
 # stores all functions and kernels for a Python module
 # creates a hash of the function to use for checking
@@ -1873,6 +2234,9 @@ class Module:
             "cuda_output": None,  # supported values: "ptx", "cubin", or None (automatic)
             "mode": warp.config.mode,
             "block_dim": 256,
+            "cpu_parallel": True,
+            "cpu_vectorize": False,
+            "compile_unit": warp.config.compile_unit,
         }
 
         # Module dependencies are determined by scanning each function
@@ -1886,6 +2250,10 @@ class Module:
         self.references = set()  # modules whose content we depend on
         self.dependents = set()  # modules that depend on our content
 
+        # compilation units of the kernels when the module is compiled per kernel (kernel: KernelUnit),
+        # the units release their kernels along with Python GC, see ``get_kernel_unit()``
+        self.kernel_units = weakref.WeakKeyDictionary()
+
     def register_struct(self, struct):
         self.structs[struct.key] = struct
 
@@ -2017,7 +2385,86 @@ class Module:
         self.hashers[block_dim] = ModuleHasher(self)
         return self.hashers[block_dim].get_module_hash()
 
-    def load(self, device, block_dim=None) -> ModuleExec:
+    def is_compiled_per_kernel(self) -> bool:
+        compile_unit = self.options["compile_unit"]
+        if compile_unit not in ("module", "kernel"):
+            raise ValueError(
+                f"Invalid compile_unit option '{compile_unit}' in module '{self.name}', valid choices are \"module\" or \"kernel\""
+            )
+
+        return compile_unit == "kernel"
+
+    def get_kernel_unit(self, kernel) -> "KernelUnit":
+        """Returns the compilation unit of a non-generic kernel (or kernel overload) of this module."""
+        unit = self.kernel_units.get(kernel)
+        if unit is None:
+            unit = KernelUnit(self, kernel)
+            self.kernel_units[kernel] = unit
+
+        return unit
+
+    def get_compile_units(self) -> List["Module"]:
+        """Returns the units the module is compiled in, the module itself or one unit per kernel and kernel overload."""
+        if not self.is_compiled_per_kernel():
+            return [self]
+
+        units = []
+        for kernel in self.live_kernels:
+            instances = kernel.overloads.values() if kernel.is_generic else (kernel,)
+            for instance in instances:
+                if not instance.adj.skip_build:
+                    units.append(self.get_kernel_unit(instance))
+
+        return units
+
+    def load(self, device, block_dim=None, kernel=None) -> ModuleExec:
+        """Loads the module on a device, compiling it if needed.
+
+        If the module is compiled per kernel (see the ``compile_unit`` module option), only the unit of the given
+        non-generic ``kernel`` is loaded and returned.  Without a kernel, the units of all the kernels are loaded
+        and ``None`` is returned.
+        """
+
+        if self.is_compiled_per_kernel():
+            if kernel is not None:
+                return self.get_kernel_unit(kernel).load(device, block_dim)
+
+            for unit in self.get_compile_units():
+                unit.load(device, block_dim)
+
+            return None
+
+        # fast path for modules that are already loaded and not stale
+        active_block_dim = self.options["block_dim"] if block_dim is None else block_dim
+        hasher = self.hashers.get(active_block_dim)
+        if hasher is not None:
+            exec = self.execs.get((runtime.get_device(device).context, active_block_dim))
+            if exec is not None and exec.module_hash == hasher.get_module_hash():
+                self.options["block_dim"] = active_block_dim
+                return exec
+
+        loader = self.load_steps(device, block_dim)
+
+        # compile inline, force_load() may compile several modules concurrently instead
+        compile_step, module_exec = resume_module_load(loader)
+        if compile_step is not None:
+            try:
+                compile_step()
+            except Exception as e:
+                resume_module_load(loader, error=e)
+            else:
+                _, module_exec = resume_module_load(loader)
+
+        return module_exec
+
+    def load_steps(self, device, block_dim=None):
+        """Generator implementing :meth:`load`.
+
+        Yields a callable compiling the module if it needs to be built. The caller runs it, possibly on another
+        thread, and resumes the generator with ``send(None)``, or with ``throw()`` if compilation failed.
+        Returns the loaded :class:`ModuleExec`, or ``None`` if a previous build failed.
+        """
+
         device = runtime.get_device(device)
 
         # update module options if launching with a new block dim
@@ -2026,9 +2473,13 @@ class Module:
 
         active_block_dim = self.options["block_dim"]
 
-        # compute the hash if needed
+        # compute the hash if needed, modules that were loaded before may be found in the kernel cache index
         if active_block_dim not in self.hashers:
-            self.hashers[active_block_dim] = ModuleHasher(self)
+            hasher = None
+            if warp.config.kernel_cache_index and warp.config.cache_kernels:
+                hasher = load_module_index_hasher(self)
+
+            self.hashers[active_block_dim] = hasher or ModuleHasher(self)
 
         # check if executable module is already loaded and not stale
         exec = self.execs.get((device.context, active_block_dim))
@@ -2047,84 +2498,106 @@ class Module:
         module_name_short = f"{module_name}_{module_hash.hex()[:7]}"
         module_dir = os.path.join(warp.config.kernel_cache_dir, module_name_short)
 
-        with warp.ScopedTimer(
-            f"Module {self.name} {module_hash.hex()[:7]} load on device '{device}'", active=not warp.config.quiet
-        ) as module_load_timer:
-            # -----------------------------------------------------------
-            # determine output paths
-            if device.is_cpu:
+        # -----------------------------------------------------------
+        # determine output paths
+        if device.is_cpu:
+            if self.options["cpu_vectorize"]:
+                # vectorized modules are compiled for the host CPU's instruction set
+                output_name = f"{module_name_short}.{runtime.llvm_host_cpu}.o"
+            else:
                 output_name = f"{module_name_short}.o"
-                output_arch = None
-
-            elif device.is_cuda:
-                # determine whether to use PTX or CUBIN
-                if device.is_cubin_supported:
-                    # get user preference specified either per module or globally
-                    preferred_cuda_output = self.options.get("cuda_output") or warp.config.cuda_output
-                    if preferred_cuda_output is not None:
-                        use_ptx = preferred_cuda_output == "ptx"
-                    else:
-                        # determine automatically: older drivers may not be able to handle PTX generated using newer
-                        # CUDA Toolkits, in which case we fall back on generating CUBIN modules
-                        use_ptx = runtime.driver_version >= runtime.toolkit_version
+            output_arch = None
+
+        elif device.is_cuda:
+            # determine whether to use PTX or CUBIN
+            if device.is_cubin_supported:
+                # get user preference specified either per module or globally
+                preferred_cuda_output = self.options.get("cuda_output") or warp.config.cuda_output
+                if preferred_cuda_output is not None:
+                    use_ptx = preferred_cuda_output == "ptx"
                 else:
-                    # CUBIN not an option, must use PTX (e.g. CUDA Toolkit too old)
-                    use_ptx = True
-
-                if use_ptx:
-                    output_arch = min(device.arch, warp.config.ptx_target_arch)
-                    output_name = f"{module_name_short}.sm{output_arch}.ptx"
-                else:
-                    output_arch = device.arch
-                    output_name = f"{module_name_short}.sm{output_arch}.cubin"
+                    # determine automatically: older drivers may not be able to handle PTX generated using newer
+                    # CUDA Toolkits, in which case we fall back on generating CUBIN modules
+                    use_ptx = runtime.driver_version >= runtime.toolkit_version
+            else:
+                # CUBIN not an option, must use PTX (e.g. CUDA Toolkit too old)
+                use_ptx = True
 
-            # final object binary path
-            binary_path = os.path.join(module_dir, output_name)
+            if use_ptx:
+                output_arch = min(device.arch, warp.config.ptx_target_arch)
+                output_name = f"{module_name_short}.sm{output_arch}.ptx"
+            else:
+                output_arch = device.arch
+                output_name = f"{module_name_short}.sm{output_arch}.cubin"
 
-            # -----------------------------------------------------------
-            # check cache and build if necessary
+        # final object binary path
+        binary_path = os.path.join(module_dir, output_name)
 
-            build_dir = None
+        # a module hash from the kernel cache index can only be used to load an existing binary,
+        # building the module requires the data collected by a full hash
+        build_required = (
+            not os.path.exists(binary_path) or not warp.config.cache_kernels or warp.config.verify_autograd_array_access
+        )
 
-            # we always want to build if binary doesn't exist yet
-            # and we want to rebuild if we are not caching kernels or if we are tracking array access
-            if (
-                not os.path.exists(binary_path)
-                or not warp.config.cache_kernels
-                or warp.config.verify_autograd_array_access
+        # modules compiled ahead of time may be found in a read-only kernel cache archive,
+        # they are copied into the kernel cache like a module built by this process
+        if build_required and warp.config.cache_kernels and not warp.config.verify_autograd_array_access:
+            archive = warp.build.get_kernel_cache_archive()
+            if archive is not None and archive.extract(
+                module_name_short, module_hash, [output_name, f"{module_name_short}.meta"], module_dir
             ):
-                builder_options = {
-                    **self.options,
-                    # Some of the Tile codegen, such as cuFFTDx and cuBLASDx, requires knowledge of the target arch
-                    "output_arch": output_arch,
-                }
-                builder = ModuleBuilder(self, builder_options, hasher=self.hashers[active_block_dim])
-
-                # create a temporary (process unique) dir for build outputs before moving to the binary dir
-                build_dir = os.path.join(
-                    warp.config.kernel_cache_dir, f"{module_name}_{module_hash.hex()[:7]}_p{os.getpid()}"
-                )
+                build_required = False
 
-                # dir may exist from previous attempts / runs / archs
-                Path(build_dir).mkdir(parents=True, exist_ok=True)
+        if build_required and isinstance(self.hashers[active_block_dim], ModuleIndexHasher):
+            self.hashers[active_block_dim] = ModuleHasher(self)
+            return (yield from self.load_steps(device, block_dim))
+
+        # -----------------------------------------------------------
+        # generate code and compile if necessary
+
+        # the load timer is started before code generation but only entered after compilation, so that
+        # the timers of modules compiled concurrently (see force_load()) are not nested in each other
+        load_start = time.perf_counter_ns()
+
+        build_dir = None
+        build_error = None
+
+        # we always want to build if binary doesn't exist yet
+        # and we want to rebuild if we are not caching kernels or if we are tracking array access
+        if build_required:
+            builder_options = {
+                **self.options,
+                # Some of the Tile codegen, such as cuFFTDx and cuBLASDx, requires knowledge of the target arch
+                "output_arch": output_arch,
+            }
+            builder = ModuleBuilder(self, builder_options, hasher=self.hashers[active_block_dim])
+
+            # create a temporary (process and device unique) dir for build outputs before moving to the binary dir,
+            # the same module may be compiled for several devices concurrently
+            device_name = device.alias.replace(":", "")
+            build_dir = os.path.join(
+                warp.config.kernel_cache_dir,
+                f"{module_name}_{module_hash.hex()[:7]}_p{os.getpid()}_{device_name}",
+            )
 
-                module_load_timer.extra_msg = " (compiled)"  # For wp.ScopedTimer informational purposes
+            # dir may exist from previous attempts / runs / archs
+            Path(build_dir).mkdir(parents=True, exist_ok=True)
 
+            try:
                 # build CPU
                 if device.is_cpu:
-                    # build
-                    try:
-                        source_code_path = os.path.join(build_dir, f"{module_name_short}.cpp")
+                    source_code_path = os.path.join(build_dir, f"{module_name_short}.cpp")
 
-                        # write cpp sources
-                        cpp_source = builder.codegen("cpu")
+                    # write cpp sources
+                    cpp_source = builder.codegen("cpu")
 
-                        with open(source_code_path, "w") as cpp_file:
-                            cpp_file.write(cpp_source)
+                    with open(source_code_path, "w") as cpp_file:
+                        cpp_file.write(cpp_source)
 
-                        output_path = os.path.join(build_dir, output_name)
+                    output_path = os.path.join(build_dir, output_name)
 
-                        # build object code
+                    # build object code
+                    def compile_module():
                         with warp.ScopedTimer("Compile x86", active=warp.config.verbose):
                             warp.build.build_cpu(
                                 output_path,
@@ -2133,27 +2606,22 @@ class Module:
                                 fast_math=self.options["fast_math"],
                                 verify_fp=warp.config.verify_fp,
                                 fuse_fp=self.options["fuse_fp"],
+                                target_cpu="native" if self.options["cpu_vectorize"] else "generic",
                             )
 
-                    except Exception as e:
-                        self.failed_builds.add(None)
-                        module_load_timer.extra_msg = " (error)"
-                        raise (e)
-
                 elif device.is_cuda:
-                    # build
-                    try:
-                        source_code_path = os.path.join(build_dir, f"{module_name_short}.cu")
+                    source_code_path = os.path.join(build_dir, f"{module_name_short}.cu")
 
-                        # write cuda sources
-                        cu_source = builder.codegen("cuda")
+                    # write cuda sources
+                    cu_source = builder.codegen("cuda")
 
-                        with open(source_code_path, "w") as cu_file:
-                            cu_file.write(cu_source)
+                    with open(source_code_path, "w") as cu_file:
+                        cu_file.write(cu_source)
 
-                        output_path = os.path.join(build_dir, output_name)
+                    output_path = os.path.join(build_dir, output_name)
 
-                        # generate PTX or CUBIN
+                    # generate PTX or CUBIN
+                    def compile_module():
                         with warp.ScopedTimer("Compile CUDA", active=warp.config.verbose):
                             warp.build.build_cuda(
                                 source_code_path,
@@ -2168,10 +2636,28 @@ class Module:
                                 fatbins=builder.fatbins.values(),
                             )
 
-                    except Exception as e:
-                        self.failed_builds.add(device.context)
-                        module_load_timer.extra_msg = " (error)"
-                        raise (e)
+                # let the caller compile the module
+                yield compile_module
+
+            except Exception as e:
+                build_error = e
+
+        with warp.ScopedTimer(
+            f"Module {self.name} {module_hash.hex()[:7]} load on device '{device}'", active=not warp.config.quiet
+        ) as module_load_timer:
+            # include code generation and compilation
+            module_load_timer.start = load_start
+
+            # -----------------------------------------------------------
+            # update the cache with the build outputs
+
+            if build_required:
+                module_load_timer.extra_msg = " (compiled)"  # For wp.ScopedTimer informational purposes
+
+                if build_error is not None:
+                    self.failed_builds.add(device.context)
+                    module_load_timer.extra_msg = " (error)"
+                    raise build_error
 
                 # ------------------------------------------------------------
                 # build meta data
@@ -2268,6 +2754,14 @@ class Module:
                 # clean up build_dir used for this process regardless
                 shutil.rmtree(build_dir, ignore_errors=True)
 
+        # record the hashes so that subsequent processes can load the module without hashing it
+        if (
+            warp.config.kernel_cache_index
+            and warp.config.cache_kernels
+            and isinstance(self.hashers[active_block_dim], ModuleHasher)
+        ):
+            save_module_index(self, self.hashers[active_block_dim])
+
         return module_exec
 
     def unload(self):
@@ -2277,6 +2771,9 @@ class Module:
         # clear loaded modules
         self.execs = {}
 
+        for unit in list(self.kernel_units.values()):
+            unit.unload()
+
     def mark_modified(self):
         # clear hash data
         self.hashers = {}
@@ -2284,8 +2781,15 @@ class Module:
         # clear build failures
         self.failed_builds = set()
 
+        # kernels depend on the functions and structs of the module
+        for unit in list(self.kernel_units.values()):
+            unit.mark_modified()
+
     # lookup kernel entry points based on name, called after compilation / module load
     def get_kernel_hooks(self, kernel, device):
+        if self.is_compiled_per_kernel():
+            return self.get_kernel_unit(kernel).get_kernel_hooks(kernel, device)
+
         module_exec = self.execs.get((device.context, self.options["block_dim"]))
         if module_exec is not None:
             return module_exec.get_kernel_hooks(kernel)
@@ -2293,6 +2797,45 @@ class Module:
             raise RuntimeError(f"Module is not loaded on device {device}")
 
 
+class KernelUnit(Module):
+    """Compilation unit of a single kernel of a module compiled per kernel.
+
+    The unit is built from the kernel and the functions and structs it uses, it shares the options, functions,
+    structs, and references of its parent module.  Units are cached in the kernel cache like modules, under the name
+    of the parent module followed by the kernel key.
+    """
+
+    def __init__(self, module, kernel):
+        name = f"{module.name}.{kernel.key}"
+
+        # overloads of generic kernels share their key
+        if kernel.sig:
+            name += f"_{hashlib.sha256(bytes(kernel.sig, 'utf-8')).hexdigest()[:8]}"
+
+        super().__init__(name, module.loader)
+
+        self.parent = module
+        self.options = module.options
+
+        self.functions = module.functions
+        self.structs = module.structs
+        self.references = module.references
+
+        # the parent module holds a weak reference to the kernel, see ``Module.get_kernel_unit()``
+        self.kernel_ref = weakref.ref(kernel)
+
+    @property
+    def live_kernels(self):
+        kernel = self.kernel_ref()
+        return [kernel] if kernel is not None else []
+
+    def is_compiled_per_kernel(self) -> bool:
+        return False
+
+    def load(self, device, block_dim=None, kernel=None) -> ModuleExec:
+        return super().load(device, block_dim)
+
+
 # -------------------------------------------
 # execution context
 
@@ -2309,6 +2852,8 @@ class CpuDefaultAllocator:
         return ptr
 
     def free(self, ptr, size_in_bytes):
+        # like freeing CUDA memory, this waits for the pending work that may use the memory
+        synchronize_cpu_streams()
         runtime.core.free_host(ptr)
 
 
@@ -2324,6 +2869,7 @@ class CpuPinnedAllocator:
         return ptr
 
     def free(self, ptr, size_in_bytes):
+        synchronize_cpu_streams()
         runtime.core.free_pinned(ptr)
 
 
@@ -2394,7 +2940,7 @@ class ContextGuard:
 
 
 class Event:
-    """A CUDA event that can be recorded onto a stream.
+    """A CUDA or CPU event that can be recorded onto a stream.
 
     Events can be used for device-side synchronization, which do not block
     the host thread.
@@ -2411,15 +2957,17 @@ class Event:
         """Creates a new event instance."""
         instance = super(Event, cls).__new__(cls)
         instance.owner = False
+        instance.cuda_event = None
+        instance.cpu_event = None
         return instance
 
     def __init__(
         self, device: "Devicelike" = None, cuda_event=None, enable_timing: bool = False, interprocess: bool = False
     ):
-        """Initializes the event on a CUDA device.
+        """Initializes the event on a CUDA device or on the CPU.
 
         Args:
-            device: The CUDA device whose streams this event may be recorded onto.
+            device: The device whose streams this event may be recorded onto.
               If ``None``, then the current default device will be used.
             cuda_event: A pointer to a previously allocated CUDA event. If
               `None`, then a new event will be allocated on the associated device.
@@ -2428,6 +2976,7 @@ class Event:
               time between two events created with ``enable_timing=True`` and
               recorded onto streams.
             interprocess: If ``True`` this event may be used as an interprocess event.
+              Not supported on the CPU.
 
         Raises:
             RuntimeError: The event could not be created.
@@ -2436,11 +2985,18 @@ class Event:
         """
 
         device = get_device(device)
-        if not device.is_cuda:
-            raise RuntimeError(f"Device {device} is not a CUDA device")
 
         self.device = device
 
+        if device.is_cpu:
+            if interprocess:
+                raise RuntimeError(f"Interprocess events are not supported on device {device}")
+
+            # CPU events always record the time at which they complete
+            self.cpu_event = runtime.core.cpu_event_create()
+            self.owner = True
+            return
+
         if cuda_event is not None:
             self.cuda_event = cuda_event
         else:
@@ -2493,24 +3049,32 @@ class Event:
         if not self.owner:
             return
 
-        runtime.core.cuda_event_destroy(self.cuda_event)
+        if self.cpu_event:
+            runtime.core.cpu_event_destroy(self.cpu_event)
+        else:
+            runtime.core.cuda_event_destroy(self.cuda_event)
 
 
 class Stream:
     def __new__(cls, *args, **kwargs):
         instance = super(Stream, cls).__new__(cls)
         instance.cuda_stream = None
+        instance.cpu_stream = None
         instance.owner = False
         return instance
 
     def __init__(self, device: Optional[Union["Device", str]] = None, priority: int = 0, **kwargs):
         """Initialize the stream on a device with an optional specified priority.
 
+        Streams created on the CPU execute their work asynchronously with respect to the
+        calling thread, in order, on a worker thread owned by the stream. Kernels are
+        still split across the host worker pool when multi-threading is enabled.
+
         Args:
-            device: The CUDA device on which this stream will be created.
+            device: The CUDA device or CPU on which this stream will be created.
             priority: An optional integer specifying the requested stream priority.
               Can be -1 (high priority) or 0 (low/default priority).
-              Values outside this range will be clamped.
+              Values outside this range will be clamped. Ignored on the CPU.
             cuda_stream (int): A optional external stream handle passed as an
               integer. The caller is responsible for ensuring that the external
               stream does not get destroyed while it is referenced by this
@@ -2520,7 +3084,6 @@ class Stream:
             RuntimeError: If function is called before Warp has completed
               initialization with a ``device`` that is not an instance of
               :class:`Device``.
-            RuntimeError: ``device`` is not a CUDA Device.
             RuntimeError: The stream could not be created on the device.
             TypeError: The requested stream priority is not an integer.
         """
@@ -2535,11 +3098,21 @@ class Stream:
                 "A Device object is required when creating a stream before or during Warp initialization"
             )
 
-        if not device.is_cuda:
-            raise RuntimeError(f"Device {device} is not a CUDA device")
-
         self.device = device
 
+        if device.is_cpu:
+            if not isinstance(priority, int):
+                raise TypeError("Stream priority must be an integer.")
+
+            # the synchronous stream of the CPU executes work on the calling thread
+            if not kwargs.get("synchronous", False):
+                self.cpu_stream = device.runtime.core.cpu_stream_create()
+                if not self.cpu_stream:
+                    raise RuntimeError(f"Failed to create stream on device {device}")
+                self.owner = True
+                device.runtime.cpu_stream_count += 1
+            return
+
         # we pass cuda_stream through kwargs because cuda_stream=None is actually a valid value (CUDA default stream)
         if "cuda_stream" in kwargs:
             self.cuda_stream = kwargs["cuda_stream"]
@@ -2555,6 +3128,12 @@ class Stream:
             self.owner = True
 
     def __del__(self):
+        if self.cpu_stream:
+            # the remaining work is executed before the stream is destroyed
+            runtime.core.cpu_stream_destroy(self.cpu_stream)
+            runtime.cpu_stream_count -= 1
+            return
+
         if not self.cuda_stream:
             return
 
@@ -2587,16 +3166,26 @@ class Stream:
                 f"Event from device {event.device} cannot be recorded on stream from device {self.device}"
             )
 
-        runtime.core.cuda_event_record(event.cuda_event, self.cuda_stream)
+        if self.device.is_cpu:
+            # the commands of a CPU graph are replayed in order, events are not recorded during capture
+            if not self.device.captures:
+                runtime.core.cpu_event_record(event.cpu_event, self.cpu_stream)
+        else:
+            runtime.core.cuda_event_record(event.cuda_event, self.cuda_stream)
 
         return event
 
     def wait_event(self, event: Event):
         """Makes all future work in this stream wait until `event` has completed.
 
-        This function does not block the host thread.
+        This function does not block the host thread, except when called on the
+        synchronous stream of the CPU, which executes work on the calling thread.
         """
-        runtime.core.cuda_stream_wait_event(self.cuda_stream, event.cuda_event)
+        if self.device.is_cpu:
+            if not self.device.captures:
+                runtime.core.cpu_stream_wait_event(self.cpu_stream, event.cpu_event)
+        else:
+            runtime.core.cuda_stream_wait_event(self.cuda_stream, event.cuda_event)
 
     def wait_stream(self, other_stream: "Stream", event: Optional[Event] = None):
         """Records an event on `other_stream` and makes this stream wait on it.
@@ -2619,18 +3208,93 @@ class Stream:
         if event is None:
             event = other_stream.cached_event
 
-        runtime.core.cuda_stream_wait_stream(self.cuda_stream, other_stream.cuda_stream, event.cuda_event)
+        if self.device.is_cpu:
+            # work on the synchronous stream is complete when it returns
+            if other_stream.cpu_stream:
+                other_stream.record_event(event)
+                self.wait_event(event)
+        else:
+            runtime.core.cuda_stream_wait_stream(self.cuda_stream, other_stream.cuda_stream, event.cuda_event)
 
     @property
     def is_capturing(self) -> bool:
         """A boolean indicating whether a graph capture is currently ongoing on this stream."""
+        if self.device.is_cpu:
+            # CPU graphs are captured on the device
+            return bool(self.device.captures)
+
         return bool(runtime.core.cuda_stream_is_capturing(self.cuda_stream))
 
     @property
     def priority(self) -> int:
         """An integer representing the priority of the stream."""
+        if self.device.is_cpu:
+            return 0
+
         return runtime.core.cuda_stream_get_priority(self.cuda_stream)
 
+    @property
+    def is_synchronous(self) -> bool:
+        """A boolean indicating whether the stream executes work on the calling thread.
+
+        This is only the case for the synchronous stream of the CPU, which is its default stream.
+        """
+        return self.device.is_cpu and not self.cpu_stream
+
+    # submits commands to an asynchronous CPU stream, the cpu_graph_add_*() functions accept streams
+    def add_cpu_kernel(self, kernel, hooks, range_hook, params, adjoint=False):
+        if range_hook is None:
+            raise RuntimeError(
+                f"Failed to launch kernel '{kernel.key}' on a CPU stream, the module '{kernel.module.name}' was "
+                "compiled without the required entry points by an earlier build, clear the kernel cache to rebuild it"
+            )
+
+        addrs = (ctypes.c_void_p * len(params))(*[ctypes.addressof(x) for x in params])
+        sizes = (ctypes.c_size_t * len(params))(*[ctypes.sizeof(x) for x in params])
+
+        # launches are only tagged while timing is active, unlike the launches recorded by graphs
+        tag = get_cpu_timing_tag(kernel, hooks, params, adjoint) if runtime.cpu_timing_flags else 0
+
+        runtime.sync_cpu_num_threads()
+        runtime.core.cpu_graph_add_kernel(
+            self.cpu_stream, range_hook, params[0].size, addrs, sizes, len(params), hooks.cpu_parallel, tag
+        )
+
+    def add_cpu_memset(self, ptr, value, size):
+        runtime.core.cpu_graph_add_memset(self.cpu_stream, ptr, value, size)
+
+    def add_cpu_memtile(self, ptr, src, srcsize, reps):
+        runtime.core.cpu_graph_add_memtile(self.cpu_stream, ptr, src, srcsize, reps)
+
+    def add_cpu_memcpy(self, dst, src, size):
+        runtime.core.cpu_graph_add_memcpy(self.cpu_stream, dst, src, size)
+
+    def add_cpu_array_copy(self, dst_desc, src_desc, dst_type, src_type, elem_size):
+        runtime.core.cpu_graph_add_array_copy(
+            self.cpu_stream,
+            ctypes.addressof(dst_desc),
+            ctypes.addressof(src_desc),
+            dst_type,
+            src_type,
+            ctypes.sizeof(dst_desc),
+            ctypes.sizeof(src_desc),
+            elem_size,
+        )
+
+    def add_cpu_array_fill(self, desc, arr_type, value):
+        runtime.core.cpu_graph_add_array_fill(
+            self.cpu_stream,
+            ctypes.addressof(desc),
+            arr_type,
+            ctypes.sizeof(desc),
+            ctypes.addressof(value),
+            ctypes.sizeof(value),
+        )
+
+    # memory referenced by pending commands stays alive since freeing CPU memory synchronizes the CPU streams
+    def retain_objects(self, objects):
+        pass
+
 
 class Device:
     """A device to allocate Warp arrays and to launch kernels on.
@@ -2680,6 +3344,9 @@ class Device:
         # maps streams to started graph captures
         self.captures = {}
 
+        # task graph recording the operations issued on the device by a warp.ScopedSchedule
+        self.task_graph = None
+
         self.context_guard = ContextGuard(self)
 
         if self.ordinal == -1:
@@ -2694,9 +3361,29 @@ class Device:
             self.uuid = None
             self.pci_bus_id = None
 
+            # the synchronous stream executes work on the calling thread, it is the default stream of the CPU
+            self.null_stream = Stream(self, synchronous=True)
+            self._stream = self.null_stream
+
             # TODO: add more device-specific dispatch functions
-            self.memset = runtime.core.memset_host
-            self.memtile = runtime.core.memtile_host
+            # memory operations are recorded instead of executed while a CPU graph is being captured,
+            # and submitted to the current stream if it is asynchronous
+            def memset(ptr, value, size):
+                target = get_cpu_command_target(self)
+                if target is not None:
+                    target.add_cpu_memset(ptr, value, size)
+                else:
+                    runtime.core.memset_host(ptr, value, size)
+
+            def memtile(ptr, src, srcsize, reps):
+                target = get_cpu_command_target(self)
+                if target is not None:
+                    target.add_cpu_memtile(ptr, src, srcsize, reps)
+                else:
+                    runtime.core.memtile_host(ptr, src, srcsize, reps)
+
+            self.memset = memset
+            self.memtile = memtile
 
             self.default_allocator = CpuDefaultAllocator(self)
             self.pinned_allocator = CpuPinnedAllocator(self)
@@ -2802,7 +3489,8 @@ class Device:
             # device and whether the current stream is capturing.
             return self.captures or self.stream.is_capturing
         else:
-            return False
+            # CPU graphs are captured on the device itself
+            return bool(self.captures)
 
     @property
     def context(self):
@@ -2829,22 +3517,21 @@ class Device:
 
     @property
     def stream(self) -> Stream:
-        """The stream associated with a CUDA device.
+        """The current stream of the device.
 
-        Raises:
-            RuntimeError: The device is not a CUDA device.
+        The current stream of the CPU is its synchronous stream unless another stream was set.
         """
-        if self.context:
+        if self.is_cpu or self.context:
             return self._stream
         else:
-            raise RuntimeError(f"Device {self} is not a CUDA device")
+            raise RuntimeError(f"Device {self} has no stream")
 
     @stream.setter
     def stream(self, stream):
         self.set_stream(stream)
 
     def set_stream(self, stream: Stream, sync: bool = True) -> None:
-        """Set the current stream for this CUDA device.
+        """Set the current stream for this device.
 
         The current stream will be used by default for all kernel launches and
         memory operations on this device.
@@ -2866,7 +3553,13 @@ class Device:
             self.runtime.core.cuda_context_set_stream(self.context, stream.cuda_stream, int(sync))
             self._stream = stream
         else:
-            raise RuntimeError(f"Device {self} is not a CUDA device")
+            if stream.device != self:
+                raise RuntimeError(f"Stream from device {stream.device} cannot be used on device {self}")
+
+            if sync:
+                stream.wait_stream(self._stream)
+
+            self._stream = stream
 
     @property
     def has_stream(self) -> bool:
@@ -2953,10 +3646,19 @@ class Graph:
         self.capture_id = capture_id
         self.module_execs = set()
 
+        # arrays and other objects referenced by the commands of a CPU graph
+        self.retained_objects = []
+
     def __del__(self):
         if not self.graph_exec:
             return
 
+        if self.device.is_cpu:
+            # the graph may have been launched on an asynchronous stream
+            synchronize_cpu_streams()
+            runtime.core.cpu_graph_destroy(self.graph_exec)
+            return
+
         # use CUDA context guard to avoid side effects during garbage collection
         with self.device.context_guard:
             runtime.core.cuda_graph_destroy(self.device.context, self.graph_exec)
@@ -2965,6 +3667,72 @@ class Graph:
     def retain_module_exec(self, module_exec: ModuleExec):
         self.module_execs.add(module_exec)
 
+    # retain objects referenced by the commands of a CPU graph, which prevents their memory from being freed
+    def retain_objects(self, objects):
+        self.retained_objects.extend(objects)
+
+    @property
+    def num_commands(self) -> int:
+        """The number of commands recorded in a CPU graph."""
+        if not self.device.is_cpu:
+            raise RuntimeError("The commands of CUDA graphs are not tracked")
+
+        return runtime.core.cpu_graph_get_num_commands(self.graph_exec)
+
+    # records a CPU kernel launch, params[0] holds the launch bounds followed by the packed kernel arguments
+    def add_cpu_kernel(self, kernel, hooks, range_hook, params, adjoint=False):
+        if range_hook is None:
+            raise RuntimeError(
+                f"Failed to capture kernel '{kernel.key}' in a CPU graph, the module '{kernel.module.name}' was compiled "
+                "without the required entry points by an earlier build, clear the kernel cache to rebuild it"
+            )
+
+        addrs = (ctypes.c_void_p * len(params))(*[ctypes.addressof(x) for x in params])
+        sizes = (ctypes.c_size_t * len(params))(*[ctypes.sizeof(x) for x in params])
+
+        runtime.core.cpu_graph_add_kernel(
+            self.graph_exec,
+            range_hook,
+            params[0].size,
+            addrs,
+            sizes,
+            len(params),
+            hooks.cpu_parallel,
+            get_cpu_timing_tag(kernel, hooks, params, adjoint),
+        )
+
+    # records host memory operations, the values and array descriptors are copied
+    def add_cpu_memset(self, ptr, value, size):
+        runtime.core.cpu_graph_add_memset(self.graph_exec, ptr, value, size)
+
+    def add_cpu_memtile(self, ptr, src, srcsize, reps):
+        runtime.core.cpu_graph_add_memtile(self.graph_exec, ptr, src, srcsize, reps)
+
+    def add_cpu_memcpy(self, dst, src, size):
+        runtime.core.cpu_graph_add_memcpy(self.graph_exec, dst, src, size)
+
+    def add_cpu_array_copy(self, dst_desc, src_desc, dst_type, src_type, elem_size):
+        runtime.core.cpu_graph_add_array_copy(
+            self.graph_exec,
+            ctypes.addressof(dst_desc),
+            ctypes.addressof(src_desc),
+            dst_type,
+            src_type,
+            ctypes.sizeof(dst_desc),
+            ctypes.sizeof(src_desc),
+            elem_size,
+        )
+
+    def add_cpu_array_fill(self, desc, arr_type, value):
+        runtime.core.cpu_graph_add_array_fill(
+            self.graph_exec,
+            ctypes.addressof(desc),
+            arr_type,
+            ctypes.sizeof(desc),
+            ctypes.addressof(value),
+            ctypes.sizeof(value),
+        )
+
 
 class Runtime:
     def __init__(self):
@@ -2996,8 +3764,17 @@ class Runtime:
             self.llvm = self.load_dll(llvm_lib)
             # setup c-types for warp-clang.dll
             self.llvm.lookup.restype = ctypes.c_uint64
+
+            # name of the host CPU that vectorized CPU modules are compiled for, libraries
+            # predating native code generation always target the generic CPU
+            if hasattr(self.llvm, "host_cpu_name"):
+                self.llvm.host_cpu_name.restype = ctypes.c_char_p
+                self.llvm_host_cpu = self.llvm.host_cpu_name().decode("utf-8")
+            else:
+                self.llvm_host_cpu = "generic"
         else:
             self.llvm = None
+            self.llvm_host_cpu = None
 
         # maps capture ids to graphs
         self.captures = {}
@@ -3054,6 +3831,112 @@ class Runtime:
             ]
             self.core.memtile_device.restype = None
 
+            self.core.cpu_set_num_threads.argtypes = [ctypes.c_int]
+            self.core.cpu_set_num_threads.restype = None
+            self.core.cpu_get_num_threads.argtypes = []
+            self.core.cpu_get_num_threads.restype = ctypes.c_int
+            self.core.cpu_launch_kernel.argtypes = [ctypes.c_uint64, ctypes.c_size_t, ctypes.POINTER(ctypes.c_void_p)]
+            self.core.cpu_launch_kernel.restype = None
+            self.core.cpu_launch_kernels.argtypes = [
+                ctypes.c_int,
+                ctypes.POINTER(ctypes.c_uint64),
+                ctypes.POINTER(ctypes.c_bool),
+                ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p)),
+                ctypes.POINTER(ctypes.c_uint64),
+            ]
+            self.core.cpu_launch_kernels.restype = None
+
+            self.core.cpu_timing_begin.argtypes = [ctypes.c_int, ctypes.c_bool]
+            self.core.cpu_timing_begin.restype = None
+            self.core.cpu_timing_get_result_count.argtypes = []
+            self.core.cpu_timing_get_result_count.restype = int
+            self.core.cpu_timing_end.argtypes = []
+            self.core.cpu_timing_end.restype = None
+
+            self.core.cpu_graph_create.argtypes = []
+            self.core.cpu_graph_create.restype = ctypes.c_void_p
+            self.core.cpu_graph_destroy.argtypes = [ctypes.c_void_p]
+            self.core.cpu_graph_destroy.restype = None
+            self.core.cpu_graph_get_num_commands.argtypes = [ctypes.c_void_p]
+            self.core.cpu_graph_get_num_commands.restype = ctypes.c_int
+            self.core.cpu_graph_add_kernel.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_uint64,
+                ctypes.c_size_t,
+                ctypes.POINTER(ctypes.c_void_p),
+                ctypes.POINTER(ctypes.c_size_t),
+                ctypes.c_int,
+                ctypes.c_bool,
+                ctypes.c_uint64,
+            ]
+            self.core.cpu_graph_add_kernel.restype = None
+            self.core.cpu_graph_add_memcpy.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_size_t,
+            ]
+            self.core.cpu_graph_add_memcpy.restype = None
+            self.core.cpu_graph_add_memset.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int, ctypes.c_size_t]
+            self.core.cpu_graph_add_memset.restype = None
+            self.core.cpu_graph_add_memtile.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_size_t,
+                ctypes.c_size_t,
+            ]
+            self.core.cpu_graph_add_memtile.restype = None
+            self.core.cpu_graph_add_array_copy.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.c_int,
+                ctypes.c_size_t,
+                ctypes.c_size_t,
+                ctypes.c_int,
+            ]
+            self.core.cpu_graph_add_array_copy.restype = None
+            self.core.cpu_graph_add_array_fill.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.c_size_t,
+                ctypes.c_void_p,
+                ctypes.c_int,
+            ]
+            self.core.cpu_graph_add_array_fill.restype = None
+            self.core.cpu_graph_launch.argtypes = [ctypes.c_void_p]
+            self.core.cpu_graph_launch.restype = None
+
+            self.core.cpu_stream_create.argtypes = []
+            self.core.cpu_stream_create.restype = ctypes.c_void_p
+            self.core.cpu_stream_destroy.argtypes = [ctypes.c_void_p]
+            self.core.cpu_stream_destroy.restype = None
+            self.core.cpu_stream_synchronize.argtypes = [ctypes.c_void_p]
+            self.core.cpu_stream_synchronize.restype = None
+            self.core.cpu_stream_query.argtypes = [ctypes.c_void_p]
+            self.core.cpu_stream_query.restype = ctypes.c_int
+            self.core.cpu_stream_synchronize_all.argtypes = []
+            self.core.cpu_stream_synchronize_all.restype = None
+            self.core.cpu_stream_launch_graph.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+            self.core.cpu_stream_launch_graph.restype = None
+            self.core.cpu_stream_wait_event.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+            self.core.cpu_stream_wait_event.restype = None
+            self.core.cpu_event_create.argtypes = []
+            self.core.cpu_event_create.restype = ctypes.c_void_p
+            self.core.cpu_event_destroy.argtypes = [ctypes.c_void_p]
+            self.core.cpu_event_destroy.restype = None
+            self.core.cpu_event_record.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+            self.core.cpu_event_record.restype = None
+            self.core.cpu_event_query.argtypes = [ctypes.c_void_p]
+            self.core.cpu_event_query.restype = ctypes.c_int
+            self.core.cpu_event_synchronize.argtypes = [ctypes.c_void_p]
+            self.core.cpu_event_synchronize.restype = None
+            self.core.cpu_event_elapsed_time.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+            self.core.cpu_event_elapsed_time.restype = ctypes.c_float
+
             self.core.memcpy_h2h.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
             self.core.memcpy_h2h.restype = ctypes.c_bool
             self.core.memcpy_h2d.argtypes = [
@@ -3193,6 +4076,9 @@ class Runtime:
             self.core.radix_sort_pairs_int_host.argtypes = [ctypes.c_uint64, ctypes.c_uint64, ctypes.c_int]
             self.core.radix_sort_pairs_int_device.argtypes = [ctypes.c_uint64, ctypes.c_uint64, ctypes.c_int]
 
+            self.core.radix_sort_pairs_int64_host.argtypes = [ctypes.c_uint64, ctypes.c_uint64, ctypes.c_int]
+            self.core.radix_sort_pairs_int64_device.argtypes = [ctypes.c_uint64, ctypes.c_uint64, ctypes.c_int]
+
             self.core.radix_sort_pairs_float_host.argtypes = [ctypes.c_uint64, ctypes.c_uint64, ctypes.c_int]
             self.core.radix_sort_pairs_float_device.argtypes = [ctypes.c_uint64, ctypes.c_uint64, ctypes.c_int]
 
@@ -3267,7 +4153,7 @@ class Runtime:
             self.core.hash_grid_create_host.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
             self.core.hash_grid_create_host.restype = ctypes.c_uint64
             self.core.hash_grid_destroy_host.argtypes = [ctypes.c_uint64]
-            self.core.hash_grid_update_host.argtypes = [ctypes.c_uint64, ctypes.c_float, ctypes.c_void_p]
+            self.core.hash_grid_update_host.argtypes = [ctypes.c_uint64, ctypes.c_float, ctypes.c_void_p, ctypes.c_bool]
             self.core.hash_grid_reserve_host.argtypes = [ctypes.c_uint64, ctypes.c_int]
 
             self.core.hash_grid_create_device.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
@@ -3306,26 +4192,69 @@ class Runtime:
                 ctypes.c_uint64,
                 ctypes.c_void_p,
             ]
-            self.core.volume_destroy_host.argtypes = [ctypes.c_uint64]
-
-            self.core.volume_create_device.argtypes = [
-                ctypes.c_void_p,
+            self.core.volume_destroy_host.argtypes = [ctypes.c_uint64]
+
+            self.core.volume_create_device.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.c_uint64,
+                ctypes.c_bool,
+                ctypes.c_bool,
+            ]
+            self.core.volume_create_device.restype = ctypes.c_uint64
+            self.core.volume_get_tiles_device.argtypes = [
+                ctypes.c_uint64,
+                ctypes.c_void_p,
+            ]
+            self.core.volume_get_voxels_device.argtypes = [
+                ctypes.c_uint64,
+                ctypes.c_void_p,
+            ]
+            self.core.volume_destroy_device.argtypes = [ctypes.c_uint64]
+
+            self.core.volume_f_from_tiles_host.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.c_float * 9,
+                ctypes.c_float * 3,
+                ctypes.c_bool,
+                ctypes.c_float,
+            ]
+            self.core.volume_f_from_tiles_host.restype = ctypes.c_uint64
+            self.core.volume_v_from_tiles_host.argtypes = [
                 ctypes.c_void_p,
-                ctypes.c_uint64,
+                ctypes.c_int,
+                ctypes.c_float * 9,
+                ctypes.c_float * 3,
                 ctypes.c_bool,
+                ctypes.c_float * 3,
+            ]
+            self.core.volume_v_from_tiles_host.restype = ctypes.c_uint64
+            self.core.volume_i_from_tiles_host.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.c_float * 9,
+                ctypes.c_float * 3,
                 ctypes.c_bool,
+                ctypes.c_int,
             ]
-            self.core.volume_create_device.restype = ctypes.c_uint64
-            self.core.volume_get_tiles_device.argtypes = [
-                ctypes.c_uint64,
+            self.core.volume_i_from_tiles_host.restype = ctypes.c_uint64
+            self.core.volume_index_from_tiles_host.argtypes = [
                 ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.c_float * 9,
+                ctypes.c_float * 3,
+                ctypes.c_bool,
             ]
-            self.core.volume_get_voxels_device.argtypes = [
-                ctypes.c_uint64,
+            self.core.volume_index_from_tiles_host.restype = ctypes.c_uint64
+            self.core.volume_from_active_voxels_host.argtypes = [
                 ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.c_float * 9,
+                ctypes.c_float * 3,
+                ctypes.c_bool,
             ]
-            self.core.volume_destroy_device.argtypes = [ctypes.c_uint64]
-
+            self.core.volume_from_active_voxels_host.restype = ctypes.c_uint64
             self.core.volume_f_from_tiles_device.argtypes = [
                 ctypes.c_void_p,
                 ctypes.c_void_p,
@@ -3702,6 +4631,17 @@ class Runtime:
                 ctypes.c_void_p,
             ]
             self.core.cuda_launch_kernel.restype = ctypes.c_size_t
+            self.core.cuda_launch_kernels.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.POINTER(ctypes.c_void_p),
+                ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p)),
+                ctypes.c_void_p,
+            ]
+            self.core.cuda_launch_kernels.restype = ctypes.c_size_t
 
             self.core.cuda_graphics_map.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
             self.core.cuda_graphics_map.restype = None
@@ -3756,6 +4696,22 @@ class Runtime:
         self.device_map = {}  # device lookup by alias
         self.context_map = {}  # device lookup by context
 
+        # size of the host worker pool, synchronized lazily with warp.config.cpu_num_threads
+        self.cpu_num_threads_config = 1
+        self.cpu_num_threads = 1
+
+        # filters of the open CPU timing scopes and flags of the innermost one, see warp.timing_begin()
+        self.cpu_timing_filters = []
+        self.cpu_timing_flags = 0
+
+        # kernel launches are identified in the CPU timing results by a tag mapping
+        # to the activity name and the number of bytes of the array arguments
+        self.cpu_timing_tags = {}
+        self.cpu_timing_activities = [None]
+
+        # number of asynchronous CPU streams that are alive, see synchronize_cpu_streams()
+        self.cpu_stream_count = 0
+
         # register CPU device
         cpu_name = platform.processor()
         if not cpu_name:
@@ -3966,6 +4922,40 @@ class Runtime:
     def get_error_string(self):
         return self.core.get_error_string().decode("utf-8")
 
+    def sync_cpu_num_threads(self):
+        """Apply :attr:`warp.config.cpu_num_threads` to the host worker pool and return its number of threads.
+
+        The pool is only resized when the setting changed since the last call, this is called before submitting
+        work to the pool, i.e. CPU kernel launches and the host implementations of the utilities and geometry types.
+        """
+        if warp.config.cpu_num_threads != self.cpu_num_threads_config:
+            self.core.cpu_set_num_threads(warp.config.cpu_num_threads)
+            self.cpu_num_threads_config = warp.config.cpu_num_threads
+            self.cpu_num_threads = self.core.cpu_get_num_threads()
+
+        return self.cpu_num_threads
+
+    def begin_host_operation(self, device, name):
+        """Prepare to run the host implementation of a utility or geometry type, e.g. ``wp.utils.radix_sort_pairs()``.
+
+        Host operations run immediately on the calling thread instead of being recorded by graphs, so they raise a
+        ``RuntimeError`` while a graph is being captured on the CPU device ``device``. Otherwise, the current stream of
+        the CPU device is synchronized so that the operation is ordered after the work already submitted to it.
+        """
+        if device.is_cpu:
+            if device.captures:
+                raise RuntimeError(
+                    f"{name} cannot be captured in a CPU graph because it runs on the host immediately, "
+                    "call it before wp.capture_begin() or after wp.capture_end()"
+                )
+
+            # work on the synchronous stream is complete when it returns
+            stream = device.stream
+            if stream.cpu_stream:
+                self.core.cpu_stream_synchronize(stream.cpu_stream)
+
+        self.sync_cpu_num_threads()
+
     def load_dll(self, dll_path):
         try:
             dll = ctypes.CDLL(dll_path, winmode=0)
@@ -4479,9 +5469,6 @@ def get_stream(device: Devicelike = None) -> Stream:
         device: An optional :class:`Device` instance or device alias
           (e.g. "cuda:0") for which the current stream will be returned.
           If ``None``, the default device will be used.
-
-    Raises:
-        RuntimeError: The device is not a CUDA device.
     """
 
     return get_device(device).stream
@@ -4548,6 +5535,9 @@ def get_event_elapsed_time(start_event: Event, end_event: Event, synchronize: Op
     if synchronize:
         synchronize_event(end_event)
 
+    if end_event.device.is_cpu:
+        return runtime.core.cpu_event_elapsed_time(start_event.cpu_event, end_event.cpu_event)
+
     return runtime.core.cuda_event_elapsed_time(start_event.cuda_event, end_event.cuda_event)
 
 
@@ -5184,6 +6174,224 @@ def pack_arg(kernel, arg_type, arg_name, value, device, adjoint=False):
             ) from e
 
 
+# returns a function packing values of the given type for a kernel argument, with the checks
+# that only depend on the type of the values resolved ahead of time, or a scalar ctype if
+# the values can be written in place into a reused parameter
+def get_arg_packer(kernel, arg_type, arg_name, value_type, device):
+    def pack_any(value):
+        return pack_arg(kernel, arg_type, arg_name, value, device)
+
+    if warp.types.is_array(arg_type):
+        if value_type is warp.types.array and type(arg_type) is warp.types.array:
+            dtype = arg_type.dtype
+            ndim = arg_type.ndim
+
+            def pack_array(value):
+                if value.dtype is dtype and value.ndim == ndim and value.device is device:
+                    return value.__ctype__()
+                else:
+                    return pack_arg(kernel, arg_type, arg_name, value, device)
+
+            return pack_array
+
+    elif isinstance(arg_type, warp.codegen.Struct):
+        if value_type is warp.codegen.StructInstance:
+            return value_type.__ctype__
+
+    elif issubclass(arg_type, ctypes.Array):
+        if value_type is arg_type:
+            return lambda value: value
+
+    elif arg_type in warp.types.int_types or arg_type is warp.types.bool:
+        if value_type in (int, bool):
+            return arg_type._type_
+
+    elif arg_type in (warp.types.float32, warp.types.float64):
+        if value_type in (float, int, bool):
+            return arg_type._type_
+
+    return pack_any
+
+
+class LaunchPacker:
+    """Packs the arguments of kernel launches on a device for a given list of argument value types.
+
+    The packed parameters are written to buffers that are reused by subsequent launches. Buffers are
+    taken with :meth:`pack` and must be returned with :meth:`release` once the launch has been submitted,
+    so that concurrent launches from several threads use separate buffers.
+    """
+
+    def __init__(self, kernel, device, value_types):
+        self.packers = []
+        self.scalar_types = []
+
+        for arg, value_type in zip(kernel.adj.args, value_types):
+            packer = get_arg_packer(kernel, arg.type, arg.label, value_type, device)
+            if isinstance(packer, type):
+                self.packers.append(None)
+                self.scalar_types.append(packer)
+            else:
+                self.packers.append(packer)
+                self.scalar_types.append(None)
+
+        self.buffers = []
+
+    def pack(self, bounds, args):
+        """Returns the params and the array of param addresses for a launch."""
+
+        try:
+            params, params_addr = self.buffers.pop()
+        except IndexError:
+            params = [bounds]
+            params_addr = (ctypes.c_void_p * (len(self.packers) + 1))()
+
+            # scalar params are allocated once and updated in place
+            for i, scalar_type in enumerate(self.scalar_types):
+                params.append(scalar_type() if scalar_type is not None else None)
+                if scalar_type is not None:
+                    params_addr[i + 1] = ctypes.addressof(params[i + 1])
+
+        params[0] = bounds
+        params_addr[0] = ctypes.addressof(bounds)
+
+        for i, (packer, value) in enumerate(zip(self.packers, args), 1):
+            if packer is None:
+                params[i].value = value
+            else:
+                carg = packer(value)
+                params[i] = carg
+                params_addr[i] = ctypes.addressof(carg)
+
+        return params, params_addr
+
+    def release(self, params, params_addr):
+        self.buffers.append((params, params_addr))
+
+
+# returns the tag identifying a CPU kernel launch in the CPU timing results,
+# launches of a kernel that access the same number of bytes share a tag
+def get_cpu_timing_tag(kernel, hooks, params, adjoint=False):
+    num_args = len(kernel.adj.args)
+    array_access = hooks.array_access
+
+    array_bytes = 0
+    bytes_read = 0
+    bytes_written = 0
+
+    # params[0] holds the launch bounds, the adjoint arguments follow the forward arguments
+    for i, param in enumerate(params[1:]):
+        arg_type = kernel.adj.args[i % num_args].type
+        if not warp.types.is_array(arg_type):
+            continue
+
+        if hasattr(param, "shape"):
+            size = math.prod(param.shape[: arg_type.ndim])
+        else:
+            size = param.size
+
+        num_bytes = size * warp.types.type_size_in_bytes(arg_type.dtype)
+        array_bytes += num_bytes
+
+        # arrays of unknown access are assumed to be read and written
+        access = array_access[i % num_args] if array_access else ARRAY_READ | ARRAY_WRITE
+
+        if i < num_args:
+            # forward arrays are accessed in the same way by the backward pass, which replays the forward pass
+            read = access & ARRAY_READ
+            write = access & ARRAY_WRITE and not adjoint
+        else:
+            # adjoints of the arrays read by the forward pass are accumulated, the others are read
+            read = access & (ARRAY_READ | ARRAY_WRITE)
+            write = access & ARRAY_READ
+
+        if read:
+            bytes_read += num_bytes
+        if write:
+            bytes_written += num_bytes
+
+    key = (kernel.key, adjoint, array_bytes, bytes_read, bytes_written)
+
+    tag = runtime.cpu_timing_tags.get(key)
+    if tag is None:
+        name = f"backward kernel {kernel.key}" if adjoint else f"forward kernel {kernel.key}"
+        tag = len(runtime.cpu_timing_activities)
+        runtime.cpu_timing_tags[key] = tag
+        runtime.cpu_timing_activities.append((name, array_bytes, bytes_read, bytes_written))
+
+    return tag
+
+
+# returns the CPU graph being captured on the device or the asynchronous CPU stream that work should be
+# submitted to, or None if the work is executed by the calling thread; the stream defaults to the current stream
+def get_cpu_command_target(device, stream=None):
+    if device.captures:
+        return device.captures[None]
+
+    if stream is None:
+        stream = device._stream
+
+    if stream.cpu_stream:
+        return stream
+
+    return None
+
+
+# waits for the work submitted to asynchronous CPU streams, this must be done
+# before releasing memory or code that the pending commands may reference
+def synchronize_cpu_streams():
+    if runtime.cpu_stream_count:
+        runtime.core.cpu_stream_synchronize_all()
+
+
+# invokes a CPU kernel entry point with packed params, splitting
+# the launch across the host worker pool when multi-threading is enabled,
+# or records the launch if a CPU graph is being captured on the device
+# or submits it to the stream if it is asynchronous
+def launch_cpu_kernel(kernel, hooks, params, device, adjoint=False, args=(), params_addr=None, stream=None):
+    if adjoint:
+        hook = hooks.backward
+        range_hook = hooks.backward_range
+        range_func = hooks.backward_range_func
+    else:
+        hook = hooks.forward
+        range_hook = hooks.forward_range
+        range_func = hooks.forward_range_func
+
+    target = get_cpu_command_target(device, stream)
+    if target is not None:
+        target.add_cpu_kernel(kernel, hooks, range_hook, params, adjoint)
+        target.retain_objects(args)
+        return
+
+    bounds = params[0]
+
+    if runtime.cpu_timing_flags and range_hook:
+        # timed launches are submitted with their tag through the native launch of kernel sequences
+        if params_addr is None:
+            params_addr = (ctypes.c_void_p * len(params))(*[ctypes.addressof(x) for x in params])
+
+        runtime.sync_cpu_num_threads()
+        runtime.core.cpu_launch_kernels(
+            1,
+            (ctypes.c_uint64 * 1)(range_hook),
+            (ctypes.c_bool * 1)(hooks.cpu_parallel),
+            (ctypes.POINTER(ctypes.c_void_p) * 1)(ctypes.cast(params_addr, ctypes.POINTER(ctypes.c_void_p))),
+            (ctypes.c_uint64 * 1)(get_cpu_timing_tag(kernel, hooks, params, adjoint)),
+        )
+        return
+
+    if hooks.cpu_parallel and range_hook and bounds.size > 1 and runtime.sync_cpu_num_threads() > 1:
+        if params_addr is None:
+            params_addr = (ctypes.c_void_p * len(params))(*[ctypes.addressof(x) for x in params])
+
+        runtime.core.cpu_launch_kernel(range_hook, bounds.size, params_addr)
+    elif range_func and params_addr is not None:
+        # passing the param addresses avoids converting each param for the call
+        range_func(0, bounds.size, params_addr)
+    else:
+        hook(*params)
+
+
 # represents all data required for a kernel launch
 # so that launches can be replayed quickly, use `wp.launch(..., record_cmd=True)`
 class Launch:
@@ -5191,7 +6399,7 @@ class Launch:
         self, kernel, device, hooks=None, params=None, params_addr=None, bounds=None, max_blocks=0, block_dim=256
     ):
         # retain the module executable so it doesn't get unloaded
-        self.module_exec = kernel.module.load(device)
+        self.module_exec = kernel.module.load(device, kernel=kernel)
         if not self.module_exec:
             raise RuntimeError(f"Failed to load module {kernel.module.name} on device {device}")
 
@@ -5221,6 +6429,10 @@ class Launch:
 
             params_addr = kernel_params
 
+        # the addresses of CPU params are only needed to submit the launch as part of a LaunchSequence
+        if params_addr is None:
+            params_addr = (ctypes.c_void_p * len(params))(*[ctypes.addressof(x) for x in params])
+
         self.kernel = kernel
         self.hooks = hooks
         self.params = params
@@ -5292,7 +6504,7 @@ class Launch:
 
     def launch(self, stream=None) -> Any:
         if self.device.is_cpu:
-            self.hooks.forward(*self.params)
+            launch_cpu_kernel(self.kernel, self.hooks, self.params, self.device, stream=stream)
         else:
             if stream is None:
                 stream = self.device.stream
@@ -5317,6 +6529,178 @@ class Launch:
             )
 
 
+class LaunchSequence:
+    """A sequence of recorded kernel launches that are submitted together.
+
+    Launch commands are recorded with ``wp.launch(..., record_cmd=True)`` and added to the sequence, which submits
+    them in order with a single native call.  The arguments of each launch are packed once when it is recorded.
+    They can be rebound individually, either per launch with :meth:`set_param` or through named slots shared by
+    several launches with :meth:`set_slot`, without packing the other arguments again.
+
+    All launches of a sequence must target the same device.
+
+    Example:
+
+    .. code-block:: python
+
+        seq = wp.LaunchSequence()
+
+        for i in range(num_substeps):
+            cmd = wp.launch(integrate, dim=n, inputs=[state_in, state_out, dt], record_cmd=True)
+            seq.add(cmd, slots={"dt": "dt"})
+
+        seq.set_slot("dt", 0.01)
+        seq.launch()
+
+    Args:
+        launches: Launch commands to add to the sequence.
+    """
+
+    def __init__(self, launches: Sequence[Launch] = ()):
+        self.device = None
+        self.launches = []
+
+        # list of (launch, argument index) bound to each slot name
+        self.slots = {}
+
+        # arrays of entry points and parameter addresses passed to the native launch, built on first launch
+        self.batch = None
+
+        for launch in launches:
+            self.add(launch)
+
+    def __len__(self):
+        return len(self.launches)
+
+    def __getitem__(self, index) -> Launch:
+        return self.launches[index]
+
+    def add(self, launch: Launch, slots: Optional[Dict[str, str]] = None) -> int:
+        """Append a launch command to the sequence.
+
+        Args:
+            launch: A launch command returned by ``wp.launch(..., record_cmd=True)``.
+            slots: Optional mapping from kernel argument names to slot names, see :meth:`set_slot`.
+
+        Returns:
+            The index of the launch in the sequence.
+        """
+
+        if not isinstance(launch, Launch):
+            raise TypeError(
+                f"Expected a launch command recorded with wp.launch(..., record_cmd=True), got {type(launch)}"
+            )
+
+        if self.device is None:
+            self.device = launch.device
+        elif launch.device != self.device:
+            raise RuntimeError(
+                f"Cannot add a launch on device {launch.device} to a launch sequence on device {self.device}"
+            )
+
+        if launch.device.is_cpu and launch.hooks.forward_range is None:
+            raise RuntimeError(
+                f"Failed to add kernel '{launch.kernel.key}' to a launch sequence, the module "
+                f"'{launch.kernel.module.name}' was compiled without the required entry points by an earlier build, "
+                "clear the kernel cache to rebuild it"
+            )
+
+        if slots:
+            arg_indices = {arg.label: i for i, arg in enumerate(launch.kernel.adj.args)}
+
+            for arg_name, slot in slots.items():
+                if arg_name not in arg_indices:
+                    raise ValueError(f"Kernel '{launch.kernel.key}' has no argument named '{arg_name}'")
+
+                self.slots.setdefault(slot, []).append((launch, arg_indices[arg_name]))
+
+        self.launches.append(launch)
+        self.batch = None
+
+        return len(self.launches) - 1
+
+    def set_param(self, index: int, name: str, value: Any):
+        """Rebind the argument ``name`` of the launch at ``index``, the other arguments are left untouched."""
+        self.launches[index].set_param_by_name(name, value)
+
+    def set_slot(self, slot: str, value: Any):
+        """Rebind all the kernel arguments associated with ``slot`` when their launches were added."""
+        bindings = self.slots.get(slot)
+        if bindings is None:
+            raise ValueError(f"Launch sequence has no slot named '{slot}'")
+
+        for launch, arg_index in bindings:
+            launch.set_param_at_index(arg_index, value)
+
+    def set_dim(self, index: int, dim: Union[int, Tuple[int, ...]]):
+        """Set the launch dimensions of the launch at ``index``."""
+        self.launches[index].set_dim(dim)
+
+    def launch(self, stream: Optional[Stream] = None):
+        """Submit all the launches of the sequence in order.
+
+        Args:
+            stream: The CUDA stream to launch on, defaults to the current stream of the device.
+        """
+
+        if not self.launches:
+            return
+
+        device = self.device
+        count = len(self.launches)
+
+        # the parameter address arrays are updated in place when arguments are rebound,
+        # so the batch only needs to be rebuilt when launches are added
+        if self.batch is None:
+            args = (ctypes.POINTER(ctypes.c_void_p) * count)(
+                *[ctypes.cast(launch.params_addr, ctypes.POINTER(ctypes.c_void_p)) for launch in self.launches]
+            )
+
+            if device.is_cpu:
+                kernels = (ctypes.c_uint64 * count)(*[launch.hooks.forward_range for launch in self.launches])
+                parallel = (ctypes.c_bool * count)(*[launch.hooks.cpu_parallel for launch in self.launches])
+                self.batch = (kernels, parallel, args)
+            else:
+                kernels = (ctypes.c_void_p * count)(*[launch.hooks.forward for launch in self.launches])
+                max_blocks = (ctypes.c_int * count)(*[launch.max_blocks for launch in self.launches])
+                block_dims = (ctypes.c_int * count)(*[launch.block_dim for launch in self.launches])
+                smem_bytes = (ctypes.c_int * count)(*[launch.hooks.forward_smem_bytes for launch in self.launches])
+                self.batch = (kernels, max_blocks, block_dims, smem_bytes, args)
+
+        if device.is_cpu:
+            # launches are recorded one by one while a CPU graph is being captured or submitted to an asynchronous stream
+            if get_cpu_command_target(device, stream) is not None:
+                for launch in self.launches:
+                    launch.launch(stream)
+                return
+
+            # the tags are computed at launch since rebinding arguments can change the size of the launches
+            if runtime.cpu_timing_flags:
+                tags = (ctypes.c_uint64 * count)(
+                    *[get_cpu_timing_tag(launch.kernel, launch.hooks, launch.params) for launch in self.launches]
+                )
+            else:
+                tags = None
+
+            runtime.sync_cpu_num_threads()
+            runtime.core.cpu_launch_kernels(count, *self.batch, tags)
+
+        else:
+            if stream is None:
+                stream = device.stream
+
+            # If the stream is capturing, we retain the CUDA modules so that they don't get unloaded
+            # before the captured graph is released.
+            if runtime.core.cuda_stream_is_capturing(stream.cuda_stream):
+                capture_id = runtime.core.cuda_stream_get_capture_id(stream.cuda_stream)
+                graph = runtime.captures.get(capture_id)
+                if graph is not None:
+                    for launch in self.launches:
+                        graph.retain_module_exec(launch.module_exec)
+
+            runtime.core.cuda_launch_kernels(device.context, count, *self.batch, stream.cuda_stream)
+
+
 def launch(
     kernel,
     dim: Tuple[int],
@@ -5372,7 +6756,21 @@ def launch(
     # construct launch bounds
     bounds = warp.types.launch_bounds_t(dim)
 
-    if bounds.size > 0:
+    if device.task_graph is not None and stream is None and not record_cmd:
+        # recorded by a warp.ScopedSchedule, the launch happens when the task graph is launched
+        device.task_graph.record_launch(
+            kernel,
+            dim,
+            inputs=inputs,
+            outputs=outputs,
+            adj_inputs=adj_inputs,
+            adj_outputs=adj_outputs,
+            adjoint=adjoint,
+            max_blocks=max_blocks,
+            block_dim=block_dim,
+        )
+
+    elif bounds.size > 0:
         # first param is the number of threads
         params = []
         params.append(bounds)
@@ -5405,7 +6803,7 @@ def launch(
 
         # delay load modules, including new overload if needed
         try:
-            module_exec = kernel.module.load(device, block_dim)
+            module_exec = kernel.module.load(device, block_dim, kernel=kernel)
         except Exception:
             kernel.adj.skip_build = True
             raise
@@ -5416,8 +6814,16 @@ def launch(
         # late bind
         hooks = module_exec.get_kernel_hooks(kernel)
 
-        pack_args(fwd_args, params)
-        pack_args(adj_args, params, adjoint=True)
+        if adjoint or adj_args or record_cmd:
+            pack_args(fwd_args, params)
+            pack_args(adj_args, params, adjoint=True)
+
+            packer = None
+            params_addr = None
+        else:
+            # fast path, arguments are converted by packers specialized for their types into reused buffers
+            packer = kernel.get_launch_packer(device, fwd_args)
+            params, params_addr = packer.pack(bounds, fwd_args)
 
         # run kernel
         if device.is_cpu:
@@ -5427,7 +6833,9 @@ def launch(
                         f"Failed to find backward kernel '{kernel.key}' from module '{kernel.module.name}' for device '{device}'"
                     )
 
-                hooks.backward(*params)
+                launch_cpu_kernel(
+                    kernel, hooks, params, device, adjoint=True, args=(*fwd_args, *adj_args), stream=stream
+                )
 
             else:
                 if hooks.forward is None:
@@ -5441,11 +6849,22 @@ def launch(
                     )
                     return launch
                 else:
-                    hooks.forward(*params)
+                    launch_cpu_kernel(
+                        kernel,
+                        hooks,
+                        params,
+                        device,
+                        args=(*fwd_args, *adj_args),
+                        params_addr=params_addr,
+                        stream=stream,
+                    )
 
         else:
-            kernel_args = [ctypes.c_void_p(ctypes.addressof(x)) for x in params]
-            kernel_params = (ctypes.c_void_p * len(kernel_args))(*kernel_args)
+            if params_addr is None:
+                kernel_args = [ctypes.c_void_p(ctypes.addressof(x)) for x in params]
+                kernel_params = (ctypes.c_void_p * len(kernel_args))(*kernel_args)
+            else:
+                kernel_params = params_addr
 
             if stream is None:
                 stream = device.stream
@@ -5513,6 +6932,10 @@ def launch(
                 print(f"Error launching kernel: {kernel.key} on device {device}")
                 raise e
 
+        # the params have been copied by the launch, the buffers can be reused
+        if packer is not None:
+            packer.release(params, params_addr)
+
     # record on tape if one is active
     if runtime.tape and record_tape:
         # record file, lineno, func as metadata
@@ -5524,7 +6947,7 @@ def launch(
 
         # detect illegal inter-kernel read/write access patterns if verification flag is set
         if warp.config.verify_autograd_array_access:
-            runtime.tape._check_kernel_array_access(kernel, fwd_args)
+            runtime.tape._check_kernel_array_access(kernel, [*inputs, *outputs])
 
 
 def launch_tiled(*args, **kwargs):
@@ -5579,11 +7002,14 @@ def launch_tiled(*args, **kwargs):
 
 def synchronize():
     """Manually synchronize the calling CPU thread with any outstanding CUDA work on all devices
+    and with the work submitted to asynchronous CPU streams
 
     This method allows the host application code to ensure that any kernel launches
     or memory copies have completed.
     """
 
+    synchronize_cpu_streams()
+
     if is_cuda_driver_initialized():
         # save the original context to avoid side effects
         saved_context = runtime.core.cuda_context_get_current()
@@ -5602,10 +7028,11 @@ def synchronize():
 
 
 def synchronize_device(device: Devicelike = None):
-    """Synchronize the calling CPU thread with any outstanding CUDA work on the specified device
+    """Synchronize the calling CPU thread with any outstanding work on the specified device
 
     This function allows the host application code to ensure that all kernel launches
-    and memory copies have completed on the device.
+    and memory copies have completed on the device. For the CPU, this waits for the work
+    submitted to all the asynchronous CPU streams.
 
     Args:
         device: Device to synchronize.
@@ -5617,10 +7044,12 @@ def synchronize_device(device: Devicelike = None):
             raise RuntimeError(f"Cannot synchronize device {device} while graph capture is active")
 
         runtime.core.cuda_context_synchronize(device.context)
+    else:
+        synchronize_cpu_streams()
 
 
 def synchronize_stream(stream_or_device: Union[Stream, Devicelike, None] = None):
-    """Synchronize the calling CPU thread with any outstanding CUDA work on the specified stream.
+    """Synchronize the calling CPU thread with any outstanding work on the specified stream.
 
     This function allows the host application code to ensure that all kernel launches
     and memory copies have completed on the stream.
@@ -5634,11 +7063,16 @@ def synchronize_stream(stream_or_device: Union[Stream, Devicelike, None] = None)
     else:
         stream = runtime.get_device(stream_or_device).stream
 
-    runtime.core.cuda_stream_synchronize(stream.cuda_stream)
+    if stream.device.is_cpu:
+        # work on the synchronous stream is complete when it returns
+        if stream.cpu_stream:
+            runtime.core.cpu_stream_synchronize(stream.cpu_stream)
+    else:
+        runtime.core.cuda_stream_synchronize(stream.cuda_stream)
 
 
 def synchronize_event(event: Event):
-    """Synchronize the calling CPU thread with an event recorded on a CUDA stream.
+    """Synchronize the calling CPU thread with an event recorded on a stream.
 
     This function allows the host application code to ensure that a specific synchronization point was reached.
 
@@ -5646,15 +7080,66 @@ def synchronize_event(event: Event):
         event: Event to wait for.
     """
 
-    runtime.core.cuda_event_synchronize(event.cuda_event)
+    if event.device.is_cpu:
+        runtime.core.cpu_event_synchronize(event.cpu_event)
+    else:
+        runtime.core.cuda_event_synchronize(event.cuda_event)
+
+
+def load_modules_concurrently(devices: List[Device], modules: List[Module], max_workers: int):
+    # generate code for all modules, compilation is deferred
+    loaders = []
+    compile_steps = []
+    for d in devices:
+        for m in modules:
+            loader = m.load_steps(d)
+            compile_step, _ = resume_module_load(loader)
+            if compile_step is not None:
+                loaders.append(loader)
+                compile_steps.append(compile_step)
+
+    if not compile_steps:
+        return
+
+    # compile, the compilers release the GIL
+    def run(compile_step):
+        try:
+            compile_step()
+        except Exception as e:
+            return e
+
+        return None
+
+    from concurrent.futures import ThreadPoolExecutor
 
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(compile_steps))) as executor:
+        errors = list(executor.map(run, compile_steps))
 
-def force_load(device: Union[Device, str, List[Device], List[str]] = None, modules: List[Module] = None):
+    # move the binaries to the kernel cache and load them in order, reporting the first failure
+    first_error = None
+    for loader, error in zip(loaders, errors):
+        try:
+            resume_module_load(loader, error=error)
+        except Exception as e:
+            if first_error is None:
+                first_error = e
+
+    if first_error is not None:
+        raise first_error
+
+
+def force_load(
+    device: Union[Device, str, List[Device], List[str]] = None, modules: List[Module] = None, max_workers: int = 1
+):
     """Force user-defined kernels to be compiled and loaded
 
     Args:
         device: The device or list of devices to load the modules on.  If None, load on all devices.
         modules: List of modules to load.  If None, load all imported modules.
+        max_workers: The maximum number of modules compiled concurrently.  If greater than 1, the source code of all
+          modules is generated first, the modules that are not in the kernel cache are then compiled by a pool of
+          worker threads, and the compiled modules are finally loaded one after the other.  If 0, one worker per
+          hardware thread is used.
     """
 
     if is_cuda_driver_initialized():
@@ -5671,9 +7156,18 @@ def force_load(device: Union[Device, str, List[Device], List[str]] = None, modul
     if modules is None:
         modules = user_modules.values()
 
-    for d in devices:
-        for m in modules:
-            m.load(d)
+    # modules compiled per kernel are loaded one kernel at a time
+    modules = [unit for m in modules for unit in m.get_compile_units()]
+
+    if max_workers == 0:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers > 1:
+        load_modules_concurrently(devices, modules, max_workers)
+    else:
+        for d in devices:
+            for m in modules:
+                m.load(d)
 
     if is_cuda_available():
         # restore original context to avoid side effects
@@ -5681,7 +7175,10 @@ def force_load(device: Union[Device, str, List[Device], List[str]] = None, modul
 
 
 def load_module(
-    module: Union[Module, types.ModuleType, str] = None, device: Union[Device, str] = None, recursive: bool = False
+    module: Union[Module, types.ModuleType, str] = None,
+    device: Union[Device, str] = None,
+    recursive: bool = False,
+    max_workers: int = 1,
 ):
     """Force user-defined module to be compiled and loaded
 
@@ -5689,6 +7186,7 @@ def load_module(
         module: The module to load.  If None, load the current module.
         device: The device to load the modules on.  If None, load on all devices.
         recursive: Whether to load submodules.  E.g., if the given module is `warp.sim`, this will also load `warp.sim.model`, `warp.sim.articulation`, etc.
+        max_workers: The maximum number of modules compiled concurrently, see :func:`force_load`.
 
     Note: A module must be imported before it can be loaded by this function.
     """
@@ -5720,7 +7218,7 @@ def load_module(
             if name.startswith(prefix):
                 modules.append(mod)
 
-    force_load(device=device, modules=modules)
+    force_load(device=device, modules=modules, max_workers=max_workers)
 
 
 def set_module_options(options: Dict[str, Any], module: Optional[Any] = None):
@@ -5757,7 +7255,7 @@ def get_module_options(module: Optional[Any] = None) -> Dict[str, Any]:
 
 
 def capture_begin(device: Devicelike = None, stream=None, force_module_load=None, external=False):
-    """Begin capture of a CUDA graph
+    """Begin capture of a CUDA graph or of a CPU graph
 
     Captures all subsequent kernel launches and memory operations on CUDA devices.
     This can be used to record large numbers of kernels and replay them with low overhead.
@@ -5767,8 +7265,12 @@ def capture_begin(device: Devicelike = None, stream=None, force_module_load=None
     on the given stream.  If both are omitted, the capture will begin on the current
     stream of the current device.
 
+    If `device` is a CPU device, subsequent kernel launches, copies between CPU arrays, and array fills on the device
+    are recorded into a CPU graph instead of being executed.  The arguments of each launch are packed once during
+    capture, and launching the graph runs all the recorded commands in a single native call.
+
     Args:
-        device: The CUDA device to capture on
+        device: The CUDA or CPU device to capture on
         stream: The CUDA stream to capture on
         force_module_load: Whether to force loading of all kernels before capture.
           In general it is better to use :func:`~warp.load_module()` to selectively load kernels.
@@ -5780,6 +7282,12 @@ def capture_begin(device: Devicelike = None, stream=None, force_module_load=None
 
     """
 
+    if stream is None:
+        device = runtime.get_device(device)
+        if device.is_cpu:
+            capture_begin_cpu(device, force_module_load, external)
+            return
+
     if force_module_load is None:
         if runtime.driver_version >= (12, 3):
             # Driver versions 12.3 and can compile modules during graph capture
@@ -5793,9 +7301,6 @@ def capture_begin(device: Devicelike = None, stream=None, force_module_load=None
     if stream is not None:
         device = stream.device
     else:
-        device = runtime.get_device(device)
-        if not device.is_cuda:
-            raise RuntimeError("Must be a CUDA device")
         stream = device.stream
 
     if external:
@@ -5823,12 +7328,30 @@ def capture_begin(device: Devicelike = None, stream=None, force_module_load=None
     runtime.captures[capture_id] = graph
 
 
+def capture_begin_cpu(device: Device, force_module_load=None, external=False):
+    if external:
+        raise RuntimeError("External capture is not supported on CPU devices")
+
+    # CPU devices have no streams, the graph being captured is the only entry of the captures
+    if device.captures:
+        raise RuntimeError("Graph capture already in progress on this device")
+
+    # modules are loaded when kernels are first launched during capture unless requested
+    if force_module_load:
+        force_load(device)
+
+    graph = Graph(device, capture_id=None)
+    graph.graph_exec = runtime.core.cpu_graph_create()
+
+    device.captures[None] = graph
+
+
 def capture_end(device: Devicelike = None, stream: Stream = None) -> Graph:
-    """Ends the capture of a CUDA graph
+    """Ends the capture of a CUDA graph or of a CPU graph
 
     Args:
 
-        device: The CUDA device where capture began
+        device: The CUDA or CPU device where capture began
         stream: The CUDA stream where capture began
 
     Returns:
@@ -5839,8 +7362,13 @@ def capture_end(device: Devicelike = None, stream: Stream = None) -> Graph:
         device = stream.device
     else:
         device = runtime.get_device(device)
-        if not device.is_cuda:
-            raise RuntimeError("Must be a CUDA device")
+        if device.is_cpu:
+            graph = device.captures.pop(None, None)
+            if graph is None:
+                raise RuntimeError("Graph capture is not active on this device")
+
+            return graph
+
         stream = device.stream
 
     # get the graph being captured
@@ -5867,13 +7395,33 @@ def capture_end(device: Devicelike = None, stream: Stream = None) -> Graph:
 
 
 def capture_launch(graph: Graph, stream: Stream = None):
-    """Launch a previously captured CUDA graph
+    """Launch a previously captured CUDA graph or CPU graph
+
+    CPU graphs are executed by the calling thread, or by the worker thread of the stream if it is an
+    asynchronous CPU stream. Kernels are split across ``wp.config.cpu_num_threads`` threads as when
+    launched individually.
 
     Args:
         graph: A Graph as returned by :func:`~warp.capture_end()`
         stream: A Stream to launch the graph on (optional)
     """
 
+    if graph.device.is_cpu:
+        if stream is not None and stream.device != graph.device:
+            raise RuntimeError(f"Cannot launch graph from device {graph.device} on stream from device {stream.device}")
+
+        if graph.device.captures:
+            raise RuntimeError("Cannot launch a CPU graph while a graph is being captured on the CPU")
+
+        runtime.sync_cpu_num_threads()
+
+        target = get_cpu_command_target(graph.device, stream)
+        if target is not None:
+            runtime.core.cpu_stream_launch_graph(target.cpu_stream, graph.graph_exec)
+        else:
+            runtime.core.cpu_graph_launch(graph.graph_exec)
+        return
+
     if stream is not None:
         if stream.device != graph.device:
             raise RuntimeError(f"Cannot launch graph from device {graph.device} on stream from device {stream.device}")
@@ -5903,7 +7451,8 @@ def copy(
     (1) If the destination array is on a CUDA device, use the current stream on the destination device.
     (2) Otherwise, if the source array is on a CUDA device, use the current stream on the source device.
 
-    If neither source nor destination are on a CUDA device, no stream is used for the copy.
+    If neither source nor destination are on a CUDA device, the copy is performed on the current stream of the CPU,
+    which executes it on the calling thread unless an asynchronous CPU stream was set.
 
     """
 
@@ -5919,6 +7468,12 @@ def copy(
     if count == 0:
         return
 
+    # copies between the arrays of a device are recorded by a warp.ScopedSchedule
+    if stream is None and (dest.device.task_graph is not None or src.device.task_graph is not None):
+        task_graph = dest.device.task_graph or src.device.task_graph
+        task_graph.record_copy(dest, src, dest_offset=dest_offset, src_offset=src_offset, count=count)
+        return
+
     # figure out the stream for the copy
     if stream is None:
         if dest.device.is_cuda:
@@ -6006,7 +7561,13 @@ def copy(
                     src.device.context, dst_ptr, src_ptr, bytes_to_copy, stream.cuda_stream
                 )
             else:
-                result = runtime.core.memcpy_h2h(dst_ptr, src_ptr, bytes_to_copy)
+                target = get_cpu_command_target(dest.device, stream)
+                if target is not None:
+                    target.add_cpu_memcpy(dst_ptr, src_ptr, bytes_to_copy)
+                    target.retain_objects((dest, src))
+                    result = True
+                else:
+                    result = runtime.core.memcpy_h2h(dst_ptr, src_ptr, bytes_to_copy)
 
         if not result:
             raise RuntimeError(f"Warp copy error: {runtime.get_error_string()}")
@@ -6054,7 +7615,13 @@ def copy(
                 )
                 stream.wait_stream(dest.device.stream)
         else:
-            result = runtime.core.array_copy_host(dst_ptr, src_ptr, dst_type, src_type, src_elem_size)
+            target = get_cpu_command_target(dest.device, stream)
+            if target is not None:
+                target.add_cpu_array_copy(dst_desc, src_desc, dst_type, src_type, src_elem_size)
+                target.retain_objects((dest, src))
+                result = True
+            else:
+                result = runtime.core.array_copy_host(dst_ptr, src_ptr, dst_type, src_type, src_elem_size)
 
         if not result:
             raise RuntimeError(f"Warp copy error: {runtime.get_error_string()}")
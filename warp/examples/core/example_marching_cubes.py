@@ -10,8 +10,6 @@
 #
 # Shows how use the built-in marching cubes functionality to extract
 # the iso-surface from a density field.
-#
-# Note: requires a CUDA-capable device
 ###########################################################################
 
 import warp as wp
@@ -320,7 +320,7 @@ class Example:
             for _ in range(self.sim_step_to_frame_ratio):
                 with wp.ScopedTimer("grid build", active=self.verbose):
                     # build grid
-                    self.grid.build(self.x, self.smoothing_length)
+                    self.grid.build(self.x, self.smoothing_length, incremental=True)
 
                 with wp.ScopedTimer("forces", active=self.verbose):
                     # compute density of points
@@ -0,0 +1,523 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+"""Fusion of consecutive element-wise kernel launches into a single kernel.
+
+Each kernel taking part in a fusion is compiled as a user function whose ``wp.tid()`` calls are replaced by
+thread index parameters, and the fused kernel calls these functions one after the other for the same thread.
+Bandwidth-bound pipelines therefore read and write intermediate values once per thread instead of once per launch,
+and the whole pipeline costs a single launch.
+"""
+
+import ast
+import ctypes
+import hashlib
+import textwrap
+import types
+from typing import Dict, List, Sequence, Tuple
+
+import warp
+import warp.codegen
+import warp.context
+import warp.types
+
+# fused kernels, keyed by the tuple of kernels they were generated from
+_fused_kernels: Dict[Tuple[warp.context.Kernel, ...], warp.context.Kernel] = {}
+
+# calls that only read the metadata of an array argument
+_metadata_functions = ("len",)
+
+
+def _fused_kernel_template():
+    # placeholder for the Python function of fused kernels, whose AST is generated by fuse_kernels()
+    pass
+
+
+def _is_tid_call(node):
+    if not isinstance(node, ast.Call):
+        return False
+
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr == "tid"
+    if isinstance(func, ast.Name):
+        return func.id == "tid"
+
+    return False
+
+
+def _slice_expr(node):
+    # Python < 3.9 wraps subscript indices in ast.Index
+    if hasattr(ast, "Index") and isinstance(node, ast.Index):
+        return node.value
+    return node
+
+
+class _TidTransformer(ast.NodeTransformer):
+    """Replaces the ``wp.tid()`` calls of a kernel by the thread index parameters of its fused function."""
+
+    def visit_Assign(self, node):
+        if not _is_tid_call(node.value):
+            return self.generic_visit(node)
+
+        target = node.targets[0]
+        if isinstance(target, ast.Tuple):
+            names = [_tid_param_name(len(target.elts), i) for i in range(len(target.elts))]
+            assigns = [
+                ast.Assign(targets=[elt], value=ast.Name(id=name, ctx=ast.Load()))
+                for elt, name in zip(target.elts, names)
+            ]
+            for assign in assigns:
+                ast.copy_location(assign, node)
+                ast.fix_missing_locations(assign)
+            return assigns
+
+        node.value = ast.copy_location(ast.Name(id=_tid_param_name(1, 0), ctx=ast.Load()), node.value)
+        return node
+
+    def visit_Call(self, node):
+        if _is_tid_call(node):
+            # a tid() call used as an expression always returns the linear thread index
+            return ast.copy_location(ast.Name(id=_tid_param_name(1, 0), ctx=ast.Load()), node)
+
+        return self.generic_visit(node)
+
+
+def _tid_param_name(ndim, index):
+    if ndim == 1:
+        return "_wp_tid"
+    return f"_wp_tid_{index}"
+
+
+def _kernel_tree(kernel):
+    return kernel.adj.tree.body[0]
+
+
+def _get_tid_dims(kernel) -> List[int]:
+    """Returns the dimensionality of each ``wp.tid()`` call in a kernel, in order of appearance."""
+
+    dims = []
+    for node in ast.walk(_kernel_tree(kernel)):
+        if isinstance(node, ast.Assign) and _is_tid_call(node.value):
+            target = node.targets[0]
+            dims.append(len(target.elts) if isinstance(target, ast.Tuple) else 1)
+        elif isinstance(node, ast.Expr) and _is_tid_call(node.value):
+            dims.append(1)
+
+    return dims
+
+
+def _get_tid_names(kernel) -> Dict[int, List[str]]:
+    """Returns the names the thread indices are assigned to in a kernel, keyed by the dimensionality of the call.
+
+    Names that are bound more than once, e.g. reassigned, updated by an augmented assignment, or used as a loop
+    target, are excluded since they may hold another location when used as an index.
+    """
+
+    tree = _kernel_tree(kernel)
+
+    binding_counts = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            binding_counts[node.id] = binding_counts.get(node.id, 0) + 1
+        elif isinstance(node, ast.arg):
+            binding_counts[node.arg] = binding_counts.get(node.arg, 0) + 1
+
+    names = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and _is_tid_call(node.value):
+            target = node.targets[0]
+            elts = target.elts if isinstance(target, ast.Tuple) else [target]
+            if all(isinstance(elt, ast.Name) and binding_counts[elt.id] == 1 for elt in elts):
+                names[len(elts)] = [elt.id for elt in elts]
+
+    return names
+
+
+class _ArrayAccess:
+    """Summary of how a kernel accesses one of its array arguments."""
+
+    def __init__(self):
+        self.read = False
+        self.write = False
+
+        # the dimensionality of the thread index used by element-wise accesses, None if the array is
+        # only accessed element-wise, and -1 if it is accessed at any other location
+        self.tid_ndim = None
+
+    @property
+    def elementwise(self):
+        return self.tid_ndim is None or self.tid_ndim > 0
+
+    def add(self, read, write, tid_ndim):
+        self.read |= read
+        self.write |= write
+
+        if self.tid_ndim is None:
+            self.tid_ndim = tid_ndim
+        elif self.tid_ndim != tid_ndim:
+            self.tid_ndim = -1
+
+
+def _get_array_accesses(kernel) -> Dict[str, _ArrayAccess]:
+    """Classifies the accesses of a kernel to each of its array arguments.
+
+    An access is element-wise if the array is indexed by exactly the thread indices returned by ``wp.tid()``,
+    in order. Any other use of an array, e.g.: indexing at another location, passing it to a function,
+    or atomic operations, is considered to read and write the array at arbitrary locations.
+    """
+
+    tree = _kernel_tree(kernel)
+    tid_names = _get_tid_names(kernel)
+
+    parents = {}
+    for node in ast.walk(tree):
+        for child in ast.iter_child_nodes(node):
+            parents[child] = node
+
+    accesses = {}
+    for arg in kernel.adj.args:
+        if warp.types.is_array(arg.type):
+            accesses[arg.label] = _ArrayAccess()
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Name) or node.id not in accesses or not isinstance(node.ctx, ast.Load):
+            continue
+
+        access = accesses[node.id]
+        arg_type = kernel.adj.arg_types[node.id]
+        parent = parents.get(node)
+
+        if isinstance(parent, ast.Attribute) and parent.value is node:
+            # metadata, e.g.: arr.shape
+            continue
+
+        if isinstance(parent, ast.Call) and isinstance(parent.func, ast.Name) and parent.func.id in _metadata_functions:
+            continue
+
+        if isinstance(parent, ast.Subscript) and parent.value is node:
+            index = _slice_expr(parent.slice)
+            elts = index.elts if isinstance(index, ast.Tuple) else [index]
+            index_names = [elt.id if isinstance(elt, ast.Name) else None for elt in elts]
+
+            tid_ndim = -1
+            if type(arg_type) is warp.types.array and len(index_names) == arg_type.ndim:
+                for ndim, names in tid_names.items():
+                    if index_names == names:
+                        tid_ndim = ndim
+
+            # stores to the components of an element, e.g.: arr[i].x = v or arr[i][0] = v, also write the element
+            target = parent
+            while isinstance(parents.get(target), (ast.Attribute, ast.Subscript)) and parents[target].value is target:
+                target = parents[target]
+
+            if isinstance(target.ctx, ast.Store):
+                augmented = isinstance(parents.get(target), ast.AugAssign)
+                access.add(read=augmented, write=True, tid_ndim=tid_ndim)
+            else:
+                access.add(read=True, write=False, tid_ndim=tid_ndim)
+            continue
+
+        # passed to a function, assigned to a local variable, etc.
+        access.add(read=True, write=True, tid_ndim=-1)
+
+    return accesses
+
+
+def _get_memory_range(arg_type, value) -> Tuple[int, int]:
+    """Returns the range of addresses spanned by a packed ``array_t`` argument."""
+
+    if not value.data:
+        return (0, 0)
+
+    lower = upper = value.data
+    for i in range(value.ndim):
+        if value.shape[i] == 0:
+            return (0, 0)
+
+        extent = (value.shape[i] - 1) * value.strides[i]
+        if extent < 0:
+            lower += extent
+        else:
+            upper += extent
+
+    return (lower, upper + warp.types.type_size_in_bytes(arg_type.dtype))
+
+
+def _same_array(a, b) -> bool:
+    return (
+        a.data == b.data
+        and a.ndim == b.ndim
+        and all(a.shape[i] == b.shape[i] and a.strides[i] == b.strides[i] for i in range(a.ndim))
+    )
+
+
+def _check_dependencies(launches):
+    """Checks that fusing the given launches cannot change their results.
+
+    A fused thread runs the code of every kernel before the next thread starts, so an array that is written
+    by one of the kernels may only be shared with the other kernels if they all access it at the location of
+    the current thread.
+    """
+
+    arrays = []
+    for i, launch in enumerate(launches):
+        accesses = _get_array_accesses(launch.kernel)
+
+        for arg, value in zip(launch.kernel.adj.args, launch.params[1:]):
+            if warp.types.is_array(arg.type):
+                if type(arg.type) is not warp.types.array:
+                    raise RuntimeError(
+                        f"Cannot fuse kernel '{launch.kernel.key}': the memory accessed through argument "
+                        f"'{arg.label}' of type {warp.context.type_str(arg.type)} cannot be determined"
+                    )
+
+                access = accesses[arg.label]
+                if access.read or access.write:
+                    arrays.append((i, launch, arg, value, access, _get_memory_range(arg.type, value)))
+
+            elif isinstance(arg.type, warp.codegen.Struct):
+                for var in arg.type.vars.values():
+                    if warp.types.is_array(var.type):
+                        raise RuntimeError(
+                            f"Cannot fuse kernel '{launch.kernel.key}': the accesses to the arrays of struct "
+                            f"argument '{arg.label}' cannot be analyzed"
+                        )
+
+    for a in range(len(arrays)):
+        i, launch_i, arg_i, value_i, access_i, range_i = arrays[a]
+
+        for b in range(a + 1, len(arrays)):
+            j, launch_j, arg_j, value_j, access_j, range_j = arrays[b]
+
+            if i == j or not (access_i.write or access_j.write):
+                continue
+
+            if range_i[0] >= range_j[1] or range_j[0] >= range_i[1]:
+                continue
+
+            if (
+                _same_array(value_i, value_j)
+                and access_i.elementwise
+                and access_j.elementwise
+                and (access_i.tid_ndim is None or access_j.tid_ndim is None or access_i.tid_ndim == access_j.tid_ndim)
+            ):
+                continue
+
+            raise RuntimeError(
+                f"Cannot fuse kernels '{launch_i.kernel.key}' and '{launch_j.kernel.key}': argument "
+                f"'{arg_i.label}' of launch {i} and argument '{arg_j.label}' of launch {j} access the same "
+                "memory and at least one of them writes to it at locations other than the current thread index"
+            )
+
+
+def fuse_kernels(kernels: Sequence[warp.context.Kernel], key: str = None) -> warp.context.Kernel:
+    """Generates a kernel that runs the code of the given kernels one after the other for each thread.
+
+    The arguments of the fused kernel are the arguments of each of the kernels in order, so a fused kernel is
+    launched with the concatenation of the inputs of the individual launches, e.g.:
+
+    .. code-block:: python
+
+        fused = wp.fuse_kernels([scale, integrate])
+        wp.launch(fused, dim=n, inputs=[x, 2.0, x, v, dt])
+
+    This function does not check whether the fusion preserves the results of the kernels,
+    see :func:`fuse_launches` for a version that verifies the dependencies between launches.
+
+    Args:
+        kernels: The kernels to fuse, which must not be generic.
+        key: The name of the fused kernel, generated from the names of the kernels if not specified.
+    """
+
+    kernels = tuple(kernels)
+    if not kernels:
+        raise ValueError("At least one kernel is required to generate a fused kernel")
+
+    if key is None:
+        fused = _fused_kernels.get(kernels)
+        if fused is not None:
+            return fused
+
+    tid_dims = []
+    for kernel in kernels:
+        if not isinstance(kernel, warp.context.Kernel):
+            raise TypeError(f"Expected a Warp kernel, got {type(kernel)}")
+        if kernel.is_generic:
+            raise TypeError(f"Cannot fuse generic kernel '{kernel.key}', fuse one of its overloads instead")
+
+        dims = set(_get_tid_dims(kernel))
+        if len(dims - {1}) > 1:
+            raise RuntimeError(f"Cannot fuse kernel '{kernel.key}': wp.tid() is called with different dimensions")
+        tid_dims.append(max(dims, default=0))
+
+    launch_ndims = {dim for dim in tid_dims if dim > 1}
+    if len(launch_ndims) > 1:
+        raise RuntimeError("Cannot fuse kernels that use multi-dimensional thread indices of different dimensions")
+
+    launch_ndim = max(launch_ndims, default=1)
+
+    # generate a module per fused kernel, named after the kernels it was generated from
+    digest = hashlib.sha256()
+    for kernel in kernels:
+        digest.update(bytes(f"{kernel.module.name}.{kernel.key}:{kernel.adj.source}", "utf-8"))
+    name = f"warp.fusion.fused_{digest.hexdigest()[:16]}"
+    if key is None:
+        key = "fused_" + "_".join(kernel.key for kernel in kernels)
+
+    module = warp.context.get_module(name)
+    module.options.update(kernels[0].module.options)
+
+    fused_globals = {"wp": warp}
+    args = []
+    body = []
+    has_linear_tid = False
+    has_nd_tid = False
+
+    for i, kernel in enumerate(kernels):
+        tid_params = {}
+        if tid_dims[i] > 0:
+            tid_params[_tid_param_name(1, 0)] = int
+            has_linear_tid = True
+        if tid_dims[i] > 1:
+            for d in range(launch_ndim):
+                tid_params[_tid_param_name(launch_ndim, d)] = int
+            has_nd_tid = True
+
+        func = warp.context.Function(
+            func=kernel.func,
+            key=f"{kernel.key}_{i}",
+            namespace="",
+            module=module,
+            overloaded_annotations={**tid_params, **kernel.adj.arg_types},
+            code_transformers=[*kernel.adj.transformers, _TidTransformer()],
+            scope_locals={},
+        )
+        func_name = f"_wp_fused_{i}"
+        fused_globals[func_name] = func
+
+        kernel_args = [f"k{i}_{arg.label}" for arg in kernel.adj.args]
+        args.extend(zip(kernel_args, (arg.type for arg in kernel.adj.args)))
+        body.append(f"{func_name}({', '.join([*tid_params.keys(), *kernel_args])})")
+
+    preamble = []
+    if has_linear_tid:
+        preamble.append(f"{_tid_param_name(1, 0)} = wp.tid()")
+    if has_nd_tid:
+        tid_names = [_tid_param_name(launch_ndim, d) for d in range(launch_ndim)]
+        preamble.append(f"{', '.join(tid_names)} = wp.tid()")
+
+    source = f"def {key}({', '.join(arg for arg, _ in args)}):\n"
+    source += textwrap.indent("\n".join(preamble + body) or "pass", "    ") + "\n"
+
+    # the kernel is created from a placeholder function, then its AST is replaced by the generated code
+    fused_func = types.FunctionType(_fused_kernel_template.__code__, fused_globals, key)
+    fused_func.__qualname__ = key
+    fused_func.__module__ = name
+
+    options = {}
+    effective_options = [{**kernel.module.options, **kernel.options} for kernel in kernels]
+    options["enable_backward"] = all(opts.get("enable_backward", True) for opts in effective_options)
+    options["cpu_parallel"] = all(opts.get("cpu_parallel", True) for opts in effective_options)
+
+    fused = warp.context.Kernel(func=fused_func, key=key, module=module, options=options)
+    fused.adj = warp.codegen.Adjoint(
+        fused_func, overload_annotations=dict(args), transformers=[_ReplaceTreeTransformer(source)]
+    )
+    fused.adj.source = source
+    fused.adj.source_lines = source.splitlines()
+    fused.arg_indices = {a.label: i for i, a in enumerate(fused.adj.args)}
+    fused.fused_kernels = kernels
+
+    module.find_references(fused.adj)
+    module.mark_modified()
+
+    if key == "fused_" + "_".join(kernel.key for kernel in kernels):
+        _fused_kernels[kernels] = fused
+
+    return fused
+
+
+class _ReplaceTreeTransformer(ast.NodeTransformer):
+    """Replaces the AST of a function by the AST parsed from the given source code."""
+
+    def __init__(self, source):
+        self.source = source
+
+    def visit_Module(self, node):
+        return ast.parse(self.source)
+
+
+def fuse_launches(launches: Sequence[warp.context.Launch]) -> warp.context.Launch:
+    """Fuses consecutive launches recorded with ``wp.launch(..., record_cmd=True)`` into a single launch.
+
+    The launches must target the same device and use the same launch dimensions. Each thread of the fused launch
+    runs the code of every kernel in order, so arrays that are shared between the kernels are read and written once
+    per thread instead of once per launch.
+
+    The arrays passed to the launches are checked for dependencies that would change the results when fused:
+    an array that is written by one of the kernels may only be accessed by the other kernels at the current thread
+    index, e.g.: ``x[i]`` where ``i = wp.tid()``. Reading another element of such an array, accessing it through a
+    function call or an atomic operation, or aliasing it with another array argument raises a ``RuntimeError``.
+    Memory accessed through handles, e.g.: mesh or volume identifiers, is not tracked.
+
+    The returned :class:`Launch` shares the parameters of the given launches, and its parameters can be
+    updated by calling :meth:`Launch.set_param_at_index` with the index into the concatenated arguments of the
+    launches.
+
+    Args:
+        launches: The launches to fuse, in the order they would run.
+    """
+
+    launches = list(launches)
+    if not launches:
+        raise ValueError("At least one launch is required to fuse launches")
+
+    first = launches[0]
+    for launch in launches:
+        if not isinstance(launch, warp.context.Launch):
+            raise TypeError(f"Expected a Launch object, got {type(launch)}, use wp.launch(..., record_cmd=True)")
+        if launch.device != first.device:
+            raise RuntimeError("Cannot fuse launches on different devices")
+        if launch.bounds.ndim != first.bounds.ndim or any(
+            launch.bounds.shape[i] != first.bounds.shape[i] for i in range(first.bounds.ndim)
+        ):
+            raise RuntimeError(
+                f"Cannot fuse launches of different dimensions, kernel '{launch.kernel.key}' is launched over "
+                f"{tuple(launch.bounds.shape[: launch.bounds.ndim])} instead of "
+                f"{tuple(first.bounds.shape[: first.bounds.ndim])}"
+            )
+
+    _check_dependencies(launches)
+
+    fused = fuse_kernels([launch.kernel for launch in launches])
+
+    nd_tids = {dim for launch in launches for dim in _get_tid_dims(launch.kernel) if dim > 1}
+    if nd_tids and nd_tids != {first.bounds.ndim}:
+        raise RuntimeError(
+            f"Cannot fuse launches: wp.tid() returns {first.bounds.ndim} indices for the launch dimensions "
+            f"but is called with {max(nd_tids)} outputs"
+        )
+
+    bounds = warp.types.launch_bounds_t(tuple(first.bounds.shape[: first.bounds.ndim]))
+    params = [bounds]
+    for launch in launches:
+        params.extend(launch.params[1:])
+
+    params_addr = None
+    if first.device.is_cuda:
+        params_addr = (ctypes.c_void_p * len(params))(*[ctypes.addressof(x) for x in params])
+
+    return warp.context.Launch(
+        kernel=fused,
+        device=first.device,
+        params=params,
+        params_addr=params_addr,
+        bounds=bounds,
+        max_blocks=first.max_blocks,
+        block_dim=first.block_dim,
+    )
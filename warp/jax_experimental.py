@@ -281,7 +281,7 @@ def _create_jax_warp_primitive():
         # mucking with kernel loading while already running the workload.
         module = wp_kernel.module
         device = wp.device_from_jax(_get_jax_device())
-        if not module.load(device):
+        if not module.load(device, kernel=wp_kernel):
             raise Exception("Could not load kernel on device")
 
         if launch_dims is None:
@@ -1188,8 +1188,9 @@ inline CUDA_CALLABLE launch_coord_t launch_coord(size_t linear, const launch_bou
 inline CUDA_CALLABLE int tid(size_t index, const launch_bounds_t& bounds)
 {
     // For the 1-D tid() we need to warn the user if we're about to provide a truncated index
-    // Only do this in _DEBUG when called from device to avoid excessive register allocation
-#if defined(_DEBUG) || !defined(__CUDA_ARCH__)
+    // Only do this in _DEBUG when called from device to avoid excessive register allocation,
+    // and skip it for vectorized CPU modules where the call would prevent SIMD code generation
+#if (defined(_DEBUG) || !defined(__CUDA_ARCH__)) && !defined(WP_CPU_VECTORIZE)
     if (index > 2147483647) {
         printf("Warp warning: tid() is returning an overflowed int\n");
     }
@@ -1223,13 +1224,59 @@ inline CUDA_CALLABLE_DEVICE void tid(int& i, int& j, int& k, int& l, size_t inde
     l = c.l;
 }
 
+#if !defined(__CUDA_ARCH__)
+
+// CPU kernels may be executed by several host threads concurrently (see wp.config.cpu_num_threads),
+// host atomics are therefore implemented as compare-and-swap loops on the underlying bits
 template<typename T>
-inline CUDA_CALLABLE T atomic_add(T* buf, T value)
+inline bool atomic_compare_exchange_host(T* buf, T& expected, T desired)
+{
+#if defined(_MSC_VER) && !defined(__clang__)
+    // MSVC only builds host library code that never runs kernels concurrently
+    *buf = desired;
+    return true;
+#else
+    return __atomic_compare_exchange(buf, &expected, &desired, true, __ATOMIC_RELAXED, __ATOMIC_RELAXED);
+#endif
+}
+
+template<typename T>
+inline T atomic_add_host(T* buf, T value)
+{
+    T old = buf[0];
+    while (!atomic_compare_exchange_host(buf, old, T(old + value)))
+    {
+    }
+    return old;
+}
+
+template<typename T>
+inline T atomic_max_host(T* buf, T value)
+{
+    T old = buf[0];
+    while (value > old && !atomic_compare_exchange_host(buf, old, value))
+    {
+    }
+    return old;
+}
+
+template<typename T>
+inline T atomic_min_host(T* buf, T value)
 {
-#if !defined(__CUDA_ARCH__)
     T old = buf[0];
-    buf[0] += value;
+    while (value < old && !atomic_compare_exchange_host(buf, old, value))
+    {
+    }
     return old;
+}
+
+#endif // !__CUDA_ARCH__
+
+template<typename T>
+inline CUDA_CALLABLE T atomic_add(T* buf, T value)
+{
+#if !defined(__CUDA_ARCH__)
+    return atomic_add_host(buf, value);
 #else
     return atomicAdd(buf, value);
 #endif
@@ -1239,9 +1286,7 @@ template<>
 inline CUDA_CALLABLE float16 atomic_add(float16* buf, float16 value)
 {
 #if !defined(__CUDA_ARCH__)
-    float16 old = buf[0];
-    buf[0] += value;
-    return old;
+    return atomic_add_host(buf, value);
 #elif defined(__clang__)  // CUDA compiled by Clang
 	__half r = atomicAdd(reinterpret_cast<__half*>(buf), *reinterpret_cast<__half*>(&value));
     return *reinterpret_cast<float16*>(&r);
@@ -1290,9 +1335,7 @@ inline CUDA_CALLABLE float atomic_max(float* address, float val)
     return __int_as_float(old);
 
 #else
-    float old = *address;
-    *address = max(old, val);
-    return old;
+    return atomic_max_host(address, val);
 #endif
 }
 
@@ -1313,9 +1356,7 @@ inline CUDA_CALLABLE float atomic_min(float* address, float val)
     return __int_as_float(old);
 
 #else
-    float old = *address;
-    *address = min(old, val);
-    return old;
+    return atomic_min_host(address, val);
 #endif
 }
 
@@ -1323,9 +1364,7 @@ template<>
 inline CUDA_CALLABLE float64 atomic_add(float64* buf, float64 value)
 {
 #if !defined(__CUDA_ARCH__)
-    float64 old = buf[0];
-    buf[0] += value;
-    return old;
+    return atomic_add_host(buf, value);
 #elif defined(__clang__)  // CUDA compiled by Clang
 	return atomicAdd(buf, value);
 #else  // CUDA compiled by NVRTC
@@ -1372,9 +1411,7 @@ inline CUDA_CALLABLE double atomic_max(double* address, double val)
     return __longlong_as_double(old);
 
 #else
-    double old = *address;
-    *address = max(old, val);
-    return old;
+    return atomic_max_host(address, val);
 #endif
 }
 
@@ -1395,9 +1432,7 @@ inline CUDA_CALLABLE double atomic_min(double* address, double val)
     return __longlong_as_double(old);
 
 #else
-    double old = *address;
-    *address = min(old, val);
-    return old;
+    return atomic_min_host(address, val);
 #endif
 }
 
@@ -1407,9 +1442,7 @@ inline CUDA_CALLABLE int atomic_max(int* address, int val)
     return atomicMax(address, val);
 
 #else
-    int old = *address;
-    *address = max(old, val);
-    return old;
+    return atomic_max_host(address, val);
 #endif
 }
 
@@ -1420,9 +1453,7 @@ inline CUDA_CALLABLE int atomic_min(int* address, int val)
     return atomicMin(address, val);
 
 #else
-    int old = *address;
-    *address = min(old, val);
-    return old;
+    return atomic_min_host(address, val);
 #endif
 }
 
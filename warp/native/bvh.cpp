@@ -8,10 +8,13 @@
 
 #include <vector>
 #include <algorithm>
+#include <atomic>
+#include <memory>
 
 #include "bvh.h"
 #include "warp.h"
 #include "cuda_util.h"
+#include "parallel.h"
 
 #include <map>
 
@@ -31,27 +34,101 @@ public:
 
 private:
 
+    // nodes of a subtree, child and parent indices are local to the list
+    struct NodeList
+    {
+        std::vector<BVHPackedNodeHalf> lowers;
+        std::vector<BVHPackedNodeHalf> uppers;
+        std::vector<int> parents;
+
+        int max_depth = 0;
+        int num_leaf_nodes = 0;
+    };
+
+    // a range of items built into its own node list by one of the worker threads
+    struct Subtree
+    {
+        int start;
+        int end;
+        int depth;
+        // index of the parent node in the top levels of the tree, -1 for the root
+        int parent;
+
+        NodeList nodes;
+        int offset;
+    };
+
+    // an inner node in the top levels of the tree, children are indices into top_nodes if >= 0 or
+    // encoded subtree indices otherwise
+    struct TopNode
+    {
+        bounds3 bounds;
+        int left;
+        int right;
+        int parent;
+        int depth;
+    };
+
     bounds3 calc_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end);
+    bounds3 calc_bounds_parallel(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end);
 
     int partition_median(const vec3* lowers, const vec3* uppers, int* indices, int start, int end, bounds3 range_bounds);
     int partition_midpoint(const vec3* lowers, const vec3* uppers, int* indices, int start, int end, bounds3 range_bounds);
     float partition_sah(BVH& bvh, const vec3* lowers, const vec3* uppers,
        int start, int end, bounds3 range_bounds, int& split_axis);
+    int partition_sah_binned(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, bool parallel);
 
-    int build_recursive(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent);
+    int partition(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, bounds3 range_bounds, bool parallel);
+
+    int build_top(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent);
+    int build_recursive(BVH& bvh, NodeList& nodes, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent);
 
     int constructor_type = -1;
+
+    std::vector<TopNode> top_nodes;
+    std::vector<Subtree> subtrees;
+
+    // scratch space for the parallel partition
+    std::vector<int> scratch_indices;
 };
 
+// ranges of more than BVH_SUBTREE_SIZE items form the top levels of the tree and are split by
+// the calling thread, with their items processed in parallel chunks of BVH_CHUNK_SIZE items;
+// smaller ranges are built as independent subtrees on the worker threads. Both sizes are fixed
+// so that the resulting tree does not depend on the number of threads.
+#define BVH_SUBTREE_SIZE (4096)
+#define BVH_CHUNK_SIZE (4096)
+
+inline int bvh_num_chunks(int start, int end)
+{
+    return (end - start + BVH_CHUNK_SIZE - 1) / BVH_CHUNK_SIZE;
+}
+
+// calls func(chunk, chunk_start, chunk_end) for each chunk of [start, end) on the host worker pool
+template <typename Func>
+void bvh_for_each_chunk(int start, int end, const Func& func)
+{
+    parallel_for(bvh_num_chunks(start, end), 1, [&](size_t begin, size_t last)
+    {
+        for (int chunk = int(begin); chunk < int(last); ++chunk)
+        {
+            const int chunk_start = start + chunk * BVH_CHUNK_SIZE;
+            const int chunk_end = std::min(chunk_start + BVH_CHUNK_SIZE, end);
+
+            func(chunk, chunk_start, chunk_end);
+        }
+    });
+}
+
 //////////////////////////////////////////////////////////////////////
 
 void TopDownBVHBuilder::build(BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type)
 {
     constructor_type = in_constructor_type;
-    if (constructor_type != BVH_CONSTRUCTOR_SAH && constructor_type != BVH_CONSTRUCTOR_MEDIAN)
+    if (constructor_type != BVH_CONSTRUCTOR_SAH && constructor_type != BVH_CONSTRUCTOR_MEDIAN && constructor_type != BVH_CONSTRUCTOR_SAH_BINNED)
     {
-        printf("Unrecognized Constructor type: %d! For CPU constructor it should be either SAH (%d) or Median (%d)!\n",
-            constructor_type, BVH_CONSTRUCTOR_SAH, BVH_CONSTRUCTOR_MEDIAN);
+        printf("Unrecognized Constructor type: %d! For CPU constructor it should be either SAH (%d), Median (%d), or binned SAH (%d)!\n",
+            constructor_type, BVH_CONSTRUCTOR_SAH, BVH_CONSTRUCTOR_MEDIAN, BVH_CONSTRUCTOR_SAH_BINNED);
         return;
     }
 
@@ -74,7 +151,80 @@ void TopDownBVHBuilder::build(BVH& bvh, const vec3* lowers, const vec3* uppers,
     for (int i = 0; i < n; ++i)
         bvh.primitive_indices[i] = i;
 
-    build_recursive(bvh, lowers, uppers,  0, n, 0, -1);
+    if (n > BVH_SUBTREE_SIZE)
+        scratch_indices.resize(n);
+
+    // split the top levels of the tree, then build the remaining subtrees concurrently
+    build_top(bvh, lowers, uppers, 0, n, 0, -1);
+
+    parallel_for(subtrees.size(), 1, [&](size_t begin, size_t end)
+    {
+        for (size_t i = begin; i < end; ++i)
+        {
+            Subtree& subtree = subtrees[i];
+            build_recursive(bvh, subtree.nodes, lowers, uppers, subtree.start, subtree.end, subtree.depth, -1);
+        }
+    });
+
+    // the top nodes come first followed by the subtrees in order, so the root remains at index 0
+    int num_nodes = int(top_nodes.size());
+    for (Subtree& subtree : subtrees)
+    {
+        subtree.offset = num_nodes;
+        num_nodes += int(subtree.nodes.lowers.size());
+
+        bvh.max_depth = std::max(bvh.max_depth, subtree.nodes.max_depth);
+        bvh.num_leaf_nodes += subtree.nodes.num_leaf_nodes;
+    }
+
+    assert(num_nodes <= bvh.max_nodes);
+    bvh.num_nodes = num_nodes;
+
+    auto resolve_child = [&](int child)
+    {
+        return child >= 0 ? child : subtrees[-child - 1].offset;
+    };
+
+    for (size_t i = 0; i < top_nodes.size(); ++i)
+    {
+        const TopNode& node = top_nodes[i];
+
+        bvh.node_lowers[i] = make_node(node.bounds.lower, resolve_child(node.left), false);
+        bvh.node_uppers[i] = make_node(node.bounds.upper, resolve_child(node.right), false);
+        bvh.node_parents[i] = node.parent;
+
+        bvh.max_depth = std::max(bvh.max_depth, node.depth);
+    }
+
+    parallel_for(subtrees.size(), 1, [&](size_t begin, size_t end)
+    {
+        for (size_t i = begin; i < end; ++i)
+        {
+            const Subtree& subtree = subtrees[i];
+            const NodeList& nodes = subtree.nodes;
+
+            for (size_t j = 0; j < nodes.lowers.size(); ++j)
+            {
+                BVHPackedNodeHalf lower = nodes.lowers[j];
+                BVHPackedNodeHalf upper = nodes.uppers[j];
+
+                // leaf nodes reference primitive ranges, inner nodes reference local child indices
+                if (!lower.b)
+                {
+                    lower.i += subtree.offset;
+                    upper.i += subtree.offset;
+                }
+
+                bvh.node_lowers[subtree.offset + j] = lower;
+                bvh.node_uppers[subtree.offset + j] = upper;
+                bvh.node_parents[subtree.offset + j] = j == 0 ? subtree.parent : nodes.parents[j] + subtree.offset;
+            }
+        }
+    });
+
+    top_nodes.clear();
+    subtrees.clear();
+    scratch_indices.clear();
 }
 
 
@@ -90,6 +240,22 @@ bounds3 TopDownBVHBuilder::calc_bounds(const vec3* lowers, const vec3* uppers, c
     return u;
 }
 
+bounds3 TopDownBVHBuilder::calc_bounds_parallel(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end)
+{
+    std::vector<bounds3> chunk_bounds(bvh_num_chunks(start, end));
+
+    bvh_for_each_chunk(start, end, [&](int chunk, int chunk_start, int chunk_end)
+    {
+        chunk_bounds[chunk] = calc_bounds(lowers, uppers, indices, chunk_start, chunk_end);
+    });
+
+    bounds3 u;
+    for (const bounds3& b : chunk_bounds)
+        u = bounds_union(u, b);
+
+    return u;
+}
+
 struct PartitionPredicateMedian
 {
     PartitionPredicateMedian(const vec3* lowers, const vec3* uppers, int a) : lowers(lowers), uppers(uppers), axis(a) {}
@@ -260,119 +426,400 @@ float TopDownBVHBuilder::partition_sah(BVH& bvh, const vec3* lowers, const vec3*
     return split_point;
 }
 
-int TopDownBVHBuilder::build_recursive(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent)
+// bins of a binned SAH split, item centroids are binned along all three axes
+struct SAHBins
 {
-    assert(start < end);
+    bounds3 bounds[3][BVH_SAH_NUM_BINS];
+    int counts[3][BVH_SAH_NUM_BINS];
 
-    // printf("start %d end %d\n", start, end);
+    void clear()
+    {
+        for (int axis = 0; axis < 3; ++axis)
+        {
+            for (int bin = 0; bin < BVH_SAH_NUM_BINS; ++bin)
+            {
+                bounds[axis][bin] = bounds3();
+                counts[axis][bin] = 0;
+            }
+        }
+    }
 
-    const int n = end - start;
-    const int node_index = bvh.num_nodes++;
+    void merge(const SAHBins& other)
+    {
+        for (int axis = 0; axis < 3; ++axis)
+        {
+            for (int bin = 0; bin < BVH_SAH_NUM_BINS; ++bin)
+            {
+                bounds[axis][bin] = bounds_union(bounds[axis][bin], other.bounds[axis][bin]);
+                counts[axis][bin] += other.counts[axis][bin];
+            }
+        }
+    }
+};
 
-    assert(node_index < bvh.max_nodes);
+inline int sah_bin_index(float centroid, float centroid_lower, float bin_scale)
+{
+    const int bin = int((centroid - centroid_lower) * bin_scale);
+    return std::min(std::max(bin, 0), BVH_SAH_NUM_BINS - 1);
+}
+
+int TopDownBVHBuilder::partition_sah_binned(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, bool parallel)
+{
+    assert(end - start >= 2);
 
-    if (depth > bvh.max_depth)
-        bvh.max_depth = depth;
+    int* indices = bvh.primitive_indices;
 
-    bounds3 b = calc_bounds(lowers, uppers, bvh.primitive_indices, start, end);
+    auto centroid = [&](int item)
+    {
+        return 0.5f * (lowers[item] + uppers[item]);
+    };
 
-    if (n <= BVH_LEAF_SIZE)
+    // bins are placed over the bounds of the item centroids rather than the item bounds
+    auto centroid_bounds = [&](int range_start, int range_end)
+    {
+        bounds3 b;
+        for (int i = range_start; i < range_end; ++i)
+            b.add_point(centroid(indices[i]));
+        return b;
+    };
+
+    bounds3 cb;
+    if (parallel)
     {
-        bvh.node_lowers[node_index] = make_node(b.lower, start, true);
-        bvh.node_uppers[node_index] = make_node(b.upper, end, false);
-        bvh.node_parents[node_index] = parent;
-        bvh.num_leaf_nodes++;
+        std::vector<bounds3> chunk_bounds(bvh_num_chunks(start, end));
+        bvh_for_each_chunk(start, end, [&](int chunk, int chunk_start, int chunk_end)
+        {
+            chunk_bounds[chunk] = centroid_bounds(chunk_start, chunk_end);
+        });
+
+        for (const bounds3& b : chunk_bounds)
+            cb = bounds_union(cb, b);
     }
     else
     {
-        int split = -1;
-        if (constructor_type == BVH_CONSTRUCTOR_SAH)
-            // SAH constructor
+        cb = centroid_bounds(start, end);
+    }
+
+    float bin_scale[3];
+    for (int axis = 0; axis < 3; ++axis)
+    {
+        const float extent = cb.upper[axis] - cb.lower[axis];
+        bin_scale[axis] = extent > 0.0f ? BVH_SAH_NUM_BINS / extent : 0.0f;
+    }
+
+    auto fill_bins = [&](SAHBins& bins, int range_start, int range_end)
+    {
+        bins.clear();
+        for (int i = range_start; i < range_end; ++i)
         {
-            int split_axis = -1;
-            float split_point = partition_sah(bvh, lowers, uppers, start, end, b, split_axis);
-            auto boundary = std::partition(bvh.primitive_indices + start, bvh.primitive_indices + end,
-                [&](int i) {
-                    return 0.5f * (lowers[i] + uppers[i])[split_axis] < split_point;
-                });
-
-            split = std::distance(bvh.primitive_indices + start, boundary) + start;
+            const int item = indices[i];
+            const vec3 c = centroid(item);
+
+            for (int axis = 0; axis < 3; ++axis)
+            {
+                const int bin = sah_bin_index(c[axis], cb.lower[axis], bin_scale[axis]);
+                bins.bounds[axis][bin].add_bounds(lowers[item], uppers[item]);
+                bins.counts[axis][bin]++;
+            }
         }
-        else if (constructor_type == BVH_CONSTRUCTOR_MEDIAN)
-            // Median constructor
+    };
+
+    SAHBins bins;
+    if (parallel)
+    {
+        std::vector<SAHBins> chunk_bins(bvh_num_chunks(start, end));
+        bvh_for_each_chunk(start, end, [&](int chunk, int chunk_start, int chunk_end)
         {
-            split = partition_median(lowers, uppers, bvh.primitive_indices, start, end, b);
-        }
-        else
+            fill_bins(chunk_bins[chunk], chunk_start, chunk_end);
+        });
+
+        bins.clear();
+        for (const SAHBins& b : chunk_bins)
+            bins.merge(b);
+    }
+    else
+    {
+        fill_bins(bins, start, end);
+    }
+
+    // find the split after bin i along any axis that minimizes area(left) * count(left) + area(right) * count(right)
+    int split_axis = -1;
+    int split_bin = -1;
+    float min_cost = FLT_MAX;
+
+    for (int axis = 0; axis < 3; ++axis)
+    {
+        if (bin_scale[axis] == 0.0f)
+            continue;
+
+        float right_areas[BVH_SAH_NUM_BINS - 1];
+        int right_counts[BVH_SAH_NUM_BINS - 1];
+
+        bounds3 right;
+        int right_count = 0;
+        for (int i = BVH_SAH_NUM_BINS - 1; i > 0; --i)
         {
-            printf("Unknown type of BVH constructor: %d!\n", constructor_type);
-            return -1;
+            right = bounds_union(right, bins.bounds[axis][i]);
+            right_count += bins.counts[axis][i];
+
+            right_areas[i - 1] = right.area();
+            right_counts[i - 1] = right_count;
         }
 
-        if (split == start || split == end)
+        bounds3 left;
+        int left_count = 0;
+        for (int i = 0; i < BVH_SAH_NUM_BINS - 1; ++i)
         {
-            // partitioning failed, split down the middle
-            split = (start + end) / 2;
+            left = bounds_union(left, bins.bounds[axis][i]);
+            left_count += bins.counts[axis][i];
+
+            if (left_count == 0 || right_counts[i] == 0)
+                continue;
+
+            const float cost = left.area() * left_count + right_areas[i] * right_counts[i];
+            if (cost < min_cost)
+            {
+                min_cost = cost;
+                split_axis = axis;
+                split_bin = i;
+            }
         }
+    }
 
-        int left_child = build_recursive(bvh, lowers, uppers, start, split, depth + 1, node_index);
-        int right_child = build_recursive(bvh, lowers, uppers, split, end, depth + 1, node_index);
+    // all centroids coincide, let the caller split down the middle
+    if (split_axis == -1)
+        return start;
 
-        bvh.node_lowers[node_index] = make_node(b.lower, left_child, false);
-        bvh.node_uppers[node_index] = make_node(b.upper, right_child, false);
-        bvh.node_parents[node_index] = parent;
-    }
+    auto is_left = [&](int item)
+    {
+        return sah_bin_index(centroid(item)[split_axis], cb.lower[split_axis], bin_scale[split_axis]) <= split_bin;
+    };
 
-    return node_index;
-}
+    if (!parallel)
+        return int(std::partition(indices + start, indices + end, is_left) - indices);
 
+    // stable partition: count the left items of each chunk, then scatter the items of each chunk
+    // to their final positions through the scratch buffer
+    const int num_chunks = bvh_num_chunks(start, end);
+    std::vector<int> left_offsets(num_chunks + 1, 0);
+    std::vector<int> right_offsets(num_chunks + 1, 0);
 
-void bvh_refit_recursive(BVH& bvh, int index)
-{
-    BVHPackedNodeHalf& lower = bvh.node_lowers[index];
-    BVHPackedNodeHalf& upper = bvh.node_uppers[index];
+    bvh_for_each_chunk(start, end, [&](int chunk, int chunk_start, int chunk_end)
+    {
+        int count = 0;
+        for (int i = chunk_start; i < chunk_end; ++i)
+            count += is_left(indices[i]);
 
-    if (lower.b)
+        left_offsets[chunk + 1] = count;
+        right_offsets[chunk + 1] = chunk_end - chunk_start - count;
+    });
+
+    for (int chunk = 0; chunk < num_chunks; ++chunk)
+    {
+        left_offsets[chunk + 1] += left_offsets[chunk];
+        right_offsets[chunk + 1] += right_offsets[chunk];
+    }
+
+    const int split = start + left_offsets[num_chunks];
+
+    bvh_for_each_chunk(start, end, [&](int chunk, int chunk_start, int chunk_end)
     {
-        // update leaf from items
-        bounds3 bound;
-        for (int item_counter = lower.i; item_counter < upper.i; item_counter++)
+        int left_index = start + left_offsets[chunk];
+        int right_index = split + right_offsets[chunk];
+
+        for (int i = chunk_start; i < chunk_end; ++i)
         {
-            const int item = bvh.primitive_indices[item_counter];
-            bound.add_bounds(bvh.item_lowers[item], bvh.item_uppers[item]);
+            const int item = indices[i];
+            if (is_left(item))
+                scratch_indices[left_index++] = item;
+            else
+                scratch_indices[right_index++] = item;
         }
+    });
+
+    bvh_for_each_chunk(start, end, [&](int chunk, int chunk_start, int chunk_end)
+    {
+        std::copy(scratch_indices.begin() + chunk_start, scratch_indices.begin() + chunk_end, indices + chunk_start);
+    });
+
+    return split;
+}
 
-        (vec3&)lower = bound.lower;
-        (vec3&)upper = bound.upper;
+int TopDownBVHBuilder::partition(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, bounds3 range_bounds, bool parallel)
+{
+    int split = -1;
+    if (constructor_type == BVH_CONSTRUCTOR_SAH)
+        // SAH constructor
+    {
+        int split_axis = -1;
+        float split_point = partition_sah(bvh, lowers, uppers, start, end, range_bounds, split_axis);
+        auto boundary = std::partition(bvh.primitive_indices + start, bvh.primitive_indices + end,
+            [&](int i) {
+                return 0.5f * (lowers[i] + uppers[i])[split_axis] < split_point;
+            });
+
+        split = std::distance(bvh.primitive_indices + start, boundary) + start;
+    }
+    else if (constructor_type == BVH_CONSTRUCTOR_MEDIAN)
+        // Median constructor
+    {
+        split = partition_median(lowers, uppers, bvh.primitive_indices, start, end, range_bounds);
+    }
+    else if (constructor_type == BVH_CONSTRUCTOR_SAH_BINNED)
+        // binned SAH constructor
+    {
+        split = partition_sah_binned(bvh, lowers, uppers, start, end, parallel);
     }
     else
     {
-        int left_index = lower.i;
-        int right_index = upper.i;
+        printf("Unknown type of BVH constructor: %d!\n", constructor_type);
+        return -1;
+    }
+
+    if (split == start || split == end)
+    {
+        // partitioning failed, split down the middle
+        split = (start + end) / 2;
+    }
+
+    return split;
+}
+
+int TopDownBVHBuilder::build_top(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent)
+{
+    if (end - start <= BVH_SUBTREE_SIZE)
+    {
+        Subtree subtree;
+        subtree.start = start;
+        subtree.end = end;
+        subtree.depth = depth;
+        subtree.parent = parent;
+        subtree.offset = 0;
 
-        bvh_refit_recursive(bvh, left_index);
-        bvh_refit_recursive(bvh, right_index);
+        subtrees.push_back(std::move(subtree));
 
-        // compute union of children
-        const vec3& left_lower = (vec3&)bvh.node_lowers[left_index];
-        const vec3& left_upper = (vec3&)bvh.node_uppers[left_index];
+        // subtrees are referenced by negative indices until their nodes are placed
+        return -int(subtrees.size());
+    }
 
-        const vec3& right_lower = (vec3&)bvh.node_lowers[right_index];
-        const vec3& right_upper = (vec3&)bvh.node_uppers[right_index];
+    const int node_index = int(top_nodes.size());
+    top_nodes.push_back(TopNode());
 
-        // union of child bounds
-        vec3 new_lower = min(left_lower, right_lower);
-        vec3 new_upper = max(left_upper, right_upper);
-        
-        // write new BVH nodes
-        (vec3&)lower = new_lower;
-        (vec3&)upper = new_upper;
+    const bounds3 b = calc_bounds_parallel(lowers, uppers, bvh.primitive_indices, start, end);
+    const int split = partition(bvh, lowers, uppers, start, end, b, true);
+
+    const int left_child = build_top(bvh, lowers, uppers, start, split, depth + 1, node_index);
+    const int right_child = build_top(bvh, lowers, uppers, split, end, depth + 1, node_index);
+
+    TopNode& node = top_nodes[node_index];
+    node.bounds = b;
+    node.left = left_child;
+    node.right = right_child;
+    node.parent = parent;
+    node.depth = depth;
+
+    return node_index;
+}
+
+int TopDownBVHBuilder::build_recursive(BVH& bvh, NodeList& nodes, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent)
+{
+    assert(start < end);
+
+    // printf("start %d end %d\n", start, end);
+
+    const int n = end - start;
+    const int node_index = int(nodes.lowers.size());
+
+    nodes.lowers.emplace_back();
+    nodes.uppers.emplace_back();
+    nodes.parents.emplace_back();
+
+    if (depth > nodes.max_depth)
+        nodes.max_depth = depth;
+
+    bounds3 b = calc_bounds(lowers, uppers, bvh.primitive_indices, start, end);
+
+    if (n <= BVH_LEAF_SIZE)
+    {
+        nodes.lowers[node_index] = make_node(b.lower, start, true);
+        nodes.uppers[node_index] = make_node(b.upper, end, false);
+        nodes.parents[node_index] = parent;
+        nodes.num_leaf_nodes++;
+    }
+    else
+    {
+        const int split = partition(bvh, lowers, uppers, start, end, b, false);
+        if (split == -1)
+            return -1;
+
+        int left_child = build_recursive(bvh, nodes, lowers, uppers, start, split, depth + 1, node_index);
+        int right_child = build_recursive(bvh, nodes, lowers, uppers, split, end, depth + 1, node_index);
+
+        nodes.lowers[node_index] = make_node(b.lower, left_child, false);
+        nodes.uppers[node_index] = make_node(b.upper, right_child, false);
+        nodes.parents[node_index] = parent;
     }
+
+    return node_index;
 }
 
+
 void bvh_refit_host(BVH& bvh)
 {
-    bvh_refit_recursive(bvh, 0);
+    if (bvh.num_nodes == 0)
+        return;
+
+    // refit bottom-up starting from the leaves, the second child to complete refits its parent
+    std::unique_ptr<std::atomic<int>[]> child_counts(new std::atomic<int>[bvh.num_nodes]());
+
+    parallel_for(bvh.num_nodes, parallel_grain_size(bvh.num_nodes, 256), [&](size_t begin, size_t end)
+    {
+        for (int index = int(begin); index < int(end); ++index)
+        {
+            BVHPackedNodeHalf& lower = bvh.node_lowers[index];
+            BVHPackedNodeHalf& upper = bvh.node_uppers[index];
+
+            if (!lower.b)
+                continue;
+
+            // update leaf from items
+            bounds3 bound;
+            for (int item_counter = lower.i; item_counter < upper.i; item_counter++)
+            {
+                const int item = bvh.primitive_indices[item_counter];
+                bound.add_bounds(bvh.item_lowers[item], bvh.item_uppers[item]);
+            }
+
+            (vec3&)lower = bound.lower;
+            (vec3&)upper = bound.upper;
+
+            for (int parent = bvh.node_parents[index]; parent != -1; parent = bvh.node_parents[parent])
+            {
+                // the first child to arrive stops, the acquire-release ordering makes
+                // its bounds visible to the second child which refits the parent
+                if (child_counts[parent].fetch_add(1, std::memory_order_acq_rel) == 0)
+                    break;
+
+                const int left_index = bvh.node_lowers[parent].i;
+                const int right_index = bvh.node_uppers[parent].i;
+
+                // compute union of children
+                const vec3& left_lower = (vec3&)bvh.node_lowers[left_index];
+                const vec3& left_upper = (vec3&)bvh.node_uppers[left_index];
+
+                const vec3& right_lower = (vec3&)bvh.node_lowers[right_index];
+                const vec3& right_upper = (vec3&)bvh.node_uppers[right_index];
+
+                // union of child bounds
+                vec3 new_lower = min(left_lower, right_lower);
+                vec3 new_upper = max(left_upper, right_upper);
+
+                // write new BVH nodes
+                (vec3&)bvh.node_lowers[parent] = new_lower;
+                (vec3&)bvh.node_uppers[parent] = new_upper;
+            }
+        }
+    });
 }
 
 
@@ -639,7 +639,7 @@ void copy_host_tree_to_device(void* context, BVH& bvh_host, BVH& bvh_device_on_h
 void bvh_create_device(void* context, vec3* lowers, vec3* uppers, int num_items, int constructor_type, BVH& bvh_device_on_host)
 {
     ContextGuard guard(context);
-    if (constructor_type == BVH_CONSTRUCTOR_SAH || constructor_type == BVH_CONSTRUCTOR_MEDIAN)
+    if (constructor_type == BVH_CONSTRUCTOR_SAH || constructor_type == BVH_CONSTRUCTOR_MEDIAN || constructor_type == BVH_CONSTRUCTOR_SAH_BINNED)
         // CPU based constructors
     {
         // copy bounds back to CPU
@@ -684,7 +684,7 @@ void bvh_create_device(void* context, vec3* lowers, vec3* uppers, int num_items,
     }
     else
     {
-        printf("Unrecognized Constructor type: %d! For GPU constructor it should be SAH (0), Median (1), or LBVH (2)!\n", constructor_type);
+        printf("Unrecognized Constructor type: %d! For GPU constructor it should be SAH (0), Median (1), LBVH (2), or binned SAH (3)!\n", constructor_type);
     }
 }
 
@@ -13,11 +13,13 @@
 
 #define BVH_LEAF_SIZE (4)
 #define SAH_NUM_BUCKETS (16)
+#define BVH_SAH_NUM_BINS (32)
 #define USE_LOAD4
 
 #define BVH_CONSTRUCTOR_SAH (0)
 #define BVH_CONSTRUCTOR_MEDIAN (1)
 #define BVH_CONSTRUCTOR_LBVH (2)
+#define BVH_CONSTRUCTOR_SAH_BINNED (3)
 
 namespace wp
 {
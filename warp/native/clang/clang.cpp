@@ -39,6 +39,11 @@
 #include <llvm/ExecutionEngine/Orc/RTDyldObjectLinkingLayer.h>
 #include <llvm/ExecutionEngine/Orc/TargetProcess/TargetExecutionUtils.h>
 #include <llvm/ExecutionEngine/SectionMemoryManager.h>
+#if LLVM_VERSION_MAJOR >= 17
+#include <llvm/TargetParser/Host.h>
+#else
+#include <llvm/Support/Host.h>
+#endif
 
 #include <cmath>
 #include <vector>
@@ -79,13 +84,53 @@ namespace wp {
 
 static void initialize_llvm()
 {
-    llvm::InitializeAllTargetInfos();
-    llvm::InitializeAllTargets();
-    llvm::InitializeAllTargetMCs();
-    llvm::InitializeAllAsmPrinters();
+    // registering the targets is not thread-safe, do it once for all threads compiling concurrently
+    static const bool initialized = []()
+    {
+        llvm::InitializeAllTargetInfos();
+        llvm::InitializeAllTargets();
+        llvm::InitializeAllTargetMCs();
+        llvm::InitializeAllAsmPrinters();
+
+        return true;
+    }();
+
+    (void)initialized;
+}
+
+// Determines the CPU and target features used to generate code for CPU kernels.
+// "native" selects the host CPU and all of its features (e.g. AVX2 / AVX-512) so that
+// vectorized kernels can use the widest available SIMD instructions, anything else
+// selects the generic target that runs on any CPU of the target architecture.
+static void get_cpu_target(const char* target_cpu, std::string& cpu, std::vector<std::string>& features)
+{
+    if (target_cpu && strcmp(target_cpu, "native") == 0)
+    {
+        cpu = llvm::sys::getHostCPUName().str();
+
+        #if LLVM_VERSION_MAJOR >= 19
+        llvm::StringMap<bool> host_features = llvm::sys::getHostCPUFeatures();
+        #else
+        llvm::StringMap<bool> host_features;
+        llvm::sys::getHostCPUFeatures(host_features);
+        #endif
+
+        for (const auto& feature : host_features)
+        {
+            features.push_back((feature.getValue() ? "+" : "-") + feature.getKey().str());
+        }
+    }
+    else
+    {
+        cpu = "generic";
+
+        #if defined(__x86_64__) || defined(_M_X64)
+            features.push_back("+f16c");  // Enables support for _Float16
+        #endif
+    }
 }
 
-static std::unique_ptr<llvm::Module> cpp_to_llvm(const std::string& input_file, const char* cpp_src, const char* include_dir, bool debug, bool verify_fp, llvm::LLVMContext& context)
+static std::unique_ptr<llvm::Module> cpp_to_llvm(const std::string& input_file, const char* cpp_src, const char* include_dir, bool debug, bool verify_fp, const std::string& cpu, const std::vector<std::string>& features, llvm::LLVMContext& context)
 {
     // Compilation arguments
     std::vector<const char*> args;
@@ -99,10 +144,17 @@ static std::unique_ptr<llvm::Module> cpp_to_llvm(const std::string& input_file,
     args.push_back("-triple");
     args.push_back(target_triple);
 
-    #if defined(__x86_64__) || defined(_M_X64)
+    if (cpu != "generic")
+    {
+        args.push_back("-target-cpu");
+        args.push_back(cpu.c_str());
+    }
+
+    for (const std::string& feature : features)
+    {
         args.push_back("-target-feature");
-        args.push_back("+f16c");  // Enables support for _Float16
-    #endif
+        args.push_back(feature.c_str());
+    }
 
     clang::IntrusiveRefCntPtr<clang::DiagnosticOptions> diagnostic_options = new clang::DiagnosticOptions();
     std::unique_ptr<clang::TextDiagnosticPrinter> text_diagnostic_printer =
@@ -218,12 +270,16 @@ static std::unique_ptr<llvm::Module> cuda_to_llvm(const std::string& input_file,
 
 extern "C" {
 
-WP_API int compile_cpp(const char* cpp_src, const char *input_file, const char* include_dir, const char* output_file, bool debug, bool verify_fp, bool fuse_fp)
+WP_API int compile_cpp(const char* cpp_src, const char *input_file, const char* include_dir, const char* output_file, bool debug, bool verify_fp, bool fuse_fp, const char* target_cpu)
 {
     initialize_llvm();
 
+    std::string cpu;
+    std::vector<std::string> cpu_features;
+    get_cpu_target(target_cpu, cpu, cpu_features);
+
     llvm::LLVMContext context;
-    std::unique_ptr<llvm::Module> module = cpp_to_llvm(input_file, cpp_src, include_dir, debug, verify_fp, context);
+    std::unique_ptr<llvm::Module> module = cpp_to_llvm(input_file, cpp_src, include_dir, debug, verify_fp, cpu, cpu_features, context);
 
     if(!module)
     {
@@ -233,7 +289,9 @@ WP_API int compile_cpp(const char* cpp_src, const char *input_file, const char*
     std::string error;
     const llvm::Target* target = llvm::TargetRegistry::lookupTarget(target_triple, error);
 
-    const char* CPU = "generic";
+    // the target features are recorded as function attributes by the frontend,
+    // the CPU name additionally selects the instruction scheduling model
+    const char* CPU = cpu.c_str();
     const char* features = "";
     llvm::TargetOptions target_options;
     if (fuse_fp)
@@ -495,6 +553,14 @@ WP_API uint64_t lookup(const char* dll_name, const char* function_name)
     return func->getValue();
 }
 
+// Name of the host CPU as used for compile_cpp(..., target_cpu="native"), e.g. "skylake-avx512"
+WP_API const char* host_cpu_name()
+{
+    static std::string name = llvm::sys::getHostCPUName().str();
+
+    return name.c_str();
+}
+
 }  // extern "C"
 
 }  // namespace wp
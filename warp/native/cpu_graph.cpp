@@ -0,0 +1,551 @@
+/** Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+ * NVIDIA CORPORATION and its licensors retain all intellectual property
+ * and proprietary rights in and to this software, related documentation
+ * and any modifications thereto.  Any use, reproduction, disclosure or
+ * distribution of this software and related documentation without an express
+ * license agreement from NVIDIA CORPORATION is strictly prohibited.
+ */
+
+#include "warp.h"
+#include "parallel.h"
+#include "cpu_timing.h"
+
+#include <chrono>
+#include <condition_variable>
+#include <cstring>
+#include <deque>
+#include <memory>
+#include <mutex>
+#include <set>
+#include <thread>
+#include <vector>
+
+// CPU graphs are the host counterpart of CUDA graphs: kernel launches and memory operations are recorded
+// into a list of commands that is replayed in order by a single call. The parameters of every command are
+// copied into a buffer owned by the command when it is recorded, so replaying a graph does not depend on
+// the lifetime of the Python objects that were used to record it (the memory they point to must stay alive).
+//
+// CPU streams accept the same commands, which are executed in order by a worker thread owned by the stream
+// as soon as they are added. Events recorded onto streams mark the completion of the commands that precede
+// them, and streams can wait on events to order their work after the work of other streams.
+
+namespace
+{
+
+// signature of the {name}_cpu_forward_range() / {name}_cpu_backward_range() kernel entry points
+typedef void (*cpu_graph_kernel_func_t)(size_t task_begin, size_t task_end, void** args);
+
+enum CpuGraphCommandType
+{
+    CPU_GRAPH_KERNEL,
+    CPU_GRAPH_MEMCPY,
+    CPU_GRAPH_MEMSET,
+    CPU_GRAPH_MEMTILE,
+    CPU_GRAPH_ARRAY_COPY,
+    CPU_GRAPH_ARRAY_FILL,
+    CPU_GRAPH_LAUNCH_GRAPH,
+    CPU_GRAPH_EVENT_RECORD,
+    CPU_GRAPH_EVENT_WAIT,
+};
+
+// parameter buffers are allocated in multiples of this size so every parameter is suitably aligned
+const size_t CPU_GRAPH_PARAM_ALIGNMENT = 16;
+
+// completion state of a single record of an event, shared by the command that signals it and the commands waiting on it
+struct CpuEventRecord
+{
+    bool done = false;
+    int64_t timestamp = 0;
+};
+
+// protects the event records and notifies the threads waiting on them
+std::mutex g_cpu_event_mutex;
+std::condition_variable g_cpu_event_cv;
+
+void cpu_event_signal(CpuEventRecord* record)
+{
+    {
+        std::lock_guard<std::mutex> lock(g_cpu_event_mutex);
+        record->timestamp = wp::cpu_timing_now();
+        record->done = true;
+    }
+    g_cpu_event_cv.notify_all();
+}
+
+void cpu_event_wait(CpuEventRecord* record)
+{
+    std::unique_lock<std::mutex> lock(g_cpu_event_mutex);
+    g_cpu_event_cv.wait(lock, [record] { return record->done; });
+}
+
+struct CpuEvent
+{
+    // the most recent record of the event, null if the event was never recorded
+    std::shared_ptr<CpuEventRecord> record;
+};
+
+struct CpuGraph;
+void cpu_graph_execute(CpuGraph* graph);
+
+struct CpuGraphCommand
+{
+    CpuGraphCommandType type;
+
+    // kernel entry point and whether the launch may be split across the host worker pool
+    cpu_graph_kernel_func_t kernel = nullptr;
+    bool parallel = false;
+
+    // identifies the kernel launch in the CPU timing results
+    uint64_t tag = 0;
+
+    // number of threads, bytes, or tile repetitions
+    size_t n = 0;
+
+    // graph launched by the command and event record signaled or waited on
+    CpuGraph* graph = nullptr;
+    std::shared_ptr<CpuEventRecord> event;
+
+    void* dest = nullptr;
+    void* src = nullptr;
+    int value = 0;
+    int dest_type = 0;
+    int src_type = 0;
+    int size = 0;
+
+    // copies of the parameters and their addresses
+    std::unique_ptr<unsigned char[]> data;
+    std::vector<void*> args;
+
+    // copies the given parameters into a single buffer owned by the command
+    void copy_params(const void* const* params, const size_t* sizes, int num_params)
+    {
+        size_t total_size = 0;
+        for (int i = 0; i < num_params; ++i)
+            total_size += (sizes[i] + CPU_GRAPH_PARAM_ALIGNMENT - 1) / CPU_GRAPH_PARAM_ALIGNMENT * CPU_GRAPH_PARAM_ALIGNMENT;
+
+        data.reset(new unsigned char[total_size]);
+        args.resize(num_params);
+
+        size_t offset = 0;
+        for (int i = 0; i < num_params; ++i)
+        {
+            memcpy(data.get() + offset, params[i], sizes[i]);
+            args[i] = data.get() + offset;
+
+            offset += (sizes[i] + CPU_GRAPH_PARAM_ALIGNMENT - 1) / CPU_GRAPH_PARAM_ALIGNMENT * CPU_GRAPH_PARAM_ALIGNMENT;
+        }
+    }
+
+    void execute()
+    {
+        switch (type)
+        {
+        case CPU_GRAPH_KERNEL:
+        {
+            // launches submitted to streams are only tagged while timing is active
+            const bool timed = tag != 0 && wp::cpu_timing_enabled(wp::CPU_TIMING_KERNEL);
+            wp::cpu_run_kernel(reinterpret_cast<void*>(kernel), n, args.data(), parallel, timed, tag);
+            break;
+        }
+        case CPU_GRAPH_MEMCPY:
+            memcpy_h2h(dest, src, n);
+            break;
+        case CPU_GRAPH_MEMSET:
+            memset_host(dest, value, n);
+            break;
+        case CPU_GRAPH_MEMTILE:
+            memtile_host(dest, args[0], size, n);
+            break;
+        case CPU_GRAPH_ARRAY_COPY:
+            array_copy_host(args[0], args[1], dest_type, src_type, size);
+            break;
+        case CPU_GRAPH_ARRAY_FILL:
+            array_fill_host(args[0], dest_type, args[1], size);
+            break;
+        case CPU_GRAPH_LAUNCH_GRAPH:
+            cpu_graph_execute(graph);
+            break;
+        case CPU_GRAPH_EVENT_RECORD:
+            cpu_event_signal(event.get());
+            break;
+        case CPU_GRAPH_EVENT_WAIT:
+            cpu_event_wait(event.get());
+            break;
+        }
+    }
+};
+
+// destination of the cpu_graph_add_*() functions, commands are either recorded by a graph or executed by a stream
+struct CpuCommandList
+{
+    virtual ~CpuCommandList() = default;
+    virtual void add(CpuGraphCommand&& cmd) = 0;
+};
+
+struct CpuGraph : CpuCommandList
+{
+    std::vector<CpuGraphCommand> commands;
+
+    void add(CpuGraphCommand&& cmd) override
+    {
+        commands.push_back(std::move(cmd));
+    }
+};
+
+void cpu_graph_execute(CpuGraph* graph)
+{
+    const bool timed = wp::cpu_timing_enabled(wp::CPU_TIMING_GRAPH);
+    const int64_t start = timed ? wp::cpu_timing_now() : 0;
+
+    for (CpuGraphCommand& cmd : graph->commands)
+        cmd.execute();
+
+    if (timed)
+        wp::cpu_timing_record(wp::CPU_TIMING_GRAPH, 0, graph->commands.size(), start, wp::cpu_timing_now());
+}
+
+class CpuStream : public CpuCommandList
+{
+public:
+
+    CpuStream()
+    {
+        worker = std::thread(&CpuStream::worker_loop, this);
+    }
+
+    ~CpuStream()
+    {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            shutdown = true;
+        }
+        work_cv.notify_one();
+
+        // the worker executes the remaining commands before exiting
+        worker.join();
+    }
+
+    void add(CpuGraphCommand&& cmd) override
+    {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            queue.push_back(std::move(cmd));
+            ++num_submitted;
+        }
+        work_cv.notify_one();
+    }
+
+    void synchronize()
+    {
+        std::unique_lock<std::mutex> lock(mutex);
+        done_cv.wait(lock, [this] { return num_completed == num_submitted; });
+    }
+
+    bool is_idle()
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        return num_completed == num_submitted;
+    }
+
+private:
+
+    void worker_loop()
+    {
+        for (;;)
+        {
+            CpuGraphCommand cmd;
+            {
+                std::unique_lock<std::mutex> lock(mutex);
+                work_cv.wait(lock, [this] { return shutdown || !queue.empty(); });
+
+                if (queue.empty())
+                    return;
+
+                cmd = std::move(queue.front());
+                queue.pop_front();
+            }
+
+            cmd.execute();
+
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                ++num_completed;
+            }
+            done_cv.notify_all();
+        }
+    }
+
+    std::thread worker;
+
+    std::mutex mutex;
+    std::condition_variable work_cv;
+    std::condition_variable done_cv;
+    std::deque<CpuGraphCommand> queue;
+    uint64_t num_submitted = 0;
+    uint64_t num_completed = 0;
+    bool shutdown = false;
+};
+
+// streams that are alive, used to synchronize all the work submitted to the CPU
+std::mutex g_cpu_streams_mutex;
+std::set<CpuStream*> g_cpu_streams;
+
+CpuCommandList* get_command_list(void* handle)
+{
+    return static_cast<CpuCommandList*>(handle);
+}
+
+CpuGraph* get_graph(void* handle)
+{
+    return static_cast<CpuGraph*>(get_command_list(handle));
+}
+
+CpuStream* get_stream(void* handle)
+{
+    return static_cast<CpuStream*>(get_command_list(handle));
+}
+
+} // anonymous namespace
+
+void* cpu_graph_create()
+{
+    return static_cast<CpuCommandList*>(new CpuGraph());
+}
+
+void cpu_graph_destroy(void* graph)
+{
+    delete get_graph(graph);
+}
+
+int cpu_graph_get_num_commands(void* graph)
+{
+    return int(get_graph(graph)->commands.size());
+}
+
+void cpu_graph_add_kernel(void* graph, void* kernel, size_t dim, void** args, const size_t* arg_sizes, int num_args, bool parallel, uint64_t tag)
+{
+    CpuGraphCommand cmd;
+    cmd.type = CPU_GRAPH_KERNEL;
+    cmd.kernel = reinterpret_cast<cpu_graph_kernel_func_t>(kernel);
+    cmd.parallel = parallel;
+    cmd.tag = tag;
+    cmd.n = dim;
+    cmd.copy_params(args, arg_sizes, num_args);
+
+    get_command_list(graph)->add(std::move(cmd));
+}
+
+void cpu_graph_add_memcpy(void* graph, void* dest, void* src, size_t n)
+{
+    CpuGraphCommand cmd;
+    cmd.type = CPU_GRAPH_MEMCPY;
+    cmd.dest = dest;
+    cmd.src = src;
+    cmd.n = n;
+
+    get_command_list(graph)->add(std::move(cmd));
+}
+
+void cpu_graph_add_memset(void* graph, void* dest, int value, size_t n)
+{
+    CpuGraphCommand cmd;
+    cmd.type = CPU_GRAPH_MEMSET;
+    cmd.dest = dest;
+    cmd.value = value;
+    cmd.n = n;
+
+    get_command_list(graph)->add(std::move(cmd));
+}
+
+void cpu_graph_add_memtile(void* graph, void* dest, const void* src, size_t srcsize, size_t n)
+{
+    CpuGraphCommand cmd;
+    cmd.type = CPU_GRAPH_MEMTILE;
+    cmd.dest = dest;
+    cmd.size = int(srcsize);
+    cmd.n = n;
+
+    const void* params[] = { src };
+    cmd.copy_params(params, &srcsize, 1);
+
+    get_command_list(graph)->add(std::move(cmd));
+}
+
+void cpu_graph_add_array_copy(void* graph, void* dst, void* src, int dst_type, int src_type, size_t dst_desc_size, size_t src_desc_size, int elem_size)
+{
+    CpuGraphCommand cmd;
+    cmd.type = CPU_GRAPH_ARRAY_COPY;
+    cmd.dest_type = dst_type;
+    cmd.src_type = src_type;
+    cmd.size = elem_size;
+
+    const void* params[] = { dst, src };
+    const size_t sizes[] = { dst_desc_size, src_desc_size };
+    cmd.copy_params(params, sizes, 2);
+
+    get_command_list(graph)->add(std::move(cmd));
+}
+
+void cpu_graph_add_array_fill(void* graph, void* arr, int arr_type, size_t arr_desc_size, const void* value, int value_size)
+{
+    CpuGraphCommand cmd;
+    cmd.type = CPU_GRAPH_ARRAY_FILL;
+    cmd.dest_type = arr_type;
+    cmd.size = value_size;
+
+    const void* params[] = { arr, value };
+    const size_t sizes[] = { arr_desc_size, size_t(value_size) };
+    cmd.copy_params(params, sizes, 2);
+
+    get_command_list(graph)->add(std::move(cmd));
+}
+
+void cpu_graph_launch(void* graph)
+{
+    cpu_graph_execute(get_graph(graph));
+}
+
+void* cpu_stream_create()
+{
+    CpuStream* stream = new CpuStream();
+
+    std::lock_guard<std::mutex> lock(g_cpu_streams_mutex);
+    g_cpu_streams.insert(stream);
+
+    return static_cast<CpuCommandList*>(stream);
+}
+
+void cpu_stream_destroy(void* stream)
+{
+    CpuStream* cpu_stream = get_stream(stream);
+
+    {
+        std::lock_guard<std::mutex> lock(g_cpu_streams_mutex);
+        g_cpu_streams.erase(cpu_stream);
+    }
+
+    delete cpu_stream;
+}
+
+void cpu_stream_synchronize(void* stream)
+{
+    get_stream(stream)->synchronize();
+}
+
+int cpu_stream_query(void* stream)
+{
+    return get_stream(stream)->is_idle();
+}
+
+void cpu_stream_synchronize_all()
+{
+    std::lock_guard<std::mutex> lock(g_cpu_streams_mutex);
+
+    for (CpuStream* stream : g_cpu_streams)
+        stream->synchronize();
+}
+
+void cpu_stream_launch_graph(void* stream, void* graph)
+{
+    CpuGraphCommand cmd;
+    cmd.type = CPU_GRAPH_LAUNCH_GRAPH;
+    cmd.graph = get_graph(graph);
+
+    get_command_list(stream)->add(std::move(cmd));
+}
+
+void* cpu_event_create()
+{
+    return new CpuEvent();
+}
+
+void cpu_event_destroy(void* event)
+{
+    // pending commands share ownership of the records they signal or wait on
+    delete static_cast<CpuEvent*>(event);
+}
+
+void cpu_event_record(void* event, void* stream)
+{
+    CpuEvent* cpu_event = static_cast<CpuEvent*>(event);
+    std::shared_ptr<CpuEventRecord> record = std::make_shared<CpuEventRecord>();
+
+    {
+        std::lock_guard<std::mutex> lock(g_cpu_event_mutex);
+        cpu_event->record = record;
+    }
+
+    if (stream)
+    {
+        CpuGraphCommand cmd;
+        cmd.type = CPU_GRAPH_EVENT_RECORD;
+        cmd.event = std::move(record);
+
+        get_command_list(stream)->add(std::move(cmd));
+    }
+    else
+    {
+        // synchronous streams have no pending work
+        cpu_event_signal(record.get());
+    }
+}
+
+void cpu_stream_wait_event(void* stream, void* event)
+{
+    std::shared_ptr<CpuEventRecord> record;
+    {
+        std::lock_guard<std::mutex> lock(g_cpu_event_mutex);
+        record = static_cast<CpuEvent*>(event)->record;
+    }
+
+    // waiting on an event that was never recorded has no effect
+    if (!record)
+        return;
+
+    if (stream)
+    {
+        CpuGraphCommand cmd;
+        cmd.type = CPU_GRAPH_EVENT_WAIT;
+        cmd.event = std::move(record);
+
+        get_command_list(stream)->add(std::move(cmd));
+    }
+    else
+    {
+        // synchronous streams block the calling thread
+        cpu_event_wait(record.get());
+    }
+}
+
+int cpu_event_query(void* event)
+{
+    std::lock_guard<std::mutex> lock(g_cpu_event_mutex);
+
+    const CpuEventRecord* record = static_cast<CpuEvent*>(event)->record.get();
+    return !record || record->done;
+}
+
+void cpu_event_synchronize(void* event)
+{
+    std::shared_ptr<CpuEventRecord> record;
+    {
+        std::lock_guard<std::mutex> lock(g_cpu_event_mutex);
+        record = static_cast<CpuEvent*>(event)->record;
+    }
+
+    if (record)
+        cpu_event_wait(record.get());
+}
+
+float cpu_event_elapsed_time(void* start_event, void* end_event)
+{
+    std::lock_guard<std::mutex> lock(g_cpu_event_mutex);
+
+    const CpuEventRecord* start = static_cast<CpuEvent*>(start_event)->record.get();
+    const CpuEventRecord* end = static_cast<CpuEvent*>(end_event)->record.get();
+
+    if (!start || !end || !start->done || !end->done)
+        return 0.0f;
+
+    return float(double(end->timestamp - start->timestamp) * 1.0e-6);
+}
@@ -0,0 +1,289 @@
+/** Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+ * NVIDIA CORPORATION and its licensors retain all intellectual property
+ * and proprietary rights in and to this software, related documentation
+ * and any modifications thereto.  Any use, reproduction, disclosure or
+ * distribution of this software and related documentation without an express
+ * license agreement from NVIDIA CORPORATION is strictly prohibited.
+ */
+
+#include "warp.h"
+#include "cpu_timing.h"
+
+#include <algorithm>
+#include <chrono>
+#include <cstring>
+#include <mutex>
+#include <vector>
+
+#if defined(__linux__)
+#include <linux/perf_event.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+#endif
+
+#if defined(__linux__) && (defined(__x86_64__) || defined(__i386__))
+#include <cpuid.h>
+#endif
+
+// CPU timing is the host counterpart of CUDA activity timing: kernel launches and graph launches executed
+// on the CPU while a timing scope is open are timed on the launching thread and recorded with a tag that
+// the Python side maps back to the kernel name and the size of its array arguments. Timing scopes nest,
+// activities are only recorded in the innermost scope.
+//
+// Scopes may also read hardware counters around kernel launches. On Linux, the counters of each thread
+// executing a part of a launch are opened with perf_event_open() and read before and after each chunk.
+
+namespace
+{
+
+struct CpuTimingRecord
+{
+    uint64_t tag;
+    size_t dim;
+    int flag;
+    int64_t start;
+    int64_t end;
+    uint64_t counters[CPU_COUNTER_COUNT];
+    int counters_mask;
+};
+
+struct CpuTimingState
+{
+    int flags;
+    bool counters;
+    int64_t origin;
+    std::vector<CpuTimingRecord> records;
+    CpuTimingState* parent;
+
+    CpuTimingState(int flags, bool counters, int64_t origin, CpuTimingState* parent)
+        : flags(flags), counters(counters), origin(origin), parent(parent)
+    {
+    }
+};
+
+// kernels may be launched from several Python threads concurrently
+std::mutex g_cpu_timing_mutex;
+CpuTimingState* g_cpu_timing_state = nullptr;
+
+#if defined(__linux__)
+
+struct CpuCounterEvent
+{
+    CpuCounter counter;
+    uint32_t type;
+    uint64_t config;
+    // number of operations per event, e.g.: the lanes of packed floating-point instructions
+    uint64_t weight;
+};
+
+std::vector<CpuCounterEvent> get_counter_events()
+{
+    std::vector<CpuCounterEvent> events = {
+        {CPU_COUNTER_CYCLES, PERF_TYPE_HARDWARE, PERF_COUNT_HW_CPU_CYCLES, 1},
+        {CPU_COUNTER_INSTRUCTIONS, PERF_TYPE_HARDWARE, PERF_COUNT_HW_INSTRUCTIONS, 1},
+        {CPU_COUNTER_CACHE_REFERENCES, PERF_TYPE_HARDWARE, PERF_COUNT_HW_CACHE_REFERENCES, 1},
+        {CPU_COUNTER_CACHE_MISSES, PERF_TYPE_HARDWARE, PERF_COUNT_HW_CACHE_MISSES, 1},
+    };
+
+    // floating-point operations are only exposed through model-specific raw events
+#if defined(__x86_64__) || defined(__i386__)
+    unsigned int eax, ebx, ecx, edx;
+    if (__get_cpuid(0, &eax, &ebx, &ecx, &edx))
+    {
+        char vendor[13] = {};
+        memcpy(vendor + 0, &ebx, 4);
+        memcpy(vendor + 4, &edx, 4);
+        memcpy(vendor + 8, &ecx, 4);
+
+        if (strcmp(vendor, "GenuineIntel") == 0)
+        {
+            // FP_ARITH_INST_RETIRED, one umask per instruction width and precision
+            const uint64_t umasks[] = {0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80};
+            const uint64_t weights[] = {1, 1, 2, 4, 4, 8, 8, 16};
+
+            for (int i = 0; i < 8; ++i)
+                events.push_back({CPU_COUNTER_FLOPS, PERF_TYPE_RAW, (umasks[i] << 8) | 0xC7, weights[i]});
+        }
+        else if (strcmp(vendor, "AuthenticAMD") == 0)
+        {
+            // RETIRED_SSE_AVX_FLOPS, counts the operations of all instruction widths and precisions
+            events.push_back({CPU_COUNTER_FLOPS, PERF_TYPE_RAW, (0xFFull << 8) | 0x03, 1});
+        }
+    }
+#endif
+
+    return events;
+}
+
+const std::vector<CpuCounterEvent>& counter_events()
+{
+    static const std::vector<CpuCounterEvent> events = get_counter_events();
+    return events;
+}
+
+// counters of a single thread, opened for the calling thread on first use
+struct ThreadCounters
+{
+    bool opened = false;
+    int mask = 0;
+    std::vector<int> fds;
+
+    ~ThreadCounters()
+    {
+        for (int fd : fds)
+        {
+            if (fd >= 0)
+                close(fd);
+        }
+    }
+
+    void open_events()
+    {
+        opened = true;
+
+        for (const CpuCounterEvent& event : counter_events())
+        {
+            perf_event_attr attr;
+            memset(&attr, 0, sizeof(attr));
+            attr.size = sizeof(attr);
+            attr.type = event.type;
+            attr.config = event.config;
+            attr.exclude_kernel = 1;
+            attr.exclude_hv = 1;
+            // events are multiplexed when there are more events than hardware counters
+            attr.read_format = PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING;
+
+            const int fd = int(syscall(SYS_perf_event_open, &attr, 0, -1, -1, 0));
+            fds.push_back(fd);
+
+            if (fd >= 0)
+                mask |= 1 << event.counter;
+        }
+    }
+
+    int read_values(uint64_t* values)
+    {
+        if (!opened)
+            open_events();
+
+        memset(values, 0, sizeof(uint64_t) * CPU_COUNTER_COUNT);
+
+        const std::vector<CpuCounterEvent>& events = counter_events();
+
+        for (size_t i = 0; i < fds.size(); ++i)
+        {
+            if (fds[i] < 0)
+                continue;
+
+            uint64_t data[3];
+            if (read(fds[i], data, sizeof(data)) != sizeof(data))
+                continue;
+
+            // scale the count of multiplexed events by the fraction of time they were counted
+            uint64_t value = data[0];
+            if (data[2] > 0 && data[2] < data[1])
+                value = uint64_t(double(value) * double(data[1]) / double(data[2]));
+
+            values[events[i].counter] += value * events[i].weight;
+        }
+
+        return mask;
+    }
+};
+
+thread_local ThreadCounters t_counters;
+
+#endif
+
+} // anonymous namespace
+
+namespace wp
+{
+
+std::atomic<int> g_cpu_timing_flags{0};
+std::atomic<bool> g_cpu_counters_enabled{false};
+
+int64_t cpu_timing_now()
+{
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+void cpu_timing_record(int flag, uint64_t tag, size_t dim, int64_t start, int64_t end, const uint64_t* counters, int counters_mask)
+{
+    std::lock_guard<std::mutex> lock(g_cpu_timing_mutex);
+
+    if (!g_cpu_timing_state || !(g_cpu_timing_state->flags & flag))
+        return;
+
+    CpuTimingRecord record = {tag, dim, flag, start, end, {}, 0};
+    if (counters)
+    {
+        memcpy(record.counters, counters, sizeof(record.counters));
+        record.counters_mask = counters_mask;
+    }
+
+    g_cpu_timing_state->records.push_back(record);
+}
+
+int cpu_counters_read(uint64_t* values)
+{
+#if defined(__linux__)
+    return t_counters.read_values(values);
+#else
+    memset(values, 0, sizeof(uint64_t) * CPU_COUNTER_COUNT);
+    return 0;
+#endif
+}
+
+} // namespace wp
+
+void cpu_timing_begin(int flags, bool counters)
+{
+    std::lock_guard<std::mutex> lock(g_cpu_timing_mutex);
+
+    g_cpu_timing_state = new CpuTimingState(flags, counters, wp::cpu_timing_now(), g_cpu_timing_state);
+    wp::g_cpu_timing_flags.store(flags, std::memory_order_relaxed);
+    wp::g_cpu_counters_enabled.store(counters, std::memory_order_relaxed);
+}
+
+int cpu_timing_get_result_count()
+{
+    std::lock_guard<std::mutex> lock(g_cpu_timing_mutex);
+
+    if (g_cpu_timing_state)
+        return int(g_cpu_timing_state->records.size());
+    return 0;
+}
+
+void cpu_timing_end(cpu_timing_result_t* results, int size)
+{
+    std::lock_guard<std::mutex> lock(g_cpu_timing_mutex);
+
+    if (!g_cpu_timing_state)
+        return;
+
+    // number of results to write to the user buffer
+    int count = std::min(int(g_cpu_timing_state->records.size()), size);
+
+    for (int i = 0; i < count; i++)
+    {
+        const CpuTimingRecord& record = g_cpu_timing_state->records[i];
+        cpu_timing_result_t& result = results[i];
+        result.tag = record.tag;
+        result.dim = record.dim;
+        result.flag = record.flag;
+        result.start = double(record.start - g_cpu_timing_state->origin) * 1.0e-6;
+        result.elapsed = double(record.end - record.start) * 1.0e-6;
+        memcpy(result.counters, record.counters, sizeof(result.counters));
+        result.counters_mask = record.counters_mask;
+    }
+
+    // restore previous state
+    CpuTimingState* parent_state = g_cpu_timing_state->parent;
+    delete g_cpu_timing_state;
+    g_cpu_timing_state = parent_state;
+
+    wp::g_cpu_timing_flags.store(parent_state ? parent_state->flags : 0, std::memory_order_relaxed);
+    wp::g_cpu_counters_enabled.store(parent_state ? parent_state->counters : false, std::memory_order_relaxed);
+}
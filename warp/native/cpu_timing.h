@@ -0,0 +1,82 @@
+/** Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+ * NVIDIA CORPORATION and its licensors retain all intellectual property
+ * and proprietary rights in and to this software, related documentation
+ * and any modifications thereto.  Any use, reproduction, disclosure or
+ * distribution of this software and related documentation without an express
+ * license agreement from NVIDIA CORPORATION is strictly prohibited.
+ */
+
+#pragma once
+
+#include <stddef.h>
+#include <stdint.h>
+
+#include <atomic>
+
+// hardware counters read around CPU kernel launches when requested by cpu_timing_begin()
+enum CpuCounter
+{
+    CPU_COUNTER_CYCLES,
+    CPU_COUNTER_INSTRUCTIONS,
+    CPU_COUNTER_CACHE_REFERENCES,
+    CPU_COUNTER_CACHE_MISSES,
+    // floating-point operations, packed instructions count one operation per lane
+    CPU_COUNTER_FLOPS,
+    CPU_COUNTER_COUNT
+};
+
+// timing result used to pass CPU timings to Python
+struct cpu_timing_result_t
+{
+    // identifies the launch on the Python side, 0 for activities that are not kernel launches
+    uint64_t tag;
+    uint64_t dim;
+    int flag;
+    // start time relative to cpu_timing_begin() and duration, in milliseconds
+    double start;
+    double elapsed;
+    // counter values summed over the threads that executed the launch, bit i of the mask is set if counter i is valid
+    uint64_t counters[CPU_COUNTER_COUNT];
+    int counters_mask;
+};
+
+namespace wp
+{
+
+// timing flags, these match the values of the CUDA timing flags
+constexpr int CPU_TIMING_KERNEL = 1;  // Warp kernel
+constexpr int CPU_TIMING_GRAPH = 16;  // graph launch
+
+// flags of the innermost timing scope, 0 when no CPU activities are being timed
+extern std::atomic<int> g_cpu_timing_flags;
+
+// set when the innermost timing scope reads hardware counters around kernel launches
+extern std::atomic<bool> g_cpu_counters_enabled;
+
+inline bool cpu_timing_enabled(int flag)
+{
+    return (g_cpu_timing_flags.load(std::memory_order_relaxed) & flag) != 0;
+}
+
+inline bool cpu_counters_enabled()
+{
+    return g_cpu_counters_enabled.load(std::memory_order_relaxed);
+}
+
+// returns a timestamp in nanoseconds
+int64_t cpu_timing_now();
+
+// records an activity that ran from start to end in the innermost timing scope,
+// counters may be null if no hardware counters were read
+void cpu_timing_record(
+    int flag, uint64_t tag, size_t dim, int64_t start, int64_t end, const uint64_t* counters=nullptr, int counters_mask=0);
+
+// reads the hardware counters of the calling thread into values, the counters are opened on the first call
+// of each thread; returns a mask of the available counters, which is 0 if the platform does not support them
+int cpu_counters_read(uint64_t* values);
+
+// runs a CPU kernel over dim threads, split across the host worker pool if parallel is set;
+// timed launches are recorded in the innermost timing scope with the given tag
+void cpu_run_kernel(void* kernel, size_t dim, void** args, bool parallel, bool timed, uint64_t tag);
+
+} // namespace wp
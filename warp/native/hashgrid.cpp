@@ -10,11 +10,15 @@
 #include "cuda_util.h"
 #include "hashgrid.h"
 #include "sort.h"
+#include "parallel.h"
 #include "string.h"
 
 using namespace wp;
 
+#include <algorithm>
 #include <map>
+#include <utility>
+#include <vector>
 
 namespace 
 {
@@ -55,10 +59,224 @@ void hash_grid_rebuild_device(const HashGrid& grid, const wp::array_t<wp::vec3>&
 
 
 // host methods
+
+namespace
+{
+
+// points are processed in blocks of a fixed size wherever the output depends on the order of the blocks
+#define HASH_GRID_BLOCK_SIZE (16384)
+
+// incremental updates fall back to a full rebuild if more than 1/HASH_GRID_INCREMENTAL_RATIO of the points changed cells
+#define HASH_GRID_INCREMENTAL_RATIO (8)
+
+// host grids carry the state of the last update so that the next one can be incremental
+struct HashGridHost : HashGrid
+{
+    // allocations holding the point arrays and their auxiliary halves, point_cells and point_ids
+    // point to either half
+    int* point_cells_alloc{nullptr};
+    int* point_ids_alloc{nullptr};
+
+    // number of points and cell width of the last update, 0 points if the sorted point arrays are not valid
+    int num_sorted_points = 0;
+    float sorted_cell_width = 0.0f;
+
+    // cell of each point in the last update, only maintained by incremental updates
+    std::vector<int> cells_by_point;
+    bool cells_by_point_valid = false;
+
+    // scratch space for incremental updates
+    std::vector<int> new_cells;
+    std::vector<unsigned char> moved_flags;
+    std::vector<std::pair<int, int>> moved;
+};
+
+inline int hash_grid_num_blocks(int n)
+{
+    return (n + HASH_GRID_BLOCK_SIZE - 1) / HASH_GRID_BLOCK_SIZE;
+}
+
+// calls func(block, first, last) for each block of [0, n) on the host worker pool
+template <typename Func>
+void hash_grid_for_each_block(int n, const Func& func)
+{
+    parallel_for(hash_grid_num_blocks(n), 1, [&](size_t begin, size_t end)
+    {
+        for (int block = int(begin); block < int(end); ++block)
+        {
+            const int first = block * HASH_GRID_BLOCK_SIZE;
+            func(block, first, std::min(first + HASH_GRID_BLOCK_SIZE, n));
+        }
+    });
+}
+
+// turns per-block counts stored at [1, num_blocks] into block offsets, returns the total
+int hash_grid_scan_blocks(std::vector<int>& counts)
+{
+    for (size_t block = 1; block < counts.size(); ++block)
+        counts[block] += counts[block - 1];
+
+    return counts.back();
+}
+
+// resets the start / end of the cells referenced by the sorted point cells
+void hash_grid_clear_cells_host(HashGridHost& grid, int num_points)
+{
+    parallel_for(num_points, parallel_grain_size(num_points, 1024), [&](size_t begin, size_t end)
+    {
+        for (int i = int(begin); i < int(end); ++i)
+        {
+            const int c = grid.point_cells[i];
+            if (i == 0 || c != grid.point_cells[i - 1])
+            {
+                grid.cell_starts[c] = 0;
+                grid.cell_ends[c] = 0;
+            }
+        }
+    });
+}
+
+void hash_grid_compute_cell_offsets_host(HashGridHost& grid, int num_points)
+{
+    parallel_for(num_points, parallel_grain_size(num_points, 1024), [&](size_t begin, size_t end)
+    {
+        for (int i = int(begin); i < int(end); ++i)
+        {
+            // scan the particle-cell array to find the start and end
+            const int c = grid.point_cells[i];
+
+            if (i == 0)
+                grid.cell_starts[c] = 0;
+            else
+            {
+                const int p = grid.point_cells[i-1];
+
+                if (c != p)
+                {
+                    grid.cell_starts[c] = i;
+                    grid.cell_ends[p] = i;
+                }
+            }
+
+            if (i == num_points - 1)
+            {
+                grid.cell_ends[c] = i + 1;
+            }
+        }
+    });
+}
+
+// merges the points that kept their cell with the sorted points that moved to a different cell,
+// both the previous and the new order are sorted by (cell, point index), so the result is identical
+// to a full rebuild
+void hash_grid_merge_moved_host(HashGridHost& grid, int num_points)
+{
+    const int num_blocks = hash_grid_num_blocks(num_points);
+
+    grid.moved_flags.resize(num_points);
+
+    // flag the points that moved in the previous order
+    std::vector<int> block_moved(num_blocks + 1, 0);
+
+    hash_grid_for_each_block(num_points, [&](int block, int first, int last)
+    {
+        int count = 0;
+        for (int i = first; i < last; ++i)
+        {
+            const bool moved = grid.new_cells[grid.point_ids[i]] != grid.point_cells[i];
+
+            grid.moved_flags[i] = moved;
+            count += moved;
+        }
+
+        block_moved[block + 1] = count;
+    });
+
+    const int num_moved = hash_grid_scan_blocks(block_moved);
+
+    grid.moved.resize(num_moved);
+
+    hash_grid_for_each_block(num_points, [&](int block, int first, int last)
+    {
+        int j = block_moved[block];
+        for (int i = first; i < last; ++i)
+        {
+            if (grid.moved_flags[i])
+            {
+                const int id = grid.point_ids[i];
+                grid.moved[j++] = std::make_pair(grid.new_cells[id], id);
+            }
+        }
+    });
+
+    parallel_sort(grid.moved.data(), grid.moved.size(), std::less<std::pair<int, int>>());
+
+    // merge into the other half of the allocations, each block of the previous order merges its kept
+    // points with the moved points whose keys fall between its first key and the first key of the next block
+    int* out_cells = grid.point_cells == grid.point_cells_alloc ? grid.point_cells_alloc + grid.max_points : grid.point_cells_alloc;
+    int* out_ids = grid.point_ids == grid.point_ids_alloc ? grid.point_ids_alloc + grid.max_points : grid.point_ids_alloc;
+
+    auto old_key = [&](int i)
+    {
+        return std::make_pair(grid.point_cells[i], grid.point_ids[i]);
+    };
+
+    // the first block also takes the moved points with keys below the first previous key
+    // and the last block the ones with keys above the last previous key
+    auto moved_lower_bound = [&](int i)
+    {
+        if (i == 0)
+            return 0;
+        if (i == num_points)
+            return num_moved;
+
+        return int(std::lower_bound(grid.moved.begin(), grid.moved.end(), old_key(i)) - grid.moved.begin());
+    };
+
+    hash_grid_for_each_block(num_points, [&](int block, int first, int last)
+    {
+        int j = moved_lower_bound(first);
+        const int j_end = moved_lower_bound(last);
+
+        // all kept and moved points with smaller keys come before the block
+        int out = (first - block_moved[block]) + j;
+
+        for (int i = first; i < last; ++i)
+        {
+            if (grid.moved_flags[i])
+                continue;
+
+            const auto key = old_key(i);
+            for (; j < j_end && grid.moved[j] < key; ++j, ++out)
+            {
+                out_cells[out] = grid.moved[j].first;
+                out_ids[out] = grid.moved[j].second;
+            }
+
+            out_cells[out] = key.first;
+            out_ids[out] = key.second;
+            ++out;
+        }
+
+        for (; j < j_end; ++j, ++out)
+        {
+            out_cells[out] = grid.moved[j].first;
+            out_ids[out] = grid.moved[j].second;
+        }
+    });
+
+    // the previous cells are still needed to clear their start / end
+    hash_grid_clear_cells_host(grid, num_points);
+
+    grid.point_cells = out_cells;
+    grid.point_ids = out_ids;
+}
+
+} // anonymous namespace
+
 uint64_t hash_grid_create_host(int dim_x, int dim_y, int dim_z)
 {
-    HashGrid* grid = new HashGrid();
-    memset(grid, 0, sizeof(HashGrid));
+    HashGridHost* grid = new HashGridHost();
     
     grid->dim_x = dim_x;
     grid->dim_y = dim_y;
@@ -68,15 +286,15 @@ uint64_t hash_grid_create_host(int dim_x, int dim_y, int dim_z)
     grid->cell_starts = (int*)alloc_host(num_cells*sizeof(int));
     grid->cell_ends = (int*)alloc_host(num_cells*sizeof(int));
 
-    return (uint64_t)(grid);
+    return (uint64_t)(static_cast<HashGrid*>(grid));
 }
 
 void hash_grid_destroy_host(uint64_t id)
 {
-    HashGrid* grid = (HashGrid*)(id);
+    HashGridHost* grid = static_cast<HashGridHost*>((HashGrid*)(id));
 
-    free_host(grid->point_ids);
-    free_host(grid->point_cells);
+    free_host(grid->point_ids_alloc);
+    free_host(grid->point_cells_alloc);
     free_host(grid->cell_starts);
     free_host(grid->cell_ends);
 
@@ -85,24 +303,30 @@ void hash_grid_destroy_host(uint64_t id)
 
 void hash_grid_reserve_host(uint64_t id, int num_points)
 {
-    HashGrid* grid = (HashGrid*)(id);
+    HashGridHost* grid = static_cast<HashGridHost*>((HashGrid*)(id));
 
     if (num_points > grid->max_points)
     {
-        free_host(grid->point_cells);
-        free_host(grid->point_ids);
+        free_host(grid->point_cells_alloc);
+        free_host(grid->point_ids_alloc);
         
         const int num_to_alloc = num_points*3/2;
-        grid->point_cells = (int*)alloc_host(2*num_to_alloc*sizeof(int));  // *2 for auxiliary radix buffers
-        grid->point_ids = (int*)alloc_host(2*num_to_alloc*sizeof(int));    // *2 for auxiliary radix buffers
+        grid->point_cells_alloc = (int*)alloc_host(2*num_to_alloc*sizeof(int));  // *2 for auxiliary radix buffers
+        grid->point_ids_alloc = (int*)alloc_host(2*num_to_alloc*sizeof(int));    // *2 for auxiliary radix buffers
+
+        grid->point_cells = grid->point_cells_alloc;
+        grid->point_ids = grid->point_ids_alloc;
 
         grid->max_points = num_to_alloc;
     }
 
+    if (num_points != grid->num_points)
+        grid->num_sorted_points = 0;
+
     grid->num_points = num_points;
 }
 
-void hash_grid_update_host(uint64_t id, float cell_width, const wp::array_t<wp::vec3>* points)
+void hash_grid_update_host(uint64_t id, float cell_width, const wp::array_t<wp::vec3>* points, bool incremental)
 {
     // Python enforces this, but let's be defensive anyways
     if (!points || points->ndim != 1)
@@ -117,53 +341,132 @@ void hash_grid_update_host(uint64_t id, float cell_width, const wp::array_t<wp::
         return;
     }
 
-    HashGrid* grid = (HashGrid*)(id);
+    HashGridHost* grid = static_cast<HashGridHost*>((HashGrid*)(id));
     int num_points = points->shape[0];
 
+    // the sorted cells of the previous update are used to clear the cell tables and as a starting
+    // point for incremental updates, they are only valid when the same number of points was
+    // bucketed into cells of the same width
+    const bool previous_valid = grid->num_sorted_points > 0 && grid->num_sorted_points == num_points && grid->sorted_cell_width == cell_width;
+
     hash_grid_reserve_host(id, num_points);
 
     grid->cell_width = cell_width;
     grid->cell_width_inv = 1.0f / cell_width;
 
-    // calculate cell for each position
-    for (int i=0; i < num_points; ++i)
+    const int num_cells = grid->dim_x * grid->dim_y * grid->dim_z;
+
+    if (incremental)
     {
-        const vec3& point = wp::index(*points, i);
-        grid->point_cells[i] = hash_grid_index(*grid, point);
-        grid->point_ids[i] = i;
-    }
-    
-    // sort indices
-    radix_sort_pairs_host(grid->point_cells, grid->point_ids, num_points);
+        // calculate cell for each position in the original order, and compare against the previous update
+        if (previous_valid && !grid->cells_by_point_valid)
+        {
+            grid->cells_by_point.resize(num_points);
+            for (int i=0; i < num_points; ++i)
+                grid->cells_by_point[grid->point_ids[i]] = grid->point_cells[i];
+        }
 
-    const int num_cells = grid->dim_x * grid->dim_y * grid->dim_z;
-    memset(grid->cell_starts, 0, sizeof(int) * num_cells);
-    memset(grid->cell_ends, 0, sizeof(int) * num_cells);
+        grid->new_cells.resize(num_points);
+
+        std::vector<int> block_moved(hash_grid_num_blocks(num_points) + 1, 0);
+
+        hash_grid_for_each_block(num_points, [&](int block, int first, int last)
+        {
+            int count = 0;
+            for (int i = first; i < last; ++i)
+            {
+                const vec3& point = wp::index(*points, i);
+                const int c = hash_grid_index(*grid, point);
+
+                grid->new_cells[i] = c;
+
+                if (previous_valid)
+                    count += c != grid->cells_by_point[i];
+            }
+
+            block_moved[block + 1] = count;
+        });
+
+        const int num_moved = hash_grid_scan_blocks(block_moved);
+
+        if (previous_valid && num_moved <= num_points / HASH_GRID_INCREMENTAL_RATIO)
+        {
+            // no point changed cells, the grid is up to date
+            if (num_moved > 0)
+            {
+                hash_grid_merge_moved_host(*grid, num_points);
+                hash_grid_compute_cell_offsets_host(*grid, num_points);
+            }
+        }
+        else
+        {
+            if (previous_valid && num_points < num_cells)
+            {
+                hash_grid_clear_cells_host(*grid, num_points);
+            }
+            else
+            {
+                memset(grid->cell_starts, 0, sizeof(int) * num_cells);
+                memset(grid->cell_ends, 0, sizeof(int) * num_cells);
+            }
+
+            // full rebuild from the cells computed above, the radix sort needs the second half of the allocations
+            grid->point_cells = grid->point_cells_alloc;
+            grid->point_ids = grid->point_ids_alloc;
+
+            hash_grid_for_each_block(num_points, [&](int block, int first, int last)
+            {
+                for (int i = first; i < last; ++i)
+                {
+                    grid->point_cells[i] = grid->new_cells[i];
+                    grid->point_ids[i] = i;
+                }
+            });
+
+            radix_sort_pairs_host(grid->point_cells, grid->point_ids, num_points);
+            hash_grid_compute_cell_offsets_host(*grid, num_points);
+        }
 
-    // compute cell start / end
-    for (int i=0; i < num_points; ++i)
+        std::swap(grid->cells_by_point, grid->new_cells);
+        grid->cells_by_point_valid = true;
+    }
+    else
     {
-		// scan the particle-cell array to find the start and end
-		const int c = grid->point_cells[i];
-		
-		if (i == 0)
-			grid->cell_starts[c] = 0;
-		else
-		{
-			const int p = grid->point_cells[i-1];
-
-			if (c != p)
-			{
-				grid->cell_starts[c] = i;
-                grid->cell_ends[p] = i;
-			}
-		}
-
-        if (i == num_points - 1)
+        // only clear the occupied cells if there are fewer points than cells
+        if (previous_valid && num_points < num_cells)
+        {
+            hash_grid_clear_cells_host(*grid, num_points);
+        }
+        else
         {
-            grid->cell_ends[c] = i + 1;
+            memset(grid->cell_starts, 0, sizeof(int) * num_cells);
+            memset(grid->cell_ends, 0, sizeof(int) * num_cells);
         }
-	}
+
+        // calculate cell for each position, the radix sort needs the second half of the allocations
+        grid->point_cells = grid->point_cells_alloc;
+        grid->point_ids = grid->point_ids_alloc;
+
+        parallel_for(num_points, parallel_grain_size(num_points, 1024), [&](size_t begin, size_t end)
+        {
+            for (int i = int(begin); i < int(end); ++i)
+            {
+                const vec3& point = wp::index(*points, i);
+                grid->point_cells[i] = hash_grid_index(*grid, point);
+                grid->point_ids[i] = i;
+            }
+        });
+
+        // sort indices, the sort is stable so points in the same cell are ordered by index
+        radix_sort_pairs_host(grid->point_cells, grid->point_ids, num_points);
+
+        hash_grid_compute_cell_offsets_host(*grid, num_points);
+
+        grid->cells_by_point_valid = false;
+    }
+
+    grid->num_sorted_points = num_points;
+    grid->sorted_cell_width = cell_width;
 }
 
 // device methods
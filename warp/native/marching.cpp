@@ -1,3 +1,325 @@
+/** Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+ * NVIDIA CORPORATION and its licensors retain all intellectual property
+ * and proprietary rights in and to this software, related documentation
+ * and any modifications thereto.  Any use, reproduction, disclosure or
+ * distribution of this software and related documentation without an express
+ * license agreement from NVIDIA CORPORATION is strictly prohibited.
+ */
 
+#include "warp.h"
+#include "marching.h"
+#include "parallel.h"
 
-// not implemented yet
\ No newline at end of file
+#include <vector>
+
+// Host implementation of marching cubes, producing the same vertices and triangles as the device version.
+//
+// Each cell owns the vertices on its +x, +y, and +z edges, so vertices on edges shared by up to four
+// cells are created exactly once and referenced by index from every triangle that uses them.
+// The grid is processed in parallel over slabs of x-layers (the outermost, contiguous dimension of the field):
+//
+// 1. count the vertices and triangle indices of every cell and accumulate the totals per layer,
+// 2. scan the per-layer totals to get the output offset of each layer,
+// 3. create the vertices of each layer and record the output index of every edge vertex,
+// 4. create the triangles of each layer, which look up the vertices owned by neighboring cells.
+
+namespace wp
+{
+
+namespace
+{
+
+inline bool marching_cubes_edge_crossing(float d0, float d1, float threshold)
+{
+    return (d0 <= threshold && d1 >= threshold) || (d1 <= threshold && d0 >= threshold);
+}
+
+inline int marching_cubes_cell_code(const MarchingCubes& mc, const float* density, int xi, int yi, int zi, float threshold)
+{
+    int code = 0;
+    for (int i = 0; i < 8; i++)
+    {
+        int cxi = xi + marchingCubeCorners[i][0];
+        int cyi = yi + marchingCubeCorners[i][1];
+        int czi = zi + marchingCubeCorners[i][2];
+
+        if (density[mc.cell_index(cxi, cyi, czi)] >= threshold)
+            code |= (1 << i);
+    }
+
+    return code;
+}
+
+// cells in the last layer of each dimension have no vertices, and cells in the last two layers
+// have no triangles since their edges would reference vertices of the last layer
+inline bool marching_cubes_has_verts(const MarchingCubes& mc, int xi, int yi, int zi)
+{
+    return xi < mc.nx - 1 && yi < mc.ny - 1 && zi < mc.nz - 1;
+}
+
+inline bool marching_cubes_has_tris(const MarchingCubes& mc, int xi, int yi, int zi)
+{
+    return xi < mc.nx - 2 && yi < mc.ny - 2 && zi < mc.nz - 2;
+}
+
+void marching_cubes_count_layers(MarchingCubes& mc, const float* density, float threshold, int* layer_verts, int* layer_indices)
+{
+    parallel_for(mc.nx, parallel_grain_size(mc.nx), [&](size_t begin, size_t end)
+    {
+        for (int xi = int(begin); xi < int(end); ++xi)
+        {
+            int num_verts = 0;
+            int num_indices = 0;
+
+            for (int yi = 0; yi < mc.ny; ++yi)
+            {
+                for (int zi = 0; zi < mc.nz; ++zi)
+                {
+                    const int cell_index = mc.cell_index(xi, yi, zi);
+
+                    int cell_verts = 0;
+                    if (marching_cubes_has_verts(mc, xi, yi, zi))
+                    {
+                        const float d0 = density[cell_index];
+
+                        cell_verts += marching_cubes_edge_crossing(d0, density[mc.cell_index(xi + 1, yi, zi)], threshold);
+                        cell_verts += marching_cubes_edge_crossing(d0, density[mc.cell_index(xi, yi + 1, zi)], threshold);
+                        cell_verts += marching_cubes_edge_crossing(d0, density[mc.cell_index(xi, yi, zi + 1)], threshold);
+                    }
+
+                    int cell_indices = 0;
+                    if (marching_cubes_has_tris(mc, xi, yi, zi))
+                    {
+                        const int code = marching_cubes_cell_code(mc, density, xi, yi, zi, threshold);
+                        cell_indices = firstMarchingCubesId[code + 1] - firstMarchingCubesId[code];
+                    }
+
+                    // store the counts, converted to output offsets by marching_cubes_create_verts()
+                    mc.first_cell_vert[cell_index] = cell_verts;
+                    mc.first_cell_tri[cell_index] = cell_indices;
+
+                    num_verts += cell_verts;
+                    num_indices += cell_indices;
+                }
+            }
+
+            layer_verts[xi] = num_verts;
+            layer_indices[xi] = num_indices;
+        }
+    });
+}
+
+void marching_cubes_create_verts(MarchingCubes& mc, const float* density, float threshold, const int* layer_verts, const int* layer_indices, vec3* verts)
+{
+    parallel_for(mc.nx, parallel_grain_size(mc.nx), [&](size_t begin, size_t end)
+    {
+        for (int xi = int(begin); xi < int(end); ++xi)
+        {
+            int next_vert = layer_verts[xi];
+            int next_index = layer_indices[xi];
+
+            for (int yi = 0; yi < mc.ny; ++yi)
+            {
+                for (int zi = 0; zi < mc.nz; ++zi)
+                {
+                    const int cell_index = mc.cell_index(xi, yi, zi);
+
+                    const int num_indices = mc.first_cell_tri[cell_index];
+                    mc.first_cell_tri[cell_index] = next_index;
+                    next_index += num_indices;
+
+                    mc.first_cell_vert[cell_index] = next_vert;
+                    mc.cell_verts[3 * cell_index + 0] = 0;
+                    mc.cell_verts[3 * cell_index + 1] = 0;
+                    mc.cell_verts[3 * cell_index + 2] = 0;
+
+                    if (!marching_cubes_has_verts(mc, xi, yi, zi))
+                        continue;
+
+                    const vec3 p = vec3(xi + 0.5f, yi + 0.5f, zi + 0.5f);
+
+                    const float d0 = density[cell_index];
+                    float ds[3];
+                    ds[0] = density[mc.cell_index(xi + 1, yi, zi)];
+                    ds[1] = density[mc.cell_index(xi, yi + 1, zi)];
+                    ds[2] = density[mc.cell_index(xi, yi, zi + 1)];
+
+                    for (int dim = 0; dim < 3; dim++)
+                    {
+                        const float d = ds[dim];
+
+                        if (marching_cubes_edge_crossing(d0, d, threshold))
+                        {
+                            float t = (d != d0) ? clamp((threshold - d0) / (d - d0), 0.0f, 1.0f) : 0.5f;
+                            int id = next_vert++;
+
+                            vec3 off;
+                            off[dim] = t;
+                            verts[id] = p + off;
+
+                            mc.cell_verts[3 * cell_index + dim] = id;
+                        }
+                    }
+                }
+            }
+        }
+    });
+}
+
+void marching_cubes_create_tris(MarchingCubes& mc, const float* density, float threshold, int* triangles)
+{
+    parallel_for(mc.nx, parallel_grain_size(mc.nx), [&](size_t begin, size_t end)
+    {
+        for (int xi = int(begin); xi < int(end); ++xi)
+        {
+            for (int yi = 0; yi < mc.ny; ++yi)
+            {
+                for (int zi = 0; zi < mc.nz; ++zi)
+                {
+                    if (!marching_cubes_has_tris(mc, xi, yi, zi))
+                        continue;
+
+                    const int code = marching_cubes_cell_code(mc, density, xi, yi, zi, threshold);
+
+                    const int first_in = firstMarchingCubesId[code];
+                    const int num = firstMarchingCubesId[code + 1] - first_in;
+                    const int first_out = mc.first_cell_tri[mc.cell_index(xi, yi, zi)];
+
+                    for (int i = 0; i < num; i++)
+                    {
+                        const int eid = marchingCubesIds[first_in + i];
+
+                        const int exi = xi + marchingCubesEdgeLocations[eid][0];
+                        const int eyi = yi + marchingCubesEdgeLocations[eid][1];
+                        const int ezi = zi + marchingCubesEdgeLocations[eid][2];
+                        const int edge = marchingCubesEdgeLocations[eid][3];
+
+                        triangles[first_out + i] = mc.cell_verts[3 * mc.cell_index(exi, eyi, ezi) + edge];
+                    }
+                }
+            }
+        }
+    });
+}
+
+void marching_cubes_resize_host(MarchingCubes& mc, int nx, int ny, int nz)
+{
+    mc.nx = nx;
+    mc.ny = ny;
+    mc.nz = nz;
+
+    mc.num_cells = nx*ny*nz;
+
+    if (mc.num_cells > mc.max_cells)
+    {
+        const int num_to_alloc = mc.num_cells*3/2;
+
+        free_host(mc.first_cell_vert);
+        free_host(mc.first_cell_tri);
+        free_host(mc.cell_verts);
+
+        mc.first_cell_vert = (int*)alloc_host(sizeof(int) * num_to_alloc);
+        mc.first_cell_tri = (int*)alloc_host(sizeof(int) * num_to_alloc);
+        mc.cell_verts = (int*)alloc_host(sizeof(int) * 3 * num_to_alloc);
+
+        mc.max_cells = num_to_alloc;
+    }
+}
+
+} // anonymous namespace
+
+} // namespace wp
+
+uint64_t marching_cubes_create_host()
+{
+    wp::MarchingCubes* mc = new wp::MarchingCubes();
+
+    return (uint64_t)(mc);
+}
+
+void marching_cubes_destroy_host(uint64_t id)
+{
+    if (!id)
+        return;
+
+    wp::MarchingCubes* mc = (wp::MarchingCubes*)(id);
+
+    free_host(mc->first_cell_vert);
+    free_host(mc->first_cell_tri);
+    free_host(mc->cell_verts);
+
+    delete mc;
+}
+
+int marching_cubes_surface_host(
+    uint64_t id,
+    const float* field,
+    int nx,
+    int ny,
+    int nz,
+    float threshold,
+    wp::vec3* verts,
+    int* triangles,
+    int max_verts,
+    int max_tris,
+    int* out_num_verts,
+    int* out_num_tris)
+{
+    if (!id)
+        return -1;
+
+    if (!field)
+        return -1;
+
+    wp::MarchingCubes& mc = *(wp::MarchingCubes*)(id);
+
+    // reset counts
+    *out_num_verts = 0;
+    *out_num_tris = 0;
+
+    // resize temporary memory
+    wp::marching_cubes_resize_host(mc, nx, ny, nz);
+
+    if (mc.num_cells == 0)
+        return 0;
+
+    // per-layer totals, turned into per-layer output offsets by an exclusive scan
+    std::vector<int> layer_verts(nx);
+    std::vector<int> layer_indices(nx);
+
+    wp::marching_cubes_count_layers(mc, field, threshold, layer_verts.data(), layer_indices.data());
+
+    int num_verts = 0;
+    int num_indices = 0;
+
+    for (int xi = 0; xi < nx; ++xi)
+    {
+        const int layer_num_verts = layer_verts[xi];
+        const int layer_num_indices = layer_indices[xi];
+
+        layer_verts[xi] = num_verts;
+        layer_indices[xi] = num_indices;
+
+        num_verts += layer_num_verts;
+        num_indices += layer_num_indices;
+    }
+
+    const int num_tris = num_indices/3;
+
+    // check we have enough storage, if not then
+    // return required buffer sizes, let user resize
+    if (num_verts > max_verts || num_tris > max_tris)
+    {
+        *out_num_verts = num_verts;
+        *out_num_tris = num_tris;
+        return -1;
+    }
+
+    wp::marching_cubes_create_verts(mc, field, threshold, layer_verts.data(), layer_indices.data(), verts);
+    wp::marching_cubes_create_tris(mc, field, threshold, triangles);
+
+    *out_num_verts = num_verts;
+    *out_num_tris = num_tris;
+
+    return 0;
+}
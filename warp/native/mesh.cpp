@@ -10,10 +10,13 @@
 #include "bvh.h"
 #include "warp.h"
 #include "cuda_util.h"
+#include "parallel.h"
 
 using namespace wp;
 
+#include <algorithm>
 #include <map>
+#include <vector>
 
 namespace 
 {
@@ -126,6 +129,53 @@ void bvh_refit_with_solid_angle_host(BVH& bvh, Mesh& mesh)
     bvh_refit_with_solid_angle_recursive_host(bvh, 0, mesh);
 }
 
+// computes the triangle bounds used by the BVH in parallel and returns the average edge length,
+// edge lengths are summed over chunks of a fixed size so the result does not depend on the thread count
+float mesh_update_triangle_bounds_host(Mesh& m)
+{
+    const int chunk_size = 4096;
+    const int num_chunks = (m.num_tris + chunk_size - 1) / chunk_size;
+
+    std::vector<float> chunk_sums(num_chunks);
+
+    parallel_for(num_chunks, 1, [&](size_t begin, size_t end)
+    {
+        for (int chunk = int(begin); chunk < int(end); ++chunk)
+        {
+            const int first = chunk * chunk_size;
+            const int last = std::min(first + chunk_size, m.num_tris);
+
+            float sum = 0.0;
+            for (int i=first; i < last; ++i)
+            {
+                wp::vec3 p0 = m.points.data[m.indices.data[i*3+0]];
+                wp::vec3 p1 = m.points.data[m.indices.data[i*3+1]];
+                wp::vec3 p2 = m.points.data[m.indices.data[i*3+2]];
+
+                // compute triangle bounds
+                bounds3 b;
+                b.add_point(p0);
+                b.add_point(p1);
+                b.add_point(p2);
+
+                m.lowers[i] = b.lower;
+                m.uppers[i] = b.upper;
+
+                // compute edge lengths
+                sum += length(p0-p1) + length(p0-p2) + length(p2-p1);
+            }
+
+            chunk_sums[chunk] = sum;
+        }
+    });
+
+    float sum = 0.0;
+    for (float chunk_sum : chunk_sums)
+        sum += chunk_sum;
+
+    return sum / (m.num_tris*3);
+}
+
 uint64_t mesh_create_host(array_t<wp::vec3> points, array_t<wp::vec3> velocities, array_t<int> indices, int num_points, int num_tris, int support_winding_number, int constructor_type)
 {
     Mesh* m = new Mesh(points, velocities, indices, num_points, num_tris);
@@ -133,26 +183,7 @@ uint64_t mesh_create_host(array_t<wp::vec3> points, array_t<wp::vec3> velocities
     m->lowers = new vec3[num_tris];
     m->uppers = new vec3[num_tris];
 
-    float sum = 0.0;
-    for (int i=0; i < num_tris; ++i)
-    {
-        wp::vec3& p0 = points[indices[i*3+0]];
-        wp::vec3& p1 = points[indices[i*3+1]];
-        wp::vec3& p2 = points[indices[i*3+2]];
-        
-        // compute triangle bounds
-        bounds3 b;       
-        b.add_point(p0);
-        b.add_point(p1);
-        b.add_point(p2);
-
-        m->lowers[i] = b.lower;
-        m->uppers[i] = b.upper;
-
-        // compute edge lengths
-        sum += length(p0-p1) + length(p0-p2) + length(p2-p1);
-    }
-    m->average_edge_length = sum / (num_tris*3);
+    m->average_edge_length = mesh_update_triangle_bounds_host(*m);
 
     wp::bvh_create_host(m->lowers, m->uppers, num_tris, constructor_type, m->bvh);
     
@@ -187,25 +218,7 @@ void mesh_refit_host(uint64_t id)
 {
     Mesh* m = (Mesh*)(id);
 
-    float sum = 0.0;
-    for (int i=0; i < m->num_tris; ++i)
-    {
-        wp::vec3 p0 = m->points.data[m->indices.data[i*3+0]];
-        wp::vec3 p1 = m->points.data[m->indices.data[i*3+1]];
-        wp::vec3 p2 = m->points.data[m->indices.data[i*3+2]];
-
-        // compute triangle bounds
-        bounds3 b;       
-        b.add_point(p0);
-        b.add_point(p1);
-        b.add_point(p2);
-
-        m->lowers[i] = b.lower;
-        m->uppers[i] = b.upper;
-
-        sum += length(p0-p1) + length(p0-p2) + length(p2-p1);
-    }
-    m->average_edge_length = sum / (m->num_tris*3);
+    m->average_edge_length = mesh_update_triangle_bounds_host(*m);
 
     if (m->solid_angle_props)
     {
@@ -0,0 +1,335 @@
+/** Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+ * NVIDIA CORPORATION and its licensors retain all intellectual property
+ * and proprietary rights in and to this software, related documentation
+ * and any modifications thereto.  Any use, reproduction, disclosure or
+ * distribution of this software and related documentation without an express
+ * license agreement from NVIDIA CORPORATION is strictly prohibited.
+ */
+
+#include "warp.h"
+#include "parallel.h"
+#include "cpu_timing.h"
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace wp
+{
+
+namespace
+{
+
+struct ParallelJob
+{
+    parallel_for_func_t func;
+    void* context;
+    size_t n;
+    size_t grain_size;
+    std::atomic<size_t> next;
+
+    void execute()
+    {
+        for (;;)
+        {
+            const size_t begin = next.fetch_add(grain_size, std::memory_order_relaxed);
+            if (begin >= n)
+                break;
+
+            func(begin, std::min(begin + grain_size, n), context);
+        }
+    }
+};
+
+// set while a thread is executing chunks of a job, used to serialize nested parallel_for() calls
+thread_local bool g_inside_parallel_region = false;
+
+class HostThreadPool
+{
+public:
+
+    int get_num_threads() const
+    {
+        return num_workers.load(std::memory_order_relaxed) + 1;
+    }
+
+    void set_num_threads(int num_threads)
+    {
+        if (num_threads <= 0)
+            num_threads = std::max(1, int(std::thread::hardware_concurrency()));
+
+        // wait for any job in flight before changing the pool
+        std::lock_guard<std::mutex> submit_lock(submit_mutex);
+
+        if (num_threads == get_num_threads())
+            return;
+
+        stop_workers();
+
+        for (int i=0; i < num_threads - 1; ++i)
+            workers.emplace_back(&HostThreadPool::worker_loop, this, generation);
+
+        num_workers.store(int(workers.size()), std::memory_order_relaxed);
+    }
+
+    void run(size_t n, size_t grain_size, parallel_for_func_t func, void* context)
+    {
+        if (n == 0)
+            return;
+
+        grain_size = std::max(grain_size, size_t(1));
+
+        if (num_workers.load(std::memory_order_relaxed) == 0 || n <= grain_size || g_inside_parallel_region)
+        {
+            func(0, n, context);
+            return;
+        }
+
+        // another thread is using the pool, run on the calling thread rather than blocking
+        std::unique_lock<std::mutex> submit_lock(submit_mutex, std::try_to_lock);
+        if (!submit_lock.owns_lock() || workers.empty())
+        {
+            func(0, n, context);
+            return;
+        }
+
+        ParallelJob job;
+        job.func = func;
+        job.context = context;
+        job.n = n;
+        job.grain_size = grain_size;
+        job.next.store(0, std::memory_order_relaxed);
+
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            current_job = &job;
+            busy_workers = int(workers.size());
+            ++generation;
+        }
+        work_cv.notify_all();
+
+        g_inside_parallel_region = true;
+        job.execute();
+        g_inside_parallel_region = false;
+
+        std::unique_lock<std::mutex> lock(mutex);
+        done_cv.wait(lock, [this] { return busy_workers == 0; });
+        current_job = nullptr;
+    }
+
+private:
+
+    void worker_loop(uint64_t seen_generation)
+    {
+        g_inside_parallel_region = true;
+
+        for (;;)
+        {
+            ParallelJob* job;
+            {
+                std::unique_lock<std::mutex> lock(mutex);
+                work_cv.wait(lock, [&] { return shutdown || generation != seen_generation; });
+
+                if (shutdown)
+                    return;
+
+                seen_generation = generation;
+                job = current_job;
+            }
+
+            job->execute();
+
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                if (--busy_workers == 0)
+                    done_cv.notify_one();
+            }
+        }
+    }
+
+    void stop_workers()
+    {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            shutdown = true;
+        }
+        work_cv.notify_all();
+
+        for (std::thread& worker : workers)
+            worker.join();
+
+        workers.clear();
+        num_workers.store(0, std::memory_order_relaxed);
+        shutdown = false;
+    }
+
+    std::vector<std::thread> workers;
+    std::atomic<int> num_workers{0};
+
+    // serializes job submission and pool resizing
+    std::mutex submit_mutex;
+
+    // protects the job state below
+    std::mutex mutex;
+    std::condition_variable work_cv;
+    std::condition_variable done_cv;
+    ParallelJob* current_job = nullptr;
+    uint64_t generation = 0;
+    int busy_workers = 0;
+    bool shutdown = false;
+};
+
+// intentionally leaked so that worker threads are never joined during static destruction
+HostThreadPool& get_thread_pool()
+{
+    static HostThreadPool* pool = new HostThreadPool();
+    return *pool;
+}
+
+} // anonymous namespace
+
+void parallel_set_num_threads(int num_threads)
+{
+    get_thread_pool().set_num_threads(num_threads);
+}
+
+int parallel_get_num_threads()
+{
+    return get_thread_pool().get_num_threads();
+}
+
+void parallel_for(size_t n, size_t grain_size, parallel_for_func_t func, void* context)
+{
+    get_thread_pool().run(n, grain_size, func, context);
+}
+
+size_t parallel_grain_size(size_t n, size_t min_grain_size)
+{
+    const size_t num_chunks = size_t(parallel_get_num_threads()) * 8;
+    return std::max((n + num_chunks - 1) / num_chunks, std::max(min_grain_size, size_t(1)));
+}
+
+} // namespace wp
+
+// signature of the {name}_cpu_forward_range() / {name}_cpu_backward_range() kernel entry points
+typedef void (*cpu_kernel_range_func_t)(size_t task_begin, size_t task_end, void** args);
+
+struct cpu_kernel_launch_t
+{
+    cpu_kernel_range_func_t kernel;
+    void** args;
+};
+
+void cpu_set_num_threads(int num_threads)
+{
+    wp::parallel_set_num_threads(num_threads);
+}
+
+int cpu_get_num_threads()
+{
+    return wp::parallel_get_num_threads();
+}
+
+void cpu_launch_kernel(void* kernel, size_t dim, void** args)
+{
+    cpu_kernel_launch_t launch = { reinterpret_cast<cpu_kernel_range_func_t>(kernel), args };
+
+    wp::parallel_for(dim, wp::parallel_grain_size(dim), [](size_t begin, size_t end, void* context)
+    {
+        const cpu_kernel_launch_t* launch = static_cast<const cpu_kernel_launch_t*>(context);
+        launch->kernel(begin, end, launch->args);
+    }, &launch);
+}
+
+namespace
+{
+
+// kernel launch that reads the hardware counters of each thread around the chunks it executes
+struct cpu_counted_launch_t
+{
+    cpu_kernel_range_func_t kernel;
+    void** args;
+    std::atomic<uint64_t> counters[CPU_COUNTER_COUNT];
+    std::atomic<int> mask;
+};
+
+void cpu_counted_range(size_t begin, size_t end, void* context)
+{
+    cpu_counted_launch_t* launch = static_cast<cpu_counted_launch_t*>(context);
+
+    uint64_t before[CPU_COUNTER_COUNT];
+    uint64_t after[CPU_COUNTER_COUNT];
+
+    wp::cpu_counters_read(before);
+    launch->kernel(begin, end, launch->args);
+    const int mask = wp::cpu_counters_read(after);
+
+    for (int i = 0; i < CPU_COUNTER_COUNT; ++i)
+        launch->counters[i].fetch_add(after[i] - before[i], std::memory_order_relaxed);
+
+    // a counter is only valid if it could be read by all threads
+    launch->mask.fetch_and(mask, std::memory_order_relaxed);
+}
+
+} // anonymous namespace
+
+namespace wp
+{
+
+void cpu_run_kernel(void* kernel, size_t dim, void** args, bool parallel, bool timed, uint64_t tag)
+{
+    const bool multi_threaded = parallel && dim > 1 && parallel_get_num_threads() > 1;
+    const int64_t start = timed ? cpu_timing_now() : 0;
+
+    if (timed && cpu_counters_enabled())
+    {
+        cpu_counted_launch_t launch;
+        launch.kernel = reinterpret_cast<cpu_kernel_range_func_t>(kernel);
+        launch.args = args;
+        for (int i = 0; i < CPU_COUNTER_COUNT; ++i)
+            launch.counters[i].store(0, std::memory_order_relaxed);
+        launch.mask.store(~0, std::memory_order_relaxed);
+
+        if (multi_threaded)
+            parallel_for(dim, parallel_grain_size(dim), cpu_counted_range, &launch);
+        else
+            cpu_counted_range(0, dim, &launch);
+
+        const int64_t end = cpu_timing_now();
+
+        uint64_t counters[CPU_COUNTER_COUNT];
+        for (int i = 0; i < CPU_COUNTER_COUNT; ++i)
+            counters[i] = launch.counters[i].load(std::memory_order_relaxed);
+
+        cpu_timing_record(CPU_TIMING_KERNEL, tag, dim, start, end, counters, launch.mask.load(std::memory_order_relaxed));
+        return;
+    }
+
+    if (multi_threaded)
+        cpu_launch_kernel(kernel, dim, args);
+    else
+        reinterpret_cast<cpu_kernel_range_func_t>(kernel)(0, dim, args);
+
+    if (timed)
+        cpu_timing_record(CPU_TIMING_KERNEL, tag, dim, start, cpu_timing_now());
+}
+
+} // namespace wp
+
+void cpu_launch_kernels(int count, void** kernels, const bool* parallel, void*** args, const uint64_t* tags)
+{
+    const bool timed = tags && wp::cpu_timing_enabled(wp::CPU_TIMING_KERNEL);
+
+    for (int i = 0; i < count; ++i)
+    {
+        const size_t dim = static_cast<const wp::launch_bounds_t*>(args[i][0])->size;
+
+        if (dim == 0)
+            continue;
+
+        wp::cpu_run_kernel(kernels[i], dim, args[i], parallel[i], timed, timed ? tags[i] : 0);
+    }
+}
@@ -0,0 +1,98 @@
+/** Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+ * NVIDIA CORPORATION and its licensors retain all intellectual property
+ * and proprietary rights in and to this software, related documentation
+ * and any modifications thereto.  Any use, reproduction, disclosure or
+ * distribution of this software and related documentation without an express
+ * license agreement from NVIDIA CORPORATION is strictly prohibited.
+ */
+
+#pragma once
+
+#include <stddef.h>
+
+#include <algorithm>
+#include <vector>
+
+namespace wp
+{
+
+// callback processing the half-open range of work items [begin, end)
+typedef void (*parallel_for_func_t)(size_t begin, size_t end, void* context);
+
+// sets the number of threads (including the calling thread) used by parallel_for(),
+// a value <= 0 selects the number of hardware threads
+void parallel_set_num_threads(int num_threads);
+int parallel_get_num_threads();
+
+// splits [0, n) into chunks of grain_size items that are processed by the persistent
+// host worker pool, the calling thread participates and returns once all chunks are done;
+// nested calls and calls made while the pool is busy run serially on the calling thread
+void parallel_for(size_t n, size_t grain_size, parallel_for_func_t func, void* context);
+
+// returns a grain size that gives each thread several chunks to balance uneven work
+size_t parallel_grain_size(size_t n, size_t min_grain_size=1);
+
+template <typename Func>
+void parallel_for(size_t n, size_t grain_size, const Func& func)
+{
+    parallel_for_func_t trampoline = [](size_t begin, size_t end, void* context)
+    {
+        (*static_cast<const Func*>(context))(begin, end);
+    };
+
+    parallel_for(n, grain_size, trampoline, const_cast<void*>(static_cast<const void*>(&func)));
+}
+
+// sorts [data, data + n) with one block per thread sorted concurrently, followed by
+// rounds of pairwise merges; the result is identical to std::sort() for unique keys
+template <typename T, typename Compare>
+void parallel_sort(T* data, size_t n, const Compare& comp)
+{
+    const size_t num_blocks = size_t(parallel_get_num_threads());
+
+    if (num_blocks <= 1 || n < 2 * 4096)
+    {
+        std::sort(data, data + n, comp);
+        return;
+    }
+
+    const size_t block_size = (n + num_blocks - 1) / num_blocks;
+
+    parallel_for(num_blocks, 1, [&](size_t begin, size_t end)
+    {
+        for (size_t block = begin; block < end; ++block)
+        {
+            const size_t first = std::min(block * block_size, n);
+            const size_t last = std::min(first + block_size, n);
+            std::sort(data + first, data + last, comp);
+        }
+    });
+
+    std::vector<T> buffer(n);
+
+    T* src = data;
+    T* dst = buffer.data();
+
+    for (size_t width = block_size; width < n; width *= 2)
+    {
+        const size_t num_merges = (n + 2 * width - 1) / (2 * width);
+
+        parallel_for(num_merges, 1, [&](size_t begin, size_t end)
+        {
+            for (size_t merge = begin; merge < end; ++merge)
+            {
+                const size_t first = merge * 2 * width;
+                const size_t mid = std::min(first + width, n);
+                const size_t last = std::min(first + 2 * width, n);
+                std::merge(src + first, src + mid, src + mid, src + last, dst + first, comp);
+            }
+        });
+
+        std::swap(src, dst);
+    }
+
+    if (src != data)
+        std::copy(src, src + n, data);
+}
+
+} // namespace wp
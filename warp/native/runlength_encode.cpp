@@ -7,8 +7,16 @@
  */
 
 #include "warp.h"
+#include "parallel.h"
 
+#include <algorithm>
 #include <cstdint>
+#include <vector>
+
+// values are processed in blocks of a fixed size: the runs starting in each block are counted and
+// scanned to get the index of the first run of each block, then each block writes the runs that
+// start in it, following the last one past the end of the block if needed
+#define RUNLENGTH_ENCODE_BLOCK_SIZE (16384)
 
 template <typename T>
 void runlength_encode_host(int n,
@@ -23,25 +31,71 @@ void runlength_encode_host(int n,
         return;
     }
 
-    const T *end = values + n;
+    // encoding in-place is only safe when the values are processed in order by a single block
+    const int block_size = run_values == values ? n : RUNLENGTH_ENCODE_BLOCK_SIZE;
+    const int num_blocks = (n + block_size - 1) / block_size;
+
+    auto is_run_start = [&](int i)
+    {
+        return i == 0 || values[i] != values[i - 1];
+    };
 
-    *run_count = 1;
-    *run_lengths = 1;
-    *run_values = *values;
+    std::vector<int> block_first_run(num_blocks);
 
-    while (++values != end)
+    wp::parallel_for(num_blocks, 1, [&](size_t begin, size_t end)
     {
-        if (*values == *run_values)
+        for (int block = int(begin); block < int(end); ++block)
         {
-            ++*run_lengths;
+            const int first = block * block_size;
+            const int last = std::min(first + block_size, n);
+
+            int count = 0;
+            for (int i = first; i < last; ++i)
+                count += is_run_start(i);
+
+            block_first_run[block] = count;
         }
-        else
+    });
+
+    int num_runs = 0;
+    for (int block = 0; block < num_blocks; ++block)
+    {
+        const int count = block_first_run[block];
+        block_first_run[block] = num_runs;
+        num_runs += count;
+    }
+
+    wp::parallel_for(num_blocks, 1, [&](size_t begin, size_t end)
+    {
+        for (int block = int(begin); block < int(end); ++block)
         {
-            ++*run_count;
-            *(++run_lengths) = 1;
-            *(++run_values) = *values;
+            const int first = block * block_size;
+            const int last = std::min(first + block_size, n);
+
+            // skip the tail of a run started in a previous block
+            int i = first;
+            while (i < last && !is_run_start(i))
+                ++i;
+
+            int run = block_first_run[block];
+            while (i < last)
+            {
+                const T value = values[i];
+
+                int run_end = i + 1;
+                while (run_end < n && values[run_end] == value)
+                    ++run_end;
+
+                run_values[run] = value;
+                run_lengths[run] = run_end - i;
+
+                ++run;
+                i = run_end;
+            }
         }
-    }
+    });
+
+    *run_count = num_runs;
 }
 
 void runlength_encode_int_host(
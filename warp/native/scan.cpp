@@ -7,31 +7,88 @@
  */
 
 #include "scan.h"
+#include "parallel.h"
 
-#include <numeric>
+#include <vector>
+
+// arrays are scanned in blocks of a fixed size so that floating-point results
+// do not depend on the number of threads
+#define SCAN_BLOCK_SIZE (16384)
+
+// scans [first, last) starting from the given offset, values_in and values_out may alias
+template<typename T>
+T scan_block_host(const T* values_in, T* values_out, int first, int last, T offset, bool inclusive)
+{
+    T sum = offset;
+
+    if (inclusive)
+    {
+        for (int i = first; i < last; ++i)
+        {
+            sum += values_in[i];
+            values_out[i] = sum;
+        }
+    }
+    else
+    {
+        for (int i = first; i < last; ++i)
+        {
+            const T value = values_in[i];
+            values_out[i] = sum;
+            sum += value;
+        }
+    }
+
+    return sum;
+}
 
 template<typename T>
 void scan_host(const T* values_in, T* values_out, int n, bool inclusive)
 {
-    static void* scan_temp_memory = NULL;
-    static size_t scan_temp_max_size = 0;
+    const int num_blocks = (n + SCAN_BLOCK_SIZE - 1) / SCAN_BLOCK_SIZE;
 
-    // compute temporary memory required
-    if (!inclusive && n > scan_temp_max_size)
+    if (num_blocks <= 1)
     {
-	    free_host(scan_temp_memory);
-        scan_temp_memory = alloc_host(sizeof(T) * n);
-        scan_temp_max_size = n;
+        scan_block_host(values_in, values_out, 0, n, T(0), inclusive);
+        return;
     }
 
-    T* result = inclusive ? values_out : static_cast<T*>(scan_temp_memory);
+    // sum each block, scan the block sums, then scan each block from its offset
+    std::vector<T> block_offsets(num_blocks);
+
+    wp::parallel_for(num_blocks, 1, [&](size_t begin, size_t end)
+    {
+        for (int block = int(begin); block < int(end); ++block)
+        {
+            const int first = block * SCAN_BLOCK_SIZE;
+            const int last = std::min(first + SCAN_BLOCK_SIZE, n);
+
+            T sum = T(0);
+            for (int i = first; i < last; ++i)
+                sum += values_in[i];
+
+            block_offsets[block] = sum;
+        }
+    });
 
-    // scan
-    std::partial_sum(values_in, values_in + n, result);
-    if (!inclusive) {
-        values_out[0] = (T)0;
-        memcpy_h2h(values_out + 1, result, sizeof(T) * (n - 1));
+    T offset = T(0);
+    for (int block = 0; block < num_blocks; ++block)
+    {
+        const T sum = block_offsets[block];
+        block_offsets[block] = offset;
+        offset += sum;
     }
+
+    wp::parallel_for(num_blocks, 1, [&](size_t begin, size_t end)
+    {
+        for (int block = int(begin); block < int(end); ++block)
+        {
+            const int first = block * SCAN_BLOCK_SIZE;
+            const int last = std::min(first + SCAN_BLOCK_SIZE, n);
+
+            scan_block_host(values_in, values_out, first, last, block_offsets[block], inclusive);
+        }
+    });
 }
 
 template void scan_host(const int*, int*, int, bool);
@@ -8,149 +8,172 @@
 
 #include "warp.h"
 #include "sort.h"
+#include "parallel.h"
 #include "string.h"
 
 #include <cstdint>
+#include <vector>
 
-void radix_sort_pairs_host(int* keys, int* values, int n)
+// Host LSD radix sort processing 8 bits per pass.
+//
+// The keys are split into one block per thread, each pass builds a digit histogram per block,
+// turns the histograms into per-block output offsets (digit-major, so equal digits keep the order
+// of the blocks), and scatters the blocks concurrently. The sort is stable, so the result does not
+// depend on the number of threads. Passes in which all keys share the same digit are skipped.
+
+#define RADIX_SORT_BITS (8)
+#define RADIX_SORT_BUCKETS (1 << RADIX_SORT_BITS)
+
+// arrays smaller than this are sorted by a single thread
+#define RADIX_SORT_MIN_BLOCK_SIZE (16384)
+
+namespace
 {
-	static int tables[2][1 << 16];
-	memset(tables, 0, sizeof(tables));
-		
-	int* auxKeys = keys + n;
-	int* auxValues = values + n;
-
-	// build histograms
-	for (int i=0; i < n; ++i)
-	{
-		const unsigned short low = keys[i] & 0xffff;
-		const unsigned short high = keys[i] >> 16;
-		
-		++tables[0][low];
-		++tables[1][high];
-	}
-	
-	// convert histograms to offset tables in-place
-	int offlow = 0;
-	int offhigh = 0;
-	
-	for (int i=0; i < 65536; ++i)
-	{
-		const int newofflow = offlow + tables[0][i];
-		const int newoffhigh = offhigh + tables[1][i];
-		
-		tables[0][i] = offlow;
-		tables[1][i] = offhigh;
-		
-		offlow = newofflow;
-		offhigh = newoffhigh;
-	}
-		
-	// pass 1 - sort by low 16 bits
-	for (int i=0; i < n; ++i)
-	{
-		// lookup offset of input
-		const int k = keys[i];
-		const int v = values[i];
-		const int b = k & 0xffff;
-		
-		// find offset and increment
-		const int offset = tables[0][b]++;
-		
-		auxKeys[offset] = k;
-		auxValues[offset] = v;
-	}	
-		
-	// pass 2 - sort by high 16 bits
-	for (int i=0; i < n; ++i)
-	{
-		// lookup offset of input
-		const int k = auxKeys[i];
-		const int v = auxValues[i];
-
-		const int b = k >> 16;
-		
-		const int offset = tables[1][b]++;
-		
-		keys[offset] = k;
-		values[offset] = v;
-	}	
+
+// maps keys to unsigned integers with the same ordering
+
+inline uint32_t radix_key(int k)
+{
+	return uint32_t(k) ^ 0x80000000u;
+}
+
+inline uint64_t radix_key(int64_t k)
+{
+	return uint64_t(k) ^ 0x8000000000000000ull;
 }
 
  //http://stereopsis.com/radix.html
-inline unsigned int radix_float_to_int(float f)
+inline uint32_t radix_key(float f)
 {
 	unsigned int i = reinterpret_cast<unsigned int&>(f);
 	unsigned int mask = (unsigned int)(-(int)(i >> 31)) | 0x80000000;
 	return i ^ mask;
 }
 
-void radix_sort_pairs_host(float* keys, int* values, int n)
+template <typename K, typename V>
+void radix_sort_pairs_host_impl(K* keys, V* values, int n)
 {
-	static unsigned int tables[2][1 << 16];
-	memset(tables, 0, sizeof(tables));
-		
-	float* auxKeys = keys + n;
-	int* auxValues = values + n;
-
-	// build histograms
-	for (int i=0; i < n; ++i)
+	if (n <= 1)
+		return;
+
+	const int num_passes = int(sizeof(radix_key(keys[0]))) * 8 / RADIX_SORT_BITS;
+
+	// the second half of the key and value arrays is used as temporary storage
+	K* src_keys = keys;
+	V* src_values = values;
+	K* dst_keys = keys + n;
+	V* dst_values = values + n;
+
+	const int max_blocks = (n + RADIX_SORT_MIN_BLOCK_SIZE - 1) / RADIX_SORT_MIN_BLOCK_SIZE;
+	const int num_blocks = std::max(1, std::min(wp::parallel_get_num_threads(), max_blocks));
+	const int block_size = (n + num_blocks - 1) / num_blocks;
+
+	std::vector<int> offsets(num_blocks * RADIX_SORT_BUCKETS);
+
+	for (int pass=0; pass < num_passes; ++pass)
 	{
-		const unsigned int k = radix_float_to_int(keys[i]);
-		const unsigned short low = k & 0xffff;
-		const unsigned short high = k >> 16;
-		
-		++tables[0][low];
-		++tables[1][high];
+		const int shift = pass * RADIX_SORT_BITS;
+
+		// build a histogram of the digits of each block
+		wp::parallel_for(num_blocks, 1, [&](size_t begin, size_t end)
+		{
+			for (int block = int(begin); block < int(end); ++block)
+			{
+				int* counts = &offsets[block * RADIX_SORT_BUCKETS];
+				std::fill(counts, counts + RADIX_SORT_BUCKETS, 0);
+
+				const int first = block * block_size;
+				const int last = std::min(first + block_size, n);
+
+				for (int i=first; i < last; ++i)
+					++counts[(radix_key(src_keys[i]) >> shift) & (RADIX_SORT_BUCKETS - 1)];
+			}
+		});
+
+		// skip the pass if all keys share the same digit
+		const int digit = (radix_key(src_keys[0]) >> shift) & (RADIX_SORT_BUCKETS - 1);
+
+		int digit_count = 0;
+		for (int block=0; block < num_blocks; ++block)
+			digit_count += offsets[block * RADIX_SORT_BUCKETS + digit];
+
+		if (digit_count == n)
+			continue;
+
+		// convert histograms to offset tables in-place
+		int offset = 0;
+		for (int bucket=0; bucket < RADIX_SORT_BUCKETS; ++bucket)
+		{
+			for (int block=0; block < num_blocks; ++block)
+			{
+				int& count = offsets[block * RADIX_SORT_BUCKETS + bucket];
+				const int new_offset = offset + count;
+
+				count = offset;
+				offset = new_offset;
+			}
+		}
+
+		// scatter the keys of each block
+		wp::parallel_for(num_blocks, 1, [&](size_t begin, size_t end)
+		{
+			for (int block = int(begin); block < int(end); ++block)
+			{
+				int* block_offsets = &offsets[block * RADIX_SORT_BUCKETS];
+
+				const int first = block * block_size;
+				const int last = std::min(first + block_size, n);
+
+				for (int i=first; i < last; ++i)
+				{
+					const K k = src_keys[i];
+					const int b = (radix_key(k) >> shift) & (RADIX_SORT_BUCKETS - 1);
+
+					// find offset and increment
+					const int out = block_offsets[b]++;
+
+					dst_keys[out] = k;
+					dst_values[out] = src_values[i];
+				}
+			}
+		});
+
+		std::swap(src_keys, dst_keys);
+		std::swap(src_values, dst_values);
 	}
-	
-	// convert histograms to offset tables in-place
-	unsigned int offlow = 0;
-	unsigned int offhigh = 0;
-	
-	for (int i=0; i < 65536; ++i)
+
+	// copy back if the result ended up in the temporary storage
+	if (src_keys != keys)
 	{
-		const unsigned int newofflow = offlow + tables[0][i];
-		const unsigned int newoffhigh = offhigh + tables[1][i];
-		
-		tables[0][i] = offlow;
-		tables[1][i] = offhigh;
-		
-		offlow = newofflow;
-		offhigh = newoffhigh;
+		wp::parallel_for(num_blocks, 1, [&](size_t begin, size_t end)
+		{
+			for (int block = int(begin); block < int(end); ++block)
+			{
+				const int first = block * block_size;
+				const int last = std::min(first + block_size, n);
+
+				memcpy(keys + first, src_keys + first, sizeof(K) * (last - first));
+				memcpy(values + first, src_values + first, sizeof(V) * (last - first));
+			}
+		});
 	}
-		
-	// pass 1 - sort by low 16 bits
-	for (int i=0; i < n; ++i)
-	{
-		// lookup offset of input
-		const float f = keys[i];
-		const unsigned int k = radix_float_to_int(f);
-		const int v = values[i];
-		const unsigned int b = k & 0xffff;
-		
-		// find offset and increment
-		const unsigned int offset = tables[0][b]++;
-		
-		auxKeys[offset] = f;
-		auxValues[offset] = v;
-	}	
-		
-	// pass 2 - sort by high 16 bits
-	for (int i=0; i < n; ++i)
-	{
-		// lookup offset of input
-		const float f = auxKeys[i];
-		const unsigned int k = radix_float_to_int(f);
-		const int v = auxValues[i];
-
-		const unsigned int b = k >> 16;
-		
-		const unsigned int offset = tables[1][b]++;
-		
-		keys[offset] = f;
-		values[offset] = v;
-	}	
+}
+
+} // anonymous namespace
+
+void radix_sort_pairs_host(int* keys, int* values, int n)
+{
+	radix_sort_pairs_host_impl(keys, values, n);
+}
+
+void radix_sort_pairs_host(int64_t* keys, int* values, int n)
+{
+	radix_sort_pairs_host_impl(keys, values, n);
+}
+
+void radix_sort_pairs_host(float* keys, int* values, int n)
+{
+	radix_sort_pairs_host_impl(keys, values, n);
 }
 
 #if !WP_ENABLE_CUDA
@@ -159,6 +182,8 @@ void radix_sort_reserve(void* context, int n, void** mem_out, size_t* size_out)
 
 void radix_sort_pairs_int_device(uint64_t keys, uint64_t values, int n) {}
 
+void radix_sort_pairs_int64_device(uint64_t keys, uint64_t values, int n) {}
+
 void radix_sort_pairs_float_device(uint64_t keys, uint64_t values, int n) {}
 
 #endif // !WP_ENABLE_CUDA
@@ -171,9 +196,16 @@ void radix_sort_pairs_int_host(uint64_t keys, uint64_t values, int n)
         reinterpret_cast<int *>(values), n);
 }
 
+void radix_sort_pairs_int64_host(uint64_t keys, uint64_t values, int n)
+{
+    radix_sort_pairs_host(
+        reinterpret_cast<int64_t *>(keys),
+        reinterpret_cast<int *>(values), n);
+}
+
 void radix_sort_pairs_float_host(uint64_t keys, uint64_t values, int n)
 {
     radix_sort_pairs_host(
         reinterpret_cast<float *>(keys),
         reinterpret_cast<int *>(values), n);
-}
\ No newline at end of file
+}
@@ -9,9 +9,12 @@
 #pragma once
 
 #include <stddef.h>
+#include <stdint.h>
 
 void radix_sort_reserve(void* context, int n, void** mem_out=NULL, size_t* size_out=NULL);
 void radix_sort_pairs_host(int* keys, int* values, int n);
+void radix_sort_pairs_host(int64_t* keys, int* values, int n);
 void radix_sort_pairs_host(float* keys, int* values, int n);
 void radix_sort_pairs_device(void* context, int* keys, int* values, int n);
+void radix_sort_pairs_device(void* context, int64_t* keys, int* values, int n);
 void radix_sort_pairs_device(void* context, float* keys, int* values, int n);
\ No newline at end of file
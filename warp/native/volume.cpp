@@ -380,6 +380,74 @@ void volume_destroy_device(uint64_t id)
     }
 }
 
+uint64_t volume_f_from_tiles_host(void *points, int num_points, float transform[9], float translation[3],
+                                  bool points_in_world_space, float bg_value)
+{
+    nanovdb::FloatGrid *grid;
+    size_t gridSize;
+    BuildGridParams<float> params;
+    params.background_value = bg_value;
+    volume_set_map(params.map, transform, translation);
+
+    build_grid_from_points_host(grid, gridSize, points, num_points, points_in_world_space, params);
+
+    return volume_create_host(grid, gridSize, false, true);
+}
+
+uint64_t volume_v_from_tiles_host(void *points, int num_points, float transform[9], float translation[3],
+                                  bool points_in_world_space, float bg_value[3])
+{
+    nanovdb::Vec3fGrid *grid;
+    size_t gridSize;
+    BuildGridParams<nanovdb::Vec3f> params;
+    params.background_value = nanovdb::Vec3f{bg_value[0], bg_value[1], bg_value[2]};
+    volume_set_map(params.map, transform, translation);
+
+    build_grid_from_points_host(grid, gridSize, points, num_points, points_in_world_space, params);
+
+    return volume_create_host(grid, gridSize, false, true);
+}
+
+uint64_t volume_i_from_tiles_host(void *points, int num_points, float transform[9], float translation[3],
+                                  bool points_in_world_space, int bg_value)
+{
+    nanovdb::Int32Grid *grid;
+    size_t gridSize;
+    BuildGridParams<int32_t> params;
+    params.background_value = (int32_t)(bg_value);
+    volume_set_map(params.map, transform, translation);
+
+    build_grid_from_points_host(grid, gridSize, points, num_points, points_in_world_space, params);
+
+    return volume_create_host(grid, gridSize, false, true);
+}
+
+uint64_t volume_index_from_tiles_host(void *points, int num_points, float transform[9], float translation[3],
+                                      bool points_in_world_space)
+{
+    nanovdb::IndexGrid *grid;
+    size_t gridSize;
+    BuildGridParams<nanovdb::ValueIndex> params;
+    volume_set_map(params.map, transform, translation);
+
+    build_grid_from_points_host(grid, gridSize, points, num_points, points_in_world_space, params);
+
+    return volume_create_host(grid, gridSize, false, true);
+}
+
+uint64_t volume_from_active_voxels_host(void *points, int num_points, float transform[9], float translation[3],
+                                        bool points_in_world_space)
+{
+    nanovdb::OnIndexGrid *grid;
+    size_t gridSize;
+    BuildGridParams<nanovdb::ValueOnIndex> params;
+    volume_set_map(params.map, transform, translation);
+
+    build_grid_from_points_host(grid, gridSize, points, num_points, points_in_world_space, params);
+
+    return volume_create_host(grid, gridSize, false, true);
+}
+
 #if WP_ENABLE_CUDA
 
 uint64_t volume_f_from_tiles_device(void *context, void *points, int num_points, float transform[9],
@@ -0,0 +1,322 @@
+/** Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+ * NVIDIA CORPORATION and its licensors retain all intellectual property
+ * and proprietary rights in and to this software, related documentation
+ * and any modifications thereto.  Any use, reproduction, disclosure or
+ * distribution of this software and related documentation without an express
+ * license agreement from NVIDIA CORPORATION is strictly prohibited.
+ */
+
+#include "volume_builder.h"
+#include "parallel.h"
+#include "warp.h"
+
+#include <cstring>
+#include <functional>
+#include <vector>
+
+// Host implementation of build_grid_from_points(), producing the same NanoVDB grid as
+// nanovdb::tools::cuda::PointsToGrid followed by finalize_grid() in volume_builder.cu.
+//
+// 1. compute the sort key of each point and sort the keys in parallel, dropping duplicate voxels,
+// 2. walk the sorted voxels once to enumerate the upper, lower and leaf nodes in breadth-first order,
+// 3. fill the leaf, lower and upper nodes in parallel, bottom up, so that each node can accumulate
+//    the bounding box of its children without atomics,
+// 4. fill the root, tree and grid headers.
+//
+// The keys order the nodes exactly like the device builder, so the resulting grids are identical.
+
+namespace
+{
+
+/// Sort key of a voxel, ordering voxels by root tile and then by their offsets in the upper, lower and leaf nodes
+struct VoxelKey
+{
+    uint64_t tile;  // tile key: 21 bits per coordinate of the upper node origin
+    uint64_t voxel; // upper offset (15 bits) | lower offset (12 bits) | leaf offset (9 bits)
+
+    bool operator<(const VoxelKey& other) const
+    {
+        return tile < other.tile || (tile == other.tile && voxel < other.voxel);
+    }
+
+    bool operator==(const VoxelKey& other) const { return tile == other.tile && voxel == other.voxel; }
+};
+
+constexpr int64_t TILE_KEY_OFFSET = int64_t(1) << 31;
+constexpr uint64_t TILE_KEY_MASK = (uint64_t(1) << 21) - 1;
+
+template <typename BuildT> VoxelKey coord_to_key(const nanovdb::Coord& ijk)
+{
+    VoxelKey key;
+    key.tile = (uint64_t(uint32_t(int64_t(ijk[2]) + TILE_KEY_OFFSET) >> 12)) |
+               (uint64_t(uint32_t(int64_t(ijk[1]) + TILE_KEY_OFFSET) >> 12) << 21) |
+               (uint64_t(uint32_t(int64_t(ijk[0]) + TILE_KEY_OFFSET) >> 12) << 42);
+    key.voxel = uint64_t(nanovdb::NanoUpper<BuildT>::CoordToOffset(ijk)) << 21 |
+                uint64_t(nanovdb::NanoLower<BuildT>::CoordToOffset(ijk)) << 9 |
+                uint64_t(nanovdb::NanoLeaf<BuildT>::CoordToOffset(ijk));
+    return key;
+}
+
+template <typename BuildT> nanovdb::Coord key_to_coord(const VoxelKey& key)
+{
+    nanovdb::Coord ijk(int(int64_t(((key.tile >> 42) & TILE_KEY_MASK) << 12) - TILE_KEY_OFFSET),
+                       int(int64_t(((key.tile >> 21) & TILE_KEY_MASK) << 12) - TILE_KEY_OFFSET),
+                       int(int64_t((key.tile & TILE_KEY_MASK) << 12) - TILE_KEY_OFFSET));
+
+    ijk += nanovdb::NanoUpper<BuildT>::OffsetToLocalCoord(uint32_t(key.voxel >> 21) & 32767u)
+           << nanovdb::NanoLower<BuildT>::TOTAL;
+    ijk += nanovdb::NanoLower<BuildT>::OffsetToLocalCoord(uint32_t(key.voxel >> 9) & 4095u)
+           << nanovdb::NanoLeaf<BuildT>::TOTAL;
+    ijk += nanovdb::NanoLeaf<BuildT>::OffsetToLocalCoord(uint32_t(key.voxel) & 511u);
+    return ijk;
+}
+
+template <typename Node, typename ValueT> void set_background_value(Node& node, const ValueT& background_value)
+{
+    if constexpr (!nanovdb::BuildTraits<typename Node::BuildType>::is_index)
+    {
+        for (uint32_t n = 0; n < Node::SIZE; ++n)
+        {
+            if (!node.mChildMask.isOn(n))
+                node.setValue(n, background_value);
+        }
+    }
+}
+
+/// Fills the internal nodes of one level, given the index range of the children of each node
+template <typename Node, typename Child, typename ValueT>
+void build_internal_nodes(Node* nodes, size_t node_count, Child* children, const std::vector<uint32_t>& first_child,
+                          const std::vector<uint32_t>& child_offsets, const ValueT& background_value)
+{
+    wp::parallel_for(node_count, wp::parallel_grain_size(node_count), [&](size_t begin, size_t end)
+    {
+        for (size_t node_id = begin; node_id < end; ++node_id)
+        {
+            Node& node = nodes[node_id];
+
+            nanovdb::CoordBBox bbox;
+            for (uint32_t child_id = first_child[node_id]; child_id < first_child[node_id + 1]; ++child_id)
+            {
+                const uint32_t n = child_offsets[child_id];
+                node.mChildMask.setOn(n);
+                node.setChild(n, &children[child_id]);
+                bbox.expand(children[child_id].bbox());
+            }
+
+            set_background_value(node, background_value);
+
+            node.mBBox = bbox;
+        }
+    });
+}
+
+} // anonymous namespace
+
+template <typename BuildT>
+void build_grid_from_points_host(nanovdb::Grid<nanovdb::NanoTree<BuildT>>*& out_grid, size_t& out_grid_size,
+                                 const void* points, size_t num_points, bool points_in_world_space,
+                                 const BuildGridParams<BuildT>& params)
+{
+    using GridT = nanovdb::NanoGrid<BuildT>;
+    using TreeT = nanovdb::NanoTree<BuildT>;
+    using RootT = nanovdb::NanoRoot<BuildT>;
+    using UpperT = nanovdb::NanoUpper<BuildT>;
+    using LowerT = nanovdb::NanoLower<BuildT>;
+    using LeafT = nanovdb::NanoLeaf<BuildT>;
+
+    // background value of the internal nodes, index grids have none
+    typename LowerT::ValueType background_value{};
+    if constexpr (!nanovdb::BuildTraits<BuildT>::is_index)
+        background_value = params.background_value;
+
+    // sorted, unique voxel keys
+    std::vector<VoxelKey> keys(num_points);
+
+    wp::parallel_for(num_points, wp::parallel_grain_size(num_points, 1024), [&](size_t begin, size_t end)
+    {
+        for (size_t i = begin; i < end; ++i)
+        {
+            nanovdb::Coord ijk;
+            if (points_in_world_space)
+                ijk = params.map.applyInverseMapF(static_cast<const nanovdb::Vec3f*>(points)[i]).round();
+            else
+                ijk = static_cast<const nanovdb::Coord*>(points)[i];
+
+            keys[i] = coord_to_key<BuildT>(ijk);
+        }
+    });
+
+    wp::parallel_sort(keys.data(), keys.size(), std::less<VoxelKey>());
+    keys.erase(std::unique(keys.begin(), keys.end()), keys.end());
+
+    const size_t voxel_count = keys.size();
+
+    // enumerate nodes in breadth-first order, recording for each node the range of its children
+    // and the offset of each node in the table of its parent
+    std::vector<nanovdb::Coord> upper_origins;
+    std::vector<uint32_t> upper_first_lower, lower_first_leaf, leaf_first_voxel;
+    std::vector<uint32_t> lower_offsets, leaf_offsets;
+
+    for (size_t i = 0; i < voxel_count; ++i)
+    {
+        const VoxelKey& key = keys[i];
+
+        const bool new_upper = i == 0 || key.tile != keys[i - 1].tile;
+        const bool new_lower = new_upper || (key.voxel >> 21) != (keys[i - 1].voxel >> 21);
+        const bool new_leaf = new_lower || (key.voxel >> 9) != (keys[i - 1].voxel >> 9);
+
+        if (new_upper)
+        {
+            upper_origins.push_back(key_to_coord<BuildT>(key) & ~UpperT::MASK);
+            upper_first_lower.push_back(uint32_t(lower_offsets.size()));
+        }
+
+        if (new_lower)
+        {
+            lower_offsets.push_back(uint32_t(key.voxel >> 21) & 32767u);
+            lower_first_leaf.push_back(uint32_t(leaf_offsets.size()));
+        }
+
+        if (new_leaf)
+        {
+            leaf_offsets.push_back(uint32_t(key.voxel >> 9) & 4095u);
+            leaf_first_voxel.push_back(uint32_t(i));
+        }
+    }
+
+    const uint32_t upper_count = uint32_t(upper_origins.size());
+    const uint32_t lower_count = uint32_t(lower_offsets.size());
+    const uint32_t leaf_count = uint32_t(leaf_offsets.size());
+
+    upper_first_lower.push_back(lower_count);
+    lower_first_leaf.push_back(leaf_count);
+    leaf_first_voxel.push_back(uint32_t(voxel_count));
+
+    // same buffer layout as PointsToGrid::getBuffer()
+    const uint64_t tree_offset = GridT::memUsage();
+    const uint64_t root_offset = tree_offset + TreeT::memUsage();
+    const uint64_t upper_offset = root_offset + RootT::memUsage(upper_count);
+    const uint64_t lower_offset = upper_offset + UpperT::memUsage() * upper_count;
+    const uint64_t leaf_offset = lower_offset + LowerT::memUsage() * lower_count;
+    const uint64_t grid_size = leaf_offset + LeafT::DataType::memUsage() * leaf_count;
+
+    // all statistics, masks and unused values start out zeroed
+    uint8_t* buffer = static_cast<uint8_t*>(alloc_host(grid_size));
+    memset(buffer, 0, grid_size);
+
+    GridT& grid = *reinterpret_cast<GridT*>(buffer);
+    TreeT& tree = *reinterpret_cast<TreeT*>(buffer + tree_offset);
+    RootT& root = *reinterpret_cast<RootT*>(buffer + root_offset);
+    UpperT* uppers = reinterpret_cast<UpperT*>(buffer + upper_offset);
+    LowerT* lowers = reinterpret_cast<LowerT*>(buffer + lower_offset);
+    LeafT* leaves = reinterpret_cast<LeafT*>(buffer + leaf_offset);
+
+    // leaf nodes, tiles are fully activated while voxel grids only activate the given voxels
+    uint8_t leaf_flags = uint8_t(nanovdb::GridFlags::IsBreadthFirst);
+    if constexpr (nanovdb::BuildTraits<BuildT>::is_onindex)
+        leaf_flags |= uint8_t(nanovdb::GridFlags::HasBBox);
+
+    wp::parallel_for(leaf_count, wp::parallel_grain_size(leaf_count), [&](size_t begin, size_t end)
+    {
+        for (size_t leaf_id = begin; leaf_id < end; ++leaf_id)
+        {
+            LeafT& leaf = leaves[leaf_id];
+
+            leaf.mBBoxMin = key_to_coord<BuildT>(keys[leaf_first_voxel[leaf_id]]) & ~LeafT::MASK;
+            leaf.mFlags = leaf_flags;
+
+            for (uint32_t i = leaf_first_voxel[leaf_id]; i < leaf_first_voxel[leaf_id + 1]; ++i)
+            {
+                const uint32_t n = uint32_t(keys[i].voxel) & 511u;
+                leaf.mValueMask.setOn(n);
+
+                if constexpr (!nanovdb::BuildTraits<BuildT>::is_special)
+                    leaf.mValues[n] = typename LeafT::ValueType(1);
+            }
+
+            if constexpr (nanovdb::BuildTraits<BuildT>::is_onindex)
+            {
+                // voxels are unique, so the number of active values before this leaf is its first voxel
+                leaf.mOffset = 1u + leaf_first_voxel[leaf_id];
+
+                const uint64_t* w = leaf.mValueMask.words();
+                uint64_t sum = nanovdb::util::countOn(*w++);
+                leaf.mPrefixSum = sum;
+                for (int n = 9; n < 55; n += 9)
+                {
+                    sum += nanovdb::util::countOn(*w++);
+                    leaf.mPrefixSum |= sum << n;
+                }
+            }
+            else
+            {
+                leaf.mValueMask.setOn();
+
+                if constexpr (nanovdb::BuildTraits<BuildT>::is_offindex)
+                    leaf.mOffset = leaf_id * 512u + 1u;
+            }
+
+            leaf.updateBBox();
+        }
+    });
+
+    build_internal_nodes(lowers, lower_count, leaves, lower_first_leaf, leaf_offsets, background_value);
+    build_internal_nodes(uppers, upper_count, lowers, upper_first_lower, lower_offsets, background_value);
+
+    // root node
+    nanovdb::CoordBBox bbox;
+    root.mTableSize = upper_count;
+    for (uint32_t upper_id = 0; upper_id < upper_count; ++upper_id)
+    {
+        root.tile(upper_id)->setChild(upper_origins[upper_id], &uppers[upper_id], &root);
+        bbox.expand(uppers[upper_id].bbox());
+    }
+    root.mBBox = bbox;
+    if constexpr (!nanovdb::BuildTraits<BuildT>::is_index)
+        root.mBackground = params.background_value;
+
+    // tree
+    tree.setRoot(&root);
+    tree.setFirstNode(uppers);
+    tree.setFirstNode(lowers);
+    tree.setFirstNode(leaves);
+    tree.mNodeCount[2] = tree.mTileCount[2] = upper_count;
+    tree.mNodeCount[1] = tree.mTileCount[1] = lower_count;
+    tree.mNodeCount[0] = tree.mTileCount[0] = leaf_count;
+
+    // grid
+    grid.init({nanovdb::GridFlags::HasBBox, nanovdb::GridFlags::IsBreadthFirst}, grid_size, params.map,
+              nanovdb::toGridType<BuildT>());
+    strncpy(grid.mGridName, params.name, nanovdb::GridData::MaxNameSize - 1);
+    grid.mWorldBBox = root.mBBox.transform(grid.map());
+
+    if constexpr (nanovdb::BuildTraits<BuildT>::is_onindex)
+    {
+        tree.mVoxelCount = voxel_count;
+        grid.mData1 = 1u + voxel_count;
+    }
+    else
+    {
+        tree.mVoxelCount = LeafT::SIZE * uint64_t(leaf_count);
+
+        if constexpr (nanovdb::BuildTraits<BuildT>::is_offindex)
+        {
+            grid.mData1 = 1u + LeafT::SIZE * uint64_t(leaf_count);
+            grid.mGridClass = nanovdb::GridClass::IndexGrid;
+        }
+    }
+
+    out_grid = &grid;
+    out_grid_size = grid_size;
+}
+
+template void build_grid_from_points_host(nanovdb::Grid<nanovdb::NanoTree<float>>*&, size_t&, const void*, size_t,
+                                          bool, const BuildGridParams<float>&);
+template void build_grid_from_points_host(nanovdb::Grid<nanovdb::NanoTree<nanovdb::Vec3f>>*&, size_t&, const void*,
+                                          size_t, bool, const BuildGridParams<nanovdb::Vec3f>&);
+template void build_grid_from_points_host(nanovdb::Grid<nanovdb::NanoTree<int32_t>>*&, size_t&, const void*, size_t,
+                                          bool, const BuildGridParams<int32_t>&);
+template void build_grid_from_points_host(nanovdb::Grid<nanovdb::NanoTree<nanovdb::ValueIndex>>*&, size_t&,
+                                          const void*, size_t, bool, const BuildGridParams<nanovdb::ValueIndex>&);
+template void build_grid_from_points_host(nanovdb::Grid<nanovdb::NanoTree<nanovdb::ValueOnIndex>>*&, size_t&,
+                                          const void*, size_t, bool, const BuildGridParams<nanovdb::ValueOnIndex>&);
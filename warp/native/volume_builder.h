@@ -35,3 +35,10 @@ template <typename BuildT>
 void build_grid_from_points(nanovdb::Grid<nanovdb::NanoTree<BuildT>>*& out_grid, size_t& out_grid_size,
                             const void* points, size_t num_points, bool points_in_world_space,
                             const BuildGridParams<BuildT>& params);
+
+// Host counterpart of build_grid_from_points(), the grid is allocated with alloc_host()
+// and has the same layout and contents as the grid built on the device
+template <typename BuildT>
+void build_grid_from_points_host(nanovdb::Grid<nanovdb::NanoTree<BuildT>>*& out_grid, size_t& out_grid_size,
+                                 const void* points, size_t num_points, bool points_in_world_space,
+                                 const BuildGridParams<BuildT>& params);
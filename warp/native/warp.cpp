@@ -1051,6 +1051,7 @@ WP_API void* cuda_load_module(void* context, const char* ptx) { return NULL; }
 WP_API void cuda_unload_module(void* context, void* module) {}
 WP_API void* cuda_get_kernel(void* context, void* module, const char* name) { return NULL; }
 WP_API size_t cuda_launch_kernel(void* context, void* kernel, size_t dim, int max_blocks, int block_dim, int shared_memory_bytes, void** args, void* stream) { return 0; }
+WP_API size_t cuda_launch_kernels(void* context, int count, void** kernels, const int* max_blocks, const int* block_dims, const int* shared_memory_bytes, void*** args, void* stream) { return 0; }
 
 WP_API int cuda_get_max_shared_memory(void* context) { return 0; }
 WP_API bool cuda_configure_kernel_shared_memory(void* kernel, int size) { return false; }
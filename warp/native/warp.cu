@@ -3424,6 +3424,25 @@ size_t cuda_launch_kernel(void* context, void* kernel, size_t dim, int max_block
     return res;
 }
 
+size_t cuda_launch_kernels(void* context, int count, void** kernels, const int* max_blocks, const int* block_dims, const int* shared_memory_bytes, void*** args, void* stream)
+{
+    ContextGuard guard(context);
+
+    for (int i = 0; i < count; ++i)
+    {
+        const size_t dim = static_cast<const wp::launch_bounds_t*>(args[i][0])->size;
+
+        if (dim == 0)
+            continue;
+
+        size_t res = cuda_launch_kernel(context, kernels[i], dim, max_blocks[i], block_dims[i], shared_memory_bytes[i], args[i], stream);
+        if (res != CUDA_SUCCESS)
+            return res;
+    }
+
+    return CUDA_SUCCESS;
+}
+
 void cuda_graphics_map(void* context, void* resource)
 {
     ContextGuard guard(context);
@@ -14,6 +14,7 @@
 #define WP_CURRENT_STREAM ((void*)0xffffffffffffffff)
 
 struct timing_result_t;
+struct cpu_timing_result_t;
 
 // this is the core runtime API exposed on the DLL level
 extern "C"
@@ -67,6 +68,51 @@ extern "C"
     WP_API void memtile_host(void* dest, const void* src, size_t srcsize, size_t n);
     WP_API void memtile_device(void* context, void* dest, const void* src, size_t srcsize, size_t n);
 
+    // host worker pool used to execute CPU kernels, a value <= 0 selects the number of hardware threads
+    WP_API void cpu_set_num_threads(int num_threads);
+    WP_API int cpu_get_num_threads();
+    // runs a {name}_cpu_forward_range() / {name}_cpu_backward_range() entry point over [0, dim) on the worker pool
+    WP_API void cpu_launch_kernel(void* kernel, size_t dim, void** args);
+    // runs a sequence of range entry points, the launch bounds of each kernel are read from its first argument,
+    // the optional tags identify the launches in the CPU timing results
+    WP_API void cpu_launch_kernels(int count, void** kernels, const bool* parallel, void*** args, const uint64_t* tags);
+
+    // CPU graphs record kernel launches and memory operations into a command list replayed by cpu_graph_launch(),
+    // the parameters of each command are copied when it is recorded; the cpu_graph_add_*() functions also accept
+    // a CPU stream, which executes the command asynchronously
+    WP_API void* cpu_graph_create();
+    WP_API void cpu_graph_destroy(void* graph);
+    WP_API int cpu_graph_get_num_commands(void* graph);
+    WP_API void cpu_graph_add_kernel(void* graph, void* kernel, size_t dim, void** args, const size_t* arg_sizes, int num_args, bool parallel, uint64_t tag);
+    WP_API void cpu_graph_add_memcpy(void* graph, void* dest, void* src, size_t n);
+    WP_API void cpu_graph_add_memset(void* graph, void* dest, int value, size_t n);
+    WP_API void cpu_graph_add_memtile(void* graph, void* dest, const void* src, size_t srcsize, size_t n);
+    WP_API void cpu_graph_add_array_copy(void* graph, void* dst, void* src, int dst_type, int src_type, size_t dst_desc_size, size_t src_desc_size, int elem_size);
+    WP_API void cpu_graph_add_array_fill(void* graph, void* arr, int arr_type, size_t arr_desc_size, const void* value, int value_size);
+    WP_API void cpu_graph_launch(void* graph);
+
+    // CPU streams execute the commands added with cpu_graph_add_*() in order on a worker thread,
+    // a null stream denotes the synchronous stream, which executes work on the calling thread
+    WP_API void* cpu_stream_create();
+    WP_API void cpu_stream_destroy(void* stream);
+    WP_API void cpu_stream_synchronize(void* stream);
+    WP_API int cpu_stream_query(void* stream);
+    WP_API void cpu_stream_synchronize_all();
+    WP_API void cpu_stream_launch_graph(void* stream, void* graph);
+    WP_API void cpu_stream_wait_event(void* stream, void* event);
+    WP_API void* cpu_event_create();
+    WP_API void cpu_event_destroy(void* event);
+    WP_API void cpu_event_record(void* event, void* stream);
+    WP_API int cpu_event_query(void* event);
+    WP_API void cpu_event_synchronize(void* event);
+    WP_API float cpu_event_elapsed_time(void* start_event, void* end_event);
+
+    // CPU timing, records the kernel and graph launches executed on the CPU while timing is active,
+    // optionally with the hardware counters read around each kernel launch
+    WP_API void cpu_timing_begin(int flags, bool counters);
+    WP_API int cpu_timing_get_result_count();
+    WP_API void cpu_timing_end(cpu_timing_result_t* results, int size);
+
 	WP_API uint64_t bvh_create_host(wp::vec3* lowers, wp::vec3* uppers, int num_items, int constructor_type);
 	WP_API void bvh_destroy_host(uint64_t id);
     WP_API void bvh_refit_host(uint64_t id);
@@ -96,7 +142,7 @@ extern "C"
     WP_API uint64_t hash_grid_create_host(int dim_x, int dim_y, int dim_z);
     WP_API void hash_grid_reserve_host(uint64_t id, int num_points);
     WP_API void hash_grid_destroy_host(uint64_t id);
-    WP_API void hash_grid_update_host(uint64_t id, float cell_width, const wp::array_t<wp::vec3>* points);
+    WP_API void hash_grid_update_host(uint64_t id, float cell_width, const wp::array_t<wp::vec3>* points, bool incremental);
 
     WP_API uint64_t hash_grid_create_device(void* context, int dim_x, int dim_y, int dim_z);
     WP_API void hash_grid_reserve_device(uint64_t id, int num_points);
@@ -117,6 +163,12 @@ extern "C"
     WP_API void volume_get_voxels_device(uint64_t id, void* buf);
     WP_API void volume_destroy_device(uint64_t id);
     
+    WP_API uint64_t volume_f_from_tiles_host(void* points, int num_points, float transform[9], float translation[3], bool points_in_world_space, float bg_value);
+    WP_API uint64_t volume_v_from_tiles_host(void* points, int num_points, float transform[9], float translation[3], bool points_in_world_space, float bg_value[3]);
+    WP_API uint64_t volume_i_from_tiles_host(void* points, int num_points, float transform[9], float translation[3], bool points_in_world_space, int bg_value);
+    WP_API uint64_t volume_index_from_tiles_host(void* points, int num_points, float transform[9], float translation[3], bool points_in_world_space);
+    WP_API uint64_t volume_from_active_voxels_host(void* points, int num_points, float transform[9], float translation[3], bool points_in_world_space);
+
     WP_API uint64_t volume_f_from_tiles_device(void* context, void* points, int num_points, float transform[9], float translation[3], bool points_in_world_space, float bg_value);
     WP_API uint64_t volume_v_from_tiles_device(void* context, void* points, int num_points, float transform[9], float translation[3], bool points_in_world_space, float bg_value[3]);
     WP_API uint64_t volume_i_from_tiles_device(void* context, void* points, int num_points, float transform[9], float translation[3], bool points_in_world_space, int bg_value);
@@ -130,6 +182,10 @@ extern "C"
     WP_API uint32_t volume_get_blind_data_count(uint64_t id);
     WP_API const char* volume_get_blind_data_info(uint64_t id, uint32_t data_index, void** buf, uint64_t* value_count, uint32_t* value_size, char type_str[16]);
     
+    WP_API uint64_t marching_cubes_create_host();
+    WP_API void marching_cubes_destroy_host(uint64_t id);
+    WP_API int marching_cubes_surface_host(uint64_t id, const float* field, int nx, int ny, int nz, float threshold, wp::vec3* verts, int* triangles, int max_verts, int max_tris, int* out_num_verts, int* out_num_tris);
+
     WP_API uint64_t marching_cubes_create_device(void* context);
     WP_API void marching_cubes_destroy_device(uint64_t id);
     WP_API int marching_cubes_surface_device(uint64_t id, const float* field, int nx, int ny, int nz, float threshold, wp::vec3* verts, int* triangles, int max_verts, int max_tris, int* out_num_verts, int* out_num_tris);
@@ -161,6 +217,9 @@ extern "C"
     WP_API void radix_sort_pairs_int_host(uint64_t keys, uint64_t values, int n);
     WP_API void radix_sort_pairs_int_device(uint64_t keys, uint64_t values, int n);
 
+    WP_API void radix_sort_pairs_int64_host(uint64_t keys, uint64_t values, int n);
+    WP_API void radix_sort_pairs_int64_device(uint64_t keys, uint64_t values, int n);
+
     WP_API void radix_sort_pairs_float_host(uint64_t keys, uint64_t values, int n);
     WP_API void radix_sort_pairs_float_device(uint64_t keys, uint64_t values, int n);
 
@@ -339,6 +398,8 @@ extern "C"
     WP_API void cuda_unload_module(void* context, void* module);
     WP_API void* cuda_get_kernel(void* context, void* module, const char* name);
     WP_API size_t cuda_launch_kernel(void* context, void* kernel, size_t dim, int max_blocks, int block_dim, int shared_memory_bytes, void** args, void* stream);
+    // launches a sequence of kernels on a stream, the launch bounds of each kernel are read from its first argument
+    WP_API size_t cuda_launch_kernels(void* context, int count, void** kernels, const int* max_blocks, const int* block_dims, const int* shared_memory_bytes, void*** args, void* stream);
     WP_API int cuda_get_max_shared_memory(void* context);
     WP_API bool cuda_configure_kernel_shared_memory(void* kernel, int size);
 
@@ -0,0 +1,466 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+"""Dependency-aware scheduling of kernel launches and memory operations across streams.
+
+A task graph records launches and memory operations together with the memory they read and write.
+Each task depends on the earlier tasks that write memory it accesses or access memory it writes, so tasks that
+are independent, e.g.: the contact generation of particles and rigid bodies, can run concurrently.
+The tasks are assigned to the streams of the device when the graph is launched, and events are recorded and
+waited on for the dependencies between tasks assigned to different streams.
+"""
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import warp
+import warp.codegen
+import warp.context
+import warp.types
+from warp.context import ARRAY_READ, ARRAY_WRITE, Devicelike
+
+
+def _get_memory_range(value) -> Optional[Tuple[int, int]]:
+    """Returns the range of addresses spanned by an array, ``(0, 0)`` if it has no memory and ``None`` if unknown."""
+
+    if type(value) is not warp.types.array:
+        return None
+
+    if not value.ptr or value.size == 0:
+        return (0, 0)
+
+    lower = upper = value.ptr
+    for i in range(value.ndim):
+        extent = (value.shape[i] - 1) * value.strides[i]
+        if extent < 0:
+            lower += extent
+        else:
+            upper += extent
+
+    return (lower, upper + warp.types.type_size_in_bytes(value.dtype))
+
+
+def _overlap(ranges_a, ranges_b) -> bool:
+    for a in ranges_a:
+        for b in ranges_b:
+            if a[0] < b[1] and b[0] < a[1]:
+                return True
+
+    return False
+
+
+class Task:
+    """A kernel launch or an operation recorded in a :class:`TaskGraph`.
+
+    Attributes:
+        name: A description of the task.
+        dependencies: The earlier tasks of the graph that must complete before this task starts.
+        stream_index: The index of the stream the task was assigned to by the last launch of the graph,
+          0 being the stream the graph was launched on.
+    """
+
+    def __init__(self, name: str, func: Callable, reads, writes, objects=None):
+        self.name = name
+        self.func = func
+
+        # address ranges read and written by the task, None if the task may access any memory
+        self.reads = reads
+        self.writes = writes
+
+        # keeps the arguments of the task alive until the graph is released
+        self.objects = objects
+
+        self.dependencies: List["Task"] = []
+        self.stream_index = 0
+
+    def __repr__(self):
+        return f"Task({self.name!r})"
+
+    def conflicts_with(self, other: "Task") -> bool:
+        if self.writes is None or other.writes is None:
+            return True
+
+        return (
+            _overlap(self.writes, other.writes)
+            or _overlap(self.writes, other.reads)
+            or _overlap(self.reads, other.writes)
+        )
+
+
+class _Access:
+    """Collects the address ranges read and written by a task."""
+
+    def __init__(self):
+        self.reads = []
+        self.writes = []
+        self.unknown = False
+
+    def add(self, value, read, write):
+        if value is None:
+            return
+
+        if isinstance(value, warp.codegen.StructInstance):
+            # the accesses to the arrays of a struct are recorded for the whole struct
+            for name in value._cls.vars:
+                self.add(getattr(value, name), read, write)
+            return
+
+        if not warp.types.is_array(value):
+            return
+
+        memory_range = _get_memory_range(value)
+        if memory_range is None:
+            self.unknown = True
+        elif memory_range[1] > memory_range[0]:
+            if read:
+                self.reads.append(memory_range)
+            if write:
+                self.writes.append(memory_range)
+
+    def add_arrays(self, arrays, read, write):
+        if arrays is None:
+            self.unknown = True
+            return
+
+        for value in arrays:
+            self.add(value, read, write)
+
+    def create_task(self, name, func, objects=None):
+        if self.unknown:
+            return Task(name, func, None, None, objects)
+
+        return Task(name, func, self.reads, self.writes, objects)
+
+
+class TaskGraph:
+    """A graph of kernel launches and memory operations executed concurrently on several streams of a device.
+
+    Tasks are recorded in program order with :meth:`record_launch`, :meth:`record_copy` and :meth:`record_func`,
+    or by issuing launches and memory operations inside a :class:`ScopedSchedule`.
+    The memory read and written by kernel launches is found from the accesses of the kernels to their array
+    arguments, and a task depends on every earlier task that writes memory it accesses or accesses memory it writes.
+
+    When the graph is launched, a task that continues the work of one of its dependencies is submitted to the same
+    stream, and independent tasks are distributed across up to ``max_streams`` streams.
+    Events are recorded and waited on for the dependencies between tasks submitted to different streams, and the
+    stream the graph is launched on waits for all of them, so the work following the graph launch is ordered after
+    all the tasks. The streams are CUDA streams or asynchronous CPU streams depending on the device, and graphs
+    launched while a graph is being captured on the device are captured with their dependencies.
+
+    Memory accessed through handles, e.g.: the identifiers of meshes or volumes, is not tracked.
+    The arrays held by a struct argument are all considered read if the kernel reads one of them, and written
+    if it writes one of them. Tasks accessing arrays other than :class:`warp.array`, e.g.: indexed arrays,
+    depend on all the other tasks.
+    """
+
+    def __init__(self, device: Devicelike = None, max_streams: int = 4):
+        """
+        Args:
+            device: The device the tasks are executed on, the default device if ``None``.
+            max_streams: The maximum number of streams the tasks are distributed across.
+        """
+
+        if max_streams < 1:
+            raise ValueError("A task graph requires at least one stream")
+
+        self.device = warp.get_device(device)
+        self.max_streams = max_streams
+        self.tasks: List[Task] = []
+
+        # streams and events used to launch the graph, created on first launch
+        self.streams = []
+        self.events = []
+        self.fork_event = None
+
+        # stream assignment of the tasks, computed on launch after tasks were recorded
+        self.schedule = None
+
+    def clear(self):
+        """Removes all the tasks from the graph."""
+
+        self.tasks = []
+        self.schedule = None
+
+    def add_task(self, task: Task) -> Task:
+        for other in self.tasks:
+            if task.conflicts_with(other):
+                task.dependencies.append(other)
+
+        self.tasks.append(task)
+        self.schedule = None
+        return task
+
+    def record_launch(
+        self,
+        kernel,
+        dim: Tuple[int],
+        inputs: Sequence = [],
+        outputs: Sequence = [],
+        adj_inputs: Sequence = [],
+        adj_outputs: Sequence = [],
+        adjoint: bool = False,
+        max_blocks: int = 0,
+        block_dim: int = 256,
+    ) -> Task:
+        """Records a kernel launch, the arguments are the same as the arguments of :func:`warp.launch`.
+
+        The arrays read and written by the kernel are found when its module is loaded, which happens now if it was
+        not loaded yet. Adjoint launches read and write all the adjoint arrays.
+        """
+
+        if not isinstance(kernel, warp.context.Kernel):
+            raise RuntimeError("Error recording kernel launch, can only launch functions decorated with @wp.kernel.")
+
+        fwd_args = [*inputs, *outputs]
+        adj_args = [*adj_inputs, *adj_outputs]
+
+        if len(fwd_args) != len(kernel.adj.args):
+            raise RuntimeError(
+                f"Error recording kernel launch '{kernel.key}', passed {len(fwd_args)} arguments but kernel requires "
+                f"{len(kernel.adj.args)}."
+            )
+
+        # the overload and its module are resolved as in wp.launch() to look up the accesses of the kernel
+        launch_kernel = kernel
+        if launch_kernel.is_generic:
+            launch_kernel = launch_kernel.add_overload(launch_kernel.infer_argument_types(fwd_args))
+
+        module_exec = launch_kernel.module.load(self.device, block_dim, kernel=launch_kernel)
+        if not module_exec:
+            raise RuntimeError(f"Failed to load module {launch_kernel.module.name} on device {self.device}")
+
+        array_access = module_exec.get_kernel_hooks(launch_kernel).array_access
+
+        access = _Access()
+        for i, value in enumerate(fwd_args):
+            # arrays of unknown access are assumed to be read and written, as well as the arrays of structs
+            # for which no access was recorded, e.g.: by modules compiled before struct accesses were tracked
+            flags = array_access[i] if array_access else 0
+            if not flags and (not array_access or isinstance(value, warp.codegen.StructInstance)):
+                flags = ARRAY_READ | ARRAY_WRITE
+
+            access.add(value, flags & ARRAY_READ, flags & ARRAY_WRITE)
+
+        for value in adj_args:
+            access.add(value, True, True)
+
+        def func():
+            warp.launch(
+                kernel,
+                dim,
+                inputs=inputs,
+                outputs=outputs,
+                adj_inputs=adj_inputs,
+                adj_outputs=adj_outputs,
+                device=self.device,
+                adjoint=adjoint,
+                record_tape=False,
+                max_blocks=max_blocks,
+                block_dim=block_dim,
+            )
+
+        name = f"backward kernel {kernel.key}" if adjoint else f"forward kernel {kernel.key}"
+        return self.add_task(access.create_task(name, func, objects=(fwd_args, adj_args)))
+
+    def record_copy(self, dest, src, dest_offset: int = 0, src_offset: int = 0, count: int = 0) -> Task:
+        """Records a copy between arrays of the device, the arguments are the same as the arguments of
+        :func:`warp.copy`."""
+
+        if dest.device != self.device or src.device != self.device:
+            raise RuntimeError(
+                f"Cannot record a copy from {src.device} to {dest.device} in a task graph on {self.device}"
+            )
+
+        access = _Access()
+        access.add(src, True, False)
+        access.add(dest, False, True)
+
+        def func():
+            warp.copy(dest, src, dest_offset=dest_offset, src_offset=src_offset, count=count)
+
+        return self.add_task(access.create_task("copy", func, objects=(dest, src)))
+
+    def record_func(
+        self,
+        func: Callable,
+        reads: Optional[Sequence] = None,
+        writes: Optional[Sequence] = None,
+        name: Optional[str] = None,
+    ) -> Task:
+        """Records a Python function issuing work on the current stream of the device.
+
+        The function is called without arguments when the graph is launched, with the stream the task is assigned
+        to set as the current stream of the device.
+
+        Args:
+            func: The function to call.
+            reads: The arrays read by the work of the function, ``None`` if unknown.
+            writes: The arrays written by the work of the function, ``None`` if unknown.
+              The function depends on all the other tasks if either ``reads`` or ``writes`` is ``None``.
+            name: A description of the task.
+        """
+
+        access = _Access()
+        access.add_arrays(reads, True, False)
+        access.add_arrays(writes, False, True)
+
+        if name is None:
+            name = getattr(func, "__name__", "func")
+
+        return self.add_task(access.create_task(name, func, objects=(reads, writes)))
+
+    def get_schedule(self):
+        """Assigns the tasks to streams, returns a list of ``(task, stream_index, wait_events, record_event)``."""
+
+        schedule = []
+
+        # last task submitted to each stream, and position of the tasks in their stream
+        tails = []
+        positions = {}
+
+        # the latest position of each stream that every stream is known to wait for
+        known = []
+
+        # tasks whose completion is recorded in an event, keyed by task id
+        events = {}
+
+        for task in self.tasks:
+            stream_index = None
+
+            # continue the work of a dependency on its stream
+            for dep in reversed(task.dependencies):
+                if tails[dep.stream_index] is dep:
+                    stream_index = dep.stream_index
+                    break
+
+            if stream_index is None:
+                if len(tails) < self.max_streams:
+                    stream_index = len(tails)
+                    tails.append(None)
+                    known.append([-1] * self.max_streams)
+                else:
+                    # the stream whose last task was submitted first
+                    stream_index = min(range(len(tails)), key=lambda i: positions[id(tails[i])][1])
+
+            waits = []
+            for dep in task.dependencies:
+                dep_stream, dep_order = positions[id(dep)][0], positions[id(dep)][2]
+                if dep_stream == stream_index or known[stream_index][dep_stream] >= dep_order:
+                    continue
+
+                event_index = events.get(id(dep))
+                if event_index is None:
+                    event_index = len(events)
+                    events[id(dep)] = event_index
+
+                waits.append(event_index)
+                known[stream_index][dep_stream] = dep_order
+
+            order = positions[id(tails[stream_index])][2] + 1 if tails[stream_index] is not None else 0
+            positions[id(task)] = (stream_index, len(schedule), order)
+            tails[stream_index] = task
+            task.stream_index = stream_index
+
+            schedule.append([task, stream_index, waits, None])
+
+        for entry in schedule:
+            entry[3] = events.get(id(entry[0]))
+
+        return schedule, len(tails), len(events)
+
+    def launch(self, stream: Optional["warp.Stream"] = None):
+        """Launches the tasks of the graph.
+
+        Args:
+            stream: The stream the graph is launched on, the current stream of the device if ``None``.
+              The first tasks are submitted to this stream, which waits for all the tasks when the launch returns.
+        """
+
+        if stream is None:
+            stream = self.device.stream
+        elif stream.device != self.device:
+            raise RuntimeError(f"Cannot launch a task graph on {self.device} on a stream of device {stream.device}")
+
+        if self.device.task_graph is not None:
+            raise RuntimeError(f"Cannot launch a task graph while a schedule is being recorded on device {self.device}")
+
+        if self.schedule is None:
+            self.schedule = self.get_schedule()
+
+        schedule, num_streams, num_events = self.schedule
+
+        # auxiliary streams and events are reused by subsequent launches
+        while len(self.streams) < num_streams - 1:
+            self.streams.append(warp.Stream(self.device))
+        while len(self.events) < num_events:
+            self.events.append(warp.Event(self.device))
+
+        streams = [stream, *self.streams[: num_streams - 1]]
+
+        # the auxiliary streams start after the work preceding the launch
+        if num_streams > 1:
+            if self.fork_event is None:
+                self.fork_event = warp.Event(self.device)
+
+            stream.record_event(self.fork_event)
+            for aux_stream in streams[1:]:
+                aux_stream.wait_event(self.fork_event)
+
+        for task, stream_index, waits, event_index in schedule:
+            task_stream = streams[stream_index]
+
+            for wait_index in waits:
+                task_stream.wait_event(self.events[wait_index])
+
+            with warp.ScopedStream(task_stream, sync_enter=False):
+                task.func()
+
+            if event_index is not None:
+                task_stream.record_event(self.events[event_index])
+
+        for aux_stream in streams[1:]:
+            stream.wait_stream(aux_stream)
+
+
+class ScopedSchedule:
+    """A context manager recording the kernel launches and memory operations issued on a device in a
+    :class:`TaskGraph`, which is launched when the context exits.
+
+    Inside the context, :func:`warp.launch` calls without a ``stream`` argument, :func:`warp.copy` calls between
+    arrays of the device, and the ``fill_()`` and ``zero_()`` methods of the device's arrays are recorded instead of
+    executed. Other operations, e.g.: array allocations or mesh and BVH builds, are executed immediately, and results
+    cannot be read before the context exits.
+
+    Attributes:
+        graph (TaskGraph): The recorded graph, which can be launched again after the context exits.
+    """
+
+    def __init__(self, device: Devicelike = None, max_streams: int = 4, launch: bool = True):
+        """
+        Args:
+            device: The device whose operations are recorded, the default device if ``None``.
+            max_streams: The maximum number of streams the tasks are distributed across.
+            launch: Whether to launch the graph when the context exits.
+        """
+
+        self.device = warp.get_device(device)
+        self.max_streams = max_streams
+        self.launch = launch
+        self.graph = None
+
+    def __enter__(self):
+        if self.device.task_graph is not None:
+            raise RuntimeError(f"A schedule is already being recorded on device {self.device}")
+
+        self.graph = TaskGraph(self.device, max_streams=self.max_streams)
+        self.device.task_graph = self.graph
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.device.task_graph = None
+
+        if exc_type is None and self.launch:
+            self.graph.launch()
@@ -46,6 +46,7 @@ from .model import (
     Mesh,
     Model,
     ModelBuilder,
+    ModelInstancing,
     ModelShapeGeometry,
     ModelShapeMaterials,
     State,
@@ -7,7 +7,8 @@
 
 import warp as wp
 
-from .utils import quat_decompose, quat_twist
+from .model import ModelInstancing
+from .utils import instance_index, quat_decompose, quat_twist
 
 
 @wp.func
@@ -181,6 +182,7 @@ def eval_single_articulation_fk(
     joint_axis_start: wp.array(dtype=int),
     joint_axis_dim: wp.array(dtype=int, ndim=2),
     body_com: wp.array(dtype=wp.vec3),
+    instancing: ModelInstancing,
     # outputs
     body_q: wp.array(dtype=wp.transform),
     body_qd: wp.array(dtype=wp.spatial_vector),
@@ -189,11 +191,14 @@ def eval_single_articulation_fk(
         parent = joint_parent[i]
         child = joint_child[i]
 
+        # index of the joint's static data, shared between instanced environments
+        j = instance_index(i, instancing.env_joint_count, instancing.env_count)
+
         # compute transform across the joint
-        type = joint_type[i]
+        type = joint_type[j]
 
         X_pj = joint_X_p[i]
-        X_cj = joint_X_c[i]
+        X_cj = joint_X_c[j]
 
         # parent anchor frame in world space
         X_wpj = X_pj
@@ -211,9 +216,9 @@ def eval_single_articulation_fk(
 
         q_start = joint_q_start[i]
         qd_start = joint_qd_start[i]
-        axis_start = joint_axis_start[i]
-        lin_axis_count = joint_axis_dim[i, 0]
-        ang_axis_count = joint_axis_dim[i, 1]
+        axis_start = instance_index(joint_axis_start[i], instancing.env_joint_axis_count, instancing.env_count)
+        lin_axis_count = joint_axis_dim[j, 0]
+        ang_axis_count = joint_axis_dim[j, 1]
 
         X_j = wp.transform_identity()
         v_j = wp.spatial_vector(wp.vec3(), wp.vec3())
@@ -382,6 +387,7 @@ def eval_articulation_fk(
     joint_axis_start: wp.array(dtype=int),
     joint_axis_dim: wp.array(dtype=int, ndim=2),
     body_com: wp.array(dtype=wp.vec3),
+    instancing: ModelInstancing,
     # outputs
     body_q: wp.array(dtype=wp.transform),
     body_qd: wp.array(dtype=wp.spatial_vector),
@@ -412,6 +418,7 @@ def eval_articulation_fk(
         joint_axis_start,
         joint_axis_dim,
         body_com,
+        instancing,
         # outputs
         body_q,
         body_qd,
@@ -438,6 +445,7 @@ def eval_articulation_fk(
     joint_axis_start: wp.array(dtype=int),
     joint_axis_dim: wp.array(dtype=int, ndim=2),
     body_com: wp.array(dtype=wp.vec3),
+    instancing: ModelInstancing,
     # outputs
     body_q: wp.array(dtype=wp.transform),
     body_qd: wp.array(dtype=wp.spatial_vector),
@@ -468,6 +476,7 @@ def eval_articulation_fk(
         joint_axis_start,
         joint_axis_dim,
         body_com,
+        instancing,
         # outputs
         body_q,
         body_qd,
@@ -505,6 +514,7 @@ def eval_fk(model, joint_q, joint_qd, mask, state):
             model.joint_axis_start,
             model.joint_axis_dim,
             model.body_com,
+            model.instancing,
         ],
         outputs=[
             state.body_q,
@@ -552,16 +562,20 @@ def eval_articulation_ik(
     joint_axis_dim: wp.array(dtype=int, ndim=2),
     joint_q_start: wp.array(dtype=int),
     joint_qd_start: wp.array(dtype=int),
+    instancing: ModelInstancing,
     joint_q: wp.array(dtype=float),
     joint_qd: wp.array(dtype=float),
 ):
     tid = wp.tid()
 
+    # index of the joint's static data, shared between instanced environments
+    j = instance_index(tid, instancing.env_joint_count, instancing.env_count)
+
     parent = joint_parent[tid]
     child = joint_child[tid]
 
     X_pj = joint_X_p[tid]
-    X_cj = joint_X_c[tid]
+    X_cj = joint_X_c[j]
 
     w_p = wp.vec3()
     v_p = wp.vec3()
@@ -588,7 +602,7 @@ def eval_articulation_ik(
     v_c = wp.spatial_bottom(v_wc)
 
     # joint properties
-    type = joint_type[tid]
+    type = joint_type[j]
 
     # compute position and orientation differences between anchor frames
     x_p = wp.transform_get_translation(X_wpj)
@@ -603,9 +617,9 @@ def eval_articulation_ik(
 
     q_start = joint_q_start[tid]
     qd_start = joint_qd_start[tid]
-    axis_start = joint_axis_start[tid]
-    lin_axis_count = joint_axis_dim[tid, 0]
-    ang_axis_count = joint_axis_dim[tid, 1]
+    axis_start = instance_index(joint_axis_start[tid], instancing.env_joint_axis_count, instancing.env_count)
+    lin_axis_count = joint_axis_dim[j, 0]
+    ang_axis_count = joint_axis_dim[j, 1]
 
     if type == wp.sim.JOINT_PRISMATIC:
         axis = joint_axis[axis_start]
@@ -779,6 +793,7 @@ def eval_ik(model, state, joint_q, joint_qd):
             model.joint_axis_dim,
             model.joint_q_start,
             model.joint_qd_start,
+            model.instancing,
         ],
         outputs=[joint_q, joint_qd],
         device=model.device,
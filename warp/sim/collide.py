@@ -15,6 +15,7 @@ import warp as wp
 from warp.sim.model import Model
 
 from .model import PARTICLE_FLAG_ACTIVE, ModelShapeGeometry
+from .utils import instance_index
 
 # types of triangle's closest point to a point
 TRI_CONTACT_FEATURE_VERTEX_A = wp.constant(0)
@@ -634,52 +635,12 @@ def replay_limited_counter_increment(
     return tids[tid]
 
 
-@wp.kernel
-def create_soft_contacts(
-    particle_x: wp.array(dtype=wp.vec3),
-    particle_radius: wp.array(dtype=float),
-    particle_flags: wp.array(dtype=wp.uint32),
-    body_X_wb: wp.array(dtype=wp.transform),
-    shape_X_bs: wp.array(dtype=wp.transform),
-    shape_body: wp.array(dtype=int),
-    geo: ModelShapeGeometry,
-    margin: float,
-    soft_contact_max: int,
-    shape_count: int,
-    # outputs
-    soft_contact_count: wp.array(dtype=int),
-    soft_contact_particle: wp.array(dtype=int),
-    soft_contact_shape: wp.array(dtype=int),
-    soft_contact_body_pos: wp.array(dtype=wp.vec3),
-    soft_contact_body_vel: wp.array(dtype=wp.vec3),
-    soft_contact_normal: wp.array(dtype=wp.vec3),
-    soft_contact_tids: wp.array(dtype=int),
-):
-    tid = wp.tid()
-    particle_index, shape_index = tid // shape_count, tid % shape_count
-    if (particle_flags[particle_index] & PARTICLE_FLAG_ACTIVE) == 0:
-        return
-
-    rigid_index = shape_body[shape_index]
-
-    px = particle_x[particle_index]
-    radius = particle_radius[particle_index]
-
-    X_wb = wp.transform_identity()
-    if rigid_index >= 0:
-        X_wb = body_X_wb[rigid_index]
-
-    X_bs = shape_X_bs[shape_index]
-
-    X_ws = wp.transform_multiply(X_wb, X_bs)
-    X_sw = wp.transform_inverse(X_ws)
-
-    # transform particle position to shape local space
-    x_local = wp.transform_point(X_sw, px)
-
-    # geo description
-    geo_type = geo.type[shape_index]
-    geo_scale = geo.scale[shape_index]
+@wp.func
+def soft_contact_sdf(geo: ModelShapeGeometry, shape_index: int, x_local: wp.vec3, margin: float, radius: float):
+    # returns the signed distance, normal, and surface velocity of the shape at a point in shape local space
+    geo_index = instance_index(shape_index, geo.env_shape_count, geo.env_count)
+    geo_type = geo.type[geo_index]
+    geo_scale = geo.scale[geo_index]
 
     # evaluate shape sdf
     d = 1.0e6
@@ -707,7 +668,7 @@ def create_soft_contacts(
         n = cone_sdf_grad(geo_scale[0], geo_scale[1], x_local)
 
     if geo_type == wp.sim.GEO_MESH:
-        mesh = geo.source[shape_index]
+        mesh = geo.source[geo_index]
 
         face_index = int(0)
         face_u = float(0.0)
@@ -731,7 +692,7 @@ def create_soft_contacts(
             v = shape_v
 
     if geo_type == wp.sim.GEO_SDF:
-        volume = geo.source[shape_index]
+        volume = geo.source[geo_index]
         xpred_local = wp.volume_world_to_index(volume, wp.cw_div(x_local, geo_scale))
         nn = wp.vec3(0.0, 0.0, 0.0)
         d = wp.volume_sample_grad_f(volume, xpred_local, wp.Volume.LINEAR, nn)
@@ -741,6 +702,54 @@ def create_soft_contacts(
         d = plane_sdf(geo_scale[0], geo_scale[1], x_local)
         n = wp.vec3(0.0, 1.0, 0.0)
 
+    return d, n, v
+
+
+@wp.kernel
+def create_soft_contacts(
+    particle_x: wp.array(dtype=wp.vec3),
+    particle_radius: wp.array(dtype=float),
+    particle_flags: wp.array(dtype=wp.uint32),
+    body_X_wb: wp.array(dtype=wp.transform),
+    shape_X_bs: wp.array(dtype=wp.transform),
+    shape_body: wp.array(dtype=int),
+    geo: ModelShapeGeometry,
+    margin: float,
+    soft_contact_max: int,
+    shape_count: int,
+    # outputs
+    soft_contact_count: wp.array(dtype=int),
+    soft_contact_particle: wp.array(dtype=int),
+    soft_contact_shape: wp.array(dtype=int),
+    soft_contact_body_pos: wp.array(dtype=wp.vec3),
+    soft_contact_body_vel: wp.array(dtype=wp.vec3),
+    soft_contact_normal: wp.array(dtype=wp.vec3),
+    soft_contact_tids: wp.array(dtype=int),
+):
+    tid = wp.tid()
+    particle_index, shape_index = tid // shape_count, tid % shape_count
+    if (particle_flags[particle_index] & PARTICLE_FLAG_ACTIVE) == 0:
+        return
+
+    rigid_index = shape_body[shape_index]
+
+    px = particle_x[particle_index]
+    radius = particle_radius[particle_index]
+
+    X_wb = wp.transform_identity()
+    if rigid_index >= 0:
+        X_wb = body_X_wb[rigid_index]
+
+    X_bs = shape_X_bs[shape_index]
+
+    X_ws = wp.transform_multiply(X_wb, X_bs)
+    X_sw = wp.transform_inverse(X_ws)
+
+    # transform particle position to shape local space
+    x_local = wp.transform_point(X_sw, px)
+
+    d, n, v = soft_contact_sdf(geo, shape_index, x_local, margin, radius)
+
     if d < margin + radius:
         index = counter_increment(soft_contact_count, 0, soft_contact_tids, tid)
 
@@ -758,6 +767,119 @@ def create_soft_contacts(
             soft_contact_normal[index] = world_normal
 
 
+@wp.kernel(enable_backward=False)
+def compute_soft_contact_shape_bounds(
+    body_q: wp.array(dtype=wp.transform),
+    shape_X_bs: wp.array(dtype=wp.transform),
+    shape_body: wp.array(dtype=int),
+    geo: ModelShapeGeometry,
+    collision_radius: wp.array(dtype=float),
+    query_radius: float,
+    # outputs
+    lower: wp.array(dtype=wp.vec3),
+    upper: wp.array(dtype=wp.vec3),
+):
+    shape_index = wp.tid()
+
+    X_ws = shape_X_bs[shape_index]
+    body = shape_body[shape_index]
+    if body > -1:
+        X_ws = wp.transform_multiply(body_q[body], X_ws)
+
+    # the bounds contain the points where the shape SDF is smaller than the query radius
+    geo_index = instance_index(shape_index, geo.env_shape_count, geo.env_count)
+    geo_type = geo.type[geo_index]
+    geo_scale = geo.scale[geo_index]
+    extent = collision_radius[shape_index] + query_radius
+
+    if geo_type == wp.sim.GEO_CONE:
+        # the cone SDF measures the distance to the side orthogonally to the axis
+        half_height = geo_scale[1]
+        radius = geo_scale[0] * (1.0 + query_radius / (2.0 * half_height)) + query_radius
+        extent = wp.length(wp.vec2(radius, half_height + query_radius))
+
+    if geo_type == wp.sim.GEO_PLANE and geo_scale[0] > 0.0 and geo_scale[1] > 0.0:
+        # the finite plane SDF is the maximum of the distances along the local axes
+        extent = wp.length(wp.vec3(geo_scale[0] + query_radius, query_radius, geo_scale[1] + query_radius))
+
+    # the collision radius does not bound the SDF volumes, these are tested against all particles
+    if geo_type == wp.sim.GEO_SDF:
+        extent = 1.0e6
+
+    center = wp.transform_get_translation(X_ws)
+    lower[shape_index] = center - wp.vec3(extent)
+    upper[shape_index] = center + wp.vec3(extent)
+
+
+@wp.kernel(enable_backward=False)
+def create_soft_contacts_bvh(
+    bvh: wp.uint64,
+    particle_x: wp.array(dtype=wp.vec3),
+    particle_radius: wp.array(dtype=float),
+    particle_flags: wp.array(dtype=wp.uint32),
+    body_X_wb: wp.array(dtype=wp.transform),
+    shape_X_bs: wp.array(dtype=wp.transform),
+    shape_body: wp.array(dtype=int),
+    geo: ModelShapeGeometry,
+    margin: float,
+    soft_contact_max: int,
+    shape_count: int,
+    # outputs
+    soft_contact_count: wp.array(dtype=int),
+    soft_contact_particle: wp.array(dtype=int),
+    soft_contact_shape: wp.array(dtype=int),
+    soft_contact_body_pos: wp.array(dtype=wp.vec3),
+    soft_contact_body_vel: wp.array(dtype=wp.vec3),
+    soft_contact_normal: wp.array(dtype=wp.vec3),
+    soft_contact_tids: wp.array(dtype=int),
+):
+    particle_index = wp.tid()
+    if (particle_flags[particle_index] & PARTICLE_FLAG_ACTIVE) == 0:
+        return
+
+    px = particle_x[particle_index]
+    radius = particle_radius[particle_index]
+
+    # only test the shapes whose bounds, inflated by the contact distance, contain the particle
+    query = wp.bvh_query_aabb(bvh, px, px)
+    shape_index = int(0)
+    while wp.bvh_query_next(query, shape_index):
+        rigid_index = shape_body[shape_index]
+
+        X_wb = wp.transform_identity()
+        if rigid_index >= 0:
+            X_wb = body_X_wb[rigid_index]
+
+        X_bs = shape_X_bs[shape_index]
+
+        X_ws = wp.transform_multiply(X_wb, X_bs)
+        X_sw = wp.transform_inverse(X_ws)
+
+        # transform particle position to shape local space
+        x_local = wp.transform_point(X_sw, px)
+
+        d, n, v = soft_contact_sdf(geo, shape_index, x_local, margin, radius)
+
+        if d < margin + radius:
+            # record the contact at the index of the particle-shape pair tested by create_soft_contacts
+            index = counter_increment(
+                soft_contact_count, 0, soft_contact_tids, particle_index * shape_count + shape_index
+            )
+
+            if index < soft_contact_max:
+                # compute contact point in body local space
+                body_pos = wp.transform_point(X_bs, x_local - n * d)
+                body_vel = wp.transform_vector(X_bs, v)
+
+                world_normal = wp.transform_vector(X_ws, n)
+
+                soft_contact_shape[index] = shape_index
+                soft_contact_body_pos[index] = body_pos
+                soft_contact_body_vel[index] = body_vel
+                soft_contact_particle[index] = particle_index
+                soft_contact_normal[index] = world_normal
+
+
 @wp.kernel(enable_backward=False)
 def count_contact_points(
     contact_pairs: wp.array(dtype=int, ndim=2),
@@ -767,8 +889,11 @@ def count_contact_points(
     contact_count: wp.array(dtype=int),
 ):
     tid = wp.tid()
-    shape_a = contact_pairs[tid, 0]
+    # the geometry indices of the shapes
+    shape_a = instance_index(contact_pairs[tid, 0], geo.env_shape_count, geo.env_count)
     shape_b = contact_pairs[tid, 1]
+    if shape_b > -1:
+        shape_b = instance_index(shape_b, geo.env_shape_count, geo.env_count)
 
     if shape_b == -1:
         actual_shape_a = shape_a
@@ -863,9 +988,116 @@ def count_contact_points(
     wp.atomic_add(contact_count, 1, num_actual_contacts)
 
 
+@wp.kernel(enable_backward=False)
+def compute_shape_bounds(
+    shapes: wp.array(dtype=int),
+    body_q: wp.array(dtype=wp.transform),
+    shape_X_bs: wp.array(dtype=wp.transform),
+    shape_body: wp.array(dtype=int),
+    collision_radius: wp.array(dtype=float),
+    geo: ModelShapeGeometry,
+    rigid_contact_margin: float,
+    # outputs
+    lower: wp.array(dtype=wp.vec3),
+    upper: wp.array(dtype=wp.vec3),
+):
+    tid = wp.tid()
+    shape = shapes[tid]
+
+    X_ws = shape_X_bs[shape]
+    body = shape_body[shape]
+    if body > -1:
+        X_ws = wp.transform_multiply(body_q[body], X_ws)
+
+    # the bounds of two shapes overlap if their bounding spheres are closer than the contact thickness and margin
+    center = wp.transform_get_translation(X_ws)
+    thickness = geo.thickness[instance_index(shape, geo.env_shape_count, geo.env_count)]
+    extent = collision_radius[shape] + thickness + 0.5 * rigid_contact_margin
+
+    lower[tid] = center - wp.vec3(extent)
+    upper[tid] = center + wp.vec3(extent)
+
+
+@wp.func
+def is_filtered_shape_pair(filter_pairs: wp.array(dtype=int, ndim=2), shape_a: int, shape_b: int):
+    # binary search in the filter pairs sorted by first and second shape index
+    lo = int(0)
+    hi = filter_pairs.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        a = filter_pairs[mid, 0]
+        b = filter_pairs[mid, 1]
+        if a == shape_a and b == shape_b:
+            return True
+        if a < shape_a or (a == shape_a and b < shape_b):
+            lo = mid + 1
+        else:
+            hi = mid
+    return False
+
+
+@wp.kernel(enable_backward=False)
+def find_shape_contact_pairs(
+    bvh: wp.uint64,
+    shapes: wp.array(dtype=int),
+    shape_lower: wp.array(dtype=wp.vec3),
+    shape_upper: wp.array(dtype=wp.vec3),
+    shape_body: wp.array(dtype=int),
+    body_mass: wp.array(dtype=float),
+    shape_group: wp.array(dtype=int),
+    filter_pairs: wp.array(dtype=int, ndim=2),
+    contact_pair_max: int,
+    # outputs
+    contact_pair_count: wp.array(dtype=int),
+    contact_pairs: wp.array(dtype=int, ndim=2),
+):
+    tid = wp.tid()
+    shape_a = shapes[tid]
+    group_a = shape_group[shape_a]
+
+    mass_a = 0.0
+    body_a = shape_body[shape_a]
+    if body_a > -1:
+        mass_a = body_mass[body_a]
+
+    query = wp.bvh_query_aabb(bvh, shape_lower[tid], shape_upper[tid])
+    index = int(0)
+    while wp.bvh_query_next(query, index):
+        # each pair is found by the shape with the lower index
+        if index <= tid:
+            continue
+
+        shape_b = shapes[index]
+
+        # shapes collide with the shapes of the same collision group, and shapes of group -1 with all shapes
+        group_b = shape_group[shape_b]
+        if group_a != group_b and group_a != -1 and group_b != -1:
+            continue
+
+        mass_b = 0.0
+        body_b = shape_body[shape_b]
+        if body_b > -1:
+            mass_b = body_mass[body_b]
+        if mass_a == 0.0 and mass_b == 0.0:
+            # skip if both bodies are static
+            continue
+
+        if is_filtered_shape_pair(filter_pairs, shape_a, shape_b):
+            continue
+
+        pair_index = wp.atomic_add(contact_pair_count, 0, 1)
+        if pair_index >= contact_pair_max:
+            print("Number of shape contact pairs exceeded limit. Increase ModelBuilder.rigid_contact_pairs_per_shape.")
+            return
+
+        contact_pairs[pair_index, 0] = shape_a
+        contact_pairs[pair_index, 1] = shape_b
+
+
 @wp.kernel(enable_backward=False)
 def broadphase_collision_pairs(
     contact_pairs: wp.array(dtype=int, ndim=2),
+    contact_pair_count: wp.array(dtype=int),
     body_q: wp.array(dtype=wp.transform),
     shape_X_bs: wp.array(dtype=wp.transform),
     shape_body: wp.array(dtype=int),
@@ -885,6 +1117,11 @@ def broadphase_collision_pairs(
     contact_point_limit: wp.array(dtype=int),
 ):
     tid = wp.tid()
+    # pairs found at runtime are counted on the device
+    if contact_pair_count:
+        if tid >= contact_pair_count[0]:
+            return
+
     shape_a = contact_pairs[tid, 0]
     shape_b = contact_pairs[tid, 1]
 
@@ -906,12 +1143,16 @@ def broadphase_collision_pairs(
         # skip if both bodies are static
         return
 
-    type_a = geo.type[shape_a]
-    type_b = geo.type[shape_b]
+    geo_a = instance_index(shape_a, geo.env_shape_count, geo.env_count)
+    geo_b = instance_index(shape_b, geo.env_shape_count, geo.env_count)
+    type_a = geo.type[geo_a]
+    type_b = geo.type[geo_b]
     # unique ordering of shape pairs
     if type_a < type_b:
         actual_shape_a = shape_a
         actual_shape_b = shape_b
+        actual_geo_a = geo_a
+        actual_geo_b = geo_b
         actual_type_a = type_a
         actual_type_b = type_b
         actual_X_ws_a = X_ws_a
@@ -919,6 +1160,8 @@ def broadphase_collision_pairs(
     else:
         actual_shape_a = shape_b
         actual_shape_b = shape_a
+        actual_geo_a = geo_b
+        actual_geo_b = geo_a
         actual_type_a = type_b
         actual_type_b = type_a
         actual_X_ws_a = X_ws_b
@@ -929,7 +1172,7 @@ def broadphase_collision_pairs(
         if actual_type_a == wp.sim.GEO_PLANE:
             return
         query_b = wp.transform_point(wp.transform_inverse(actual_X_ws_b), p_a)
-        scale = geo.scale[actual_shape_b]
+        scale = geo.scale[actual_geo_b]
         closest = closest_point_plane(scale[0], scale[1], query_b)
         d = wp.length(query_b - closest)
         r_a = collision_radius[actual_shape_a]
@@ -952,13 +1195,13 @@ def broadphase_collision_pairs(
         num_contacts = 1
     elif actual_type_a == wp.sim.GEO_CAPSULE:
         if actual_type_b == wp.sim.GEO_PLANE:
-            if geo.scale[actual_shape_b][0] == 0.0 and geo.scale[actual_shape_b][1] == 0.0:
+            if geo.scale[actual_geo_b][0] == 0.0 and geo.scale[actual_geo_b][1] == 0.0:
                 num_contacts = 2  # vertex-based collision for infinite plane
             else:
                 num_contacts = 2 + 4  # vertex-based collision + plane edges
         elif actual_type_b == wp.sim.GEO_MESH:
             num_contacts_a = 2
-            mesh_b = wp.mesh_get(geo.source[actual_shape_b])
+            mesh_b = wp.mesh_get(geo.source[actual_geo_b])
             if iterate_mesh_vertices:
                 num_contacts_b = mesh_b.points.shape[0]
             else:
@@ -1003,7 +1246,7 @@ def broadphase_collision_pairs(
             return
         elif actual_type_b == wp.sim.GEO_MESH:
             num_contacts_a = 8
-            mesh_b = wp.mesh_get(geo.source[actual_shape_b])
+            mesh_b = wp.mesh_get(geo.source[actual_geo_b])
             if iterate_mesh_vertices:
                 num_contacts_b = mesh_b.points.shape[0]
             else:
@@ -1029,18 +1272,18 @@ def broadphase_collision_pairs(
                 contact_point_limit[pair_index_ba] = num_contacts_b
             return
         elif actual_type_b == wp.sim.GEO_PLANE:
-            if geo.scale[actual_shape_b][0] == 0.0 and geo.scale[actual_shape_b][1] == 0.0:
+            if geo.scale[actual_geo_b][0] == 0.0 and geo.scale[actual_geo_b][1] == 0.0:
                 num_contacts = 8  # vertex-based collision
             else:
                 num_contacts = 8 + 4  # vertex-based collision + plane edges
         else:
             num_contacts = 8
     elif actual_type_a == wp.sim.GEO_MESH:
-        mesh_a = wp.mesh_get(geo.source[actual_shape_a])
+        mesh_a = wp.mesh_get(geo.source[actual_geo_a])
         num_contacts_a = mesh_a.points.shape[0]
         num_contacts_b = 0
         if actual_type_b == wp.sim.GEO_MESH:
-            mesh_b = wp.mesh_get(geo.source[actual_shape_b])
+            mesh_b = wp.mesh_get(geo.source[actual_geo_b])
             num_contacts_b = mesh_b.points.shape[0]
         elif actual_type_b != wp.sim.GEO_PLANE:
             print("broadphase_collision_pairs: unsupported geometry type for mesh collision")
@@ -1134,6 +1377,9 @@ def handle_contact_pairs(
 
     point_id = contact_point_id[tid]
 
+    geo_a = instance_index(shape_a, geo.env_shape_count, geo.env_count)
+    geo_b = instance_index(shape_b, geo.env_shape_count, geo.env_count)
+
     rigid_a = shape_body[shape_a]
     X_wb_a = wp.transform_identity()
     if rigid_a >= 0:
@@ -1142,11 +1388,11 @@ def handle_contact_pairs(
     X_ws_a = wp.transform_multiply(X_wb_a, X_bs_a)
     X_sw_a = wp.transform_inverse(X_ws_a)
     X_bw_a = wp.transform_inverse(X_wb_a)
-    geo_type_a = geo.type[shape_a]
-    geo_scale_a = geo.scale[shape_a]
+    geo_type_a = geo.type[geo_a]
+    geo_scale_a = geo.scale[geo_a]
     min_scale_a = min(geo_scale_a)
-    thickness_a = geo.thickness[shape_a]
-    # is_solid_a = geo.is_solid[shape_a]
+    thickness_a = geo.thickness[geo_a]
+    # is_solid_a = geo.is_solid[geo_a]
 
     rigid_b = shape_body[shape_b]
     X_wb_b = wp.transform_identity()
@@ -1156,11 +1402,11 @@ def handle_contact_pairs(
     X_ws_b = wp.transform_multiply(X_wb_b, X_bs_b)
     X_sw_b = wp.transform_inverse(X_ws_b)
     X_bw_b = wp.transform_inverse(X_wb_b)
-    geo_type_b = geo.type[shape_b]
-    geo_scale_b = geo.scale[shape_b]
+    geo_type_b = geo.type[geo_b]
+    geo_scale_b = geo.scale[geo_b]
     min_scale_b = min(geo_scale_b)
-    thickness_b = geo.thickness[shape_b]
-    # is_solid_b = geo.is_solid[shape_b]
+    thickness_b = geo.thickness[geo_b]
+    # is_solid_b = geo.is_solid[geo_b]
 
     distance = 1.0e6
     u = float(0.0)
@@ -1182,7 +1428,7 @@ def handle_contact_pairs(
             B_b = wp.transform_point(X_ws_b, wp.vec3(0.0, -half_height_b, 0.0))
             p_b_world = closest_point_line_segment(A_b, B_b, p_a_world)
         elif geo_type_b == wp.sim.GEO_MESH:
-            mesh_b = geo.source[shape_b]
+            mesh_b = geo.source[geo_b]
             query_b_local = wp.transform_point(X_sw_b, p_a_world)
             face_index = int(0)
             face_u = float(0.0)
@@ -1339,13 +1585,13 @@ def handle_contact_pairs(
         edge1_b = wp.transform_point(X_sw_b, edge1_world)
         max_iter = edge_sdf_iter
         max_dist = (rigid_contact_margin + thickness) / min_scale_b
-        mesh_b = geo.source[shape_b]
+        mesh_b = geo.source[geo_b]
         u = closest_edge_coordinate_mesh(
             mesh_b, wp.cw_div(edge0_b, geo_scale_b), wp.cw_div(edge1_b, geo_scale_b), max_iter, max_dist
         )
         p_a_world = (1.0 - u) * edge0_world + u * edge1_world
         query_b_local = wp.transform_point(X_sw_b, p_a_world)
-        mesh_b = geo.source[shape_b]
+        mesh_b = geo.source[geo_b]
 
         face_index = int(0)
         face_u = float(0.0)
@@ -1368,7 +1614,7 @@ def handle_contact_pairs(
 
     elif geo_type_a == wp.sim.GEO_MESH and geo_type_b == wp.sim.GEO_CAPSULE:
         # vertex-based contact
-        mesh = wp.mesh_get(geo.source[shape_a])
+        mesh = wp.mesh_get(geo.source[geo_a])
         body_a_pos = wp.cw_mul(mesh.points[point_id], geo_scale_a)
         p_a_world = wp.transform_point(X_ws_a, body_a_pos)
         # find closest point + contact normal on capsule B
@@ -1423,7 +1669,7 @@ def handle_contact_pairs(
 
     elif geo_type_a == wp.sim.GEO_MESH and geo_type_b == wp.sim.GEO_BOX:
         # vertex-based contact
-        mesh = wp.mesh_get(geo.source[shape_a])
+        mesh = wp.mesh_get(geo.source[geo_a])
         body_a_pos = wp.cw_mul(mesh.points[point_id], geo_scale_a)
         p_a_world = wp.transform_point(X_ws_a, body_a_pos)
         # find closest point + contact normal on box B
@@ -1442,7 +1688,7 @@ def handle_contact_pairs(
         query_a = get_box_vertex(point_id, geo_scale_a)
         p_a_world = wp.transform_point(X_ws_a, query_a)
         query_b_local = wp.transform_point(X_sw_b, p_a_world)
-        mesh_b = geo.source[shape_b]
+        mesh_b = geo.source[geo_b]
         max_dist = (rigid_contact_margin + thickness) / min_scale_b
         face_index = int(0)
         face_u = float(0.0)
@@ -1465,8 +1711,8 @@ def handle_contact_pairs(
 
     elif geo_type_a == wp.sim.GEO_MESH and geo_type_b == wp.sim.GEO_MESH:
         # vertex-based contact
-        mesh = wp.mesh_get(geo.source[shape_a])
-        mesh_b = geo.source[shape_b]
+        mesh = wp.mesh_get(geo.source[geo_a])
+        mesh_b = geo.source[geo_b]
 
         body_a_pos = wp.cw_mul(mesh.points[point_id], geo_scale_a)
         p_a_world = wp.transform_point(X_ws_a, body_a_pos)
@@ -1496,7 +1742,7 @@ def handle_contact_pairs(
 
     elif geo_type_a == wp.sim.GEO_MESH and geo_type_b == wp.sim.GEO_PLANE:
         # vertex-based contact
-        mesh = wp.mesh_get(geo.source[shape_a])
+        mesh = wp.mesh_get(geo.source[geo_a])
         body_a_pos = wp.cw_mul(mesh.points[point_id], geo_scale_a)
         p_a_world = wp.transform_point(X_ws_a, body_a_pos)
         query_b = wp.transform_point(X_sw_b, p_a_world)
@@ -1547,6 +1793,15 @@ def handle_contact_pairs(
         contact_thickness[index] = thickness
 
 
+def refit_bvh(bvh: wp.Bvh, device):
+    # the refit is ordered with the kernels accessing the bounds when the launches are scheduled
+    task_graph = device.task_graph
+    if task_graph is not None:
+        task_graph.record_func(bvh.refit, reads=[bvh.lowers, bvh.uppers], writes=[bvh.lowers, bvh.uppers], name="refit")
+    else:
+        bvh.refit()
+
+
 def collide(model, state, edge_sdf_iter: int = 10, iterate_mesh_vertices: bool = True, requires_grad: bool = None):
     """
     Generates contact points for the particles and rigid bodies in the model,
@@ -1572,10 +1827,45 @@ def collide(model, state, edge_sdf_iter: int = 10, iterate_mesh_vertices: bool =
                 model.soft_contact_normal = wp.empty_like(model.soft_contact_normal)
             # clear old count
             model.soft_contact_count.zero_()
+
+            # BVH queries are not differentiable, all the particle-shape pairs are tested when computing gradients
+            bvh = model.soft_contact_shape_bvh
+            if bvh is not None and not requires_grad:
+                if model.device.is_cpu and model.device.is_capturing:
+                    raise RuntimeError("The 'bvh' soft contact broadphase does not support graph capture on the CPU")
+
+                wp.launch(
+                    kernel=compute_soft_contact_shape_bounds,
+                    dim=model.shape_count - 1,
+                    inputs=[
+                        state.body_q,
+                        model.shape_transform,
+                        model.shape_body,
+                        model.shape_geo,
+                        model.shape_collision_radius,
+                        model.soft_contact_margin + model.particle_max_radius,
+                    ],
+                    outputs=[bvh.lowers, bvh.uppers],
+                    device=model.device,
+                    record_tape=False,
+                )
+                refit_bvh(bvh, model.device)
+
+                soft_contact_kernel = create_soft_contacts_bvh
+                soft_contact_dim = model.particle_count
+                soft_contact_inputs = [bvh.id]
+                soft_contact_record_tape = False
+            else:
+                soft_contact_kernel = create_soft_contacts
+                soft_contact_dim = model.particle_count * (model.shape_count - 1)
+                soft_contact_inputs = []
+                soft_contact_record_tape = True
+
             wp.launch(
-                kernel=create_soft_contacts,
-                dim=model.particle_count * (model.shape_count - 1),
+                kernel=soft_contact_kernel,
+                dim=soft_contact_dim,
                 inputs=[
+                    *soft_contact_inputs,
                     state.particle_q,
                     model.particle_radius,
                     model.particle_flags,
@@ -1597,6 +1887,7 @@ def collide(model, state, edge_sdf_iter: int = 10, iterate_mesh_vertices: bool =
                     model.soft_contact_tids,
                 ],
                 device=model.device,
+                record_tape=soft_contact_record_tape,
             )
 
         if model.shape_contact_pair_count or model.ground and model.shape_ground_contact_pair_count:
@@ -1606,12 +1897,57 @@ def collide(model, state, edge_sdf_iter: int = 10, iterate_mesh_vertices: bool =
             model.rigid_contact_broad_shape0.fill_(-1)
             model.rigid_contact_broad_shape1.fill_(-1)
 
+        if model.shape_contact_pair_count and model.rigid_broadphase == "bvh":
+            if model.device.is_cpu and model.device.is_capturing:
+                raise RuntimeError("The 'bvh' rigid broadphase does not support graph capture on the CPU")
+
+            # find the pairs of shapes whose bounds overlap
+            wp.launch(
+                kernel=compute_shape_bounds,
+                dim=len(model.shape_broadphase_shapes),
+                inputs=[
+                    model.shape_broadphase_shapes,
+                    state.body_q,
+                    model.shape_transform,
+                    model.shape_body,
+                    model.shape_collision_radius,
+                    model.shape_geo,
+                    model.rigid_contact_margin,
+                ],
+                outputs=[model.shape_broadphase_bvh.lowers, model.shape_broadphase_bvh.uppers],
+                device=model.device,
+                record_tape=False,
+            )
+
+            refit_bvh(model.shape_broadphase_bvh, model.device)
+
+            model.shape_contact_pair_found.zero_()
+            wp.launch(
+                kernel=find_shape_contact_pairs,
+                dim=len(model.shape_broadphase_shapes),
+                inputs=[
+                    model.shape_broadphase_bvh.id,
+                    model.shape_broadphase_shapes,
+                    model.shape_broadphase_bvh.lowers,
+                    model.shape_broadphase_bvh.uppers,
+                    model.shape_body,
+                    model.body_mass,
+                    model.shape_broadphase_group,
+                    model.shape_broadphase_filter_pairs,
+                    model.shape_contact_pair_count,
+                ],
+                outputs=[model.shape_contact_pair_found, model.shape_contact_pairs],
+                device=model.device,
+                record_tape=False,
+            )
+
         if model.shape_contact_pair_count:
             wp.launch(
                 kernel=broadphase_collision_pairs,
                 dim=model.shape_contact_pair_count,
                 inputs=[
                     model.shape_contact_pairs,
+                    model.shape_contact_pair_found,
                     state.body_q,
                     model.shape_transform,
                     model.shape_body,
@@ -1641,6 +1977,7 @@ def collide(model, state, edge_sdf_iter: int = 10, iterate_mesh_vertices: bool =
                 dim=model.shape_ground_contact_pair_count,
                 inputs=[
                     model.shape_ground_contact_pairs,
+                    None,
                     state.body_q,
                     model.shape_transform,
                     model.shape_body,
@@ -145,8 +145,97 @@ def integrate_bodies(
 class Integrator:
     """
     Generic base class for integrators. Provides methods to integrate rigid bodies and particles.
+
+    By default, the integrators may allocate temporary arrays at every simulation step. After calling
+    :meth:`allocate_workspace`, these arrays are allocated once for the model and reused by the steps that do not
+    compute gradients, which makes the steps allocation-free, e.g. to capture them in a CUDA graph without
+    allocating from the memory pool at every replay.
     """
 
+    # temporary arrays by name, see allocate_workspace()
+    workspace = None
+    workspace_model = None
+
+    def workspace_arrays(self, model: Model):
+        """
+        Returns the temporary arrays used by the simulation steps of the model, as a dictionary mapping the name of
+        each temporary array to the array of the model whose shape and data type it follows.
+
+        Args:
+            model (Model): The model to simulate.
+        """
+        return {}
+
+    def allocate_workspace(self, model: Model):
+        """
+        Preallocates the temporary arrays of the simulation steps of the model, which are reused by all the
+        subsequent steps that do not compute gradients. Steps computing gradients still allocate new arrays so that
+        the arrays recorded by the :class:`warp.Tape` are not overwritten by later steps.
+
+        Args:
+            model (Model): The model to simulate.
+        """
+        self.workspace = {}
+        self.workspace_model = model
+        for name, src in self.workspace_arrays(model).items():
+            if src is not None:
+                self.workspace[name] = wp.empty_like(src, requires_grad=False)
+
+    def free_workspace(self):
+        """
+        Releases the temporary arrays allocated by :meth:`allocate_workspace`, subsequent steps allocate
+        their temporary arrays again.
+        """
+        self.workspace = None
+        self.workspace_model = None
+
+    def temporary_like(self, model: Model, name: str, src: wp.array, zero: bool = False, requires_grad: bool = False):
+        """
+        Returns a temporary array with the same shape and data type as ``src``, taken from the workspace if
+        it was allocated for the model and gradients are not required, or newly allocated otherwise.
+
+        Args:
+            model (Model): The model being simulated.
+            name (str): The name of the temporary array in the workspace.
+            src (array): The array whose shape and data type to follow.
+            zero (bool): Whether to initialize the array with zeros.
+            requires_grad (bool): Whether the simulation step computes gradients.
+        """
+        if self.workspace is None or requires_grad:
+            if zero:
+                return wp.zeros_like(src)
+            return wp.empty_like(src)
+
+        if model is not self.workspace_model:
+            self.allocate_workspace(model)
+
+        dest = self.workspace.get(name)
+        if dest is None or dest.shape != src.shape or dest.dtype != src.dtype:
+            # temporary arrays that were not declared by workspace_arrays() are allocated on first use
+            dest = wp.empty_like(src, requires_grad=False)
+            self.workspace[name] = dest
+
+        if zero:
+            dest.zero_()
+        return dest
+
+    def temporary_clone(self, model: Model, name: str, src: wp.array, requires_grad: bool = False):
+        """
+        Returns a temporary copy of ``src``, see :meth:`temporary_like`.
+
+        Args:
+            model (Model): The model being simulated.
+            name (str): The name of the temporary array in the workspace.
+            src (array): The array to copy.
+            requires_grad (bool): Whether the simulation step computes gradients.
+        """
+        if self.workspace is None or requires_grad:
+            return wp.clone(src)
+
+        dest = self.temporary_like(model, name, src)
+        wp.copy(dest, src)
+        return dest
+
     def integrate_bodies(
         self,
         model: Model,
@@ -16,7 +16,7 @@ from .collide import triangle_closest_point_barycentric
 from .integrator import Integrator
 from .model import PARTICLE_FLAG_ACTIVE, Control, Model, ModelShapeGeometry, ModelShapeMaterials, State
 from .particles import eval_particle_forces
-from .utils import quat_decompose, quat_twist
+from .utils import instance_index, quat_decompose, quat_twist
 
 
 @wp.kernel
@@ -802,10 +802,11 @@ def eval_particle_contacts(
         return
 
     # take average material properties of shape and particle parameters
-    ke = 0.5 * (particle_ke + shape_materials.ke[shape_index])
-    kd = 0.5 * (particle_kd + shape_materials.kd[shape_index])
-    kf = 0.5 * (particle_kf + shape_materials.kf[shape_index])
-    mu = 0.5 * (particle_mu + shape_materials.mu[shape_index])
+    material_index = instance_index(shape_index, shape_materials.env_shape_count, shape_materials.env_count)
+    ke = 0.5 * (particle_ke + shape_materials.ke[material_index])
+    kd = 0.5 * (particle_kd + shape_materials.kd[material_index])
+    kf = 0.5 * (particle_kf + shape_materials.kf[material_index])
+    mu = 0.5 * (particle_mu + shape_materials.mu[material_index])
 
     body_w = wp.spatial_top(body_v_s)
     body_v = wp.spatial_bottom(body_v_s)
@@ -898,21 +899,23 @@ def eval_rigid_contacts(
     body_b = -1
     if shape_a >= 0:
         mat_nonzero += 1
-        ke += shape_materials.ke[shape_a]
-        kd += shape_materials.kd[shape_a]
-        kf += shape_materials.kf[shape_a]
-        ka += shape_materials.ka[shape_a]
-        mu += shape_materials.mu[shape_a]
-        thickness_a = geo.thickness[shape_a]
+        material_a = instance_index(shape_a, shape_materials.env_shape_count, shape_materials.env_count)
+        ke += shape_materials.ke[material_a]
+        kd += shape_materials.kd[material_a]
+        kf += shape_materials.kf[material_a]
+        ka += shape_materials.ka[material_a]
+        mu += shape_materials.mu[material_a]
+        thickness_a = geo.thickness[instance_index(shape_a, geo.env_shape_count, geo.env_count)]
         body_a = shape_body[shape_a]
     if shape_b >= 0:
         mat_nonzero += 1
-        ke += shape_materials.ke[shape_b]
-        kd += shape_materials.kd[shape_b]
-        kf += shape_materials.kf[shape_b]
-        ka += shape_materials.ka[shape_b]
-        mu += shape_materials.mu[shape_b]
-        thickness_b = geo.thickness[shape_b]
+        material_b = instance_index(shape_b, shape_materials.env_shape_count, shape_materials.env_count)
+        ke += shape_materials.ke[material_b]
+        kd += shape_materials.kd[material_b]
+        kf += shape_materials.kf[material_b]
+        ka += shape_materials.ka[material_b]
+        mu += shape_materials.mu[material_b]
+        thickness_b = geo.thickness[instance_index(shape_b, geo.env_shape_count, geo.env_count)]
         body_b = shape_body[shape_b]
     if mat_nonzero > 0:
         ke /= float(mat_nonzero)
@@ -1967,6 +1970,11 @@ class SemiImplicitIntegrator(Integrator):
         self.friction_smoothing = friction_smoothing
 
     def simulate(self, model: Model, state_in: State, state_out: State, dt: float, control: Control = None):
+        if model.instancing.env_body_count or model.instancing.env_joint_count:
+            raise ValueError(
+                "SemiImplicitIntegrator does not support models with instanced rigid bodies or joints, use FeatherstoneIntegrator instead"
+            )
+
         with wp.ScopedTimer("simulate", False):
             particle_f = None
             body_f = None
@@ -26,7 +26,8 @@ from .integrator_euler import (
     eval_triangle_contact_forces,
     eval_triangle_forces,
 )
-from .model import Control, Model, State
+from .model import Control, Model, ModelInstancing, State
+from .utils import instance_index
 
 
 # Frank & Park definition 3.20, pg 100
@@ -79,11 +80,12 @@ def spatial_adjoint(R: wp.mat33, S: wp.mat33):
 def compute_spatial_inertia(
     body_inertia: wp.array(dtype=wp.mat33),
     body_mass: wp.array(dtype=float),
+    instancing: ModelInstancing,
     # outputs
     body_I_m: wp.array(dtype=wp.spatial_matrix),
 ):
     tid = wp.tid()
-    I = body_inertia[tid]
+    I = body_inertia[instance_index(tid, instancing.env_body_count, instancing.env_count)]
     m = body_mass[tid]
     # fmt: off
     body_I_m[tid] = wp.spatial_matrix(
@@ -658,27 +660,31 @@ def compute_link_transform(
     joint_axis: wp.array(dtype=wp.vec3),
     joint_axis_start: wp.array(dtype=int),
     joint_axis_dim: wp.array(dtype=int, ndim=2),
+    instancing: ModelInstancing,
     # outputs
     body_q: wp.array(dtype=wp.transform),
     body_q_com: wp.array(dtype=wp.transform),
 ):
+    # index of the joint's static data, shared between instanced environments
+    j = instance_index(i, instancing.env_joint_count, instancing.env_count)
+
     # parent transform
     parent = joint_parent[i]
     child = joint_child[i]
 
     # parent transform in spatial coordinates
     X_pj = joint_X_p[i]
-    X_cj = joint_X_c[i]
+    X_cj = joint_X_c[j]
     # parent anchor frame in world space
     X_wpj = X_pj
     if parent >= 0:
         X_wp = body_q[parent]
         X_wpj = X_wp * X_wpj
 
-    type = joint_type[i]
-    axis_start = joint_axis_start[i]
-    lin_axis_count = joint_axis_dim[i, 0]
-    ang_axis_count = joint_axis_dim[i, 1]
+    type = joint_type[j]
+    axis_start = instance_index(joint_axis_start[i], instancing.env_joint_axis_count, instancing.env_count)
+    lin_axis_count = joint_axis_dim[j, 0]
+    ang_axis_count = joint_axis_dim[j, 1]
     coord_start = joint_q_start[i]
 
     # compute transform across joint
@@ -712,6 +718,7 @@ def eval_rigid_fk(
     joint_axis: wp.array(dtype=wp.vec3),
     joint_axis_start: wp.array(dtype=int),
     joint_axis_dim: wp.array(dtype=int, ndim=2),
+    instancing: ModelInstancing,
     # outputs
     body_q: wp.array(dtype=wp.transform),
     body_q_com: wp.array(dtype=wp.transform),
@@ -736,6 +743,7 @@ def eval_rigid_fk(
             joint_axis,
             joint_axis_start,
             joint_axis_dim,
+            instancing,
             body_q,
             body_q_com,
         )
@@ -793,6 +801,7 @@ def compute_link_velocity(
     joint_X_p: wp.array(dtype=wp.transform),
     joint_X_c: wp.array(dtype=wp.transform),
     gravity: wp.vec3,
+    instancing: ModelInstancing,
     # outputs
     joint_S_s: wp.array(dtype=wp.spatial_vector),
     body_I_s: wp.array(dtype=wp.spatial_matrix),
@@ -800,7 +809,10 @@ def compute_link_velocity(
     body_f_s: wp.array(dtype=wp.spatial_vector),
     body_a_s: wp.array(dtype=wp.spatial_vector),
 ):
-    type = joint_type[i]
+    # index of the joint's static data, shared between instanced environments
+    j = instance_index(i, instancing.env_joint_count, instancing.env_count)
+
+    type = joint_type[j]
     child = joint_child[i]
     parent = joint_parent[i]
     q_start = joint_q_start[i]
@@ -816,9 +828,9 @@ def compute_link_velocity(
         X_wpj = X_wp * X_wpj
 
     # compute motion subspace and velocity across the joint (also stores S_s to global memory)
-    axis_start = joint_axis_start[i]
-    lin_axis_count = joint_axis_dim[i, 0]
-    ang_axis_count = joint_axis_dim[i, 1]
+    axis_start = instance_index(joint_axis_start[i], instancing.env_joint_axis_count, instancing.env_count)
+    lin_axis_count = joint_axis_dim[j, 0]
+    ang_axis_count = joint_axis_dim[j, 1]
     v_j_s = jcalc_motion(
         type,
         joint_axis,
@@ -887,6 +899,7 @@ def eval_rigid_id(
     joint_X_p: wp.array(dtype=wp.transform),
     joint_X_c: wp.array(dtype=wp.transform),
     gravity: wp.vec3,
+    instancing: ModelInstancing,
     # outputs
     joint_S_s: wp.array(dtype=wp.spatial_vector),
     body_I_s: wp.array(dtype=wp.spatial_matrix),
@@ -920,6 +933,7 @@ def eval_rigid_id(
             joint_X_p,
             joint_X_c,
             gravity,
+            instancing,
             joint_S_s,
             body_I_s,
             body_v_s,
@@ -951,6 +965,7 @@ def eval_rigid_tau(
     joint_S_s: wp.array(dtype=wp.spatial_vector),
     body_fb_s: wp.array(dtype=wp.spatial_vector),
     body_f_ext: wp.array(dtype=wp.spatial_vector),
+    instancing: ModelInstancing,
     # outputs
     body_ft_s: wp.array(dtype=wp.spatial_vector),
     tau: wp.array(dtype=float),
@@ -966,15 +981,16 @@ def eval_rigid_tau(
     for offset in range(count):
         # for backwards traversal
         i = end - offset - 1
+        j = instance_index(i, instancing.env_joint_count, instancing.env_count)
 
-        type = joint_type[i]
+        type = joint_type[j]
         parent = joint_parent[i]
         child = joint_child[i]
         dof_start = joint_qd_start[i]
         coord_start = joint_q_start[i]
         axis_start = joint_axis_start[i]
-        lin_axis_count = joint_axis_dim[i, 0]
-        ang_axis_count = joint_axis_dim[i, 1]
+        lin_axis_count = joint_axis_dim[j, 0]
+        ang_axis_count = joint_axis_dim[j, 1]
 
         # total forces on body
         f_b_s = body_fb_s[child]
@@ -1456,18 +1472,20 @@ def integrate_generalized_joints(
     joint_qd: wp.array(dtype=float),
     joint_qdd: wp.array(dtype=float),
     dt: float,
+    instancing: ModelInstancing,
     # outputs
     joint_q_new: wp.array(dtype=float),
     joint_qd_new: wp.array(dtype=float),
 ):
     # one thread per-articulation
     index = wp.tid()
+    j = instance_index(index, instancing.env_joint_count, instancing.env_count)
 
-    type = joint_type[index]
+    type = joint_type[j]
     coord_start = joint_q_start[index]
     dof_start = joint_qd_start[index]
-    lin_axis_count = joint_axis_dim[index, 0]
-    ang_axis_count = joint_axis_dim[index, 1]
+    lin_axis_count = joint_axis_dim[j, 0]
+    ang_axis_count = joint_axis_dim[j, 1]
 
     jcalc_integrate(
         type,
@@ -1655,7 +1673,7 @@ class FeatherstoneIntegrator(Integrator):
             wp.launch(
                 compute_spatial_inertia,
                 model.body_count,
-                inputs=[model.body_inertia, model.body_mass],
+                inputs=[model.body_inertia, model.body_mass, model.instancing],
                 outputs=[self.body_I_m],
                 device=model.device,
             )
@@ -1781,6 +1799,7 @@ class FeatherstoneIntegrator(Integrator):
                         model.joint_axis,
                         model.joint_axis_start,
                         model.joint_axis_dim,
+                        model.instancing,
                     ],
                     outputs=[state_in.body_q, state_aug.body_q_com],
                     device=model.device,
@@ -1812,6 +1831,7 @@ class FeatherstoneIntegrator(Integrator):
                         model.joint_X_p,
                         model.joint_X_c,
                         model.gravity,
+                        model.instancing,
                     ],
                     outputs=[
                         state_aug.joint_S_s,
@@ -1880,6 +1900,7 @@ class FeatherstoneIntegrator(Integrator):
                             state_aug.joint_S_s,
                             state_aug.body_f_s,
                             body_f,
+                            model.instancing,
                         ],
                         outputs=[
                             state_aug.body_ft_s,
@@ -2092,6 +2113,7 @@ class FeatherstoneIntegrator(Integrator):
                         state_in.joint_qd,
                         state_aug.joint_qdd,
                         dt,
+                        model.instancing,
                     ],
                     outputs=[state_out.joint_q, state_out.joint_qd],
                     device=model.device,
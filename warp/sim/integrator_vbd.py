@@ -22,6 +22,7 @@ from .collide import (
 )
 from .integrator import Integrator
 from .model import PARTICLE_FLAG_ACTIVE, Control, Model, ModelShapeMaterials, State
+from .utils import instance_index
 
 wp.set_module_options({"enable_backward": False})
 
@@ -419,7 +420,8 @@ def evaluate_body_particle_contact(
         body_contact_force = n * body_contact_force_norm
         body_contact_hessian = soft_contact_ke * wp.outer(n, n)
 
-        mu = 0.5 * (friction_mu + shape_materials.mu[shape_index])
+        material_index = instance_index(shape_index, shape_materials.env_shape_count, shape_materials.env_count)
+        mu = 0.5 * (friction_mu + shape_materials.mu[material_index])
 
         dx = particle_pos - particle_prev_pos
 
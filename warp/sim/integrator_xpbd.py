@@ -18,7 +18,7 @@ from .model import (
     ModelShapeMaterials,
     State,
 )
-from .utils import vec_abs, vec_leaky_max, vec_leaky_min, vec_max, vec_min, velocity_at_point
+from .utils import instance_index, vec_abs, vec_leaky_max, vec_leaky_min, vec_max, vec_min, velocity_at_point
 
 
 @wp.kernel
@@ -260,7 +260,8 @@ def solve_particle_shape_contacts(
         return
 
     # take average material properties of shape and particle parameters
-    mu = 0.5 * (particle_mu + shape_materials.mu[shape_index])
+    material_index = instance_index(shape_index, shape_materials.env_shape_count, shape_materials.env_count)
+    mu = 0.5 * (particle_mu + shape_materials.mu[material_index])
 
     # body velocity
     body_v_s = wp.spatial_vector()
@@ -2329,10 +2330,10 @@ def solve_body_contact_positions(
     mu = 0.0
     if shape_a >= 0:
         mat_nonzero += 1
-        mu += shape_materials.mu[shape_a]
+        mu += shape_materials.mu[instance_index(shape_a, shape_materials.env_shape_count, shape_materials.env_count)]
     if shape_b >= 0:
         mat_nonzero += 1
-        mu += shape_materials.mu[shape_b]
+        mu += shape_materials.mu[instance_index(shape_b, shape_materials.env_shape_count, shape_materials.env_count)]
     if mat_nonzero > 0:
         mu /= float(mat_nonzero)
 
@@ -2510,11 +2511,15 @@ def apply_rigid_restitution(
     restitution = 0.0
     if shape_a >= 0:
         mat_nonzero += 1
-        restitution += shape_materials.restitution[shape_a]
+        restitution += shape_materials.restitution[
+            instance_index(shape_a, shape_materials.env_shape_count, shape_materials.env_count)
+        ]
         body_a = shape_body[shape_a]
     if shape_b >= 0:
         mat_nonzero += 1
-        restitution += shape_materials.restitution[shape_b]
+        restitution += shape_materials.restitution[
+            instance_index(shape_b, shape_materials.env_shape_count, shape_materials.env_count)
+        ]
         body_b = shape_body[shape_b]
     if mat_nonzero > 0:
         restitution /= float(mat_nonzero)
@@ -2681,6 +2686,28 @@ class XPBDIntegrator(Integrator):
         self._particle_delta_counter = 0
         self._body_delta_counter = 0
 
+    def workspace_arrays(self, model: Model):
+        arrays = {}
+        if model.particle_count:
+            arrays["particle_q_init"] = model.particle_q
+            arrays["particle_deltas"] = model.particle_qd
+            if self.enable_restitution:
+                arrays["particle_qd_init"] = model.particle_qd
+        if model.body_count:
+            arrays["body_deltas"] = model.body_qd
+            if self.compute_body_velocity_from_position_delta or self.enable_restitution:
+                arrays["body_q_init"] = model.body_q
+                arrays["body_qd_init"] = model.body_qd
+        if model.rigid_contact_max > 0 and self.rigid_contact_con_weighting:
+            arrays["rigid_contact_inv_weight"] = model.rigid_contact_thickness
+            if self.enable_restitution:
+                arrays["rigid_contact_inv_weight_init"] = model.rigid_contact_thickness
+        if model.spring_count:
+            arrays["spring_constraint_lambdas"] = model.spring_rest_length
+        if model.edge_count:
+            arrays["edge_constraint_lambdas"] = model.edge_rest_angle
+        return arrays
+
     def apply_particle_deltas(
         self,
         model: Model,
@@ -2784,6 +2811,11 @@ class XPBDIntegrator(Integrator):
         return new_body_q, new_body_qd
 
     def simulate(self, model: Model, state_in: State, state_out: State, dt: float, control: Control = None):
+        if model.instancing.env_body_count or model.instancing.env_joint_count:
+            raise ValueError(
+                "XPBDIntegrator does not support models with instanced rigid bodies or joints, use FeatherstoneIntegrator instead"
+            )
+
         requires_grad = state_in.requires_grad
         self._particle_delta_counter = 0
         self._body_delta_counter = 0
@@ -2800,7 +2832,13 @@ class XPBDIntegrator(Integrator):
 
         if model.rigid_contact_max > 0:
             if self.rigid_contact_con_weighting:
-                rigid_contact_inv_weight = wp.zeros_like(model.rigid_contact_thickness)
+                rigid_contact_inv_weight = self.temporary_like(
+                    model,
+                    "rigid_contact_inv_weight",
+                    model.rigid_contact_thickness,
+                    zero=True,
+                    requires_grad=requires_grad,
+                )
             rigid_contact_inv_weight_init = None
 
         if control is None:
@@ -2811,10 +2849,16 @@ class XPBDIntegrator(Integrator):
                 particle_q = state_out.particle_q
                 particle_qd = state_out.particle_qd
 
-                self.particle_q_init = wp.clone(state_in.particle_q)
+                self.particle_q_init = self.temporary_clone(
+                    model, "particle_q_init", state_in.particle_q, requires_grad=requires_grad
+                )
                 if self.enable_restitution:
-                    self.particle_qd_init = wp.clone(state_in.particle_qd)
-                particle_deltas = wp.empty_like(state_out.particle_qd)
+                    self.particle_qd_init = self.temporary_clone(
+                        model, "particle_qd_init", state_in.particle_qd, requires_grad=requires_grad
+                    )
+                particle_deltas = self.temporary_like(
+                    model, "particle_deltas", state_out.particle_qd, requires_grad=requires_grad
+                )
 
                 self.integrate_particles(model, state_in, state_out, dt)
 
@@ -2823,10 +2867,14 @@ class XPBDIntegrator(Integrator):
                 body_qd = state_out.body_qd
 
                 if self.compute_body_velocity_from_position_delta or self.enable_restitution:
-                    body_q_init = wp.clone(state_in.body_q)
-                    body_qd_init = wp.clone(state_in.body_qd)
+                    body_q_init = self.temporary_clone(
+                        model, "body_q_init", state_in.body_q, requires_grad=requires_grad
+                    )
+                    body_qd_init = self.temporary_clone(
+                        model, "body_qd_init", state_in.body_qd, requires_grad=requires_grad
+                    )
 
-                body_deltas = wp.empty_like(state_out.body_qd)
+                body_deltas = self.temporary_like(model, "body_deltas", state_out.body_qd, requires_grad=requires_grad)
 
                 if model.joint_count:
                     wp.launch(
@@ -2854,10 +2902,14 @@ class XPBDIntegrator(Integrator):
 
             spring_constraint_lambdas = None
             if model.spring_count:
-                spring_constraint_lambdas = wp.empty_like(model.spring_rest_length)
+                spring_constraint_lambdas = self.temporary_like(
+                    model, "spring_constraint_lambdas", model.spring_rest_length, requires_grad=requires_grad
+                )
             edge_constraint_lambdas = None
             if model.edge_count:
-                edge_constraint_lambdas = wp.empty_like(model.edge_rest_angle)
+                edge_constraint_lambdas = self.temporary_like(
+                    model, "edge_constraint_lambdas", model.edge_rest_angle, requires_grad=requires_grad
+                )
 
             for i in range(self.iterations):
                 with wp.ScopedTimer(f"iteration_{i}", False):
@@ -3144,7 +3196,12 @@ class XPBDIntegrator(Integrator):
                         if self.enable_restitution and i == 0:
                             # remember contact constraint weighting from the first iteration
                             if self.rigid_contact_con_weighting:
-                                rigid_contact_inv_weight_init = wp.clone(rigid_contact_inv_weight)
+                                rigid_contact_inv_weight_init = self.temporary_clone(
+                                    model,
+                                    "rigid_contact_inv_weight_init",
+                                    rigid_contact_inv_weight,
+                                    requires_grad=requires_grad,
+                                )
                             else:
                                 rigid_contact_inv_weight_init = None
 
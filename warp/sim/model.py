@@ -25,6 +25,7 @@ from .inertia import (
     compute_sphere_inertia,
     transform_inertia,
 )
+from .utils import instance_indices
 
 Vec3 = List[float]
 Vec4 = List[float]
@@ -70,6 +71,41 @@ def flag_to_int(flag):
     return int(flag)
 
 
+def _quat_multiply_np(a, b):
+    # products of quaternions stored as (x, y, z, w) along the last axis
+    ax, ay, az, aw = np.moveaxis(a, -1, 0)
+    bx, by, bz, bw = np.moveaxis(b, -1, 0)
+    return np.stack(
+        (
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+            aw * bw - ax * bx - ay * by - az * bz,
+        ),
+        axis=-1,
+    )
+
+
+def _transform_multiply_np(a, b):
+    # products of transforms stored as (p, q) along the last axis, broadcast over the leading axes
+    a, b = np.broadcast_arrays(a, b)
+    u = a[..., 3:6]
+    w = a[..., 6:7]
+    v = b[..., :3]
+    t = 2.0 * np.cross(u, v)
+    p = a[..., :3] + v + w * t + np.cross(u, t)
+    return np.concatenate((p, _quat_multiply_np(a[..., 3:], b[..., 3:])), axis=-1)
+
+
+def _values_to_numpy(values, dtype):
+    # lists of Warp vector/matrix instances are converted through their raw buffers,
+    # which is much faster than letting NumPy iterate over every element
+    if len(values) and hasattr(dtype, "_wp_scalar_type_") and all(type(v) is dtype for v in values):
+        npdtype = wp.types.warp_type_to_np_dtype[dtype._wp_scalar_type_]
+        return np.frombuffer(b"".join(map(bytes, values)), dtype=npdtype).reshape(len(values), *dtype._shape_)
+    return values
+
+
 # Material properties pertaining to rigid shape contact dynamics
 @wp.struct
 class ModelShapeMaterials:
@@ -81,6 +117,8 @@ class ModelShapeMaterials:
     )  # The contact adhesion distance (values greater than 0 mean adhesive contact; only used by the Euler integrators)
     mu: wp.array(dtype=float)  # The coefficient of friction
     restitution: wp.array(dtype=float)  # The coefficient of restitution (only used by XPBD integrator)
+    env_count: int  # The number of environments sharing the materials of their shapes (0 if the model is not instanced)
+    env_shape_count: int  # The number of shapes per instanced environment
 
 
 # Shape properties of geometry
@@ -93,6 +131,17 @@ class ModelShapeGeometry:
     )  # The thickness of the shape (used for collision detection, and inertia computation of hollow shapes)
     source: wp.array(dtype=wp.uint64)  # Pointer to the source geometry (in case of a mesh, zero otherwise)
     scale: wp.array(dtype=wp.vec3)  # The 3D scale of the shape
+    env_count: int  # The number of environments sharing the geometry of their shapes (0 if the model is not instanced)
+    env_shape_count: int  # The number of shapes per instanced environment
+
+
+# Layout of the joint and body data shared by the environments of an instanced model
+@wp.struct
+class ModelInstancing:
+    env_count: int  # The number of instanced environments (0 if the model is not instanced)
+    env_body_count: int  # The number of bodies per instanced environment
+    env_joint_count: int  # The number of joints per instanced environment
+    env_joint_axis_count: int  # The number of joint axes per instanced environment
 
 
 # Axis (linear or angular) of a joint that can have bounds and be driven towards a target
@@ -484,6 +533,8 @@ class Model:
     Attributes:
         requires_grad (float): Indicates whether the model was finalized (see :meth:`ModelBuilder.finalize`) with gradient computation enabled
         num_envs (int): Number of articulation environments that were added to the ModelBuilder via `add_builder`
+        instanced (bool): Whether the environments share their static shape, joint and body data, see :attr:`ModelBuilder.instanced`
+        instancing (ModelInstancing): Layout of the joint and body data shared by the environments of an instanced model
 
         particle_q (array): Particle positions, shape [particle_count, 3], float
         particle_qd (array): Particle velocities, shape [particle_count, 3], float
@@ -515,7 +566,9 @@ class Model:
         shape_collision_radius (array): Collision radius of each shape used for bounding sphere broadphase collision checking, shape [shape_count], float
         shape_ground_collision (list): Indicates whether each shape should collide with the ground, shape [shape_count], bool
         shape_shape_collision (list): Indicates whether each shape should collide with any other shape, shape [shape_count], bool
-        shape_contact_pairs (array): Pairs of shape indices that may collide, shape [contact_pair_count, 2], int
+        shape_contact_pairs (array): Pairs of shape indices that may collide, shape [contact_pair_count, 2], int. With the ``"bvh"`` broadphase, the pairs found at the last call to :func:`warp.sim.collide`
+        shape_contact_pair_count (int): Number of pairs of shape indices that may collide, or the maximum number of pairs found at runtime with the ``"bvh"`` broadphase
+        shape_contact_pair_found (array): Number of pairs of shape indices found at runtime with the ``"bvh"`` broadphase, shape [1], int
         shape_ground_contact_pairs (array): Pairs of shape, ground indices that may collide, shape [ground_contact_pair_count, 2], int
 
         spring_indices (array): Particle spring indices, shape [spring_count*2], int
@@ -593,6 +646,8 @@ class Model:
 
         soft_contact_radius (float): Contact radius used for self-collisions in the VBD integrator.
         soft_contact_margin (float): Contact margin for generation of soft contacts
+        soft_contact_broadphase (str): Broadphase finding the shapes each particle may collide with, ``"explicit"`` to test all the pairs of particles and shapes, or ``"bvh"`` to query a :class:`warp.Bvh` of the shape bounds for each particle
+        soft_contact_shape_bvh (Bvh): BVH of the world-space bounds of the shapes, refit at every call to :func:`warp.sim.collide` when using the ``"bvh"`` soft contact broadphase
         soft_contact_ke (float): Stiffness of soft contacts (used by the Euler integrators)
         soft_contact_kd (float): Damping of soft contacts (used by the Euler integrators)
         soft_contact_kf (float): Stiffness of friction force in soft contacts (used by the Euler integrators)
@@ -610,6 +665,8 @@ class Model:
         rigid_contact_max_limited (int): Maximum number of potential rigid body contact points to generate respecting the `rigid_mesh_contact_max` limit.
         rigid_mesh_contact_max (int): Maximum number of rigid body contact points to generate per mesh (0 = unlimited, default)
         rigid_contact_margin (float): Contact margin for generation of rigid body contacts
+        rigid_broadphase (str): Broadphase finding the pairs of shapes that may collide, ``"explicit"`` to test all the pairs of shapes allowed by the collision groups and filters, or ``"bvh"`` to find the pairs whose bounds overlap at runtime using a :class:`warp.Bvh`
+        rigid_contact_pairs_per_shape (int): Expected maximum number of shapes each shape may collide with, used to allocate the pairs and contact points found by the ``"bvh"`` broadphase
         rigid_contact_torsional_friction (float): Torsional friction coefficient for rigid body contacts (used by :class:`XPBDIntegrator`)
         rigid_contact_rolling_friction (float): Rolling friction coefficient for rigid body contacts (used by :class:`XPBDIntegrator`)
 
@@ -656,6 +713,8 @@ class Model:
     def __init__(self, device=None):
         self.requires_grad = False
         self.num_envs = 0
+        self.instanced = False
+        self.instancing = ModelInstancing()
 
         self.particle_q = None
         self.particle_qd = None
@@ -688,8 +747,16 @@ class Model:
         self.shape_ground_collision = None
         self.shape_shape_collision = None
         self.shape_contact_pairs = None
+        self.shape_contact_pair_count = 0
+        self.shape_contact_pair_found = None
         self.shape_ground_contact_pairs = None
 
+        # runtime broadphase data, see find_shape_contact_pairs()
+        self.shape_broadphase_shapes = None
+        self.shape_broadphase_group = None
+        self.shape_broadphase_filter_pairs = None
+        self.shape_broadphase_bvh = None
+
         self.spring_indices = None
         self.spring_rest_length = None
         self.spring_stiffness = None
@@ -764,6 +831,8 @@ class Model:
 
         self.soft_contact_radius = 0.2
         self.soft_contact_margin = 0.2
+        self.soft_contact_broadphase = "explicit"
+        self.soft_contact_shape_bvh = None
         self.soft_contact_ke = 1.0e3
         self.soft_contact_kd = 10.0
         self.soft_contact_kf = 1.0e3
@@ -781,6 +850,8 @@ class Model:
         self.rigid_contact_max_limited = 0
         self.rigid_mesh_contact_max = 0
         self.rigid_contact_margin = None
+        self.rigid_broadphase = "explicit"
+        self.rigid_contact_pairs_per_shape = 16
         self.rigid_contact_torsional_friction = None
         self.rigid_contact_rolling_friction = None
 
@@ -899,7 +970,63 @@ class Model:
     def allocate_soft_contacts(self, count, requires_grad=False):
         self._allocate_soft_contacts(self, count, requires_grad)
 
+    def init_soft_contact_broadphase(self):
+        """
+        Builds the BVH of the shape bounds used by the ``"bvh"`` soft contact broadphase, which only tests
+        the particles against the shapes whose bounds overlap them in :func:`warp.sim.collide`.
+        The BVH is built from the shape bounds at the body configuration of the model and refit at every call.
+        """
+        from .collide import compute_soft_contact_shape_bounds
+
+        if self.soft_contact_broadphase not in ("explicit", "bvh"):
+            raise ValueError(
+                f"Unknown soft contact broadphase '{self.soft_contact_broadphase}', valid choices are 'explicit' or 'bvh'"
+            )
+
+        self.soft_contact_shape_bvh = None
+
+        # the last shape is the ground plane
+        if self.soft_contact_broadphase != "bvh" or self.shape_count < 2:
+            return
+
+        lower = wp.empty(self.shape_count - 1, dtype=wp.vec3, device=self.device)
+        upper = wp.empty(self.shape_count - 1, dtype=wp.vec3, device=self.device)
+        wp.launch(
+            kernel=compute_soft_contact_shape_bounds,
+            dim=self.shape_count - 1,
+            inputs=[
+                self.body_q,
+                self.shape_transform,
+                self.shape_body,
+                self.shape_geo,
+                self.shape_collision_radius,
+                self.soft_contact_margin + self.particle_max_radius,
+            ],
+            outputs=[lower, upper],
+            device=self.device,
+        )
+        self.soft_contact_shape_bvh = wp.Bvh(lower, upper)
+
     def find_shape_contact_pairs(self):
+        if self.rigid_broadphase == "bvh":
+            self.init_shape_broadphase()
+        elif self.rigid_broadphase != "explicit":
+            raise ValueError(
+                f"Unknown rigid broadphase '{self.rigid_broadphase}', valid choices are 'explicit' or 'bvh'"
+            )
+        else:
+            self.find_explicit_shape_contact_pairs()
+
+        # find ground contact pairs
+        ground_contact_pairs = []
+        ground_id = self.shape_count - 1
+        for i in range(ground_id):
+            if self.shape_ground_collision[i]:
+                ground_contact_pairs.append((i, ground_id))
+        self.shape_ground_contact_pairs = wp.array(np.array(ground_contact_pairs), dtype=wp.int32, device=self.device)
+        self.shape_ground_contact_pair_count = len(ground_contact_pairs)
+
+    def find_explicit_shape_contact_pairs(self):
         # find potential contact pairs based on collision groups and collision mask (pairwise filtering)
         import copy
         import itertools
@@ -924,14 +1051,72 @@ class Model:
                         contact_pairs.append((shape_a, shape_b))
         self.shape_contact_pairs = wp.array(np.array(contact_pairs), dtype=wp.int32, device=self.device)
         self.shape_contact_pair_count = len(contact_pairs)
-        # find ground contact pairs
-        ground_contact_pairs = []
-        ground_id = self.shape_count - 1
-        for i in range(ground_id):
-            if self.shape_ground_collision[i]:
-                ground_contact_pairs.append((i, ground_id))
-        self.shape_ground_contact_pairs = wp.array(np.array(ground_contact_pairs), dtype=wp.int32, device=self.device)
-        self.shape_ground_contact_pair_count = len(ground_contact_pairs)
+
+    def init_shape_broadphase(self):
+        """
+        Allocates the data of the ``"bvh"`` broadphase, which finds the pairs of shapes whose bounds overlap
+        in :func:`warp.sim.collide` instead of testing all the pairs allowed by the collision groups and filters.
+        The BVH is built from the shape bounds at the body configuration of the model and refit at every call.
+        """
+        from .collide import compute_shape_bounds
+
+        shapes = np.flatnonzero(np.array(self.shape_shape_collision, dtype=bool)).astype(np.int32)
+        groups = np.array(self.shape_collision_group, dtype=np.int32)
+
+        # pairs of shapes that should not collide, sorted by first and second shape index
+        filters = np.array(
+            sorted({(min(a, b), max(a, b)) for a, b in self.shape_collision_filter_pairs}), dtype=np.int32
+        ).reshape(-1, 2)
+
+        # number of pairs allowed by the collision groups, shapes of group -1 collide with all shapes
+        group_ids, group_sizes = np.unique(groups[shapes], return_counts=True)
+        global_count = int(group_sizes[group_ids == -1].sum())
+        local_sizes = group_sizes[group_ids != -1].astype(np.int64)
+        pair_count = (
+            int(np.sum(local_sizes * (local_sizes - 1) // 2 + local_sizes * global_count))
+            + global_count * (global_count - 1) // 2
+        )
+
+        self.shape_contact_pair_count = min(pair_count, (self.rigid_contact_pairs_per_shape * len(shapes) + 1) // 2)
+        self.shape_contact_pairs = wp.zeros(
+            (max(self.shape_contact_pair_count, 1), 2), dtype=wp.int32, device=self.device
+        )
+        self.shape_contact_pair_found = wp.zeros(1, dtype=wp.int32, device=self.device)
+
+        self.shape_broadphase_shapes = wp.array(shapes, dtype=wp.int32, device=self.device)
+        self.shape_broadphase_group = wp.array(groups, dtype=wp.int32, device=self.device)
+        self.shape_broadphase_filter_pairs = wp.array(filters, dtype=wp.int32, device=self.device)
+        self.shape_broadphase_bvh = None
+
+        if self.shape_contact_pair_count:
+            lower = wp.empty(len(shapes), dtype=wp.vec3, device=self.device)
+            upper = wp.empty(len(shapes), dtype=wp.vec3, device=self.device)
+            wp.launch(
+                kernel=compute_shape_bounds,
+                dim=len(shapes),
+                inputs=[
+                    self.shape_broadphase_shapes,
+                    self.body_q,
+                    self.shape_transform,
+                    self.shape_body,
+                    self.shape_collision_radius,
+                    self.shape_geo,
+                    self.rigid_contact_margin,
+                ],
+                outputs=[lower, upper],
+                device=self.device,
+                record_tape=False,
+            )
+            self.shape_broadphase_bvh = wp.Bvh(lower, upper)
+
+    def shape_geo_indices(self):
+        """
+        Returns the indices of the entries of :attr:`shape_geo`, :attr:`shape_materials` and :attr:`shape_geo_src`
+        describing each shape, which differ from the shape indices if the model is instanced.
+
+        :returns: The index of the geometry of each shape, shape [shape_count], int
+        """
+        return instance_indices(self.shape_count, self.shape_geo.env_shape_count, self.shape_geo.env_count)
 
     def count_contact_points(self):
         """
@@ -948,18 +1133,31 @@ class Model:
 
         # calculate the potential number of shape pair contact points
         contact_count = wp.zeros(2, dtype=wp.int32, device=self.device)
-        wp.launch(
-            kernel=count_contact_points,
-            dim=self.shape_contact_pair_count,
-            inputs=[
-                self.shape_contact_pairs,
-                self.shape_geo,
-                self.rigid_mesh_contact_max,
-            ],
-            outputs=[contact_count],
-            device=self.device,
-            record_tape=False,
-        )
+        if self.rigid_broadphase == "bvh":
+            # the pairs are found at runtime, estimate the number of contact points assuming that each shape
+            # collides with at most rigid_contact_pairs_per_shape other shapes
+            counts = np.zeros(2, dtype=np.int64)
+            shapes = self.shape_broadphase_shapes.numpy()
+            geo_types = self.shape_geo.type.numpy()
+            geo_indices = self.shape_geo_indices()
+            pairs_per_shape = min(self.rigid_contact_pairs_per_shape, max(len(shapes) - 1, 0))
+            for shape in shapes:
+                geo_index = geo_indices[shape]
+                counts += self._shape_contact_point_bound(geo_index, geo_types[geo_index]) * pairs_per_shape
+            contact_count.assign(np.minimum(counts, 2**31 - 1).astype(np.int32))
+        else:
+            wp.launch(
+                kernel=count_contact_points,
+                dim=self.shape_contact_pair_count,
+                inputs=[
+                    self.shape_contact_pairs,
+                    self.shape_geo,
+                    self.rigid_mesh_contact_max,
+                ],
+                outputs=[contact_count],
+                device=self.device,
+                record_tape=False,
+            )
         # count ground contacts
         wp.launch(
             kernel=count_contact_points,
@@ -978,6 +1176,22 @@ class Model:
         actual_count = int(counts[1])
         return potential_count, actual_count
 
+    def _shape_contact_point_bound(self, geo_index, geo_type):
+        # upper bound of the contact points a shape contributes to a pair in broadphase_collision_pairs,
+        # ignoring and respecting the rigid_mesh_contact_max limit
+        if geo_type == GEO_SPHERE:
+            return np.array((1, 1))
+        elif geo_type == GEO_CAPSULE:
+            return np.array((6, 6))
+        elif geo_type == GEO_BOX:
+            return np.array((12, 12))
+        elif geo_type == GEO_MESH:
+            num_points = len(self.shape_geo_src[geo_index].vertices)
+            if self.rigid_mesh_contact_max > 0:
+                return np.array((num_points, min(num_points, self.rigid_mesh_contact_max)))
+            return np.array((num_points, num_points))
+        return np.array((0, 0))
+
     def allocate_rigid_contacts(self, target=None, count=None, limited_contact_count=None, requires_grad=False):
         if count is not None:
             # potential number of contact points to consider
@@ -1279,6 +1493,10 @@ class ModelBuilder:
         # Maximum number of soft contacts that can be registered
         self.soft_contact_max = 64 * 1024
 
+        # broadphase finding the shapes each particle may collide with, "explicit" tests all the pairs of particles
+        # and shapes, "bvh" queries a BVH of the shape bounds refit at every call to collide()
+        self.soft_contact_broadphase = "explicit"
+
         # maximum number of contact points to generate per mesh shape
         self.rigid_mesh_contact_max = 0  # 0 = unlimited
 
@@ -1294,6 +1512,20 @@ class ModelBuilder:
         # if setting is None, the number of worst-case number of contacts will be calculated in self.finalize()
         self.num_rigid_contacts_per_env = None
 
+        # broadphase finding the pairs of shapes that may collide, "explicit" tests all the pairs of shapes allowed
+        # by the collision groups and filters, "bvh" finds the pairs whose bounds overlap at every call to collide()
+        self.rigid_broadphase = "explicit"
+        # expected maximum number of shapes each shape collides with when using the "bvh" broadphase,
+        # used to allocate the contact pairs and points
+        self.rigid_contact_pairs_per_shape = 16
+
+        # whether the environments added by add_builders() share their static shape, joint and body data in the
+        # finalized model instead of storing a copy per environment
+        self.instanced = False
+        # number of environments added by add_builders() before any other element, and their number of
+        # shapes, bodies, joints and joint axes
+        self._env_instances = None
+
     @property
     def shape_count(self):
         return len(self.shape_geo_type)
@@ -1359,107 +1591,224 @@ class ModelBuilder:
             update_num_env_count (bool): if True, the number of environments is incremented by 1.
             separate_collision_group (bool): if True, the shapes from the articulations in `builder` will all be put into a single new collision group, otherwise, only the shapes in collision group > -1 will be moved to a new group.
         """
+        self.add_builders(
+            builder,
+            num_copies=1,
+            xforms=None if xform is None else [xform],
+            update_num_env_count=update_num_env_count,
+            separate_collision_group=separate_collision_group,
+        )
+
+    def add_builders(
+        self, builder, num_copies=None, xforms=None, update_num_env_count=True, separate_collision_group=True
+    ):
+        """Copies the data from `builder`, another `ModelBuilder`, to this `ModelBuilder` several times,
+        e.g. to replicate an environment.
+
+        This is equivalent to calling :meth:`add_builder` once per copy, but the attributes of all copies are
+        computed at once by tiling the attributes of `builder` and offsetting their indices.
+
+        Args:
+            builder (ModelBuilder): a model builder to add model data from.
+            num_copies (int): the number of copies, defaults to the number of transforms in `xforms`.
+            xforms (list): offset transform applied to the root bodies of each copy, or None to not transform the copies.
+            update_num_env_count (bool): if True, the number of environments is incremented by the number of copies.
+            separate_collision_group (bool): if True, the shapes from the articulations of each copy will all be put into a single new collision group, otherwise, only the shapes in collision group > -1 will be moved to new groups.
+        """
+        if xforms is not None:
+            xforms = np.array(xforms, dtype=np.float64).reshape(-1, 7)
+            if num_copies is None:
+                num_copies = len(xforms)
+            elif num_copies != len(xforms):
+                raise ValueError(f"Expected {num_copies} transforms, got {len(xforms)}")
+        elif num_copies is None:
+            raise ValueError("Either the number of copies or the transforms of the copies must be given")
+
+        if num_copies == 0:
+            return
+
+        # keep track of the environments that may share their static data in an instanced model
+        env_counts = (builder.shape_count, builder.body_count, builder.joint_count, builder.joint_axis_total_count)
+        counts = (self.shape_count, self.body_count, self.joint_count, self.joint_axis_total_count)
+        if not any(counts):
+            self._env_instances = (num_copies, *env_counts)
+        elif (
+            self._env_instances is not None
+            and self._env_instances[1:] == env_counts
+            and all(count == self._env_instances[0] * n for count, n in zip(counts, env_counts))
+        ):
+            self._env_instances = (self._env_instances[0] + num_copies, *env_counts)
+
+        copies = np.arange(num_copies)
+
+        def transformed(transforms, mask=None):
+            # applies the copy transforms to the transforms selected by mask, returns the transforms of all copies
+            transforms = np.array(transforms, dtype=np.float64).reshape(-1, 7)
+            if mask is None:
+                mask = np.ones(len(transforms), dtype=bool)
+            result = np.broadcast_to(transforms, (num_copies, *transforms.shape)).copy()
+            if xforms is not None:
+                result[:, mask] = _transform_multiply_np(xforms[:, None], transforms[None, mask])
+            return result
+
+        def to_transforms(array, shared, mask):
+            # converts back to transform objects, the attributes that were not transformed are shared between copies
+            if xforms is None:
+                return list(shared) * num_copies
+            transforms = []
+            for k in range(num_copies):
+                transforms.extend(wp.transform(*array[k, i]) if mask[i] else shared[i] for i in range(len(shared)))
+            return transforms
+
+        def offset(indices, count, start, keep_negative=False):
+            # offsets the indices of each copy by the number of elements of the previous copies
+            indices = np.asarray(indices, dtype=np.int64)
+            offsets = (start + copies * count).reshape(-1, *([1] * indices.ndim))
+            result = indices[None] + offsets
+            if keep_negative:
+                result = np.where(indices[None] < 0, indices[None], result)
+            return result.reshape(-1, *indices.shape[1:]).tolist()
 
         start_particle_idx = self.particle_count
         if builder.particle_count:
             self.particle_max_velocity = builder.particle_max_velocity
-            if xform is not None:
-                pos_offset = wp.transform_get_translation(xform)
-            else:
-                pos_offset = np.zeros(3)
-            self.particle_q.extend((np.array(builder.particle_q) + pos_offset).tolist())
+            pos_offsets = np.zeros((num_copies, 1, 3))
+            if xforms is not None:
+                pos_offsets[:, 0] = xforms[:, :3]
+            particle_q = np.array(builder.particle_q, dtype=np.float64).reshape(-1, 3)
+            self.particle_q.extend((particle_q[None] + pos_offsets).reshape(-1, 3).tolist())
             # other particle attributes are added below
 
         if builder.spring_count:
-            self.spring_indices.extend((np.array(builder.spring_indices, dtype=np.int32) + start_particle_idx).tolist())
+            self.spring_indices.extend(offset(builder.spring_indices, builder.particle_count, start_particle_idx))
         if builder.edge_count:
-            self.edge_indices.extend((np.array(builder.edge_indices, dtype=np.int32) + start_particle_idx).tolist())
+            # edges on the boundary of a mesh have no opposite vertex
+            self.edge_indices.extend(
+                offset(
+                    np.array(builder.edge_indices).reshape(-1, 4),
+                    builder.particle_count,
+                    start_particle_idx,
+                    keep_negative=True,
+                )
+            )
         if builder.tri_count:
-            self.tri_indices.extend((np.array(builder.tri_indices, dtype=np.int32) + start_particle_idx).tolist())
+            self.tri_indices.extend(
+                offset(np.array(builder.tri_indices).reshape(-1, 3), builder.particle_count, start_particle_idx)
+            )
         if builder.tet_count:
-            self.tet_indices.extend((np.array(builder.tet_indices, dtype=np.int32) + start_particle_idx).tolist())
+            self.tet_indices.extend(
+                offset(np.array(builder.tet_indices).reshape(-1, 4), builder.particle_count, start_particle_idx)
+            )
 
-        builder_coloring_translated = [group + start_particle_idx for group in builder.particle_coloring]
-        self.particle_coloring = combine_independent_particle_coloring(
-            self.particle_coloring, builder_coloring_translated
-        )
+        for k in range(num_copies):
+            builder_coloring_translated = [
+                group + start_particle_idx + k * builder.particle_count for group in builder.particle_coloring
+            ]
+            self.particle_coloring = combine_independent_particle_coloring(
+                self.particle_coloring, builder_coloring_translated
+            )
 
         start_body_idx = self.body_count
         start_shape_idx = self.shape_count
-        for s, b in enumerate(builder.shape_body):
-            if b > -1:
-                new_b = b + start_body_idx
-                self.shape_body.append(new_b)
-                self.shape_transform.append(builder.shape_transform[s])
-            else:
-                self.shape_body.append(-1)
-                # apply offset transform to root bodies
-                if xform is not None:
-                    self.shape_transform.append(xform * builder.shape_transform[s])
-
-        for b, shapes in builder.body_shapes.items():
-            self.body_shapes[b + start_body_idx] = [s + start_shape_idx for s in shapes]
+        if builder.shape_count:
+            self.shape_body.extend(offset(builder.shape_body, builder.body_count, start_body_idx, keep_negative=True))
+
+            # apply offset transform to the static shapes
+            static_shapes = np.array(builder.shape_body) == -1
+            shape_transform = transformed(builder.shape_transform, static_shapes)
+            self.shape_transform.extend(to_transforms(shape_transform, builder.shape_transform, static_shapes))
+
+        for k in range(num_copies):
+            body_offset = start_body_idx + k * builder.body_count
+            shape_offset = start_shape_idx + k * builder.shape_count
+            for b, shapes in builder.body_shapes.items():
+                new_shapes = [s + shape_offset for s in shapes]
+                if b > -1:
+                    self.body_shapes[b + body_offset] = new_shapes
+                else:
+                    self.body_shapes.setdefault(-1, []).extend(new_shapes)
 
+        start_joint_idx = self.joint_count
         if builder.joint_count:
-            joint_X_p = copy.deepcopy(builder.joint_X_p)
-            joint_q = copy.deepcopy(builder.joint_q)
-            if xform is not None:
-                for i in range(len(joint_X_p)):
-                    if builder.joint_type[i] == wp.sim.JOINT_FREE:
-                        qi = builder.joint_q_start[i]
-                        xform_prev = wp.transform(joint_q[qi : qi + 3], joint_q[qi + 3 : qi + 7])
-                        tf = xform * xform_prev
-                        joint_q[qi : qi + 3] = tf.p
-                        joint_q[qi + 3 : qi + 7] = tf.q
-                    elif builder.joint_parent[i] == -1:
-                        joint_X_p[i] = xform * joint_X_p[i]
-            self.joint_X_p.extend(joint_X_p)
-            self.joint_q.extend(joint_q)
+            joint_type = np.array(builder.joint_type)
+            joint_parent = np.array(builder.joint_parent)
+
+            # apply offset transform to the root joints
+            free_joints = joint_type == wp.sim.JOINT_FREE
+            root_joints = (joint_parent == -1) & ~free_joints
+            joint_X_p = transformed(builder.joint_X_p, root_joints)
+            self.joint_X_p.extend(to_transforms(joint_X_p, builder.joint_X_p, root_joints))
+
+            # apply offset transform to the coordinates of the free joints
+            joint_q = np.broadcast_to(
+                np.array(builder.joint_q, dtype=np.float64), (num_copies, builder.joint_coord_count)
+            )
+            if xforms is not None and np.any(free_joints):
+                joint_q = joint_q.copy()
+                q_start = np.array(builder.joint_q_start)[free_joints]
+                coords = q_start[:, None] + np.arange(7)
+                joint_q[:, coords] = transformed(joint_q[0, coords])
+            self.joint_q.extend(joint_q.reshape(-1).tolist())
 
             # offset the indices
-            self.articulation_start.extend([a + self.joint_count for a in builder.articulation_start])
-            self.joint_parent.extend([p + self.joint_count if p != -1 else -1 for p in builder.joint_parent])
-            self.joint_child.extend([c + self.joint_count for c in builder.joint_child])
+            self.articulation_start.extend(offset(builder.articulation_start, builder.joint_count, start_joint_idx))
+            self.joint_parent.extend(
+                offset(builder.joint_parent, builder.body_count, start_body_idx, keep_negative=True)
+            )
+            self.joint_child.extend(offset(builder.joint_child, builder.body_count, start_body_idx))
 
-            self.joint_q_start.extend([c + self.joint_coord_count for c in builder.joint_q_start])
-            self.joint_qd_start.extend([c + self.joint_dof_count for c in builder.joint_qd_start])
+            self.joint_q_start.extend(offset(builder.joint_q_start, builder.joint_coord_count, self.joint_coord_count))
+            self.joint_qd_start.extend(offset(builder.joint_qd_start, builder.joint_dof_count, self.joint_dof_count))
 
-            self.joint_axis_start.extend([a + self.joint_axis_total_count for a in builder.joint_axis_start])
+            self.joint_axis_start.extend(
+                offset(builder.joint_axis_start, builder.joint_axis_total_count, self.joint_axis_total_count)
+            )
 
-        joint_children = set(builder.joint_child)
-        for i in range(builder.body_count):
-            if xform is not None and i not in joint_children:
-                # rigid body is not attached to a joint, so apply input transform directly
-                self.body_q.append(xform * builder.body_q[i])
-            else:
-                self.body_q.append(builder.body_q[i])
+        if builder.body_count:
+            # rigid bodies that are not attached to a joint are transformed directly
+            free_bodies = np.ones(builder.body_count, dtype=bool)
+            free_bodies[np.array(builder.joint_child, dtype=int)] = False
+            body_q = transformed(builder.body_q, free_bodies)
+            self.body_q.extend(to_transforms(body_q, builder.body_q, free_bodies))
 
         # apply collision group
-        if separate_collision_group:
-            self.shape_collision_group.extend([self.last_collision_group + 1 for _ in builder.shape_collision_group])
-        else:
-            self.shape_collision_group.extend(
-                [(g + self.last_collision_group if g > -1 else -1) for g in builder.shape_collision_group]
-            )
-        shape_count = self.shape_count
-        for i, j in builder.shape_collision_filter_pairs:
-            self.shape_collision_filter_pairs.add((i + shape_count, j + shape_count))
-        for group, shapes in builder.shape_collision_group_map.items():
+        builder_group_count = max(builder.last_collision_group, 0)
+        for k in range(num_copies):
             if separate_collision_group:
-                extend_group = self.last_collision_group + 1
+                group_offset = self.last_collision_group + 1 + k
             else:
-                extend_group = group + self.last_collision_group if group > -1 else -1
+                group_offset = self.last_collision_group + k * builder_group_count
+            shape_offset = start_shape_idx + k * builder.shape_count
+
+            if separate_collision_group:
+                self.shape_collision_group.extend([group_offset] * builder.shape_count)
+            else:
+                self.shape_collision_group.extend(
+                    [(g + group_offset if g > -1 else -1) for g in builder.shape_collision_group]
+                )
 
-            if extend_group not in self.shape_collision_group_map:
-                self.shape_collision_group_map[extend_group] = []
+            for group, shapes in builder.shape_collision_group_map.items():
+                if separate_collision_group:
+                    extend_group = group_offset
+                else:
+                    extend_group = group + group_offset if group > -1 else -1
+
+                if extend_group not in self.shape_collision_group_map:
+                    self.shape_collision_group_map[extend_group] = []
 
-            self.shape_collision_group_map[extend_group].extend([s + shape_count for s in shapes])
+                self.shape_collision_group_map[extend_group].extend([s + shape_offset for s in shapes])
+
+        if builder.shape_collision_filter_pairs:
+            filter_pairs = np.array(sorted(builder.shape_collision_filter_pairs)).reshape(-1, 2)
+            self.shape_collision_filter_pairs.update(
+                map(tuple, offset(filter_pairs, builder.shape_count, start_shape_idx))
+            )
 
         # update last collision group counter
         if separate_collision_group:
-            self.last_collision_group += 1
+            self.last_collision_group += num_copies
         elif builder.last_collision_group > -1:
-            self.last_collision_group += builder.last_collision_group
+            self.last_collision_group += num_copies * builder.last_collision_group
 
         more_builder_attrs = [
             "body_inertia",
@@ -1522,18 +1871,18 @@ class ModelBuilder:
         ]
 
         for attr in more_builder_attrs:
-            getattr(self, attr).extend(getattr(builder, attr))
+            getattr(self, attr).extend(getattr(builder, attr) * num_copies)
 
-        self.joint_dof_count += builder.joint_dof_count
-        self.joint_coord_count += builder.joint_coord_count
-        self.joint_axis_total_count += builder.joint_axis_total_count
+        self.joint_dof_count += num_copies * builder.joint_dof_count
+        self.joint_coord_count += num_copies * builder.joint_coord_count
+        self.joint_axis_total_count += num_copies * builder.joint_axis_total_count
 
         self.up_vector = builder.up_vector
         self.gravity = builder.gravity
         self._ground_params = builder._ground_params
 
         if update_num_env_count:
-            self.num_envs += 1
+            self.num_envs += num_copies
 
     # register a rigid body and return its index.
     def add_body(
@@ -1597,6 +1946,63 @@ class ModelBuilder:
         self.body_shapes[body_id] = []
         return body_id
 
+    def add_bodies(
+        self,
+        origins: List[Transform],
+        armature: List[float] = 0.0,
+        com: Optional[List[Vec3]] = None,
+        I_m: Optional[List[Mat33]] = None,
+        m: List[float] = 0.0,
+        names: Optional[List[str]] = None,
+    ) -> int:
+        """Adds a batch of rigid bodies to the model.
+
+        This is equivalent to calling :meth:`add_body` for each body, but computes the inverse masses and inertias
+        of all the bodies at once.
+
+        Args:
+            origins: The locations of the bodies in the world frame, as an array of shape (N, 7)
+            armature: Artificial inertia added to the bodies, either a scalar or an array of shape (N,)
+            com: The centers of mass of the bodies w.r.t their origins, as an array of shape (N, 3)
+            I_m: The 3x3 inertia tensors of the bodies (specified relative to the centers of mass), as an array of shape (N, 3, 3)
+            m: Masses of the bodies, either a scalar or an array of shape (N,)
+            names: Names of the bodies (optional)
+
+        Returns:
+            The index of the first added body in the model
+        """
+
+        origins = np.asarray(origins, dtype=np.float32).reshape(-1, 7)
+        count = len(origins)
+        com = np.broadcast_to(np.zeros(3) if com is None else np.asarray(com, dtype=np.float32), (count, 3))
+        I_m = np.broadcast_to(np.zeros((3, 3)) if I_m is None else np.asarray(I_m, dtype=np.float32), (count, 3, 3))
+        armature = np.broadcast_to(np.asarray(armature, dtype=np.float32), count)
+        m = np.broadcast_to(np.asarray(m, dtype=np.float32), count)
+
+        inertia = (I_m + armature[:, None, None] * np.eye(3)).astype(np.float32)
+        inv_mass = np.divide(1.0, m, out=np.zeros_like(m), where=m > 0.0)
+        # zero and singular inertia tensors have a zero inverse, as with wp.inverse()
+        inv_inertia = np.zeros_like(inertia)
+        invertible = np.linalg.det(inertia) != 0.0
+        inv_inertia[invertible] = np.linalg.inv(inertia[invertible])
+
+        start = len(self.body_mass)
+
+        self.body_inertia.extend(wp.mat33(*I) for I in inertia.reshape(-1, 9).tolist())
+        self.body_mass.extend(m.tolist())
+        self.body_com.extend(wp.vec3(*c) for c in com.tolist())
+        self.body_inv_mass.extend(inv_mass.tolist())
+        self.body_inv_inertia.extend(wp.mat33(*I) for I in inv_inertia.reshape(-1, 9).tolist())
+        self.body_q.extend(wp.transform(*q) for q in origins.tolist())
+        self.body_qd.extend(wp.spatial_vector() for _ in range(count))
+
+        for i in range(count):
+            body_id = start + i
+            self.body_name.append(names[i] if names is not None and names[i] else f"body {body_id}")
+            self.body_shapes[body_id] = []
+
+        return start
+
     def add_joint(
         self,
         joint_type: wp.constant,
@@ -3476,6 +3882,47 @@ class ModelBuilder:
 
         return particle_id
 
+    def add_particles(
+        self,
+        pos: List[Vec3],
+        vel: List[Vec3],
+        mass: List[float],
+        radius: List[float] = None,
+        flags: List[int] = None,
+    ) -> int:
+        """Adds a batch of particles to the model
+
+        This is equivalent to calling :meth:`add_particle` for each particle, but avoids the per-particle overhead
+        when building large systems.
+
+        Args:
+            pos: The initial positions of the particles, as an array of shape (N, 3)
+            vel: The initial velocities of the particles, as an array of shape (N, 3)
+            mass: The masses of the particles, either a scalar or an array of shape (N,)
+            radius: The radii of the particles used in collision handling, either a scalar or an array of shape (N,). If None, the radius is set to the default value (:attr:`default_particle_radius`).
+            flags: The flags that control the dynamical behavior of the particles, either a scalar or an array of shape (N,). If None, the particles are active.
+
+        Returns:
+            The index of the first added particle in the system
+        """
+        pos = np.asarray(pos, dtype=np.float32).reshape(-1, 3)
+        count = len(pos)
+        vel = np.broadcast_to(np.asarray(vel, dtype=np.float32), (count, 3))
+        if radius is None:
+            radius = self.default_particle_radius
+        if flags is None:
+            flags = PARTICLE_FLAG_ACTIVE
+
+        start = self.particle_count
+
+        self.particle_q.extend(wp.vec3(*p) for p in pos.tolist())
+        self.particle_qd.extend(wp.vec3(*v) for v in vel.tolist())
+        self.particle_mass.extend(np.broadcast_to(np.asarray(mass, dtype=np.float64), count).tolist())
+        self.particle_radius.extend(np.broadcast_to(np.asarray(radius, dtype=np.float64), count).tolist())
+        self.particle_flags.extend(np.broadcast_to(np.asarray(flags, dtype=np.uint32), count).tolist())
+
+        return start
+
     def add_spring(self, i: int, j, ke: float, kd: float, control: float):
         """Adds a spring between two particles in the system
 
@@ -4489,6 +4936,52 @@ class ModelBuilder:
             target_max_min_color_ratio=target_max_min_color_ratio,
         )
 
+    def _check_env_instances(self):
+        # verifies that the environments share their static data, returns the number of environments and their
+        # number of shapes, bodies, joints and joint axes
+        if self._env_instances is None:
+            raise ValueError(
+                "An instanced model requires the environments to be added by add_builders() or add_builder() "
+                "before any other shape, body or joint"
+            )
+        env_count, *env_counts = self._env_instances
+        shape_count, body_count, joint_count, axis_count = env_counts
+        attributes = (
+            ("shape_geo_type", shape_count, None),
+            ("shape_geo_scale", shape_count, None),
+            ("shape_geo_is_solid", shape_count, None),
+            ("shape_geo_thickness", shape_count, None),
+            ("shape_material_ke", shape_count, None),
+            ("shape_material_kd", shape_count, None),
+            ("shape_material_kf", shape_count, None),
+            ("shape_material_ka", shape_count, None),
+            ("shape_material_mu", shape_count, None),
+            ("shape_material_restitution", shape_count, None),
+            ("body_inertia", body_count, wp.mat33),
+            ("body_inv_inertia", body_count, wp.mat33),
+            ("joint_type", joint_count, None),
+            ("joint_X_c", joint_count, wp.transform),
+            ("joint_axis_dim", joint_count, None),
+            ("joint_axis", axis_count, wp.vec3),
+        )
+        for name, count, dtype in attributes:
+            values = getattr(self, name)[: env_count * count]
+            if len(values) == env_count * count and count > 0:
+                if dtype is not None:
+                    values = _values_to_numpy(values, dtype)
+                values = np.asarray(values).reshape(env_count, count, -1)
+                if np.all(values == values[0]):
+                    continue
+            elif count == 0:
+                continue
+            raise ValueError(f"The environments of an instanced model must have the same '{name}'")
+
+        sources = self.shape_geo_src
+        if any(sources[i] is not sources[i % shape_count] for i in range(shape_count, env_count * shape_count)):
+            raise ValueError("The environments of an instanced model must have the same 'shape_geo_src'")
+
+        return env_count, shape_count, body_count, joint_count, axis_count
+
     def finalize(self, device=None, requires_grad=False) -> Model:
         """Convert this builder object to a concrete model for simulation.
 
@@ -4511,6 +5004,17 @@ class ModelBuilder:
         if not self._ground_created:
             self._create_ground_plane()
 
+        if self.instanced:
+            env_count, env_shape_count, env_body_count, env_joint_count, env_axis_count = self._check_env_instances()
+        else:
+            env_count, env_shape_count, env_body_count, env_joint_count, env_axis_count = 0, 0, 0, 0, 0
+
+        def static_data(values, env_element_count):
+            # the data of the instanced environments is stored once, followed by the data of the other elements
+            if not self.instanced:
+                return values
+            return values[:env_element_count] + values[env_count * env_element_count :]
+
         # construct particle inv masses
         ms = np.array(self.particle_mass, dtype=np.float32)
         # static particles (with zero mass) have zero inverse mass
@@ -4526,13 +5030,22 @@ class ModelBuilder:
             m.ground_plane_params = self._ground_params["plane"]
 
             m.num_envs = self.num_envs
+            m.instanced = self.instanced
+            m.instancing.env_count = env_count
+            m.instancing.env_body_count = env_body_count
+            m.instancing.env_joint_count = env_joint_count
+            m.instancing.env_joint_axis_count = env_axis_count
 
             # ---------------------
             # particles
 
             # state (initial)
-            m.particle_q = wp.array(self.particle_q, dtype=wp.vec3, requires_grad=requires_grad)
-            m.particle_qd = wp.array(self.particle_qd, dtype=wp.vec3, requires_grad=requires_grad)
+            m.particle_q = wp.array(
+                _values_to_numpy(self.particle_q, wp.vec3), dtype=wp.vec3, requires_grad=requires_grad
+            )
+            m.particle_qd = wp.array(
+                _values_to_numpy(self.particle_qd, wp.vec3), dtype=wp.vec3, requires_grad=requires_grad
+            )
             m.particle_mass = wp.array(self.particle_mass, dtype=wp.float32, requires_grad=requires_grad)
             m.particle_inv_mass = wp.array(particle_inv_mass, dtype=wp.float32, requires_grad=requires_grad)
             m.particle_radius = wp.array(self.particle_radius, dtype=wp.float32, requires_grad=requires_grad)
@@ -4548,7 +5061,9 @@ class ModelBuilder:
             # ---------------------
             # collision geometry
 
-            m.shape_transform = wp.array(self.shape_transform, dtype=wp.transform, requires_grad=requires_grad)
+            m.shape_transform = wp.array(
+                _values_to_numpy(self.shape_transform, wp.transform), dtype=wp.transform, requires_grad=requires_grad
+            )
             m.shape_body = wp.array(self.shape_body, dtype=wp.int32)
             m.shape_visible = wp.array(self.shape_visible, dtype=wp.bool)
             m.body_shapes = self.body_shapes
@@ -4556,7 +5071,8 @@ class ModelBuilder:
             # build list of ids for geometry sources (meshes, sdfs)
             geo_sources = []
             finalized_meshes = {}  # do not duplicate meshes
-            for geo in self.shape_geo_src:
+            shape_geo_src = static_data(self.shape_geo_src, env_shape_count)
+            for geo in shape_geo_src:
                 geo_hash = hash(geo)  # avoid repeated hash computations
                 if geo:
                     if geo_hash not in finalized_meshes:
@@ -4566,24 +5082,44 @@ class ModelBuilder:
                     # add null pointer
                     geo_sources.append(0)
 
-            m.shape_geo.type = wp.array(self.shape_geo_type, dtype=wp.int32)
+            m.shape_geo.type = wp.array(static_data(self.shape_geo_type, env_shape_count), dtype=wp.int32)
             m.shape_geo.source = wp.array(geo_sources, dtype=wp.uint64)
-            m.shape_geo.scale = wp.array(self.shape_geo_scale, dtype=wp.vec3, requires_grad=requires_grad)
-            m.shape_geo.is_solid = wp.array(self.shape_geo_is_solid, dtype=wp.uint8)
-            m.shape_geo.thickness = wp.array(self.shape_geo_thickness, dtype=wp.float32, requires_grad=requires_grad)
-            m.shape_geo_src = self.shape_geo_src  # used for rendering
+            m.shape_geo.scale = wp.array(
+                static_data(self.shape_geo_scale, env_shape_count), dtype=wp.vec3, requires_grad=requires_grad
+            )
+            m.shape_geo.is_solid = wp.array(static_data(self.shape_geo_is_solid, env_shape_count), dtype=wp.uint8)
+            m.shape_geo.thickness = wp.array(
+                static_data(self.shape_geo_thickness, env_shape_count), dtype=wp.float32, requires_grad=requires_grad
+            )
+            m.shape_geo.env_count = env_count
+            m.shape_geo.env_shape_count = env_shape_count
+            m.shape_geo_src = shape_geo_src  # used for rendering
             # store refs to geometry
             m.geo_meshes = self.geo_meshes
             m.geo_sdfs = self.geo_sdfs
 
-            m.shape_materials.ke = wp.array(self.shape_material_ke, dtype=wp.float32, requires_grad=requires_grad)
-            m.shape_materials.kd = wp.array(self.shape_material_kd, dtype=wp.float32, requires_grad=requires_grad)
-            m.shape_materials.kf = wp.array(self.shape_material_kf, dtype=wp.float32, requires_grad=requires_grad)
-            m.shape_materials.ka = wp.array(self.shape_material_ka, dtype=wp.float32, requires_grad=requires_grad)
-            m.shape_materials.mu = wp.array(self.shape_material_mu, dtype=wp.float32, requires_grad=requires_grad)
+            m.shape_materials.ke = wp.array(
+                static_data(self.shape_material_ke, env_shape_count), dtype=wp.float32, requires_grad=requires_grad
+            )
+            m.shape_materials.kd = wp.array(
+                static_data(self.shape_material_kd, env_shape_count), dtype=wp.float32, requires_grad=requires_grad
+            )
+            m.shape_materials.kf = wp.array(
+                static_data(self.shape_material_kf, env_shape_count), dtype=wp.float32, requires_grad=requires_grad
+            )
+            m.shape_materials.ka = wp.array(
+                static_data(self.shape_material_ka, env_shape_count), dtype=wp.float32, requires_grad=requires_grad
+            )
+            m.shape_materials.mu = wp.array(
+                static_data(self.shape_material_mu, env_shape_count), dtype=wp.float32, requires_grad=requires_grad
+            )
             m.shape_materials.restitution = wp.array(
-                self.shape_material_restitution, dtype=wp.float32, requires_grad=requires_grad
+                static_data(self.shape_material_restitution, env_shape_count),
+                dtype=wp.float32,
+                requires_grad=requires_grad,
             )
+            m.shape_materials.env_count = env_count
+            m.shape_materials.env_shape_count = env_shape_count
 
             m.shape_collision_filter_pairs = self.shape_collision_filter_pairs
             m.shape_collision_group = self.shape_collision_group
@@ -4607,7 +5143,9 @@ class ModelBuilder:
             # triangles
 
             m.tri_indices = wp.array(self.tri_indices, dtype=wp.int32)
-            m.tri_poses = wp.array(self.tri_poses, dtype=wp.mat22, requires_grad=requires_grad)
+            m.tri_poses = wp.array(
+                _values_to_numpy(self.tri_poses, wp.mat22), dtype=wp.mat22, requires_grad=requires_grad
+            )
             m.tri_activations = wp.array(self.tri_activations, dtype=wp.float32, requires_grad=requires_grad)
             m.tri_materials = wp.array(self.tri_materials, dtype=wp.float32, requires_grad=requires_grad)
             m.tri_areas = wp.array(self.tri_areas, dtype=wp.float32, requires_grad=requires_grad)
@@ -4625,7 +5163,9 @@ class ModelBuilder:
             # tetrahedra
 
             m.tet_indices = wp.array(self.tet_indices, dtype=wp.int32)
-            m.tet_poses = wp.array(self.tet_poses, dtype=wp.mat33, requires_grad=requires_grad)
+            m.tet_poses = wp.array(
+                _values_to_numpy(self.tet_poses, wp.mat33), dtype=wp.mat33, requires_grad=requires_grad
+            )
             m.tet_activations = wp.array(self.tet_activations, dtype=wp.float32, requires_grad=requires_grad)
             m.tet_materials = wp.array(self.tet_materials, dtype=wp.float32, requires_grad=requires_grad)
 
@@ -4645,24 +5185,48 @@ class ModelBuilder:
             # --------------------------------------
             # rigid bodies
 
-            m.body_q = wp.array(self.body_q, dtype=wp.transform, requires_grad=requires_grad)
-            m.body_qd = wp.array(self.body_qd, dtype=wp.spatial_vector, requires_grad=requires_grad)
-            m.body_inertia = wp.array(self.body_inertia, dtype=wp.mat33, requires_grad=requires_grad)
-            m.body_inv_inertia = wp.array(self.body_inv_inertia, dtype=wp.mat33, requires_grad=requires_grad)
+            m.body_q = wp.array(
+                _values_to_numpy(self.body_q, wp.transform), dtype=wp.transform, requires_grad=requires_grad
+            )
+            m.body_qd = wp.array(
+                _values_to_numpy(self.body_qd, wp.spatial_vector), dtype=wp.spatial_vector, requires_grad=requires_grad
+            )
+            m.body_inertia = wp.array(
+                _values_to_numpy(static_data(self.body_inertia, env_body_count), wp.mat33),
+                dtype=wp.mat33,
+                requires_grad=requires_grad,
+            )
+            m.body_inv_inertia = wp.array(
+                _values_to_numpy(static_data(self.body_inv_inertia, env_body_count), wp.mat33),
+                dtype=wp.mat33,
+                requires_grad=requires_grad,
+            )
             m.body_mass = wp.array(self.body_mass, dtype=wp.float32, requires_grad=requires_grad)
             m.body_inv_mass = wp.array(self.body_inv_mass, dtype=wp.float32, requires_grad=requires_grad)
-            m.body_com = wp.array(self.body_com, dtype=wp.vec3, requires_grad=requires_grad)
+            m.body_com = wp.array(_values_to_numpy(self.body_com, wp.vec3), dtype=wp.vec3, requires_grad=requires_grad)
             m.body_name = self.body_name
 
             # joints
-            m.joint_type = wp.array(self.joint_type, dtype=wp.int32)
+            m.joint_type = wp.array(static_data(self.joint_type, env_joint_count), dtype=wp.int32)
             m.joint_parent = wp.array(self.joint_parent, dtype=wp.int32)
             m.joint_child = wp.array(self.joint_child, dtype=wp.int32)
-            m.joint_X_p = wp.array(self.joint_X_p, dtype=wp.transform, requires_grad=requires_grad)
-            m.joint_X_c = wp.array(self.joint_X_c, dtype=wp.transform, requires_grad=requires_grad)
+            m.joint_X_p = wp.array(
+                _values_to_numpy(self.joint_X_p, wp.transform), dtype=wp.transform, requires_grad=requires_grad
+            )
+            m.joint_X_c = wp.array(
+                _values_to_numpy(static_data(self.joint_X_c, env_joint_count), wp.transform),
+                dtype=wp.transform,
+                requires_grad=requires_grad,
+            )
             m.joint_axis_start = wp.array(self.joint_axis_start, dtype=wp.int32)
-            m.joint_axis_dim = wp.array(np.array(self.joint_axis_dim), dtype=wp.int32, ndim=2)
-            m.joint_axis = wp.array(self.joint_axis, dtype=wp.vec3, requires_grad=requires_grad)
+            m.joint_axis_dim = wp.array(
+                np.array(static_data(self.joint_axis_dim, env_joint_count)), dtype=wp.int32, ndim=2
+            )
+            m.joint_axis = wp.array(
+                _values_to_numpy(static_data(self.joint_axis, env_axis_count), wp.vec3),
+                dtype=wp.vec3,
+                requires_grad=requires_grad,
+            )
             m.joint_q = wp.array(self.joint_q, dtype=wp.float32, requires_grad=requires_grad)
             m.joint_qd = wp.array(self.joint_qd, dtype=wp.float32, requires_grad=requires_grad)
             m.joint_name = self.joint_name
@@ -4724,6 +5288,11 @@ class ModelBuilder:
             # contacts
             if m.particle_count:
                 m.allocate_soft_contacts(self.soft_contact_max, requires_grad=requires_grad)
+                m.soft_contact_broadphase = self.soft_contact_broadphase
+                m.init_soft_contact_broadphase()
+            m.rigid_broadphase = self.rigid_broadphase
+            m.rigid_contact_pairs_per_shape = self.rigid_contact_pairs_per_shape
+            m.rigid_contact_margin = self.rigid_contact_margin
             m.find_shape_contact_pairs()
             if self.num_rigid_contacts_per_env is None:
                 contact_count, limited_contact_count = m.count_contact_points()
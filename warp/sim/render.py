@@ -13,6 +13,7 @@ import warp as wp
 import warp.render
 import warp.sim
 from warp.render.utils import solidify_mesh, tab10_color_map
+from warp.sim.utils import instance_indices
 
 # TODO allow NaNs in Warp kernels
 NAN = wp.constant(-1.0e8)
@@ -125,11 +126,13 @@ def CreateSimRenderer(renderer):
                 self.body_shapes = defaultdict(list)  # mapping from body index to its shape IDs
 
                 shape_body = model.shape_body.numpy()
-                shape_geo_src = model.shape_geo_src
-                shape_geo_type = model.shape_geo.type.numpy()
-                shape_geo_scale = model.shape_geo.scale.numpy()
-                shape_geo_thickness = model.shape_geo.thickness.numpy()
-                shape_geo_is_solid = model.shape_geo.is_solid.numpy()
+                # expand the geometry shared between instanced environments to one entry per shape
+                geo_indices = model.shape_geo_indices()
+                shape_geo_src = [model.shape_geo_src[i] for i in geo_indices]
+                shape_geo_type = model.shape_geo.type.numpy()[geo_indices]
+                shape_geo_scale = model.shape_geo.scale.numpy()[geo_indices]
+                shape_geo_thickness = model.shape_geo.thickness.numpy()[geo_indices]
+                shape_geo_is_solid = model.shape_geo.is_solid.numpy()[geo_indices]
                 shape_transform = model.shape_transform.numpy()
                 shape_visible = model.shape_visible.numpy()
 
@@ -231,10 +234,18 @@ def CreateSimRenderer(renderer):
                     self.instance_count += 1
 
                 if self.show_joints and model.joint_count:
-                    joint_type = model.joint_type.numpy()
-                    joint_axis = model.joint_axis.numpy()
+                    # expand the joint data shared between instanced environments to one entry per joint
+                    instancing = model.instancing
+                    joint_indices = instance_indices(
+                        model.joint_count, instancing.env_joint_count, instancing.env_count
+                    )
+                    axis_indices = instance_indices(
+                        model.joint_axis_count, instancing.env_joint_axis_count, instancing.env_count
+                    )
+                    joint_type = model.joint_type.numpy()[joint_indices]
+                    joint_axis = model.joint_axis.numpy()[axis_indices]
                     joint_axis_start = model.joint_axis_start.numpy()
-                    joint_axis_dim = model.joint_axis_dim.numpy()
+                    joint_axis_dim = model.joint_axis_dim.numpy()[joint_indices]
                     joint_parent = model.joint_parent.numpy()
                     joint_child = model.joint_child.numpy()
                     joint_tf = model.joint_X_p.numpy()
@@ -242,6 +242,39 @@ def transform_inertia(t: wp.transform, I: wp.spatial_matrix):
     return wp.mul(wp.mul(wp.transpose(T), I), T)
 
 
+@wp.func
+def instance_index(index: int, env_element_count: int, env_count: int):
+    """
+    Returns the index of the static data of an element in an instanced model.
+
+    The data of the elements of the ``env_count`` instanced environments is stored once, followed by the
+    data of the elements added after these environments.
+
+    Args:
+        index (int): The index of the element in the model.
+        env_element_count (int): The number of elements per instanced environment, zero if the model is not instanced.
+        env_count (int): The number of instanced environments, zero if the model is not instanced.
+
+    Returns:
+        int: The index of the static data of the element.
+    """
+    instanced_count = env_element_count * env_count
+    if index < instanced_count:
+        return index % env_element_count
+    return index - instanced_count + env_element_count
+
+
+def instance_indices(count: int, env_element_count: int, env_count: int) -> np.ndarray:
+    """
+    Returns the indices of the static data of the ``count`` elements of an instanced model, see :func:`instance_index`.
+    """
+    indices = np.arange(count)
+    instanced_count = env_element_count * env_count
+    return np.where(
+        indices < instanced_count, indices % max(env_element_count, 1), indices - instanced_count + env_element_count
+    )
+
+
 @wp.func
 def boltzmann(a: float, b: float, alpha: float):
     e1 = wp.exp(alpha * a)
@@ -343,6 +343,7 @@ def bsr_set_from_triplets(
     from warp.context import runtime
 
     if device.is_cpu:
+        runtime.begin_host_operation(device, "wp.sparse.bsr_set_from_triplets()")
         if scalar_type == wp.float32:
             native_func = runtime.core.bsr_matrix_from_triplets_float_host
         elif scalar_type == wp.float64:
@@ -748,6 +749,7 @@ def bsr_assign(
         from warp.context import runtime
 
         if dest.device.is_cpu:
+            runtime.begin_host_operation(dest.device, "wp.sparse.bsr_assign()")
             native_func = runtime.core.bsr_matrix_from_triplets_float_host
         else:
             native_func = runtime.core.bsr_matrix_from_triplets_float_device
@@ -865,6 +867,7 @@ def bsr_set_transpose(
     from warp.context import runtime
 
     if dest.values.device.is_cpu:
+        runtime.begin_host_operation(dest.values.device, "wp.sparse.bsr_set_transpose()")
         if dest.scalar_type == wp.float32:
             native_func = runtime.core.bsr_transpose_float_host
         elif dest.scalar_type == wp.float64:
@@ -1338,6 +1341,7 @@ def bsr_axpy(
     from warp.context import runtime
 
     if device.is_cpu:
+        runtime.begin_host_operation(device, "wp.sparse.bsr_axpy()")
         native_func = runtime.core.bsr_matrix_from_triplets_float_host
     else:
         native_func = runtime.core.bsr_matrix_from_triplets_float_device
@@ -1689,6 +1693,7 @@ def bsr_mm(
     from warp.context import runtime
 
     if device.is_cpu:
+        runtime.begin_host_operation(device, "wp.sparse.bsr_mm()")
         native_func = runtime.core.bsr_matrix_from_triplets_float_host
     else:
         native_func = runtime.core.bsr_matrix_from_triplets_float_device
@@ -90,7 +90,16 @@ from warp.utils import ScopedTimer, ScopedDevice, ScopedStream
 from warp.utils import ScopedMempool, ScopedMempoolAccess, ScopedPeerAccess
 from warp.utils import ScopedCapture
 from warp.utils import transform_expand, quat_between_vectors
-from warp.utils import TimingResult, timing_begin, timing_end, timing_print
+from warp.utils import (
+    RooflineResult,
+    TimingResult,
+    timing_begin,
+    timing_end,
+    timing_export_trace,
+    timing_print,
+    timing_print_roofline,
+    timing_roofline,
+)
 from warp.utils import (
     TIMING_KERNEL,
     TIMING_KERNEL_BUILTIN,
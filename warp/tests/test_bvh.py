@@ -45,6 +45,30 @@ def aabb_overlap(a_lower, a_upper, b_lower, b_upper):
         return 1
 
 
+@wp.kernel
+def bvh_query_aabb_count(
+    bvh_id: wp.uint64,
+    query_lowers: wp.array(dtype=wp.vec3),
+    query_uppers: wp.array(dtype=wp.vec3),
+    counts: wp.array(dtype=int),
+    first_hits: wp.array(dtype=int),
+):
+    tid = wp.tid()
+
+    query = wp.bvh_query_aabb(bvh_id, query_lowers[tid], query_uppers[tid])
+    bounds_nr = int(0)
+    count = int(0)
+    first_hit = int(-1)
+
+    while wp.bvh_query_next(query, bounds_nr):
+        if first_hit == -1:
+            first_hit = bounds_nr
+        count += 1
+
+    counts[tid] = count
+    first_hits[tid] = first_hit
+
+
 def intersect_ray_aabb(start, rcp_dir, lower, upper):
     l1 = (lower[0] - start[0]) * rcp_dir[0]
     l2 = (upper[0] - start[0]) * rcp_dir[0]
@@ -129,6 +153,80 @@ def test_bvh_query_ray(test, device):
     test_bvh(test, "ray", device)
 
 
+def test_bvh_constructors(test, device):
+    # enough bounds for the top levels of the tree to be split in parallel
+    rng = np.random.default_rng(123)
+
+    num_bounds = 20000
+    lowers = rng.random(size=(num_bounds, 3), dtype=np.float32) * 50.0
+    uppers = lowers + rng.random(size=(num_bounds, 3), dtype=np.float32)
+
+    num_queries = 64
+    query_lowers = rng.random(size=(num_queries, 3), dtype=np.float32) * 50.0
+    query_uppers = query_lowers + 5.0
+
+    device_lowers = wp.array(lowers, dtype=wp.vec3, device=device)
+    device_uppers = wp.array(uppers, dtype=wp.vec3, device=device)
+    device_query_lowers = wp.array(query_lowers, dtype=wp.vec3, device=device)
+    device_query_uppers = wp.array(query_uppers, dtype=wp.vec3, device=device)
+
+    def expected_counts(lowers, uppers):
+        return np.array(
+            [
+                np.count_nonzero(np.all(lowers <= query_uppers[i], axis=1) & np.all(uppers >= query_lowers[i], axis=1))
+                for i in range(num_queries)
+            ]
+        )
+
+    expected = expected_counts(lowers, uppers)
+
+    counts = wp.zeros(num_queries, dtype=int, device=device)
+    first_hits = wp.zeros(num_queries, dtype=int, device=device)
+
+    def query(bvh):
+        wp.launch(
+            bvh_query_aabb_count,
+            dim=num_queries,
+            inputs=[bvh.id, device_query_lowers, device_query_uppers, counts, first_hits],
+            device=device,
+        )
+        return counts.numpy(), first_hits.numpy()
+
+    saved_num_threads = wp.config.cpu_num_threads
+    try:
+        for constructor in ("sah", "sah_binned", "median"):
+            first_hits_per_thread_count = []
+
+            # the host builder should produce the same tree regardless of the number of threads
+            for num_threads in (1, 4):
+                wp.config.cpu_num_threads = num_threads
+
+                bvh = wp.Bvh(device_lowers, device_uppers, constructor=constructor)
+
+                query_counts, query_first_hits = query(bvh)
+                assert_np_equal(query_counts, expected)
+                first_hits_per_thread_count.append(query_first_hits)
+
+            assert_np_equal(first_hits_per_thread_count[0], first_hits_per_thread_count[1])
+
+            if not device.is_cpu:
+                continue
+
+            # parallel host refit after moving the bounds
+            offsets = rng.random(size=(num_bounds, 3), dtype=np.float32)
+            wp.copy(device_lowers, wp.array(lowers + offsets, dtype=wp.vec3, device=device))
+            wp.copy(device_uppers, wp.array(uppers + offsets, dtype=wp.vec3, device=device))
+            bvh.refit()
+
+            query_counts, _ = query(bvh)
+            assert_np_equal(query_counts, expected_counts(lowers + offsets, uppers + offsets))
+
+            wp.copy(device_lowers, wp.array(lowers, dtype=wp.vec3, device=device))
+            wp.copy(device_uppers, wp.array(uppers, dtype=wp.vec3, device=device))
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
 def test_gh_288(test, device):
     num_bounds = 1
     lowers = ((0.5, -1.0, -1.0),) * num_bounds
@@ -185,6 +283,7 @@ class TestBvh(unittest.TestCase):
 
 add_function_test(TestBvh, "test_bvh_aabb", test_bvh_query_aabb, devices=devices)
 add_function_test(TestBvh, "test_bvh_ray", test_bvh_query_ray, devices=devices)
+add_function_test(TestBvh, "test_bvh_constructors", test_bvh_constructors, devices=devices)
 add_function_test(TestBvh, "test_gh_288", test_gh_288, devices=devices)
 
 if __name__ == "__main__":
@@ -664,6 +664,86 @@ def test_while_condition_eval():
         it.valid = False
 
 
+# overloads of a function taking different numbers of arguments
+@wp.func
+def overload_arity(a: float, b: float) -> float:
+    return a + b
+
+
+@wp.func
+def overload_arity(a: float, b: float, c: wp.array(dtype=float)) -> float:
+    c[0] = a * b
+    return a + b + c[0]
+
+
+@wp.kernel
+def overload_arity_kernel(out: wp.array(dtype=float)):
+    wp.expect_eq(overload_arity(1.0, 2.0), 3.0)
+    wp.expect_eq(overload_arity(1.0, 2.0, out), 5.0)
+
+
+def test_overload_arity(test, device):
+    out = wp.zeros(1, dtype=float, device=device)
+    wp.launch(overload_arity_kernel, dim=1, inputs=[out], device=device)
+    assert_np_equal(out.numpy(), np.array([2.0]))
+
+
+@wp.kernel
+def component_store_attribute(a: wp.array(dtype=wp.vec3), b: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i].x = b[i]
+
+
+@wp.kernel
+def component_store_subscript(a: wp.array(dtype=wp.vec3), b: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i][0] = b[i]
+
+
+@wp.kernel
+def component_store_attribute_add(a: wp.array(dtype=wp.vec3), b: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i].x += b[i]
+
+
+@wp.kernel
+def component_store_subscript_add(a: wp.array(dtype=wp.vec3), b: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i][0] += b[i]
+
+
+@wp.kernel
+def component_store_struct(a: wp.array(dtype=Iterator), b: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i].valid = b[i] > 0.0
+
+
+def test_array_access_component_store(test, device):
+    device = wp.get_device(device)
+
+    kernels = (
+        component_store_attribute,
+        component_store_subscript,
+        component_store_attribute_add,
+        component_store_subscript_add,
+        component_store_struct,
+    )
+
+    # stores to the components of array elements write the array
+    for kernel in kernels:
+        with test.subTest(kernel=kernel.key):
+            array_access = kernel.module.load(device, kernel=kernel).get_kernel_hooks(kernel).array_access
+            test.assertTrue(array_access[0] & wp.context.ARRAY_WRITE)
+            test.assertEqual(array_access[1], wp.context.ARRAY_READ)
+
+    a = wp.zeros(2, dtype=wp.vec3, device=device)
+    b = wp.array([1.0, 2.0], dtype=float, device=device)
+
+    wp.launch(component_store_attribute, dim=2, inputs=[a, b], device=device)
+    wp.launch(component_store_attribute_add, dim=2, inputs=[a, b], device=device)
+    assert_np_equal(a.numpy(), np.array([[2.0, 0.0, 0.0], [4.0, 0.0, 0.0]]))
+
+
 class TestCodeGen(unittest.TestCase):
     pass
 
@@ -795,6 +875,10 @@ add_function_test(
 add_kernel_test(TestCodeGen, name="test_call_syntax", kernel=test_call_syntax, dim=1, devices=devices)
 add_kernel_test(TestCodeGen, name="test_shadow_builtin", kernel=test_shadow_builtin, dim=1, devices=devices)
 add_kernel_test(TestCodeGen, name="test_while_condition_eval", kernel=test_while_condition_eval, dim=1, devices=devices)
+add_function_test(TestCodeGen, func=test_overload_arity, name="test_overload_arity", devices=devices)
+add_function_test(
+    TestCodeGen, func=test_array_access_component_store, name="test_array_access_component_store", devices=devices
+)
 
 
 if __name__ == "__main__":
@@ -583,6 +583,203 @@ def test_particle_collision(test, device):
     test.assertTrue((np.linalg.norm(particle_f_2.numpy(), axis=1) == 0).all())
 
 
+def build_rigid_clutter(rigid_broadphase, device, num_bodies=60, seed=42):
+    rng = np.random.default_rng(seed)
+
+    builder = wp.sim.ModelBuilder()
+    builder.rigid_broadphase = rigid_broadphase
+    for i in range(num_bodies):
+        body = builder.add_body(origin=wp.transform(rng.uniform(-2.0, 2.0, 3), wp.quat_identity()))
+        if i % 3 == 0:
+            builder.add_shape_sphere(body, radius=0.3)
+        elif i % 3 == 1:
+            builder.add_shape_box(body, hx=0.3, hy=0.2, hz=0.25)
+        else:
+            builder.add_shape_capsule(body, radius=0.15, half_height=0.3)
+
+    builder.shape_collision_filter_pairs.add((3, 7))
+    builder.add_shape_box(-1, pos=(0.0, -3.0, 0.0), hx=3.0, hy=0.5, hz=3.0)
+
+    return builder.finalize(device=device)
+
+
+def get_rigid_contacts(model):
+    count = model.rigid_contact_count.numpy()[0]
+    shape0 = model.rigid_contact_shape0.numpy()[:count]
+    shape1 = model.rigid_contact_shape1.numpy()[:count]
+    point_id = model.rigid_contact_point0.numpy()[:count]
+    return sorted(zip(shape0, shape1, map(tuple, np.round(point_id, 4))))
+
+
+def test_rigid_broadphase_bvh(test, device):
+    explicit_model = build_rigid_clutter("explicit", device)
+    bvh_model = build_rigid_clutter("bvh", device)
+
+    explicit_state = explicit_model.state()
+    bvh_state = bvh_model.state()
+
+    rng = np.random.default_rng(123)
+
+    for _ in range(3):
+        wp.sim.collide(explicit_model, explicit_state)
+        wp.sim.collide(bvh_model, bvh_state)
+
+        # the runtime broadphase finds fewer pairs but generates the same contacts
+        found = bvh_model.shape_contact_pair_found.numpy()[0]
+        test.assertGreater(found, 0)
+        test.assertLess(found, explicit_model.shape_contact_pair_count)
+        test.assertEqual(get_rigid_contacts(bvh_model), get_rigid_contacts(explicit_model))
+
+        # move the bodies, the BVH is refit at the next call
+        body_q = explicit_state.body_q.numpy()
+        body_q[:, :3] += rng.uniform(-0.5, 0.5, (len(body_q), 3))
+        explicit_state.body_q.assign(body_q)
+        bvh_state.body_q.assign(body_q)
+
+
+def test_rigid_broadphase_bvh_filtering(test, device):
+    builder = wp.sim.ModelBuilder()
+    builder.rigid_broadphase = "bvh"
+
+    # overlapping spheres in different collision groups
+    groups = [1, 1, 2, -1, 2, 1]
+    for group in groups:
+        body = builder.add_body(origin=wp.transform((0.0, 1.0, 0.0), wp.quat_identity()))
+        builder.add_shape_sphere(body, radius=0.5, collision_group=group)
+
+    # filtered pair, shape without shape collisions, static shapes, and a distant shape
+    builder.shape_collision_filter_pairs.add((5, 0))
+    builder.add_shape_sphere(builder.add_body(), radius=0.5, has_shape_collision=False)
+    builder.add_shape_sphere(-1, pos=(0.0, 1.0, 0.0), radius=0.5, collision_group=3)
+    builder.add_shape_sphere(-1, pos=(0.0, 1.0, 0.0), radius=0.5, collision_group=3)
+    builder.add_shape_sphere(builder.add_body(origin=wp.transform((10.0, 1.0, 0.0), wp.quat_identity())), radius=0.5)
+
+    model = builder.finalize(device=device)
+    wp.sim.collide(model, model.state())
+
+    found = model.shape_contact_pair_found.numpy()[0]
+    pairs = {tuple(pair) for pair in model.shape_contact_pairs.numpy()[:found]}
+
+    expected = {(0, 1), (0, 3), (1, 3), (1, 5), (2, 3), (2, 4), (3, 4), (3, 5), (3, 7), (3, 8)}
+    test.assertEqual(pairs, expected)
+
+    builder.rigid_broadphase = "sweep"
+    with test.assertRaises(ValueError):
+        builder.finalize(device=device)
+
+
+def build_particle_clutter(soft_contact_broadphase, device, num_particles=2000, seed=42):
+    rng = np.random.default_rng(seed)
+
+    builder = wp.sim.ModelBuilder()
+    builder.soft_contact_broadphase = soft_contact_broadphase
+    for pos in rng.uniform(-2.0, 2.0, (num_particles, 3)):
+        builder.add_particle(pos, wp.vec3(), 1.0, radius=rng.uniform(0.01, 0.1))
+
+    # unit cube mesh
+    points = [(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)]
+    indices = [
+        0,
+        1,
+        3,
+        0,
+        3,
+        2,
+        4,
+        6,
+        7,
+        4,
+        7,
+        5,
+        0,
+        4,
+        5,
+        0,
+        5,
+        1,
+        2,
+        3,
+        7,
+        2,
+        7,
+        6,
+        0,
+        2,
+        6,
+        0,
+        6,
+        4,
+        1,
+        5,
+        7,
+        1,
+        7,
+        3,
+    ]
+    mesh = wp.sim.Mesh(points, indices)
+
+    for i in range(14):
+        rot = wp.quat_from_axis_angle(wp.normalize(wp.vec3(*rng.uniform(-1.0, 1.0, 3))), rng.uniform(0.0, np.pi))
+        body = builder.add_body(origin=wp.transform(rng.uniform(-2.0, 2.0, 3), rot))
+        if i % 7 == 0:
+            builder.add_shape_sphere(body, radius=0.3)
+        elif i % 7 == 1:
+            builder.add_shape_box(body, hx=0.3, hy=0.2, hz=0.25)
+        elif i % 7 == 2:
+            builder.add_shape_capsule(body, radius=0.15, half_height=0.3)
+        elif i % 7 == 3:
+            builder.add_shape_cylinder(body, radius=0.2, half_height=0.3)
+        elif i % 7 == 4:
+            builder.add_shape_cone(body, radius=0.2, half_height=0.3)
+        elif i % 7 == 5:
+            builder.add_shape_plane(body=body, width=0.5, length=0.4)
+        else:
+            builder.add_shape_mesh(body, mesh=mesh, scale=(0.6, 0.4, 0.5))
+
+    # only test the particle-shape contacts
+    builder.shape_shape_collision = [False] * builder.shape_count
+    builder.shape_ground_collision = [False] * builder.shape_count
+
+    return builder.finalize(device=device)
+
+
+def get_soft_contacts(model):
+    count = min(model.soft_contact_count.numpy()[0], model.soft_contact_max)
+    particle = model.soft_contact_particle.numpy()[:count]
+    shape = model.soft_contact_shape.numpy()[:count]
+    body_pos = model.soft_contact_body_pos.numpy()[:count]
+    return sorted(zip(particle, shape, map(tuple, np.round(body_pos, 4))))
+
+
+def test_soft_contact_broadphase_bvh(test, device):
+    explicit_model = build_particle_clutter("explicit", device)
+    bvh_model = build_particle_clutter("bvh", device)
+
+    explicit_state = explicit_model.state()
+    bvh_state = bvh_model.state()
+
+    rng = np.random.default_rng(123)
+
+    for _ in range(3):
+        wp.sim.collide(explicit_model, explicit_state)
+        wp.sim.collide(bvh_model, bvh_state)
+
+        test.assertGreater(bvh_model.soft_contact_count.numpy()[0], 0)
+        test.assertEqual(get_soft_contacts(bvh_model), get_soft_contacts(explicit_model))
+
+        # move the bodies, the BVH is refit at the next call
+        body_q = explicit_state.body_q.numpy()
+        body_q[:, :3] += rng.uniform(-0.5, 0.5, (len(body_q), 3))
+        explicit_state.body_q.assign(body_q)
+        bvh_state.body_q.assign(body_q)
+
+    builder = wp.sim.ModelBuilder()
+    builder.soft_contact_broadphase = "grid"
+    builder.add_particle(wp.vec3(), wp.vec3(), 1.0)
+    with test.assertRaises(ValueError):
+        builder.finalize(device=device)
+
+
 class TestCollision(unittest.TestCase):
     pass
 
@@ -590,6 +787,11 @@ class TestCollision(unittest.TestCase):
 add_function_test(TestCollision, "test_vertex_triangle_collision", test_vertex_triangle_collision, devices=devices)
 add_function_test(TestCollision, "test_edge_edge_collision", test_vertex_triangle_collision, devices=devices)
 add_function_test(TestCollision, "test_particle_collision", test_particle_collision, devices=devices)
+add_function_test(TestCollision, "test_rigid_broadphase_bvh", test_rigid_broadphase_bvh, devices=devices)
+add_function_test(
+    TestCollision, "test_rigid_broadphase_bvh_filtering", test_rigid_broadphase_bvh_filtering, devices=devices
+)
+add_function_test(TestCollision, "test_soft_contact_broadphase_bvh", test_soft_contact_broadphase_bvh, devices=devices)
 
 if __name__ == "__main__":
     wp.clear_kernel_cache()
@@ -216,7 +216,9 @@ add_example_test(
     test_options={"headless": True},
     test_options_cpu={"num_frames": 100},
 )
-add_example_test(TestCoreExamples, name="core.example_marching_cubes", devices=cuda_test_devices)
+add_example_test(
+    TestCoreExamples, name="core.example_marching_cubes", devices=test_devices, test_options_cpu={"num_frames": 10}
+)
 add_example_test(TestCoreExamples, name="core.example_mesh", devices=test_devices, test_options={"usd_required": True})
 add_example_test(
     TestCoreExamples, name="core.example_mesh_intersect", devices=test_devices, test_options={"usd_required": True}
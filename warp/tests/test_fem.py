@@ -1921,7 +1921,6 @@ def test_array_axpy(test, device):
 
 
 devices = get_test_devices()
-cuda_devices = get_selected_cuda_test_devices()
 
 
 class TestFem(unittest.TestCase):
@@ -1941,8 +1940,8 @@ add_function_test(TestFem, "test_quad_mesh", test_quad_mesh, devices=devices)
 add_function_test(TestFem, "test_grid_3d", test_grid_3d, devices=devices)
 add_function_test(TestFem, "test_tet_mesh", test_tet_mesh, devices=devices)
 add_function_test(TestFem, "test_hex_mesh", test_hex_mesh, devices=devices)
-add_function_test(TestFem, "test_nanogrid", test_nanogrid, devices=cuda_devices)
-add_function_test(TestFem, "test_adaptive_nanogrid", test_adaptive_nanogrid, devices=cuda_devices)
+add_function_test(TestFem, "test_nanogrid", test_nanogrid, devices=devices)
+add_function_test(TestFem, "test_adaptive_nanogrid", test_adaptive_nanogrid, devices=devices)
 add_function_test(TestFem, "test_deformed_geometry", test_deformed_geometry, devices=devices)
 add_function_test(TestFem, "test_vector_spaces", test_vector_spaces, devices=devices)
 add_function_test(TestFem, "test_dof_mapper", test_dof_mapper)
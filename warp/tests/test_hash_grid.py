@@ -183,6 +183,110 @@ def test_hashgrid_inputs(test, device):
             assert_array_equal(counts_ndim, counts_ref)
 
 
+@wp.kernel
+def sorted_point_ids(grid: wp.uint64, ids: wp.array(dtype=int)):
+    tid = wp.tid()
+    ids[tid] = wp.hash_grid_point_id(grid, tid)
+
+
+def test_hashgrid_incremental(test, device):
+    rng = np.random.default_rng(42)
+
+    num_threads = wp.config.cpu_num_threads
+
+    try:
+        for threads in (1, 4):
+            wp.config.cpu_num_threads = threads
+
+            points = rng.random(size=(20000, 3)) * scale
+            points_arr = wp.array(points, dtype=wp.vec3, device=device)
+
+            grid = wp.HashGrid(dim_x, dim_y, dim_z, device)
+            grid_ref = wp.HashGrid(dim_x, dim_y, dim_z, device)
+
+            grid.build(points_arr, cell_radius, incremental=True)
+
+            # no point moved, few points moved, many points moved, different number of points
+            for moved in (0.0, 0.001, 0.02, 0.5, 0.01, None):
+                if moved is None:
+                    points = points[: len(points) // 2]
+                else:
+                    indices = rng.choice(len(points), int(len(points) * moved), replace=False)
+                    points[indices] += rng.standard_normal(size=(len(indices), 3)) * cell_radius
+
+                points_arr = wp.array(points, dtype=wp.vec3, device=device)
+
+                grid.build(points_arr, cell_radius, incremental=True)
+                grid_ref.build(points_arr, cell_radius)
+
+                ids = wp.empty(len(points), dtype=int, device=device)
+                ids_ref = wp.empty(len(points), dtype=int, device=device)
+
+                wp.launch(sorted_point_ids, dim=len(points), inputs=[grid.id, ids], device=device)
+                wp.launch(sorted_point_ids, dim=len(points), inputs=[grid_ref.id, ids_ref], device=device)
+
+                assert_array_equal(ids, ids_ref)
+
+                counts = wp.empty(len(points), dtype=int, device=device)
+                counts_ref = wp.empty(len(points), dtype=int, device=device)
+
+                wp.launch(
+                    count_neighbors, dim=len(points), inputs=[grid.id, query_radius, points_arr, counts], device=device
+                )
+                wp.launch(
+                    count_neighbors,
+                    dim=len(points),
+                    inputs=[grid_ref.id, query_radius, points_arr, counts_ref],
+                    device=device,
+                )
+
+                assert_array_equal(counts, counts_ref)
+    finally:
+        wp.config.cpu_num_threads = num_threads
+
+
+def test_hashgrid_incremental_random(test, device):
+    rng = np.random.default_rng(123)
+
+    num_threads = wp.config.cpu_num_threads
+
+    # points moved anywhere in a small grid also land before the lowest occupied cell of the previous order
+    grid_dim = 16
+    radius = 0.7
+    extent = 2.0 * grid_dim * radius
+
+    try:
+        for threads in (1, 4):
+            wp.config.cpu_num_threads = threads
+
+            for _ in range(3):
+                points = rng.random(size=(12163, 3)) * extent
+
+                grid = wp.HashGrid(grid_dim, grid_dim, grid_dim, device)
+                grid_ref = wp.HashGrid(grid_dim, grid_dim, grid_dim, device)
+
+                grid.build(wp.array(points, dtype=wp.vec3, device=device), radius)
+
+                for _ in range(5):
+                    indices = rng.choice(len(points), len(points) // 20, replace=False)
+                    points[indices] = rng.random(size=(len(indices), 3)) * extent
+
+                    points_arr = wp.array(points, dtype=wp.vec3, device=device)
+
+                    grid.build(points_arr, radius, incremental=True)
+                    grid_ref.build(points_arr, radius)
+
+                    ids = wp.empty(len(points), dtype=int, device=device)
+                    ids_ref = wp.empty(len(points), dtype=int, device=device)
+
+                    wp.launch(sorted_point_ids, dim=len(points), inputs=[grid.id, ids], device=device)
+                    wp.launch(sorted_point_ids, dim=len(points), inputs=[grid_ref.id, ids_ref], device=device)
+
+                    assert_array_equal(ids, ids_ref)
+    finally:
+        wp.config.cpu_num_threads = num_threads
+
+
 devices = get_test_devices()
 
 
@@ -206,6 +310,8 @@ class TestHashGrid(unittest.TestCase):
 
 add_function_test(TestHashGrid, "test_hashgrid_query", test_hashgrid_query, devices=devices)
 add_function_test(TestHashGrid, "test_hashgrid_inputs", test_hashgrid_inputs, devices=devices)
+add_function_test(TestHashGrid, "test_hashgrid_incremental", test_hashgrid_incremental, devices=devices)
+add_function_test(TestHashGrid, "test_hashgrid_incremental_random", test_hashgrid_incremental_random, devices=devices)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,9 @@
 # distribution of this software and related documentation without an express
 # license agreement from NVIDIA CORPORATION is strictly prohibited.
 
+import json
+import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -326,6 +329,608 @@ def test_launch_tuple_args(test, device):
     assert_np_equal(out.numpy(), np.array((0, 3, 6, 9)))
 
 
+@wp.struct
+class Offset:
+    value: wp.vec3
+
+
+@wp.kernel
+def kernel_cpu_threads(
+    values: wp.array2d(dtype=float),
+    scale: wp.vec3,
+    offset: Offset,
+    out: wp.array2d(dtype=wp.vec3),
+    count: wp.array(dtype=int),
+    total: wp.array(dtype=float),
+):
+    i, j = wp.tid()
+    out[i, j] = scale * values[i, j] + offset.value
+    wp.atomic_add(count, 0, 1)
+    wp.atomic_max(count, 1, i * 1000 + j)
+    wp.atomic_add(total, 0, values[i, j] * values[i, j])
+
+
+@wp.kernel(cpu_parallel=False)
+def kernel_cpu_serial(out: wp.array(dtype=int), counter: wp.array(dtype=int)):
+    # relies on launch order, only valid when executed on a single thread
+    out[wp.tid()] = wp.atomic_add(counter, 0, 1)
+
+
+def test_launch_cpu_threads(test, device):
+    saved_num_threads = wp.config.cpu_num_threads
+
+    try:
+        rows, cols = 37, 129
+        values_np = np.random.default_rng(42).random((rows, cols), dtype=np.float32)
+
+        results = []
+        for num_threads in (1, 4):
+            wp.config.cpu_num_threads = num_threads
+
+            values = wp.array(values_np, dtype=float, device=device, requires_grad=True)
+            out = wp.zeros((rows, cols), dtype=wp.vec3, device=device)
+            count = wp.zeros(2, dtype=int, device=device)
+            total = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+            offset = Offset()
+            offset.value = wp.vec3(1.0, 2.0, 3.0)
+
+            tape = wp.Tape()
+            with tape:
+                wp.launch(
+                    kernel_cpu_threads,
+                    dim=(rows, cols),
+                    inputs=[values, wp.vec3(1.0, 2.0, 3.0), offset],
+                    outputs=[out, count, total],
+                    device=device,
+                )
+            tape.backward(loss=total)
+
+            assert_np_equal(count.numpy(), np.array([rows * cols, (rows - 1) * 1000 + cols - 1]))
+            assert_np_equal(values.grad.numpy(), 2.0 * values_np, tol=1.0e-6)
+
+            results.append((out.numpy(), total.numpy()))
+
+            # serial kernels keep their launch order
+            order = wp.zeros(1000, dtype=int, device=device)
+            counter = wp.zeros(1, dtype=int, device=device)
+            wp.launch(kernel_cpu_serial, dim=1000, outputs=[order, counter], device=device)
+            assert_np_equal(order.numpy(), np.arange(1000))
+
+        assert_np_equal(results[0][0], results[1][0])
+        assert_np_equal(results[0][1], results[1][1], tol=1.0e-3)
+
+        # recorded launches also run on the worker pool
+        out = wp.zeros(64, dtype=int, device=device)
+        cmd = wp.launch(arange, dim=64, inputs=[], outputs=[out], device=device, record_cmd=True)
+        cmd.launch()
+        assert_np_equal(out.numpy(), np.arange(64))
+
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
+@wp.kernel
+def kernel_cpu_vectorize(
+    x: wp.array(dtype=float),
+    y: wp.array(dtype=float),
+    a: float,
+    v: wp.array(dtype=wp.vec3),
+    out: wp.array(dtype=float),
+    out_v: wp.array(dtype=wp.vec3),
+):
+    i = wp.tid()
+    out[i] = a * x[i] * x[i] + y[i]
+    out_v[i] = wp.cross(v[i], wp.vec3(1.0, 2.0, 3.0)) + v[i] * a
+
+
+def test_launch_cpu_vectorize(test, device):
+    saved_num_threads = wp.config.cpu_num_threads
+
+    wp.set_module_options({"cpu_vectorize": True})
+
+    try:
+        rng = np.random.default_rng(42)
+
+        for num_threads in (1, 4):
+            wp.config.cpu_num_threads = num_threads
+
+            # odd sizes exercise the scalar tail after the last full SIMD batch
+            for n in (1, 7, 1021):
+                x_np = rng.random(2 * n, dtype=np.float32)
+                y_np = rng.random(n, dtype=np.float32)
+                v_np = rng.random((n, 3), dtype=np.float32)
+                expected_v = np.cross(v_np, np.array((1.0, 2.0, 3.0), dtype=np.float32)) + 2.0 * v_np
+
+                # contiguous 1-D launches take the vectorized path, strided arrays and
+                # multi-dimensional launches fall back to the scalar loop
+                for x_indices, launch_dim in (
+                    (np.arange(n), n),
+                    (np.arange(0, 2 * n, 2), n),
+                    (np.arange(n), (n, 1)),
+                ):
+                    x = wp.array(x_np, dtype=float, device=device, requires_grad=True)
+                    y = wp.array(y_np, dtype=float, device=device, requires_grad=True)
+                    v = wp.array(v_np, dtype=wp.vec3, device=device)
+                    out = wp.zeros(n, dtype=float, device=device, requires_grad=True)
+                    out_v = wp.zeros(n, dtype=wp.vec3, device=device)
+
+                    x_view = x[:n] if x_indices[-1] == n - 1 else x[::2]
+
+                    tape = wp.Tape()
+                    with tape:
+                        wp.launch(
+                            kernel_cpu_vectorize,
+                            dim=launch_dim,
+                            inputs=[x_view, y, 2.0, v],
+                            outputs=[out, out_v],
+                            device=device,
+                        )
+                    tape.backward(grads={out: wp.ones(n, dtype=float, device=device)})
+
+                    expected_x_grad = np.zeros(2 * n, dtype=np.float32)
+                    expected_x_grad[x_indices] = 4.0 * x_np[x_indices]
+
+                    assert_np_equal(out.numpy(), 2.0 * x_np[x_indices] ** 2 + y_np, tol=1.0e-6)
+                    assert_np_equal(out_v.numpy(), expected_v, tol=1.0e-6)
+                    assert_np_equal(x.grad.numpy(), expected_x_grad, tol=1.0e-6)
+                    assert_np_equal(y.grad.numpy(), np.ones(n), tol=1.0e-6)
+
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+        wp.set_module_options({"cpu_vectorize": False})
+
+
+@wp.kernel
+def kernel_cpu_graph_step(x: wp.array(dtype=float), v: wp.array(dtype=float), dt: float, gravity: wp.vec3):
+    i = wp.tid()
+    v[i] = v[i] + dt * gravity[1]
+    x[i] = x[i] + dt * v[i]
+
+
+def test_launch_cpu_graph(test, device):
+    saved_num_threads = wp.config.cpu_num_threads
+
+    try:
+        for num_threads in (1, 4):
+            wp.config.cpu_num_threads = num_threads
+
+            n = 1000
+            x = wp.zeros(n, dtype=float, device=device)
+            v = wp.zeros(n, dtype=float, device=device)
+            x_prev = wp.zeros(n, dtype=float, device=device)
+            strided = wp.zeros(2 * n, dtype=float, device=device)
+            order = wp.zeros(n, dtype=int, device=device)
+            counter = wp.zeros(1, dtype=int, device=device)
+
+            # load the modules ahead of time so that capture only records commands
+            wp.load_module(device=device)
+
+            with wp.ScopedCapture(device=device) as capture:
+                wp.copy(x_prev, x)
+                wp.launch(kernel_cpu_graph_step, dim=n, inputs=[x, v, 0.5, wp.vec3(0.0, -2.0, 0.0)], device=device)
+                strided[::2].fill_(3.0)
+                counter.zero_()
+                wp.launch(kernel_cpu_serial, dim=n, outputs=[order, counter], device=device)
+
+            graph = capture.graph
+            test.assertEqual(graph.num_commands, 5)
+
+            # nothing is executed during capture
+            assert_np_equal(x.numpy(), np.zeros(n))
+            assert_np_equal(strided.numpy(), np.zeros(2 * n))
+            assert_np_equal(order.numpy(), np.zeros(n))
+
+            # the arguments packed during capture are replayed
+            x_np = np.zeros(n)
+            v_np = np.zeros(n)
+            for _ in range(3):
+                wp.capture_launch(graph)
+
+                x_prev_np = x_np
+                v_np = v_np - 1.0
+                x_np = x_np + 0.5 * v_np
+
+            assert_np_equal(x.numpy(), x_np)
+            assert_np_equal(x_prev.numpy(), x_prev_np)
+            assert_np_equal(strided.numpy()[::2], np.full(n, 3.0))
+            assert_np_equal(strided.numpy()[1::2], np.zeros(n))
+            assert_np_equal(order.numpy(), np.arange(n))
+            assert_np_equal(counter.numpy(), np.array([n]))
+
+            with test.assertRaisesRegex(RuntimeError, "Graph capture is not active"):
+                wp.capture_end(device=device)
+
+        # host operations can't be recorded, replaying the graph would skip them
+        keys = wp.array([0, 4, 3, 2, 0, 0, 0, 0], dtype=int, device=device)
+        values = wp.zeros(8, dtype=int, device=device)
+        with test.assertRaisesRegex(RuntimeError, "cannot be captured in a CPU graph"):
+            with wp.ScopedCapture(device=device):
+                wp.utils.radix_sort_pairs(keys, values, 4)
+
+        test.assertFalse(wp.get_device(device).captures)
+        assert_np_equal(keys.numpy(), np.array([0, 4, 3, 2, 0, 0, 0, 0]))
+
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
+@wp.kernel
+def kernel_sequence_axpy(x: wp.array(dtype=float), y: wp.array(dtype=float), a: float):
+    i = wp.tid()
+    y[i] = y[i] + a * x[i]
+
+
+def test_launch_sequence(test, device):
+    n = 16
+    x = wp.array(np.arange(n, dtype=np.float32), device=device)
+    y = wp.zeros(n, dtype=float, device=device)
+    z = wp.zeros(n, dtype=float, device=device)
+
+    seq = wp.LaunchSequence()
+    for _ in range(3):
+        cmd = wp.launch(kernel_sequence_axpy, dim=n, inputs=[x, y, 1.0], device=device, record_cmd=True)
+        seq.add(cmd, slots={"a": "scale", "y": "out"})
+
+    test.assertEqual(len(seq), 3)
+    test.assertIs(seq.device, device)
+
+    seq.launch()
+    assert_np_equal(y.numpy(), 3.0 * np.arange(n))
+
+    # rebinding a slot updates the argument of every launch bound to it
+    seq.set_slot("scale", 2.0)
+    seq.set_slot("out", z)
+    seq.launch()
+    assert_np_equal(y.numpy(), 3.0 * np.arange(n))
+    assert_np_equal(z.numpy(), 6.0 * np.arange(n))
+
+    # arguments and dimensions of individual launches can be changed as well
+    seq.set_param(0, "a", -6.0)
+    seq.set_dim(1, n // 2)
+    seq.set_dim(2, 0)
+    seq.launch()
+    expected = 2.0 * np.arange(n, dtype=np.float32)
+    expected[n // 2 :] = 0.0
+    assert_np_equal(z.numpy(), expected)
+
+    with test.assertRaises(ValueError):
+        seq.set_slot("missing", 1.0)
+
+    with test.assertRaises(ValueError):
+        seq.add(seq[0], slots={"b": "scale"})
+
+
+@wp.kernel
+def kernel_fusion_scale(x: wp.array(dtype=float), s: float):
+    i = wp.tid()
+    x[i] = x[i] * s
+
+
+@wp.kernel
+def kernel_fusion_integrate(x: wp.array(dtype=float), v: wp.array(dtype=float), dt: float):
+    i = wp.tid()
+    x[i] += v[i] * dt
+
+
+@wp.kernel
+def kernel_fusion_shift(x: wp.array(dtype=float), y: wp.array(dtype=float)):
+    i = wp.tid()
+    y[i] = x[(i + 1) % x.shape[0]]
+
+
+@wp.kernel
+def kernel_fusion_shift_reassigned(x: wp.array(dtype=float), y: wp.array(dtype=float)):
+    i = wp.tid()
+    t = i
+    i = (i + 1) % x.shape[0]
+    y[t] = x[i]
+
+
+@wp.kernel
+def kernel_fusion_set_x(a: wp.array(dtype=wp.vec3)):
+    i = wp.tid()
+    a[i].x = float(i) + 1.0
+
+
+@wp.kernel
+def kernel_fusion_set_y(a: wp.array(dtype=wp.vec3)):
+    i = wp.tid()
+    a[i][1] = float(i) + 1.0
+
+
+@wp.kernel
+def kernel_fusion_shift_xy(a: wp.array(dtype=wp.vec3), y: wp.array(dtype=float)):
+    i = wp.tid()
+    j = (i + 1) % a.shape[0]
+    y[i] = a[j].x + a[j][1]
+
+
+def test_launch_fusion(test, device):
+    n = 16
+    x = wp.array(np.arange(n, dtype=np.float32), device=device)
+    v = wp.ones(n, dtype=float, device=device)
+    y = wp.zeros(n, dtype=float, device=device)
+
+    scale = wp.launch(kernel_fusion_scale, dim=n, inputs=[x, 2.0], device=device, record_cmd=True)
+    integrate = wp.launch(kernel_fusion_integrate, dim=n, inputs=[x, v, 0.5], device=device, record_cmd=True)
+
+    fused = wp.fuse_launches([scale, integrate])
+    fused.launch()
+    assert_np_equal(x.numpy(), 2.0 * np.arange(n) + 0.5)
+
+    # parameters are indexed by their position in the concatenated arguments of the launches
+    fused.set_param_at_index(1, 0.0)
+    fused.launch()
+    assert_np_equal(x.numpy(), np.full(n, 0.5))
+
+    # fused kernels are reused for the same sequence of kernels
+    test.assertIs(wp.fuse_kernels([kernel_fusion_scale, kernel_fusion_integrate]), fused.kernel)
+
+    # fused kernels can be launched directly
+    wp.launch(fused.kernel, dim=n, inputs=[x, 4.0, x, v, -2.0], device=device)
+    assert_np_equal(x.numpy(), np.zeros(n))
+
+    # reading an element written by another thread of the fused launch is rejected
+    shift = wp.launch(kernel_fusion_shift, dim=n, inputs=[x, y], device=device, record_cmd=True)
+    with test.assertRaisesRegex(RuntimeError, "Cannot fuse kernels"):
+        wp.fuse_launches([integrate, shift])
+
+    # also when the element is indexed by a reassigned thread index
+    shift_reassigned = wp.launch(kernel_fusion_shift_reassigned, dim=n, inputs=[x, y], device=device, record_cmd=True)
+    with test.assertRaisesRegex(RuntimeError, "Cannot fuse kernels"):
+        wp.fuse_launches([integrate, shift_reassigned])
+
+    # also when the element is written through one of its components
+    a = wp.zeros(n, dtype=wp.vec3, device=device)
+    shift_xy = wp.launch(kernel_fusion_shift_xy, dim=n, inputs=[a, y], device=device, record_cmd=True)
+    for kernel in (kernel_fusion_set_x, kernel_fusion_set_y):
+        set_component = wp.launch(kernel, dim=n, inputs=[a], device=device, record_cmd=True)
+        with test.assertRaisesRegex(RuntimeError, "Cannot fuse kernels"):
+            wp.fuse_launches([set_component, shift_xy])
+
+    # unless the arrays do not overlap
+    shift.set_param_at_index(0, v)
+    wp.fuse_launches([integrate, shift]).launch()
+    assert_np_equal(y.numpy(), np.ones(n))
+
+    with test.assertRaisesRegex(RuntimeError, "different dimensions"):
+        wp.fuse_launches(
+            [scale, wp.launch(kernel_fusion_scale, dim=n // 2, inputs=[x, 1.0], device=device, record_cmd=True)]
+        )
+
+
+@wp.kernel
+def kernel_packing(
+    values: wp.array(dtype=float), scale: float, offset: wp.vec3, count: int, out: wp.array(dtype=wp.vec3)
+):
+    tid = wp.tid()
+    out[tid] = offset * float(count) + wp.vec3(values[tid] * scale)
+
+
+def test_launch_arg_packing(test, device):
+    n = 4
+    values = wp.array(np.arange(n, dtype=np.float32), device=device)
+    out = wp.zeros(n, dtype=wp.vec3, device=device)
+
+    def expected(scale, offset, count):
+        return np.outer(np.arange(n) * scale, np.ones(3)) + np.array(offset) * count
+
+    # repeated launches with the same argument types reuse the packer of the first launch
+    for i in range(3):
+        wp.launch(kernel_packing, dim=n, inputs=[values, float(i), wp.vec3(1.0, 2.0, 3.0), i, out], device=device)
+        assert_np_equal(out.numpy(), expected(i, (1.0, 2.0, 3.0), i))
+
+    # arguments of other types get their own packers
+    wp.launch(kernel_packing, dim=n, inputs=[values, 2, (3.0, 2.0, 1.0), True, out], device=device)
+    assert_np_equal(out.numpy(), expected(2, (3.0, 2.0, 1.0), 1))
+
+    wp.launch(kernel_packing, dim=n, inputs=[values, np.float32(0.5), [0.0, 0.0, 1.0], np.int32(2), out], device=device)
+    assert_np_equal(out.numpy(), expected(0.5, (0.0, 0.0, 1.0), 2))
+
+    # arrays that do not match the kernel are still reported by cached packers
+    with test.assertRaisesRegex(RuntimeError, "expects an array with dtype"):
+        wp.launch(
+            kernel_packing,
+            dim=n,
+            inputs=[wp.zeros(n, dtype=int, device=device), 1.0, wp.vec3(), 1, out],
+            device=device,
+        )
+
+    with test.assertRaisesRegex(RuntimeError, "expects an array with 1 dimension"):
+        wp.launch(
+            kernel_packing,
+            dim=n,
+            inputs=[wp.zeros((n, 1), dtype=float, device=device), 1.0, wp.vec3(), 1, out],
+            device=device,
+        )
+
+    # captured launches keep the values they were recorded with
+    if device.is_cpu or device.is_capturable:
+        with wp.ScopedCapture(device=device, force_module_load=False) as capture:
+            wp.launch(kernel_packing, dim=n, inputs=[values, 3.0, wp.vec3(1.0), 1, out], device=device)
+
+        wp.launch(kernel_packing, dim=n, inputs=[values, 5.0, wp.vec3(2.0), 2, out], device=device)
+        assert_np_equal(out.numpy(), expected(5.0, (2.0, 2.0, 2.0), 2))
+
+        wp.capture_launch(capture.graph)
+        assert_np_equal(out.numpy(), expected(3.0, (1.0, 1.0, 1.0), 1))
+
+
+@wp.kernel
+def kernel_cpu_timing_scale(x: wp.array(dtype=float), y: wp.array(dtype=float), a: float):
+    i = wp.tid()
+    y[i] = a * x[i]
+
+
+def test_launch_cpu_timing(test, device):
+    n = 1024
+    x = wp.ones(n, dtype=float, device=device, requires_grad=True)
+    y = wp.zeros(n, dtype=float, device=device, requires_grad=True)
+
+    wp.load_module(device=device)
+
+    with wp.ScopedCapture(device=device) as capture:
+        wp.launch(kernel_cpu_timing_scale, dim=n, inputs=[x, y, 2.0], device=device)
+
+    seq = wp.LaunchSequence(
+        [wp.launch(kernel_cpu_timing_scale, dim=n // 2, inputs=[x, y, 2.0], device=device, record_cmd=True)]
+    )
+
+    # launches outside of timing scopes are not recorded
+    wp.launch(kernel_cpu_timing_scale, dim=n, inputs=[x, y, 2.0], device=device)
+
+    wp.timing_begin(cuda_filter=0)
+    wp.launch(kernel_cpu_timing_scale, dim=n, inputs=[x, y, 2.0], device=device)
+    wp.launch(
+        kernel_cpu_timing_scale,
+        dim=n,
+        inputs=[x, y, 2.0],
+        adj_inputs=[x.grad, y.grad, 0.0],
+        device=device,
+        adjoint=True,
+    )
+    wp.capture_launch(capture.graph)
+    seq.launch()
+    results = wp.timing_end()
+
+    test.assertEqual(
+        [r.name for r in results],
+        [
+            "forward kernel kernel_cpu_timing_scale",
+            "backward kernel kernel_cpu_timing_scale",
+            "graph",
+            "forward kernel kernel_cpu_timing_scale",
+            "forward kernel kernel_cpu_timing_scale",
+        ],
+    )
+    test.assertEqual(
+        [r.filter for r in results],
+        [wp.TIMING_KERNEL, wp.TIMING_KERNEL, wp.TIMING_GRAPH, wp.TIMING_KERNEL, wp.TIMING_KERNEL],
+    )
+    test.assertEqual([r.dim for r in results], [n, n, None, n, n // 2])
+    test.assertEqual([r.array_bytes for r in results], [8 * n, 16 * n, None, 8 * n, 8 * n])
+
+    # x is read and y is written, the backward pass reads x and both adjoints and accumulates into adj_x
+    test.assertEqual([r.bytes_read for r in results], [4 * n, 12 * n, None, 4 * n, 4 * n])
+    test.assertEqual([r.bytes_written for r in results], [4 * n, 4 * n, None, 4 * n, 4 * n])
+
+    for r in results:
+        test.assertEqual(r.device, device)
+        test.assertGreaterEqual(r.elapsed, 0.0)
+
+    # the graph launch encloses the launch it replays
+    starts = [r.start for r in results]
+    test.assertEqual(starts, sorted(starts))
+    test.assertLessEqual(results[3].start + results[3].elapsed, results[2].start + results[2].elapsed)
+
+    # nested scopes only record in the innermost scope, filters select the activities
+    with wp.ScopedTimer("outer", print=False, cpu_filter=wp.TIMING_ALL) as outer:
+        with wp.ScopedTimer("inner", print=False, cpu_filter=wp.TIMING_GRAPH) as inner:
+            wp.launch(kernel_cpu_timing_scale, dim=n, inputs=[x, y, 2.0], device=device)
+            wp.capture_launch(capture.graph)
+
+        wp.launch(kernel_cpu_timing_scale, dim=n, inputs=[x, y, 2.0], device=device)
+
+    test.assertEqual([r.name for r in inner.timing_results], ["graph"])
+    test.assertEqual([r.name for r in outer.timing_results], ["forward kernel kernel_cpu_timing_scale"])
+
+    # timing is disabled once all the scopes are closed
+    test.assertEqual(wp.context.runtime.cpu_timing_flags, 0)
+
+    capture_stdout = StdOutCapture()
+    capture_stdout.begin()
+    try:
+        wp.timing_print(results)
+    finally:
+        output = capture_stdout.end()
+
+    test.assertIn("CPU kernel summary", output)
+    test.assertIn("backward kernel kernel_cpu_timing_scale", output)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trace_path = os.path.join(tmp_dir, "trace.json")
+        wp.timing_export_trace(results, trace_path)
+
+        with open(trace_path) as f:
+            trace = json.load(f)
+
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    test.assertEqual([e["name"] for e in events], [r.name for r in results])
+    test.assertAlmostEqual(events[0]["ts"], results[0].start * 1000.0)
+    test.assertAlmostEqual(events[0]["dur"], results[0].elapsed * 1000.0)
+    test.assertEqual(events[0]["args"], {"dim": n, "array_bytes": 8 * n, "bytes_read": 4 * n, "bytes_written": 4 * n})
+
+
+@wp.kernel
+def kernel_cpu_counters_axpy(x: wp.array(dtype=float), y: wp.array(dtype=float), a: float):
+    i = wp.tid()
+    y[i] = a * x[i] + y[i]
+
+
+def test_launch_cpu_counters(test, device):
+    n = 1 << 16
+    x = wp.ones(n, dtype=float, device=device)
+    y = wp.zeros(n, dtype=float, device=device)
+
+    wp.load_module(device=device)
+
+    with wp.ScopedTimer("counters", print=False, cpu_filter=wp.TIMING_KERNEL, cpu_counters=True) as timer:
+        wp.launch(kernel_cpu_counters_axpy, dim=n, inputs=[x, y, 2.0], device=device)
+
+    (result,) = timer.timing_results
+    test.assertEqual(result.bytes_read, 8 * n)
+    test.assertEqual(result.bytes_written, 4 * n)
+
+    # counters depend on the platform and on the permissions of the process
+    if result.counters is not None:
+        test.assertTrue(set(result.counters).issubset(wp.utils.CPU_COUNTER_NAMES))
+        if "instructions" in result.counters:
+            test.assertGreater(result.counters["instructions"], 0)
+
+    assert_np_equal(y.numpy(), np.full(n, 2.0, dtype=np.float32))
+
+    # roofline statistics from known results, 1 ms per launch
+    results = [
+        wp.TimingResult(device, "a", wp.TIMING_KERNEL, 1.0, bytes_read=1000000, bytes_written=1000000),
+        wp.TimingResult(
+            device, "b", wp.TIMING_KERNEL, 1.0, bytes_read=1000000, bytes_written=0, counters={"flops": 100000000}
+        ),
+        wp.TimingResult(
+            device, "b", wp.TIMING_KERNEL, 1.0, bytes_read=1000000, bytes_written=0, counters={"flops": 100000000}
+        ),
+        wp.TimingResult(device, "graph", wp.TIMING_GRAPH, 3.0),
+    ]
+
+    kernels = wp.timing_roofline(results, peak_bandwidth=10.0, peak_flops=200.0)
+    test.assertEqual([k.name for k in kernels], ["b", "a"])
+
+    b, a = kernels
+    test.assertEqual(b.count, 2)
+    test.assertAlmostEqual(b.bandwidth, 1.0)
+    test.assertAlmostEqual(b.flop_rate, 100.0)
+    test.assertAlmostEqual(b.arithmetic_intensity, 100.0)
+    test.assertAlmostEqual(b.bandwidth_fraction, 0.1)
+    test.assertAlmostEqual(b.flop_rate_fraction, 0.5)
+    test.assertEqual(b.bound, "compute")
+
+    test.assertAlmostEqual(a.bandwidth, 2.0)
+    test.assertAlmostEqual(a.bandwidth_fraction, 0.2)
+    test.assertIsNone(a.flops)
+    test.assertIsNone(a.flop_rate)
+    test.assertIsNone(a.bound)
+
+    capture_stdout = StdOutCapture()
+    capture_stdout.begin()
+    try:
+        wp.timing_print_roofline(results, peak_bandwidth=10.0, peak_flops=200.0)
+    finally:
+        output = capture_stdout.end()
+
+    test.assertIn("CPU kernel roofline", output)
+    test.assertIn("compute", output)
+
+
 devices = get_test_devices()
 
 
@@ -345,6 +950,14 @@ add_function_test(TestLaunch, "test_launch_cmd_set_dim", test_launch_cmd_set_dim
 add_function_test(TestLaunch, "test_launch_cmd_empty", test_launch_cmd_empty, devices=devices)
 
 add_function_test(TestLaunch, "test_launch_tuple_args", test_launch_tuple_args, devices=devices)
+add_function_test(TestLaunch, "test_launch_arg_packing", test_launch_arg_packing, devices=devices)
+add_function_test(TestLaunch, "test_launch_cpu_threads", test_launch_cpu_threads, devices=["cpu"])
+add_function_test(TestLaunch, "test_launch_cpu_vectorize", test_launch_cpu_vectorize, devices=["cpu"])
+add_function_test(TestLaunch, "test_launch_cpu_graph", test_launch_cpu_graph, devices=["cpu"])
+add_function_test(TestLaunch, "test_launch_sequence", test_launch_sequence, devices=devices)
+add_function_test(TestLaunch, "test_launch_fusion", test_launch_fusion, devices=devices)
+add_function_test(TestLaunch, "test_launch_cpu_timing", test_launch_cpu_timing, devices=["cpu"])
+add_function_test(TestLaunch, "test_launch_cpu_counters", test_launch_cpu_counters, devices=["cpu"])
 
 
 if __name__ == "__main__":
@@ -48,7 +48,62 @@ def test_marching_cubes(test, device):
     iso.resize(nx=dim * 2, ny=dim * 2, nz=dim * 2, max_verts=max_verts, max_tris=max_tris)
 
 
-devices = get_selected_cuda_test_devices()
+def test_marching_cubes_shared_verts(test, device):
+    dim = 32
+    # avoid isosurface values exactly on grid points, which produce coincident vertices
+    radius = dim / 4.0 + 0.3
+
+    field = wp.zeros(shape=(dim, dim, dim), dtype=float, device=device)
+    wp.launch(make_field, dim=field.shape, inputs=[field, wp.vec3(dim / 2, dim / 2, dim / 2), radius], device=device)
+
+    iso = wp.MarchingCubes(nx=dim, ny=dim, nz=dim, max_verts=10**5, max_tris=10**5, device=device)
+    iso.surface(field=field, threshold=0.0)
+
+    verts = iso.verts.numpy()
+    tris = iso.indices.numpy().reshape(-1, 3)
+
+    test.assertGreater(len(tris), 0)
+
+    # vertices on edges shared between cells are only created once
+    test.assertEqual(len(np.unique(verts, axis=0)), len(verts))
+    test.assertEqual(len(np.unique(tris)), len(verts))
+
+    # every edge of the closed surface is shared by exactly two triangles
+    edges = np.sort(np.concatenate((tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]])), axis=1)
+    _, edge_counts = np.unique(edges, axis=0, return_counts=True)
+    test.assertTrue(np.all(edge_counts == 2))
+
+    # buffers that are too small report the required sizes
+    small = wp.MarchingCubes(nx=dim, ny=dim, nz=dim, max_verts=16, max_tris=16, device=device)
+    with test.assertRaisesRegex(RuntimeError, f"at least {len(verts)} vertices"):
+        small.surface(field=field, threshold=0.0)
+
+
+def test_marching_cubes_cpu_threads(test, device):
+    saved_num_threads = wp.config.cpu_num_threads
+
+    try:
+        dim = 48
+        field_np = np.random.default_rng(42).random((dim, dim, dim), dtype=np.float32)
+
+        results = []
+        for num_threads in (1, 4):
+            wp.config.cpu_num_threads = num_threads
+
+            field = wp.array(field_np, dtype=float, device=device)
+            iso = wp.MarchingCubes(nx=dim, ny=dim, nz=dim, max_verts=10**6, max_tris=10**6, device=device)
+            iso.surface(field=field, threshold=0.5)
+
+            results.append((iso.verts.numpy(), iso.indices.numpy()))
+
+        assert_np_equal(results[0][0], results[1][0])
+        assert_np_equal(results[0][1], results[1][1])
+
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
+devices = get_test_devices()
 
 
 class TestMarchingCubes(unittest.TestCase):
@@ -59,6 +114,12 @@ class TestMarchingCubes(unittest.TestCase):
 
 
 add_function_test(TestMarchingCubes, "test_marching_cubes", test_marching_cubes, devices=devices)
+add_function_test(
+    TestMarchingCubes, "test_marching_cubes_shared_verts", test_marching_cubes_shared_verts, devices=devices
+)
+add_function_test(
+    TestMarchingCubes, "test_marching_cubes_cpu_threads", test_marching_cubes_cpu_threads, devices=["cpu"]
+)
 
 
 if __name__ == "__main__":
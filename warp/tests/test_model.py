@@ -11,6 +11,7 @@ import numpy as np
 
 import warp as wp
 from warp.sim import ModelBuilder
+from warp.sim.model import flag_to_int
 from warp.tests.unittest_utils import *
 
 
@@ -170,6 +171,253 @@ class TestModel(unittest.TestCase):
         assert builder2.articulation_count == 2 * builder.articulation_count
         assert builder2.articulation_start == [0, 1, 2, 3]
 
+    def test_add_builders(self):
+        def build_env(builder: ModelBuilder):
+            # a free-floating two-link chain, a static shape, and a piece of cloth
+            b0 = builder.add_body(origin=wp.transform(wp.vec3(0.0, 1.0, 0.0), wp.quat_identity()))
+            builder.add_shape_box(body=b0, hx=0.1, hy=0.1, hz=0.1)
+            b1 = builder.add_body(origin=wp.transform(wp.vec3(0.5, 1.0, 0.0), wp.quat_identity()))
+            builder.add_shape_capsule(body=b1, radius=0.05, half_height=0.2)
+            builder.add_joint_free(child=b0)
+            builder.add_joint_revolute(parent=b0, child=b1, axis=wp.vec3(0.0, 0.0, 1.0))
+            builder.add_shape_sphere(body=-1, pos=wp.vec3(0.0, 0.2, 0.3), radius=0.2)
+            builder.add_cloth_grid(
+                pos=wp.vec3(0.0, 2.0, 0.0),
+                rot=wp.quat_identity(),
+                vel=wp.vec3(),
+                dim_x=2,
+                dim_y=2,
+                cell_x=0.1,
+                cell_y=0.1,
+                mass=0.1,
+                add_springs=True,
+            )
+            builder.shape_collision_filter_pairs.add((0, 2))
+
+        env = ModelBuilder()
+        build_env(env)
+        num_envs = 3
+        xforms = [
+            wp.transform(wp.vec3(float(i), 0.0, 0.0), wp.quat_from_axis_angle(wp.vec3(0.0, 1.0, 0.0), 0.3 * i))
+            for i in range(num_envs)
+        ]
+
+        builder1 = ModelBuilder()
+        for xform in xforms:
+            builder1.add_builder(env, xform=xform)
+        builder2 = ModelBuilder()
+        builder2.add_builders(env, xforms=xforms)
+
+        self.assertEqual(builder2.num_envs, num_envs)
+        self.assertEqual(builder2.shape_count, num_envs * env.shape_count)
+        self.assertEqual(builder2.articulation_start, [0, 2, 4])
+        self.assertEqual(builder2.joint_parent, [-1, 0, -1, 2, -1, 4])
+        self.assertEqual(builder2.joint_child, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(builder2.shape_collision_group, [1, 1, 1, 2, 2, 2, 3, 3, 3])
+        self.assertEqual(builder2.shape_collision_filter_pairs, builder1.shape_collision_filter_pairs)
+        self.assertIn((6, 8), builder2.shape_collision_filter_pairs)
+
+        for name in (
+            "particle_q",
+            "particle_mass",
+            "spring_indices",
+            "tri_indices",
+            "edge_indices",
+            "shape_body",
+            "shape_transform",
+            "body_q",
+            "joint_q",
+            "joint_X_p",
+            "joint_q_start",
+            "joint_qd_start",
+            "joint_axis_start",
+        ):
+            assert_np_equal(
+                np.array(getattr(builder1, name), dtype=float),
+                np.array(getattr(builder2, name), dtype=float),
+                tol=1.0e-6,
+            )
+        self.assertEqual(builder2.body_shapes, builder1.body_shapes)
+
+        # the static shapes and particles are transformed into each environment
+        for i, xform in enumerate(xforms):
+            assert_np_equal(
+                np.array(builder2.shape_transform[i * env.shape_count + 2]),
+                np.array(wp.transform_multiply(xform, env.shape_transform[2])),
+                tol=1.0e-6,
+            )
+            assert_np_equal(
+                np.array(builder2.particle_q[i * env.particle_count]),
+                np.array(wp.transform_point(xform, env.particle_q[0])),
+                tol=1.0e-6,
+            )
+
+        # boundary edges keep their missing opposite vertices
+        edges = np.array(builder2.edge_indices)
+        self.assertEqual(np.count_nonzero(edges == -1), num_envs * np.count_nonzero(np.array(env.edge_indices) == -1))
+
+        # untransformed copies
+        builder3 = ModelBuilder()
+        builder3.add_builders(env, num_copies=2)
+        self.assertEqual(builder3.num_envs, 2)
+        self.assertEqual(builder3.particle_q[env.particle_count], env.particle_q[0])
+        self.assertEqual(builder3.shape_transform[env.shape_count + 2], env.shape_transform[2])
+
+        model = builder2.finalize(device="cpu")
+        self.assertEqual(model.body_count, num_envs * env.body_count)
+        assert_np_equal(model.body_q.numpy(), np.array(builder1.body_q), tol=1.0e-6)
+
+        with self.assertRaises(ValueError):
+            builder3.add_builders(env, num_copies=2, xforms=xforms)
+        with self.assertRaises(ValueError):
+            builder3.add_builders(env)
+
+    def test_add_particles(self):
+        rng = np.random.default_rng(123)
+        pos = rng.standard_normal(size=(5, 3))
+        vel = rng.standard_normal(size=(5, 3))
+        mass = rng.uniform(0.5, 1.0, size=5)
+
+        builder1 = ModelBuilder()
+        builder2 = ModelBuilder()
+        builder1.add_particle(wp.vec3(), wp.vec3(), 0.0)
+        builder2.add_particle(wp.vec3(), wp.vec3(), 0.0)
+        for i in range(5):
+            builder1.add_particle(wp.vec3(pos[i]), wp.vec3(vel[i]), mass[i], radius=0.2)
+        self.assertEqual(builder2.add_particles(pos, vel, mass, radius=0.2), 1)
+
+        self.assertEqual(builder2.particle_count, 6)
+        assert_np_equal(np.array(builder1.particle_q), np.array(builder2.particle_q), tol=1.0e-6)
+        assert_np_equal(np.array(builder1.particle_qd), np.array(builder2.particle_qd), tol=1.0e-6)
+        assert_np_equal(np.array(builder1.particle_mass), np.array(builder2.particle_mass))
+        assert_np_equal(np.array(builder1.particle_radius), np.array(builder2.particle_radius))
+        self.assertEqual(
+            [flag_to_int(f) for f in builder1.particle_flags], [flag_to_int(f) for f in builder2.particle_flags]
+        )
+
+        model = builder2.finalize(device="cpu")
+        assert_np_equal(model.particle_q.numpy(), np.array(builder1.particle_q), tol=1.0e-6)
+
+    def test_add_bodies(self):
+        rng = np.random.default_rng(123)
+        pos = rng.standard_normal(size=(4, 3))
+        rot = rng.standard_normal(size=(4, 4))
+        rot /= np.linalg.norm(rot, axis=1, keepdims=True)
+        origins = np.hstack((pos, rot))
+        com = rng.standard_normal(size=(4, 3))
+        I_m = np.array([np.diag(d) for d in rng.uniform(0.1, 1.0, size=(4, 3))])
+        I_m[3] = 0.0
+        mass = np.array([1.0, 2.0, 0.5, 0.0])
+
+        builder1 = ModelBuilder()
+        builder2 = ModelBuilder()
+        for i in range(4):
+            builder1.add_body(
+                origin=wp.transform(*origins[i]), armature=0.1, com=wp.vec3(com[i]), I_m=wp.mat33(I_m[i]), m=mass[i]
+            )
+        self.assertEqual(builder2.add_bodies(origins, armature=0.1, com=com, I_m=I_m, m=mass), 0)
+
+        self.assertEqual(builder2.body_count, 4)
+        self.assertEqual(builder2.body_name, builder1.body_name)
+        self.assertEqual(builder2.body_shapes, builder1.body_shapes)
+        for name in ("body_q", "body_qd", "body_com", "body_mass", "body_inv_mass", "body_inertia", "body_inv_inertia"):
+            assert_np_equal(
+                np.array(getattr(builder1, name), dtype=float),
+                np.array(getattr(builder2, name), dtype=float),
+                tol=1.0e-5,
+            )
+
+    def test_instanced_model(self):
+        def build_env():
+            builder = ModelBuilder()
+            b0 = builder.add_body(origin=wp.transform((0.0, 1.0, 0.0), wp.quat_identity()))
+            builder.add_shape_box(b0, hx=0.1, hy=0.2, hz=0.1, density=100.0)
+            b1 = builder.add_body(origin=wp.transform((0.0, 0.5, 0.0), wp.quat_identity()))
+            builder.add_shape_sphere(b1, radius=0.1, density=100.0)
+            builder.add_joint_revolute(
+                -1, b0, parent_xform=wp.transform((0.0, 0.3, 0.0), wp.quat_identity()), axis=(0.0, 0.0, 1.0)
+            )
+            builder.add_joint_d6(
+                b0,
+                b1,
+                parent_xform=wp.transform((0.0, -0.25, 0.0), wp.quat_identity()),
+                linear_axes=[wp.sim.JointAxis((0.0, 1.0, 0.0))],
+                angular_axes=[wp.sim.JointAxis((1.0, 0.0, 0.0)), wp.sim.JointAxis((0.0, 0.0, 1.0))],
+            )
+            return builder
+
+        def build_model(instanced):
+            builder = ModelBuilder()
+            builder.instanced = instanced
+            builder.add_builders(
+                build_env(), xforms=[wp.transform((2.0 * i, 0.0, 0.0), wp.quat_identity()) for i in range(4)]
+            )
+            builder.add_shape_sphere(-1, pos=(0.0, 0.05, 0.0), radius=0.05)
+            builder.joint_q = list(np.random.default_rng(123).uniform(-0.5, 0.5, len(builder.joint_q)))
+            return builder.finalize()
+
+        results = []
+        for instanced in (False, True):
+            model = build_model(instanced)
+            state_0, state_1 = model.state(), model.state()
+            wp.sim.eval_fk(model, model.joint_q, model.joint_qd, None, state_0)
+            body_q = state_0.body_q.numpy()
+            joint_q = wp.zeros_like(model.joint_q)
+            joint_qd = wp.zeros_like(model.joint_qd)
+            wp.sim.eval_ik(model, state_0, joint_q, joint_qd)
+
+            integrator = wp.sim.FeatherstoneIntegrator(model)
+            for _ in range(10):
+                state_0.clear_forces()
+                wp.sim.collide(model, state_0)
+                integrator.simulate(model, state_0, state_1, 1.0e-3)
+                state_0, state_1 = state_1, state_0
+            results.append((body_q, joint_q.numpy(), state_0.joint_q.numpy(), model.rigid_contact_count.numpy()))
+
+        # static data is stored once for the environments, followed by the extra sphere and the ground plane
+        self.assertTrue(model.instanced)
+        self.assertEqual(model.instancing.env_count, 4)
+        self.assertEqual(model.shape_count, 10)
+        self.assertEqual(len(model.shape_geo.type), 4)
+        self.assertEqual(len(model.shape_materials.ke), 4)
+        self.assertEqual(len(model.shape_geo_src), 4)
+        assert_np_equal(model.shape_geo_indices(), np.array([0, 1, 0, 1, 0, 1, 0, 1, 2, 3]))
+        self.assertEqual(len(model.body_inertia), 2)
+        self.assertEqual(len(model.body_mass), 8)
+        self.assertEqual(len(model.joint_type), 2)
+        self.assertEqual(len(model.joint_axis), 4)
+        self.assertEqual(len(model.joint_X_p), 8)
+
+        self.assertGreater(results[0][3][0], 0)
+        for expected, actual in zip(*results):
+            assert_np_equal(actual, expected, tol=1.0e-6)
+
+        with self.assertRaises(ValueError):
+            wp.sim.XPBDIntegrator().simulate(model, model.state(), model.state(), 1.0e-3)
+        with self.assertRaises(ValueError):
+            wp.sim.SemiImplicitIntegrator().simulate(model, model.state(), model.state(), 1.0e-3)
+
+    def test_instanced_model_mismatch(self):
+        env = ModelBuilder()
+        body = env.add_body()
+        env.add_shape_sphere(body, radius=0.1)
+        env.add_joint_free(body)
+
+        builder = ModelBuilder()
+        builder.instanced = True
+        builder.add_builders(env, num_copies=3)
+        builder.shape_geo_scale[1] = (0.2, 0.0, 0.0)
+        with self.assertRaises(ValueError):
+            builder.finalize()
+
+        # elements added before the environments cannot be instanced
+        builder = ModelBuilder()
+        builder.instanced = True
+        builder.add_shape_box(-1, hx=1.0, hy=0.1, hz=1.0)
+        builder.add_builders(env, num_copies=3)
+        with self.assertRaises(ValueError):
+            builder.finalize()
+
 
 if __name__ == "__main__":
     wp.clear_kernel_cache()
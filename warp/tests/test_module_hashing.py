@@ -12,6 +12,8 @@ import tempfile
 import unittest
 from importlib import util
 
+import numpy as np
+
 import warp as wp
 from warp.tests.unittest_utils import *
 
@@ -234,6 +236,331 @@ def test_module_load(test, device):
     test.assertEqual(hash1, hash2)
 
 
+INDEXED_MODULE = """# -*- coding: utf-8 -*-
+import warp as wp
+
+@wp.func
+def scale(x: float):
+    return 2.0 * x
+
+@wp.kernel
+def k(a: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i] = scale(a[i])
+"""
+
+
+def test_module_index(test, device):
+    """Ensure that the kernel cache index restores the module hash and is invalidated by source and option changes"""
+    kernel_cache_index = wp.config.kernel_cache_index
+    wp.config.kernel_cache_index = True
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "indexed_module.py")
+            with open(file_path, "w") as f:
+                f.write(INDEXED_MODULE)
+
+            spec = util.spec_from_file_location(f"indexed_module_{device.alias}", file_path)
+            module = util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            m = wp.get_module(module.__name__)
+            block_dim = m.options["block_dim"]
+
+            # the first load hashes the module and records it in the index
+            m.load(device)
+            test.assertIsInstance(m.hashers[block_dim], wp.context.ModuleHasher)
+
+            module_hash = m.hashers[block_dim].get_module_hash()
+            kernel_hash = module.k.hash
+
+            # loading the module again restores the hashes from the index
+            m.unload()
+            module.k.hash = None
+            m.load(device)
+            test.assertIsInstance(m.hashers[block_dim], wp.context.ModuleIndexHasher)
+            test.assertEqual(m.hashers[block_dim].get_module_hash(), module_hash)
+            test.assertEqual(module.k.hash, kernel_hash)
+
+            a = wp.full(4, 3.0, dtype=float, device=device)
+            wp.launch(module.k, dim=4, inputs=[a], device=device)
+            assert_np_equal(a.numpy(), np.full(4, 6.0))
+
+            # changing the module options invalidates the index entry
+            m.unload()
+            wp.set_module_options({"max_unroll": m.options["max_unroll"] + 1}, module=module)
+            m.load(device)
+            test.assertIsInstance(m.hashers[block_dim], wp.context.ModuleHasher)
+
+            # so does modifying the source file
+            with open(file_path, "w") as f:
+                f.write(INDEXED_MODULE.replace("2.0 * x", "x + x"))
+
+            m.unload()
+            m.load(device)
+            test.assertIsInstance(m.hashers[block_dim], wp.context.ModuleHasher)
+    finally:
+        wp.config.kernel_cache_index = kernel_cache_index
+
+
+INDEXED_CONSTANT_MODULE = """# -*- coding: utf-8 -*-
+import warp as wp
+
+C = wp.constant(1)
+
+@wp.kernel
+def k(a: wp.array(dtype=int)):
+    a[0] = C
+"""
+
+
+def test_module_index_constants(test, device):
+    """Ensure that the kernel cache index is invalidated by changing the value of a referenced constant"""
+    kernel_cache_index = wp.config.kernel_cache_index
+    wp.config.kernel_cache_index = True
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "indexed_constant_module.py")
+            with open(file_path, "w") as f:
+                f.write(INDEXED_CONSTANT_MODULE)
+
+            spec = util.spec_from_file_location(f"indexed_constant_module_{device.alias}", file_path)
+            module = util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            m = wp.get_module(module.__name__)
+            block_dim = m.options["block_dim"]
+
+            a = wp.zeros(1, dtype=int, device=device)
+            wp.launch(module.k, dim=1, inputs=[a], device=device)
+            assert_np_equal(a.numpy(), np.array([1]))
+
+            # the constant may be computed at runtime, e.g. from the environment, without changing the source
+            m.unload()
+            module.C = wp.constant(2)
+            m.load(device)
+            test.assertIsInstance(m.hashers[block_dim], wp.context.ModuleHasher)
+
+            wp.launch(module.k, dim=1, inputs=[a], device=device)
+            assert_np_equal(a.numpy(), np.array([2]))
+    finally:
+        wp.config.kernel_cache_index = kernel_cache_index
+
+
+CONCURRENT_MODULE = """# -*- coding: utf-8 -*-
+import warp as wp
+
+@wp.kernel
+def k(a: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i] = float(i) + VALUE
+"""
+
+CONCURRENT_MODULE_ERROR = """# -*- coding: utf-8 -*-
+import warp as wp
+
+@wp.func_native("this is not valid C++;")
+def invalid(x: float):
+    ...
+
+@wp.kernel
+def k(a: wp.array(dtype=float)):
+    i = wp.tid()
+    invalid(a[i])
+"""
+
+
+def test_force_load_concurrent(test, device):
+    """Ensure that modules compiled concurrently by wp.force_load() are loaded, and that failures are reported"""
+    modules = []
+    m = load_code_as_module(CONCURRENT_MODULE.replace("VALUE", "1.0"), f"concurrent_module_1_{device.alias}")
+    modules.append(m)
+    m = load_code_as_module(CONCURRENT_MODULE.replace("VALUE", "2.0"), f"concurrent_module_2_{device.alias}")
+    modules.append(m)
+
+    wp.force_load(device=device, modules=modules, max_workers=2)
+
+    for i, m in enumerate(modules):
+        test.assertIn((device.context, m.options["block_dim"]), m.execs)
+
+        a = wp.zeros(4, dtype=float, device=device)
+        wp.launch(m.kernels["k"], dim=4, inputs=[a], device=device)
+        assert_np_equal(a.numpy(), np.arange(4) + float(i + 1))
+
+    m = load_code_as_module(CONCURRENT_MODULE.replace("VALUE", "3.0"), f"concurrent_module_3_{device.alias}")
+    modules.append(m)
+    m = load_code_as_module(CONCURRENT_MODULE_ERROR, f"concurrent_module_error_{device.alias}")
+    modules.append(m)
+
+    with test.assertRaisesRegex(Exception, "kernel build failed"):
+        wp.force_load(device=device, modules=modules, max_workers=2)
+
+    # modules compiled successfully are still loaded
+    test.assertIn((device.context, modules[2].options["block_dim"]), modules[2].execs)
+    test.assertNotIn((device.context, modules[3].options["block_dim"]), modules[3].execs)
+
+
+def test_kernel_cache_archive(test, device):
+    """Ensure that modules packed by wp.pack_kernel_cache() are loaded from the archive and misses are compiled"""
+    m = load_code_as_module(CONCURRENT_MODULE.replace("VALUE", "1.0"), f"archived_module_{device.alias}")
+
+    kernel_cache_dir = wp.config.kernel_cache_dir
+    kernel_cache_archive = wp.config.kernel_cache_archive
+    block_dim = m.options["block_dim"]
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            archive_path = os.path.join(tmp_dir, "kernels.zip")
+            wp.pack_kernel_cache(archive_path, modules=[m], devices=[device], block_dims=[64])
+
+            # packing restores the module options
+            test.assertEqual(m.options["block_dim"], block_dim)
+
+            # start from an empty kernel cache using the archive as a read-only layer
+            wp.config.kernel_cache_dir = os.path.join(tmp_dir, "cache")
+            os.makedirs(wp.config.kernel_cache_dir)
+            wp.config.kernel_cache_archive = archive_path
+
+            def module_sources(block_dim):
+                module_hash = m.hashers[block_dim].get_module_hash()
+                module_dir = os.path.join(wp.config.kernel_cache_dir, f"wp_{m.name}_{module_hash.hex()[:7]}")
+                test.assertTrue(os.path.isdir(module_dir))
+                return [f for f in os.listdir(module_dir) if os.path.splitext(f)[1] in (".cpp", ".cu")]
+
+            m.unload()
+            m.load(device, block_dim=64)
+            test.assertEqual(module_sources(64), [])
+
+            a = wp.zeros(4, dtype=float, device=device)
+            wp.launch(m.kernels["k"], dim=4, inputs=[a], device=device, block_dim=64)
+            assert_np_equal(a.numpy(), np.arange(4) + 1.0)
+
+            # block dimensions that were not packed are compiled into the kernel cache
+            m.load(device, block_dim=32)
+            test.assertNotEqual(module_sources(32), [])
+
+            wp.config.kernel_cache_archive = None
+            m.unload()
+    finally:
+        wp.config.kernel_cache_dir = kernel_cache_dir
+        wp.config.kernel_cache_archive = kernel_cache_archive
+        m.options["block_dim"] = block_dim
+
+
+PER_KERNEL_MODULE = """# -*- coding: utf-8 -*-
+from typing import Any
+
+import warp as wp
+
+@wp.func
+def scale(x: float):
+    return 2.0 * x
+
+@wp.func
+def offset(x: float):
+    return x + 1.0
+
+@wp.kernel
+def k_scale(a: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i] = scale(a[i])
+
+@wp.kernel
+def k_offset(a: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i] = offset(a[i])
+
+@wp.kernel
+def k_generic(a: wp.array(dtype=Any)):
+    i = wp.tid()
+    a[i] = a[i] + a.dtype(1)
+"""
+
+
+def test_compile_per_kernel(test, device):
+    """Ensure that modules compiled per kernel only build the kernels that are launched"""
+    kernel_cache_dir = wp.config.kernel_cache_dir
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            wp.config.kernel_cache_dir = tmp_dir
+
+            # generic kernels are instantiated from the source file
+            file_path = os.path.join(tmp_dir, "per_kernel_module.py")
+            with open(file_path, "w") as f:
+                f.write(PER_KERNEL_MODULE)
+
+            spec = util.spec_from_file_location(f"per_kernel_module_{device.alias}", file_path)
+            module = util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            m = wp.get_module(module.__name__)
+            m.options["compile_unit"] = "kernel"
+            m.mark_modified()
+
+            def cached_sources():
+                sources = []
+                for entry in os.listdir(tmp_dir):
+                    if entry.startswith(f"wp_{m.name}"):
+                        sources.extend(
+                            os.path.join(tmp_dir, entry, f)
+                            for f in os.listdir(os.path.join(tmp_dir, entry))
+                            if os.path.splitext(f)[1] in (".cpp", ".cu")
+                        )
+                return sources
+
+            a = wp.full(4, 3.0, dtype=float, device=device)
+            wp.launch(m.kernels["k_scale"], dim=4, inputs=[a], device=device)
+            assert_np_equal(a.numpy(), np.full(4, 6.0))
+
+            # only the launched kernel and the functions it calls are compiled
+            sources = cached_sources()
+            test.assertEqual(len(sources), 1)
+            with open(sources[0]) as f:
+                source = f.read()
+            test.assertIn("k_scale", source)
+            test.assertIn("scale", source)
+            test.assertNotIn("k_offset", source)
+            test.assertNotIn("offset_", source)
+            test.assertEqual(m.execs, {})
+
+            wp.launch(m.kernels["k_offset"], dim=4, inputs=[a], device=device)
+            assert_np_equal(a.numpy(), np.full(4, 7.0))
+            test.assertEqual(len(cached_sources()), 2)
+
+            # overloads of generic kernels are compiled separately
+            b = wp.zeros(4, dtype=int, device=device)
+            wp.launch(m.kernels["k_generic"], dim=4, inputs=[b], device=device)
+            wp.launch(m.kernels["k_generic"], dim=4, inputs=[a], device=device)
+            assert_np_equal(b.numpy(), np.full(4, 1))
+            assert_np_equal(a.numpy(), np.full(4, 8.0))
+            test.assertEqual(len(cached_sources()), 4)
+
+            # modifying the module options rebuilds the kernels on their next launch
+            m.options["max_unroll"] += 1
+            m.mark_modified()
+            wp.launch(m.kernels["k_scale"], dim=4, inputs=[a], device=device)
+            assert_np_equal(a.numpy(), np.full(4, 16.0))
+            test.assertEqual(len(cached_sources()), 5)
+
+            # force loading a module loads all its kernels
+            m.unload()
+            wp.force_load(device=device, modules=[m])
+            test.assertEqual(len(cached_sources()), 8)
+            for unit in m.get_compile_units():
+                test.assertIn((device.context, m.options["block_dim"]), unit.execs)
+
+            with test.assertRaises(ValueError):
+                m.options["compile_unit"] = "function"
+                wp.launch(m.kernels["k_scale"], dim=4, inputs=[a], device=device)
+
+            m.unload()
+    finally:
+        wp.config.kernel_cache_dir = kernel_cache_dir
+
+
 class TestModuleHashing(unittest.TestCase):
     pass
 
@@ -243,6 +570,11 @@ devices = get_test_devices()
 add_function_test(TestModuleHashing, "test_function_overload_hashing", test_function_overload_hashing)
 add_function_test(TestModuleHashing, "test_function_generic_overload_hashing", test_function_generic_overload_hashing)
 add_function_test(TestModuleHashing, "test_module_load", test_module_load, devices=devices)
+add_function_test(TestModuleHashing, "test_module_index", test_module_index, devices=devices)
+add_function_test(TestModuleHashing, "test_module_index_constants", test_module_index_constants, devices=devices)
+add_function_test(TestModuleHashing, "test_force_load_concurrent", test_force_load_concurrent, devices=devices)
+add_function_test(TestModuleHashing, "test_kernel_cache_archive", test_kernel_cache_archive, devices=devices)
+add_function_test(TestModuleHashing, "test_compile_per_kernel", test_compile_per_kernel, devices=devices)
 
 
 if __name__ == "__main__":
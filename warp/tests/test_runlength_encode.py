@@ -34,6 +34,40 @@ def test_runlength_encode_int(test, device, n):
     assert_np_equal(unique_counts.numpy()[:run_count], unique_counts_np[:run_count])
 
 
+def test_runlength_encode_cpu_threads(test, device):
+    rng = np.random.default_rng(123)
+
+    # long runs spanning several of the blocks processed by each thread
+    values_np = np.repeat(np.arange(-500, 500, dtype=np.int32), rng.integers(1, 500, size=1000))
+    values_np[-50000:] = values_np[-1]
+
+    unique_values_np, unique_counts_np = np.unique(values_np, return_counts=True)
+
+    saved_num_threads = wp.config.cpu_num_threads
+    try:
+        for num_threads in (1, 4):
+            wp.config.cpu_num_threads = num_threads
+
+            values = wp.array(values_np, device=device, dtype=int)
+            unique_values = wp.empty_like(values)
+            unique_counts = wp.empty_like(values)
+
+            run_count = runlength_encode(values, unique_values, unique_counts)
+
+            test.assertEqual(run_count, len(unique_values_np))
+            assert_np_equal(unique_values.numpy()[:run_count], unique_values_np)
+            assert_np_equal(unique_counts.numpy()[:run_count], unique_counts_np)
+
+            # in-place encoding
+            run_count = runlength_encode(values, values, unique_counts)
+
+            test.assertEqual(run_count, len(unique_values_np))
+            assert_np_equal(values.numpy()[:run_count], unique_values_np)
+            assert_np_equal(unique_counts.numpy()[:run_count], unique_counts_np)
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
 def test_runlength_encode_error_insufficient_storage(test, device):
     values = wp.zeros(123, dtype=int, device=device)
     run_values = wp.empty(1, dtype=int, device=device)
@@ -151,6 +185,9 @@ add_function_test(
 add_function_test(
     TestRunlengthEncode, "test_runlength_encode_empty", partial(test_runlength_encode_int, n=0), devices=devices
 )
+add_function_test(
+    TestRunlengthEncode, "test_runlength_encode_cpu_threads", test_runlength_encode_cpu_threads, devices=["cpu"]
+)
 add_function_test(
     TestRunlengthEncode,
     "test_runlength_encode_error_insufficient_storage",
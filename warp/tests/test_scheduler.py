@@ -0,0 +1,316 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+import unittest
+
+import numpy as np
+
+import warp as wp
+import warp.sim
+from warp.tests.unittest_utils import *
+
+
+@wp.kernel
+def inc(a: wp.array(dtype=float)):
+    tid = wp.tid()
+    a[tid] = a[tid] + 1.0
+
+
+@wp.kernel
+def scale(src: wp.array(dtype=float), s: float, dst: wp.array(dtype=float)):
+    tid = wp.tid()
+    dst[tid] = src[tid] * s
+
+
+@wp.kernel
+def sum(a: wp.array(dtype=float), b: wp.array(dtype=float), c: wp.array(dtype=float)):
+    tid = wp.tid()
+    c[tid] = a[tid] + b[tid]
+
+
+@wp.kernel
+def square(x: wp.array(dtype=float), y: wp.array(dtype=float)):
+    tid = wp.tid()
+    y[tid] = x[tid] * x[tid]
+
+
+@wp.kernel
+def set_x(a: wp.array(dtype=wp.vec3), x: float):
+    tid = wp.tid()
+    a[tid].x = x
+
+
+@wp.kernel
+def get_x(a: wp.array(dtype=wp.vec3), x: wp.array(dtype=float)):
+    tid = wp.tid()
+    x[tid] = a[tid].x
+
+
+N = 1024
+
+
+def test_task_graph_dependencies(test, device):
+    a = wp.ones(N, dtype=float, device=device)
+    b = wp.zeros(N, dtype=float, device=device)
+    c = wp.zeros(N, dtype=float, device=device)
+    d = wp.zeros(N, dtype=float, device=device)
+
+    graph = wp.TaskGraph(device)
+    t0 = graph.record_launch(scale, dim=N, inputs=[a, 2.0], outputs=[b])
+    t1 = graph.record_launch(scale, dim=N, inputs=[a, 3.0], outputs=[c])
+    t2 = graph.record_launch(sum, dim=N, inputs=[b, c], outputs=[d])
+    t3 = graph.record_launch(inc, dim=N, inputs=[a])
+
+    # kernels reading the same array are independent
+    test.assertEqual(t0.dependencies, [])
+    test.assertEqual(t1.dependencies, [])
+    test.assertEqual(t2.dependencies, [t0, t1])
+
+    # writing an array read by earlier tasks
+    test.assertEqual(t3.dependencies, [t0, t1])
+
+    graph.launch()
+
+    # independent tasks are submitted to different streams
+    test.assertNotEqual(t0.stream_index, t1.stream_index)
+
+    assert_np_equal(d.numpy(), np.full(N, 5.0))
+    assert_np_equal(a.numpy(), np.full(N, 2.0))
+
+
+def test_task_graph_array_views(test, device):
+    a = wp.zeros(2 * N, dtype=float, device=device)
+
+    graph = wp.TaskGraph(device)
+    t0 = graph.record_launch(inc, dim=N, inputs=[a[:N]])
+    t1 = graph.record_launch(inc, dim=N, inputs=[a[N:]])
+    t2 = graph.record_launch(inc, dim=N, inputs=[a[N // 2 : N // 2 + N]])
+
+    # disjoint views of an array are independent
+    test.assertEqual(t0.dependencies, [])
+    test.assertEqual(t1.dependencies, [])
+    test.assertEqual(t2.dependencies, [t0, t1])
+
+    graph.launch()
+
+    expected = np.ones(2 * N)
+    expected[N // 2 : N // 2 + N] += 1.0
+    assert_np_equal(a.numpy(), expected)
+
+
+def test_task_graph_component_store(test, device):
+    a = wp.zeros(N, dtype=wp.vec3, device=device)
+    x = wp.zeros(N, dtype=float, device=device)
+
+    graph = wp.TaskGraph(device)
+    t0 = graph.record_launch(set_x, dim=N, inputs=[a, 1.0])
+    t1 = graph.record_launch(get_x, dim=N, inputs=[a], outputs=[x])
+    t2 = graph.record_launch(set_x, dim=N, inputs=[a, 2.0])
+
+    # stores to the components of array elements write the array
+    test.assertEqual(t1.dependencies, [t0])
+    test.assertEqual(t2.dependencies, [t0, t1])
+
+    graph.launch()
+
+    assert_np_equal(x.numpy(), np.full(N, 1.0))
+    assert_np_equal(a.numpy()[:, 0], np.full(N, 2.0))
+
+
+def test_task_graph_unknown_access(test, device):
+    a = wp.zeros(N, dtype=float, device=device)
+    b = wp.zeros(N, dtype=float, device=device)
+
+    graph = wp.TaskGraph(device)
+    t0 = graph.record_launch(inc, dim=N, inputs=[a])
+    t1 = graph.record_func(lambda: wp.launch(inc, dim=N, inputs=[a], device=device), name="inc a")
+    t2 = graph.record_launch(inc, dim=N, inputs=[b])
+    t3 = graph.record_func(lambda: b.fill_(10.0), reads=[], writes=[b])
+
+    # functions of unknown access depend on all the other tasks
+    test.assertEqual(t1.dependencies, [t0])
+    test.assertEqual(t2.dependencies, [t1])
+    test.assertEqual(t3.dependencies, [t1, t2])
+
+    graph.launch()
+
+    assert_np_equal(a.numpy(), np.full(N, 2.0))
+    assert_np_equal(b.numpy(), np.full(N, 10.0))
+
+
+def test_task_graph_relaunch(test, device):
+    x = wp.zeros(N, dtype=float, device=device)
+    y = wp.zeros(N, dtype=float, device=device)
+
+    graph = wp.TaskGraph(device, max_streams=2)
+    graph.record_launch(inc, dim=N, inputs=[x])
+    graph.record_launch(inc, dim=N, inputs=[y])
+    graph.record_launch(inc, dim=N, inputs=[y])
+
+    num_iters = 5
+    for _ in range(num_iters):
+        graph.launch()
+
+    assert_np_equal(x.numpy(), np.full(N, float(num_iters)))
+    assert_np_equal(y.numpy(), np.full(N, float(2 * num_iters)))
+
+    # tasks are assigned to the launch stream when a single stream is allowed
+    graph = wp.TaskGraph(device, max_streams=1)
+    tasks = [graph.record_launch(inc, dim=N, inputs=[x]), graph.record_launch(inc, dim=N, inputs=[y])]
+    graph.launch()
+    test.assertEqual([task.stream_index for task in tasks], [0, 0])
+
+
+def test_scoped_schedule(test, device):
+    a = wp.zeros(N, dtype=float, device=device)
+    b = wp.zeros(N, dtype=float, device=device)
+    c = wp.empty(N, dtype=float, device=device)
+
+    with wp.ScopedSchedule(device) as schedule:
+        a.fill_(2.0)
+        b.zero_()
+        wp.launch(inc, dim=N, inputs=[b], device=device)
+        wp.copy(c, a)
+        wp.launch(sum, dim=N, inputs=[b, c], outputs=[a], device=device)
+
+        # operations are recorded and executed when the context exits
+        test.assertEqual(len(schedule.graph.tasks), 5)
+
+    assert_np_equal(a.numpy(), np.full(N, 3.0))
+    assert_np_equal(c.numpy(), np.full(N, 2.0))
+
+    tasks = schedule.graph.tasks
+    test.assertEqual(tasks[4].dependencies, [tasks[0], tasks[1], tasks[2], tasks[3]])
+
+    # the recorded graph can be launched again
+    schedule.graph.launch()
+    assert_np_equal(a.numpy(), np.full(N, 3.0))
+
+    with test.assertRaises(RuntimeError):
+        with wp.ScopedSchedule(device):
+            with wp.ScopedSchedule(device):
+                pass
+
+    with wp.ScopedSchedule(device, launch=False) as schedule:
+        wp.launch(inc, dim=N, inputs=[a], device=device)
+
+    assert_np_equal(a.numpy(), np.full(N, 3.0))
+    schedule.graph.launch()
+    assert_np_equal(a.numpy(), np.full(N, 4.0))
+
+
+def test_scoped_schedule_capture(test, device):
+    a = wp.zeros(N, dtype=float, device=device)
+    b = wp.zeros(N, dtype=float, device=device)
+    c = wp.zeros(N, dtype=float, device=device)
+
+    with wp.ScopedSchedule(device, launch=False) as schedule:
+        wp.launch(inc, dim=N, inputs=[a], device=device)
+        wp.launch(inc, dim=N, inputs=[b], device=device)
+        wp.launch(sum, dim=N, inputs=[a, b], outputs=[c], device=device)
+
+    # the tasks and their dependencies are captured in a graph
+    with wp.ScopedCapture(device, force_module_load=False) as capture:
+        schedule.graph.launch()
+
+    num_iters = 3
+    for _ in range(num_iters):
+        wp.capture_launch(capture.graph)
+
+    assert_np_equal(c.numpy(), np.full(N, 2.0 * num_iters))
+
+
+def test_scoped_schedule_tape(test, device):
+    x = wp.array(np.linspace(0.0, 1.0, N, dtype=np.float32), device=device, requires_grad=True)
+    y = wp.zeros(N, dtype=float, device=device, requires_grad=True)
+    z = wp.zeros(N, dtype=float, device=device, requires_grad=True)
+
+    tape = wp.Tape()
+    with tape:
+        with wp.ScopedSchedule(device):
+            wp.launch(square, dim=N, inputs=[x], outputs=[y], device=device)
+            wp.launch(scale, dim=N, inputs=[x, 3.0], outputs=[z], device=device)
+
+    # the forward launches are recorded on the tape
+    tape.backward(grads={y: wp.ones(N, dtype=float, device=device), z: wp.ones(N, dtype=float, device=device)})
+
+    assert_np_equal(x.grad.numpy(), 2.0 * x.numpy() + 3.0, tol=1.0e-5)
+
+
+def test_scoped_schedule_collide(test, device):
+    builder = wp.sim.ModelBuilder()
+
+    # particles resting on a sphere and two overlapping boxes
+    for i in range(4):
+        builder.add_particle(wp.vec3(0.1 * i, 0.55, 0.0), wp.vec3(), 1.0, radius=0.1)
+
+    b0 = builder.add_body(origin=wp.transform((0.0, 0.0, 0.0), wp.quat_identity()))
+    builder.add_shape_sphere(b0, radius=0.5)
+    b1 = builder.add_body(origin=wp.transform((2.0, 0.5, 0.0), wp.quat_identity()))
+    builder.add_shape_box(b1, hx=0.5, hy=0.5, hz=0.5)
+    b2 = builder.add_body(origin=wp.transform((2.0, 1.4, 0.0), wp.quat_identity()))
+    builder.add_shape_box(b2, hx=0.5, hy=0.5, hz=0.5)
+
+    model = builder.finalize(device=device)
+    state = model.state()
+
+    wp.sim.collide(model, state)
+    soft_count = model.soft_contact_count.numpy()[0]
+    rigid_count = model.rigid_contact_count.numpy()[0]
+    rigid_shape0 = model.rigid_contact_shape0.numpy()
+
+    test.assertGreater(soft_count, 0)
+    test.assertGreater(rigid_count, 0)
+
+    with wp.ScopedSchedule(device) as schedule:
+        wp.sim.collide(model, state)
+
+    # the soft contacts do not depend on the rigid contacts
+    tasks = schedule.graph.tasks
+    soft_task = next(task for task in tasks if "create_soft_contacts" in task.name)
+    rigid_tasks = [task for task in tasks if "broadphase_collision_pairs" in task.name]
+    test.assertTrue(rigid_tasks)
+    test.assertTrue(all(soft_task not in task.dependencies for task in rigid_tasks))
+
+    test.assertEqual(model.soft_contact_count.numpy()[0], soft_count)
+    test.assertEqual(model.rigid_contact_count.numpy()[0], rigid_count)
+    assert_np_equal(np.sort(model.rigid_contact_shape0.numpy()), np.sort(rigid_shape0))
+
+
+devices = get_test_devices()
+
+
+class TestScheduler(unittest.TestCase):
+    def test_task_graph_exceptions(self):
+        with self.assertRaises(ValueError):
+            wp.TaskGraph("cpu", max_streams=0)
+
+        a = wp.zeros(N, dtype=float, device="cpu")
+        graph = wp.TaskGraph("cpu")
+
+        with self.assertRaises(RuntimeError):
+            graph.record_launch(inc, dim=N, inputs=[a, a])
+
+        with self.assertRaises(RuntimeError):
+            with wp.ScopedSchedule("cpu"):
+                graph.launch()
+
+
+add_function_test(TestScheduler, "test_task_graph_dependencies", test_task_graph_dependencies, devices=devices)
+add_function_test(TestScheduler, "test_task_graph_array_views", test_task_graph_array_views, devices=devices)
+add_function_test(TestScheduler, "test_task_graph_component_store", test_task_graph_component_store, devices=devices)
+add_function_test(TestScheduler, "test_task_graph_unknown_access", test_task_graph_unknown_access, devices=devices)
+add_function_test(TestScheduler, "test_task_graph_relaunch", test_task_graph_relaunch, devices=devices)
+add_function_test(TestScheduler, "test_scoped_schedule", test_scoped_schedule, devices=devices)
+add_function_test(TestScheduler, "test_scoped_schedule_capture", test_scoped_schedule_capture, devices=devices)
+add_function_test(TestScheduler, "test_scoped_schedule_tape", test_scoped_schedule_tape, devices=devices)
+add_function_test(TestScheduler, "test_scoped_schedule_collide", test_scoped_schedule_collide, devices=devices)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)
@@ -0,0 +1,140 @@
+# Copyright (c) 2025 NVIDIA CORPORATION.  All rights reserved.
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+import unittest
+
+import numpy as np
+
+import warp as wp
+import warp.sim
+from warp.tests.unittest_utils import *
+
+
+def build_scene(device, requires_grad=False):
+    builder = wp.sim.ModelBuilder()
+
+    # cloth with springs and bending edges falling on a sphere
+    builder.add_cloth_grid(
+        pos=wp.vec3(-0.5, 1.0, -0.5),
+        rot=wp.quat_identity(),
+        vel=wp.vec3(),
+        dim_x=8,
+        dim_y=8,
+        cell_x=0.125,
+        cell_y=0.125,
+        mass=0.1,
+        fix_left=True,
+        add_springs=True,
+        particle_radius=0.05,
+    )
+    builder.add_shape_sphere(-1, pos=(0.0, 0.5, 0.0), radius=0.3)
+
+    # boxes falling on the ground
+    for i in range(3):
+        body = builder.add_body(origin=wp.transform((1.0 + 0.5 * i, 0.3 + 0.2 * i, 0.0), wp.quat_identity()))
+        builder.add_shape_box(body, hx=0.2, hy=0.2, hz=0.2)
+
+    return builder.finalize(device=device, requires_grad=requires_grad)
+
+
+def simulate(model, integrator, state_0, state_1, num_steps, dt=1.0e-3):
+    for _ in range(num_steps):
+        state_0.clear_forces()
+        wp.sim.collide(model, state_0)
+        integrator.simulate(model, state_0, state_1, dt)
+        state_0, state_1 = state_1, state_0
+    return state_0, state_1
+
+
+def test_xpbd_workspace(test, device):
+    model = build_scene(device)
+
+    integrator = wp.sim.XPBDIntegrator(enable_restitution=True)
+    ref_state_0, _ = simulate(model, integrator, model.state(), model.state(), 10)
+    test.assertIsNone(integrator.workspace)
+
+    integrator.allocate_workspace(model)
+    workspace = dict(integrator.workspace)
+    test.assertIn("particle_deltas", workspace)
+    test.assertIn("body_deltas", workspace)
+    test.assertIn("spring_constraint_lambdas", workspace)
+
+    state_0, state_1 = simulate(model, integrator, model.state(), model.state(), 10)
+
+    # the steps reuse the preallocated arrays
+    test.assertEqual(integrator.workspace.keys(), workspace.keys())
+    for name, array in workspace.items():
+        test.assertIs(integrator.workspace[name], array)
+    test.assertIs(integrator.particle_q_init, workspace["particle_q_init"])
+
+    assert_np_equal(state_0.particle_q.numpy(), ref_state_0.particle_q.numpy(), tol=1.0e-5)
+    assert_np_equal(state_0.body_q.numpy(), ref_state_0.body_q.numpy(), tol=1.0e-5)
+
+    integrator.free_workspace()
+    simulate(model, integrator, state_0, state_1, 1)
+    test.assertIsNone(integrator.workspace)
+    test.assertIsNot(integrator.particle_q_init, workspace["particle_q_init"])
+
+
+def test_xpbd_workspace_capture(test, device):
+    model = build_scene(device)
+
+    num_steps = 4
+    integrator = wp.sim.XPBDIntegrator()
+    ref_state_0, _ = simulate(model, integrator, model.state(), model.state(), 3 * num_steps)
+
+    integrator.allocate_workspace(model)
+    state_0 = model.state()
+    state_1 = model.state()
+
+    with wp.ScopedCapture(device) as capture:
+        simulate(model, integrator, state_0, state_1, num_steps)
+
+    for _ in range(3):
+        wp.capture_launch(capture.graph)
+
+    assert_np_equal(state_0.particle_q.numpy(), ref_state_0.particle_q.numpy(), tol=1.0e-5)
+    assert_np_equal(state_0.body_q.numpy(), ref_state_0.body_q.numpy(), tol=1.0e-5)
+
+
+def test_xpbd_workspace_requires_grad(test, device):
+    model = build_scene(device, requires_grad=True)
+
+    integrator = wp.sim.XPBDIntegrator()
+    integrator.allocate_workspace(model)
+
+    states = [model.state() for _ in range(3)]
+    tape = wp.Tape()
+    with tape:
+        for i in range(2):
+            wp.sim.collide(model, states[i])
+            integrator.simulate(model, states[i], states[i + 1], 1.0e-3)
+
+            # the temporary arrays recorded on the tape are not taken from the workspace
+            test.assertTrue(all(integrator.particle_q_init is not a for a in integrator.workspace.values()))
+
+    tape.backward(grads={states[-1].particle_q: wp.ones_like(states[-1].particle_q, requires_grad=False)})
+    test.assertTrue(np.any(states[0].particle_q.grad.numpy() != 0.0))
+
+
+devices = get_test_devices()
+
+
+class TestSimIntegrator(unittest.TestCase):
+    pass
+
+
+add_function_test(TestSimIntegrator, "test_xpbd_workspace", test_xpbd_workspace, devices=devices)
+add_function_test(TestSimIntegrator, "test_xpbd_workspace_capture", test_xpbd_workspace_capture, devices=devices)
+add_function_test(
+    TestSimIntegrator, "test_xpbd_workspace_requires_grad", test_xpbd_workspace_requires_grad, devices=devices
+)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)
@@ -20,6 +20,13 @@ def inc(a: wp.array(dtype=float)):
     a[tid] = a[tid] + 1.0
 
 
+@wp.kernel
+def write_keys(keys: wp.array(dtype=int), values: wp.array(dtype=int)):
+    tid = wp.tid()
+    keys[tid] = keys.shape[0] // 2 - 1 - tid
+    values[tid] = tid
+
+
 @wp.kernel
 def inc_new(src: wp.array(dtype=float), dst: wp.array(dtype=float)):
     tid = wp.tid()
@@ -395,27 +402,94 @@ def test_stream_priority_timings(test, device):
 
 devices = get_selected_cuda_test_devices()
 
+# CPU streams support the same operations, except for priorities
+stream_devices = get_test_devices()
+
 
 class TestStreams(unittest.TestCase):
     def test_stream_exceptions(self):
         cpu_device = wp.get_device("cpu")
 
-        # Can't set the stream on a CPU device
+        # Can't create an interprocess event on the CPU
         with self.assertRaises(RuntimeError):
-            stream0 = wp.Stream()
-            cpu_device.stream = stream0
+            wp.Event(device=cpu_device, interprocess=True)
 
-        # Can't create a stream on the CPU
-        with self.assertRaises(RuntimeError):
-            wp.Stream(device="cpu")
+        # Can't set the stream of another device
+        if wp.is_cuda_available():
+            with self.assertRaises(RuntimeError):
+                cpu_device.stream = wp.Stream("cuda:0")
 
-        # Can't create an event with CPU device
-        with self.assertRaises(RuntimeError):
-            wp.Event(device=cpu_device)
+        # Stream priorities must be integers
+        with self.assertRaises(TypeError):
+            wp.Stream(device="cpu", priority=0.5)
 
-        # Can't get the stream on a CPU device
-        with self.assertRaises(RuntimeError):
-            cpu_stream = cpu_device.stream  # noqa: F841
+    def test_cpu_stream_default(self):
+        cpu_device = wp.get_device("cpu")
+
+        # the default CPU stream executes work synchronously on the calling thread
+        test_stream = cpu_device.stream
+        self.assertTrue(cpu_device.has_stream)
+        self.assertTrue(test_stream.is_synchronous)
+        self.assertEqual(test_stream, cpu_device.null_stream)
+        self.assertFalse(wp.Stream("cpu").is_synchronous)
+
+    def test_cpu_stream_async(self):
+        stream = wp.Stream("cpu")
+
+        a = wp.zeros(N, dtype=float, device="cpu")
+        event = wp.Event("cpu")
+
+        num_iters = 20
+        for _ in range(num_iters):
+            wp.launch(inc, dim=N, inputs=[a], stream=stream)
+        stream.record_event(event)
+
+        # the launches return before the work is completed by the stream
+        self.assertFalse(wp.context.runtime.core.cpu_event_query(event.cpu_event))
+
+        wp.synchronize_event(event)
+        self.assertTrue(wp.context.runtime.core.cpu_event_query(event.cpu_event))
+        assert_np_equal(a.numpy(), np.full(N, fill_value=float(num_iters)))
+
+    def test_cpu_stream_host_utility(self):
+        stream = wp.Stream("cpu")
+
+        n = 1024
+        keys = wp.zeros(2 * n, dtype=int, device="cpu")
+        values = wp.zeros(2 * n, dtype=int, device="cpu")
+        a = wp.zeros(N, dtype=float, device="cpu")
+
+        with wp.ScopedStream(stream):
+            wp.launch(inc, dim=N, inputs=[a])
+            wp.launch(write_keys, dim=n, inputs=[keys, values])
+
+            # the sort runs on the calling thread after the pending launch is completed by the stream
+            wp.utils.radix_sort_pairs(keys, values, n)
+
+        wp.synchronize_stream(stream)
+        assert_np_equal(keys.numpy()[:n], np.arange(n))
+        assert_np_equal(values.numpy()[:n], np.arange(n)[::-1])
+
+    def test_cpu_stream_capture_launch(self):
+        stream = wp.Stream("cpu")
+
+        a = wp.zeros(N, dtype=float, device="cpu")
+        b = wp.empty(N, dtype=float, device="cpu")
+
+        with wp.ScopedCapture("cpu", force_module_load=False) as capture:
+            wp.launch(inc, dim=N, inputs=[a], device="cpu")
+            wp.launch(inc_new, dim=N, inputs=[a, b], device="cpu")
+
+        num_iters = 5
+        for _ in range(num_iters):
+            wp.capture_launch(capture.graph, stream=stream)
+
+        # the graph replays are ordered with the launches on the stream
+        wp.launch(inc, dim=N, inputs=[b], stream=stream)
+
+        wp.synchronize_stream(stream)
+        assert_np_equal(a.numpy(), np.full(N, fill_value=float(num_iters)))
+        assert_np_equal(b.numpy(), np.full(N, fill_value=float(num_iters + 2)))
 
     @unittest.skipUnless(len(wp.get_cuda_devices()) > 1, "Requires at least two CUDA devices")
     @unittest.skipUnless(check_p2p(), "Peer-to-Peer transfers not supported")
@@ -534,21 +608,23 @@ class TestStreams(unittest.TestCase):
         instance.__del__()
 
 
-add_function_test(TestStreams, "test_stream_set", test_stream_set, devices=devices)
-add_function_test(TestStreams, "test_stream_arg_explicit_sync", test_stream_arg_explicit_sync, devices=devices)
-add_function_test(TestStreams, "test_stream_scope_implicit_sync", test_stream_scope_implicit_sync, devices=devices)
+add_function_test(TestStreams, "test_stream_set", test_stream_set, devices=stream_devices)
+add_function_test(TestStreams, "test_stream_arg_explicit_sync", test_stream_arg_explicit_sync, devices=stream_devices)
+add_function_test(
+    TestStreams, "test_stream_scope_implicit_sync", test_stream_scope_implicit_sync, devices=stream_devices
+)
 
-add_function_test(TestStreams, "test_stream_arg_synchronize", test_stream_arg_synchronize, devices=devices)
-add_function_test(TestStreams, "test_stream_arg_wait_event", test_stream_arg_wait_event, devices=devices)
-add_function_test(TestStreams, "test_stream_arg_wait_stream", test_stream_arg_wait_stream, devices=devices)
-add_function_test(TestStreams, "test_stream_scope_synchronize", test_stream_scope_synchronize, devices=devices)
-add_function_test(TestStreams, "test_stream_scope_wait_event", test_stream_scope_wait_event, devices=devices)
-add_function_test(TestStreams, "test_stream_scope_wait_stream", test_stream_scope_wait_stream, devices=devices)
+add_function_test(TestStreams, "test_stream_arg_synchronize", test_stream_arg_synchronize, devices=stream_devices)
+add_function_test(TestStreams, "test_stream_arg_wait_event", test_stream_arg_wait_event, devices=stream_devices)
+add_function_test(TestStreams, "test_stream_arg_wait_stream", test_stream_arg_wait_stream, devices=stream_devices)
+add_function_test(TestStreams, "test_stream_scope_synchronize", test_stream_scope_synchronize, devices=stream_devices)
+add_function_test(TestStreams, "test_stream_scope_wait_event", test_stream_scope_wait_event, devices=stream_devices)
+add_function_test(TestStreams, "test_stream_scope_wait_stream", test_stream_scope_wait_stream, devices=stream_devices)
 add_function_test(TestStreams, "test_stream_priority_basics", test_stream_priority_basics, devices=devices)
 add_function_test(TestStreams, "test_stream_priority_timings", test_stream_priority_timings, devices=devices)
 
-add_function_test(TestStreams, "test_event_synchronize", test_event_synchronize, devices=devices)
-add_function_test(TestStreams, "test_event_elapsed_time", test_event_elapsed_time, devices=devices)
+add_function_test(TestStreams, "test_event_synchronize", test_event_synchronize, devices=stream_devices)
+add_function_test(TestStreams, "test_event_elapsed_time", test_event_elapsed_time, devices=stream_devices)
 
 if __name__ == "__main__":
     wp.clear_kernel_cache()
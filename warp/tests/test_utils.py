@@ -79,7 +79,7 @@ def test_array_scan_error_unsupported_dtype(test, device):
 
 
 def test_radix_sort_pairs(test, device):
-    keyTypes = [int, wp.float32]
+    keyTypes = [int, wp.int64, wp.float32]
 
     for keyType in keyTypes:
         keys = wp.array((7, 2, 8, 4, 1, 6, 5, 3, 0, 0, 0, 0, 0, 0, 0, 0), dtype=keyType, device=device)
@@ -90,7 +90,7 @@ def test_radix_sort_pairs(test, device):
 
 
 def test_radix_sort_pairs_empty(test, device):
-    keyTypes = [int, wp.float32]
+    keyTypes = [int, wp.int64, wp.float32]
 
     for keyType in keyTypes:
         keys = wp.array((), dtype=keyType, device=device)
@@ -98,6 +98,75 @@ def test_radix_sort_pairs_empty(test, device):
         wp.utils.radix_sort_pairs(keys, values, 0)
 
 
+def test_radix_sort_pairs_large(test, device):
+    rng = np.random.default_rng(123)
+
+    count = 100000
+    keys_np = {
+        int: rng.integers(-(2**31), 2**31, size=count, dtype=np.int64).astype(np.int32),
+        wp.int64: rng.integers(-(2**63), 2**63 - 1, size=count, dtype=np.int64),
+        wp.float32: rng.uniform(low=-1e6, high=1e6, size=count).astype(np.float32),
+    }
+
+    # the CPU sort splits the keys between threads
+    num_threads_list = (1, 4) if device.is_cpu else (None,)
+
+    saved_num_threads = wp.config.cpu_num_threads
+    try:
+        for keyType, keys in keys_np.items():
+            # repeated keys must keep their order
+            keys[: count // 4] = keys[0]
+            values = np.arange(count, dtype=np.int32)
+
+            order = np.argsort(keys, kind="stable")
+
+            for num_threads in num_threads_list:
+                if num_threads is not None:
+                    wp.config.cpu_num_threads = num_threads
+
+                keys_wp = wp.array(np.concatenate((keys, keys)), dtype=keyType, device=device)
+                values_wp = wp.array(np.concatenate((values, values)), dtype=int, device=device)
+                wp.utils.radix_sort_pairs(keys_wp, values_wp, count)
+
+                assert_np_equal(keys_wp.numpy()[:count], keys[order])
+                assert_np_equal(values_wp.numpy()[:count], values[order])
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
+def test_array_scan_cpu_threads(test, device):
+    rng = np.random.default_rng(123)
+
+    values_np = rng.uniform(low=-1e6, high=1e6, size=100000).astype(np.float32)
+
+    saved_num_threads = wp.config.cpu_num_threads
+    try:
+        results = []
+        for num_threads in (1, 4):
+            wp.config.cpu_num_threads = num_threads
+
+            values = wp.array(values_np, dtype=float, device=device)
+            result_inc = wp.zeros_like(values)
+            wp.utils.array_scan(values, result_inc, True)
+
+            # in-place exclusive scan
+            wp.utils.array_scan(values, values, False)
+
+            results.append((result_inc.numpy(), values.numpy()))
+
+        # blocks have a fixed size, so floating-point results do not depend on the number of threads
+        assert_np_equal(results[0][0], results[1][0])
+        assert_np_equal(results[0][1], results[1][1])
+
+        expected = np.cumsum(values_np.astype(np.float64))
+        tolerance = 1e-2 * np.max(np.abs(expected))
+        assert_np_equal(results[0][0], expected, tol=tolerance)
+        assert_np_equal(results[0][1][1:], expected[:-1], tol=tolerance)
+        test.assertEqual(results[0][1][0], 0.0)
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
 def test_radix_sort_pairs_error_insufficient_storage(test, device):
     keyTypes = [int, wp.float32]
 
@@ -448,6 +517,8 @@ add_function_test(
 )
 add_function_test(TestUtils, "test_radix_sort_pairs", test_radix_sort_pairs, devices=devices)
 add_function_test(TestUtils, "test_radix_sort_pairs_empty", test_radix_sort_pairs, devices=devices)
+add_function_test(TestUtils, "test_radix_sort_pairs_large", test_radix_sort_pairs_large, devices=devices)
+add_function_test(TestUtils, "test_array_scan_cpu_threads", test_array_scan_cpu_threads, devices=["cpu"])
 add_function_test(
     TestUtils,
     "test_radix_sort_pairs_error_insufficient_storage",
@@ -822,7 +822,6 @@ def test_volume_sample_index(test, device):
 
 
 def test_volume_from_numpy(test, device):
-    # Volume.allocate_from_tiles() is only available with CUDA
     mins = np.array([-3.0, -3.0, -3.0])
     voxel_size = 0.2
     maxs = np.array([3.0, 3.0, 3.0])
@@ -846,7 +845,6 @@ def test_volume_from_numpy(test, device):
 
 
 def test_volume_from_numpy_3d(test, device):
-    # Volume.allocate_from_tiles() is only available with CUDA
     mins = np.array([-3.0, -3.0, -3.0])
     voxel_size = 0.2
     maxs = np.array([3.0, 3.0, 3.0])
@@ -950,25 +948,13 @@ add_function_test(
 )
 add_function_test(TestVolume, "test_volume_transform_gradient", test_volume_transform_gradient, devices=devices)
 add_function_test(TestVolume, "test_volume_store", test_volume_store, devices=devices)
-add_function_test(
-    TestVolume, "test_volume_allocation_f", test_volume_allocation_f, devices=get_selected_cuda_test_devices()
-)
-add_function_test(
-    TestVolume, "test_volume_allocation_v", test_volume_allocation_v, devices=get_selected_cuda_test_devices()
-)
-add_function_test(
-    TestVolume, "test_volume_allocation_i", test_volume_allocation_i, devices=get_selected_cuda_test_devices()
-)
+add_function_test(TestVolume, "test_volume_allocation_f", test_volume_allocation_f, devices=devices)
+add_function_test(TestVolume, "test_volume_allocation_v", test_volume_allocation_v, devices=devices)
+add_function_test(TestVolume, "test_volume_allocation_i", test_volume_allocation_i, devices=devices)
 add_function_test(TestVolume, "test_volume_introspection", test_volume_introspection, devices=devices)
-add_function_test(
-    TestVolume, "test_volume_from_numpy", test_volume_from_numpy, devices=get_selected_cuda_test_devices()
-)
-add_function_test(
-    TestVolume, "test_volume_from_numpy_3d", test_volume_from_numpy_3d, devices=get_selected_cuda_test_devices()
-)
-add_function_test(
-    TestVolume, "test_volume_aniso_transform", test_volume_aniso_transform, devices=get_selected_cuda_test_devices()
-)
+add_function_test(TestVolume, "test_volume_from_numpy", test_volume_from_numpy, devices=devices)
+add_function_test(TestVolume, "test_volume_from_numpy_3d", test_volume_from_numpy_3d, devices=devices)
+add_function_test(TestVolume, "test_volume_aniso_transform", test_volume_aniso_transform, devices=devices)
 add_function_test(TestVolume, "test_volume_multiple_grids", test_volume_multiple_grids, devices=devices)
 add_function_test(TestVolume, "test_volume_feature_array", test_volume_feature_array, devices=devices)
 add_function_test(TestVolume, "test_volume_sample_index", test_volume_sample_index, devices=devices)
@@ -312,7 +312,60 @@ def test_volume_allocation_from_voxels(test, device):
     np.testing.assert_equal(voxel_sorted, ijk_voxel_sorted)
 
 
-devices = get_selected_cuda_test_devices()
+def test_volume_allocation_cpu_threads(test, device):
+    saved_num_threads = wp.config.cpu_num_threads
+
+    try:
+        rng = np.random.default_rng(101215)
+        voxels_np = rng.integers(-200, 200, size=(20000, 3), dtype=np.int32)
+        points_np = rng.uniform(-20.0, 20.0, size=(20000, 3)).astype(np.float32)
+
+        grids = []
+        for num_threads in (1, 4):
+            wp.config.cpu_num_threads = num_threads
+
+            voxels = wp.array(voxels_np, dtype=wp.int32, device=device)
+            points = wp.array(points_np, dtype=wp.vec3, device=device)
+
+            volumes = (
+                wp.Volume.allocate_by_tiles(voxels, 0.1, bg_value=-1.0, device=device),
+                wp.Volume.allocate_by_tiles(points, 0.1, bg_value=(1.0, 2.0, 3.0), device=device),
+                wp.Volume.allocate_by_tiles(voxels, 0.1, bg_value=7, device=device),
+                wp.Volume.allocate_by_tiles(points, 0.1, bg_value=None, device=device),
+                wp.Volume.allocate_by_voxels(voxels, 0.1, device=device),
+                wp.Volume.allocate_by_voxels(points, 0.1, device=device),
+            )
+            grids.append([volume.array().numpy().copy() for volume in volumes])
+
+        for grid_a, grid_b in zip(*grids):
+            assert_np_equal(grid_a, grid_b)
+
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
+def test_volume_allocation_host_matches_device(test, device):
+    rng = np.random.default_rng(101215)
+    voxels_np = rng.integers(-600, 600, size=(5000, 3), dtype=np.int32)
+
+    for bg_value in (-1.0, (1.0, 2.0, 3.0), 7, None):
+        with test.subTest(bg_value=bg_value):
+            volume_host = wp.Volume.allocate_by_tiles(wp.array(voxels_np, device="cpu"), 0.1, bg_value, device="cpu")
+            volume_device = wp.Volume.allocate_by_tiles(
+                wp.array(voxels_np, device=device), 0.1, bg_value, device=device
+            )
+
+            test.assertEqual(volume_host.get_grid_info().grid_size, volume_device.get_grid_info().grid_size)
+            assert_np_equal(volume_host.get_tiles().numpy(), volume_device.get_tiles().numpy())
+
+    volume_host = wp.Volume.allocate_by_voxels(wp.array(voxels_np, device="cpu"), 0.1, device="cpu")
+    volume_device = wp.Volume.allocate_by_voxels(wp.array(voxels_np, device=device), 0.1, device=device)
+
+    test.assertEqual(volume_host.get_voxel_count(), volume_device.get_voxel_count())
+    assert_np_equal(volume_host.get_voxels().numpy(), volume_device.get_voxels().numpy())
+
+
+devices = get_test_devices()
 
 
 class TestVolumeWrite(unittest.TestCase):
@@ -331,6 +384,15 @@ add_function_test(
     test_volume_allocation_from_voxels,
     devices=devices,
 )
+add_function_test(
+    TestVolumeWrite, "test_volume_allocation_cpu_threads", test_volume_allocation_cpu_threads, devices=["cpu"]
+)
+add_function_test(
+    TestVolumeWrite,
+    "test_volume_allocation_host_matches_device",
+    test_volume_allocation_host_matches_device,
+    devices=get_selected_cuda_test_devices(),
+)
 
 
 if __name__ == "__main__":
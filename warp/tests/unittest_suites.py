@@ -167,8 +167,10 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
     from warp.tests.test_rounding import TestRounding
     from warp.tests.test_runlength_encode import TestRunlengthEncode
     from warp.tests.test_scalar_ops import TestScalarOps
+    from warp.tests.test_scheduler import TestScheduler
 
     # from warp.tests.test_sim_grad import TestSimGradients Disabled, flaky
+    from warp.tests.test_sim_integrator import TestSimIntegrator
     from warp.tests.test_sim_kinematics import TestSimKinematics
     from warp.tests.test_smoothstep import TestSmoothstep
     from warp.tests.test_snippet import TestSnippets
@@ -277,7 +279,9 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
         TestRounding,
         TestRunlengthEncode,
         TestScalarOps,
+        TestScheduler,
         # TestSimGradients, Disabled, flaky
+        TestSimIntegrator,
         TestSimKinematics,
         TestSmoothstep,
         TestSnippets,
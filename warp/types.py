@@ -2188,6 +2188,9 @@ class array(Array):
                 if stream is not None:
                     raise TypeError("DLPack stream must be None or -1 for CPU device")
 
+                # the consumer accesses the memory directly, complete the work of asynchronous CPU streams
+                warp.context.synchronize_cpu_streams()
+
         return warp.dlpack.to_dlpack(self)
 
     def __dlpack_device__(self):
@@ -2452,6 +2455,11 @@ class array(Array):
 
     def zero_(self):
         """Zeroes-out the array entries."""
+        if self.device is not None and self.device.task_graph is not None:
+            # recorded by a warp.ScopedSchedule
+            self.device.task_graph.record_func(self.zero_, reads=(), writes=(self,), name="zero")
+            return
+
         if self.is_contiguous:
             # simple memset is usually faster than generic fill
             self.device.memset(self.ptr, 0, self.size * type_size_in_bytes(self.dtype))
@@ -2489,6 +2497,11 @@ class array(Array):
         if self.size == 0:
             return
 
+        if self.device.task_graph is not None:
+            # recorded by a warp.ScopedSchedule
+            self.device.task_graph.record_func(lambda: self.fill_(value), reads=(), writes=(self,), name="fill")
+            return
+
         # try to convert the given value to the array dtype
         try:
             if isinstance(self.dtype, warp.codegen.Struct):
@@ -2530,7 +2543,11 @@ class array(Array):
                     self.device.context, carr_ptr, ARRAY_TYPE_REGULAR, cvalue_ptr, cvalue_size
                 )
             else:
-                warp.context.runtime.core.array_fill_host(carr_ptr, ARRAY_TYPE_REGULAR, cvalue_ptr, cvalue_size)
+                target = warp.context.get_cpu_command_target(self.device)
+                if target is not None:
+                    target.add_cpu_array_fill(carr, ARRAY_TYPE_REGULAR, cvalue)
+                else:
+                    warp.context.runtime.core.array_fill_host(carr_ptr, ARRAY_TYPE_REGULAR, cvalue_ptr, cvalue_size)
 
         self.mark_init()
 
@@ -2545,11 +2562,17 @@ class array(Array):
         """Converts the array to a :class:`numpy.ndarray` (aliasing memory through the array interface protocol)
         If the array is on the GPU, a synchronous device-to-host copy (on the CUDA default stream) will be
         automatically performed to ensure that any outstanding work is completed.
+        If the array is on the CPU, the work submitted to asynchronous CPU streams is completed first.
         """
         if self.ptr:
-            # use the CUDA default stream for synchronous behaviour with other streams
-            with warp.ScopedStream(self.device.null_stream):
-                a = self.to("cpu", requires_grad=False)
+            if self.device.is_cpu:
+                # the memory is aliased, wait for the streams that may be writing to it
+                warp.context.synchronize_cpu_streams()
+                a = self
+            else:
+                # use the CUDA default stream for synchronous behaviour with other streams
+                with warp.ScopedStream(self.device.null_stream):
+                    a = self.to("cpu", requires_grad=False)
             # convert through __array_interface__
             # Note: this handles arrays of structs using `descr`, so the result will be a structured NumPy array
             return np.asarray(a)
@@ -2978,6 +3001,11 @@ class noncontiguous_array_base(Generic[T]):
         if self.size == 0:
             return
 
+        if self.device.task_graph is not None:
+            # recorded by a warp.ScopedSchedule, the memory written through the indices is not tracked
+            self.device.task_graph.record_func(lambda: self.fill_(value), reads=(), writes=(self,), name="fill")
+            return
+
         # try to convert the given value to the array dtype
         try:
             if isinstance(self.dtype, warp.codegen.Struct):
@@ -3015,7 +3043,11 @@ class noncontiguous_array_base(Generic[T]):
                 self.device.context, ctype_ptr, self.type_id, cvalue_ptr, cvalue_size
             )
         else:
-            warp.context.runtime.core.array_fill_host(ctype_ptr, self.type_id, cvalue_ptr, cvalue_size)
+            target = warp.context.get_cpu_command_target(self.device)
+            if target is not None:
+                target.add_cpu_array_fill(ctype, self.type_id, cvalue)
+            else:
+                warp.context.runtime.core.array_fill_host(ctype_ptr, self.type_id, cvalue_ptr, cvalue_size)
 
 
 # helper to check index array properties
@@ -3307,7 +3339,7 @@ def is_tile(t):
     return isinstance(t, Tile)
 
 
-bvh_constructor_values = {"sah": 0, "median": 1, "lbvh": 2}
+bvh_constructor_values = {"sah": 0, "median": 1, "lbvh": 2, "sah_binned": 3}
 
 
 class Bvh:
@@ -3330,7 +3362,7 @@ class Bvh:
             uppers: Array of upper bounds of data type :class:`warp.vec3`.
               ``lowers`` and ``uppers`` must live on the same device.
             constructor: The construction algorithm used to build the tree.
-              Valid choices are ``"sah"``, ``"median"``, ``"lbvh"``, or ``None``.
+              Valid choices are ``"sah"``, ``"sah_binned"``, ``"median"``, ``"lbvh"``, or ``None``.
               When ``None``, the default constructor will be used (see the note).
 
         Note:
@@ -3339,6 +3371,10 @@ class Bvh:
             - ``"sah"``: A CPU-based top-down constructor where the AABBs are split based on Surface Area
               Heuristics (SAH). Construction takes slightly longer than others but has the best query
               performance.
+            - ``"sah_binned"``: A CPU-based top-down constructor that bins the centroids of the primitives
+              along all three axes and picks the split with the lowest SAH cost. The top levels of the tree
+              are binned and partitioned in parallel, which makes it the fastest way to build high quality
+              trees over large inputs.
             - ``"median"``: A CPU-based top-down constructor where the AABBs are split based on the median
               of centroids of primitives in an AABB. This constructor is faster than SAH but offers
               inferior query performance.
@@ -3348,12 +3384,17 @@ class Bvh:
               lives. For a GPU tree, the ``"lbvh"`` constructor will be selected; for a CPU tree, the ``"sah"``
               constructor will be selected.
 
-            All three constructors are supported for GPU trees. When a CPU-based constructor is selected
+            All constructors are supported for GPU trees. When a CPU-based constructor is selected
             for a GPU tree, bounds will be copied back to the CPU to run the CPU-based constructor. After
             construction, the CPU tree will be copied to the GPU.
 
-            Only ``"sah"`` and ``"median"`` are supported for CPU trees. If ``"lbvh"`` is selected for a CPU tree, a
-            warning message will be issued, and the constructor will automatically fall back to ``"sah"``.
+            The CPU-based constructors build independent subtrees concurrently using up to
+            :attr:`warp.config.cpu_num_threads` threads, the resulting tree does not depend on the
+            number of threads.
+
+            Only ``"sah"``, ``"sah_binned"``, and ``"median"`` are supported for CPU trees. If ``"lbvh"`` is selected
+            for a CPU tree, a warning message will be issued, and the constructor will automatically fall back to
+            ``"sah"``.
         """
 
         if len(lowers) != len(uppers):
@@ -3389,6 +3430,9 @@ class Bvh:
         if constructor not in bvh_constructor_values:
             raise ValueError(f"Unrecognized BVH constructor type: {constructor}")
 
+        # CPU-based constructors run on the host worker pool, also when building GPU trees
+        self.runtime.begin_host_operation(self.device, "wp.Bvh()")
+
         if self.device.is_cpu:
             if constructor == "lbvh":
                 warp.utils.warn(
@@ -3426,6 +3470,7 @@ class Bvh:
         """
 
         if self.device.is_cpu:
+            self.runtime.begin_host_operation(self.device, "wp.Bvh.refit()")
             self.runtime.core.bvh_refit_host(self.id)
         else:
             self.runtime.core.bvh_refit_device(self.id)
@@ -3469,7 +3514,7 @@ class Mesh:
               data structures to support ``wp.mesh_query_point_sign_winding_number()`` queries.
             bvh_constructor: The construction algorithm for the underlying BVH
               (see the docstring of :class:`Bvh` for explanation).
-              Valid choices are ``"sah"``, ``"median"``, ``"lbvh"``, or ``None``.
+              Valid choices are ``"sah"``, ``"sah_binned"``, ``"median"``, ``"lbvh"``, or ``None``.
         """
 
         if points.device != indices.device:
@@ -3503,6 +3548,8 @@ class Mesh:
         if bvh_constructor not in bvh_constructor_values:
             raise ValueError(f"Unrecognized BVH constructor type: {bvh_constructor}")
 
+        self.runtime.begin_host_operation(self.device, "wp.Mesh()")
+
         if self.device.is_cpu:
             if bvh_constructor == "lbvh":
                 warp.utils.warn(
@@ -3549,6 +3596,7 @@ class Mesh:
         """
 
         if self.device.is_cpu:
+            self.runtime.begin_host_operation(self.device, "wp.Mesh.refit()")
             self.runtime.core.mesh_refit_host(self.id)
         else:
             self.runtime.core.mesh_refit_device(self.id)
@@ -3581,6 +3629,7 @@ class Mesh:
 
         self._points = points_new
         if self.device.is_cpu:
+            self.runtime.begin_host_operation(self.device, "wp.Mesh.points")
             self.runtime.core.mesh_set_points_host(self.id, points_new.__ctype__())
         else:
             self.runtime.core.mesh_set_points_device(self.id, points_new.__ctype__())
@@ -3611,6 +3660,7 @@ class Mesh:
 
         self._velocities = velocities_new
         if self.device.is_cpu:
+            self.runtime.begin_host_operation(self.device, "wp.Mesh.velocities")
             self.runtime.core.mesh_set_velocities_host(self.id, velocities_new.__ctype__())
         else:
             self.runtime.core.mesh_set_velocities_device(self.id, velocities_new.__ctype__())
@@ -3709,6 +3759,7 @@ class Volume:
             )
 
         if self.device.is_cpu:
+            self.runtime.begin_host_operation(self.device, "wp.Volume.get_tiles()")
             self.runtime.core.volume_get_tiles_host(self.id, out.ptr)
         else:
             self.runtime.core.volume_get_tiles_device(self.id, out.ptr)
@@ -3748,6 +3799,7 @@ class Volume:
             )
 
         if self.device.is_cpu:
+            self.runtime.begin_host_operation(self.device, "wp.Volume.get_voxels()")
             self.runtime.core.volume_get_voxels_host(self.id, out.ptr)
         else:
             self.runtime.core.volume_get_voxels_device(self.id, out.ptr)
@@ -4202,13 +4254,11 @@ class Volume:
     ) -> Volume:
         """Creates a Volume object from a dense 3D NumPy array.
 
-        This function is only supported for CUDA devices.
-
         Args:
             min_world: The 3D coordinate of the lower corner of the volume.
             voxel_size: The size of each voxel in spatial coordinates.
             bg_value: Background value
-            device: The CUDA device to create the volume on, e.g.: "cuda" or "cuda:0".
+            device: The device to create the volume on, e.g.: "cpu", "cuda" or "cuda:0".
 
         Returns:
 
@@ -4294,8 +4344,6 @@ class Volume:
     ) -> Volume:
         """Allocate a new Volume based on the bounding box defined by min and max.
 
-        This function is only supported for CUDA devices.
-
         Allocate a volume that is large enough to contain voxels [min[0], min[1], min[2]] - [max[0], max[1], max[2]], inclusive.
         If points_in_world_space is true, then min and max are first converted to index space with the given voxel size and
         translation, and the volume is allocated with those.
@@ -4309,7 +4357,7 @@ class Volume:
             voxel_size (float): Voxel size of the new volume.
             bg_value (float or array-like): Value of unallocated voxels of the volume, also defines the volume's type, a :class:`warp.vec3` volume is created if this is `array-like`, otherwise a float volume is created
             translation (array-like): translation between the index and world spaces.
-            device (Devicelike): The CUDA device to create the volume on, e.g.: "cuda" or "cuda:0".
+            device (Devicelike): The device to create the volume on, e.g.: "cpu", "cuda" or "cuda:0".
 
         """
         if points_in_world_space:
@@ -4367,10 +4415,9 @@ class Volume:
     ) -> Volume:
         """Allocate a new Volume with active tiles for each point tile_points.
 
-        This function is only supported for CUDA devices.
-
         The smallest unit of allocation is a dense tile of 8x8x8 voxels.
         This is the primary method for allocating sparse volumes. It uses an array of points indicating the tiles that must be allocated.
+        On the CPU, the volume is built by ``wp.config.cpu_num_threads`` host threads and has the same layout as on CUDA devices.
 
         Example use cases:
             * `tile_points` can mark tiles directly in index space as in the case this method is called by `allocate`.
@@ -4385,18 +4432,16 @@ class Volume:
             bg_value (array-like, float, int or None): Value of unallocated voxels of the volume, also defines the volume's type. A :class:`warp.vec3` volume is created if this is `array-like`, an index volume will be created if `bg_value` is ``None``.
             translation (array-like): Translation between the index and world spaces.
             transform (array-like): Linear transform between the index and world spaces. If ``None``, deduced from `voxel_size`.
-            device (Devicelike): The CUDA device to create the volume on, e.g.: "cuda" or "cuda:0".
+            device (Devicelike): The device to create the volume on, e.g.: "cpu", "cuda" or "cuda:0".
 
         """
         device = warp.get_device(device)
 
-        if not device.is_cuda:
-            raise RuntimeError("Only CUDA devices are supported for allocate_by_tiles")
         if not _is_contiguous_vec_like_array(tile_points, vec_length=3, scalar_types=(float32, int32)):
             raise RuntimeError(
                 "tile_points must be contiguous and either a 1D warp array of vec3f or vec3i or a 2D n-by-3 array of int32 or float32."
             )
-        if not tile_points.device.is_cuda:
+        if tile_points.device != device:
             tile_points = tile_points.to(device)
 
         volume = cls(data=None)
@@ -4405,45 +4450,27 @@ class Volume:
 
         transform_buf, translation_buf = Volume._fill_transform_buffers(voxel_size, translation, transform)
 
+        core = volume.runtime.core
         if bg_value is None:
-            volume.id = volume.runtime.core.volume_index_from_tiles_device(
-                volume.device.context,
-                ctypes.c_void_p(tile_points.ptr),
-                tile_points.shape[0],
-                transform_buf,
-                translation_buf,
-                in_world_space,
-            )
+            create_host, create_device = core.volume_index_from_tiles_host, core.volume_index_from_tiles_device
+            bg_args = ()
         elif hasattr(bg_value, "__len__"):
-            volume.id = volume.runtime.core.volume_v_from_tiles_device(
-                volume.device.context,
-                ctypes.c_void_p(tile_points.ptr),
-                tile_points.shape[0],
-                transform_buf,
-                translation_buf,
-                in_world_space,
-                (ctypes.c_float * 3)(bg_value[0], bg_value[1], bg_value[2]),
-            )
+            create_host, create_device = core.volume_v_from_tiles_host, core.volume_v_from_tiles_device
+            bg_args = ((ctypes.c_float * 3)(bg_value[0], bg_value[1], bg_value[2]),)
         elif isinstance(bg_value, int):
-            volume.id = volume.runtime.core.volume_i_from_tiles_device(
-                volume.device.context,
-                ctypes.c_void_p(tile_points.ptr),
-                tile_points.shape[0],
-                transform_buf,
-                translation_buf,
-                in_world_space,
-                bg_value,
-            )
+            create_host, create_device = core.volume_i_from_tiles_host, core.volume_i_from_tiles_device
+            bg_args = (bg_value,)
         else:
-            volume.id = volume.runtime.core.volume_f_from_tiles_device(
-                volume.device.context,
-                ctypes.c_void_p(tile_points.ptr),
-                tile_points.shape[0],
-                transform_buf,
-                translation_buf,
-                in_world_space,
-                float(bg_value),
-            )
+            create_host, create_device = core.volume_f_from_tiles_host, core.volume_f_from_tiles_device
+            bg_args = (float(bg_value),)
+
+        args = (ctypes.c_void_p(tile_points.ptr), tile_points.shape[0], transform_buf, translation_buf, in_world_space)
+
+        if device.is_cpu:
+            volume.runtime.begin_host_operation(device, "wp.Volume.allocate_by_tiles()")
+            volume.id = create_host(*args, *bg_args)
+        else:
+            volume.id = create_device(volume.device.context, *args, *bg_args)
 
         if volume.id == 0:
             raise RuntimeError("Failed to create volume")
@@ -4465,8 +4492,6 @@ class Volume:
         explicit payload but encodes a linearized index for each active voxel, allowing to lookup and
         sample data from arbitrary external arrays.
 
-        This function is only supported for CUDA devices.
-
         Args:
             voxel_points (:class:`warp.array`): Array of positions that define the voxels to be allocated.
                 The array may use an integer scalar type (2D N-by-3 array of :class:`warp.int32` or 1D array of `warp.vec3i` values), indicating index space positions,
@@ -4475,18 +4500,16 @@ class Volume:
             voxel_size (float or array-like): Voxel size(s) of the new volume. Ignored if `transform` is given.
             translation (array-like): Translation between the index and world spaces.
             transform (array-like): Linear transform between the index and world spaces. If ``None``, deduced from `voxel_size`.
-            device (Devicelike): The CUDA device to create the volume on, e.g.: "cuda" or "cuda:0".
+            device (Devicelike): The device to create the volume on, e.g.: "cpu", "cuda" or "cuda:0".
 
         """
         device = warp.get_device(device)
 
-        if not device.is_cuda:
-            raise RuntimeError("Only CUDA devices are supported for allocate_by_tiles")
         if not _is_contiguous_vec_like_array(voxel_points, vec_length=3, scalar_types=(float32, int32)):
             raise RuntimeError(
                 "voxel_points must be contiguous and either a 1D warp array of vec3f or vec3i or a 2D n-by-3 array of int32 or float32."
             )
-        if not voxel_points.device.is_cuda:
+        if voxel_points.device != device:
             voxel_points = voxel_points.to(device)
 
         volume = cls(data=None)
@@ -4495,8 +4518,7 @@ class Volume:
 
         transform_buf, translation_buf = Volume._fill_transform_buffers(voxel_size, translation, transform)
 
-        volume.id = volume.runtime.core.volume_from_active_voxels_device(
-            volume.device.context,
+        args = (
             ctypes.c_void_p(voxel_points.ptr),
             voxel_points.shape[0],
             transform_buf,
@@ -4504,6 +4526,12 @@ class Volume:
             in_world_space,
         )
 
+        if device.is_cpu:
+            volume.runtime.begin_host_operation(device, "wp.Volume.allocate_by_voxels()")
+            volume.id = volume.runtime.core.volume_from_active_voxels_host(*args)
+        else:
+            volume.id = volume.runtime.core.volume_from_active_voxels_device(volume.device.context, *args)
+
         if volume.id == 0:
             raise RuntimeError("Failed to create volume")
 
@@ -5336,17 +5364,25 @@ class HashGrid:
         # indicates whether the grid data has been reserved for use by a kernel
         self.reserved = False
 
-    def build(self, points, radius):
+    def build(self, points, radius, incremental=False):
         """Updates the hash grid data structure.
 
         This method rebuilds the underlying datastructure and should be called any time the set
         of points changes.
 
+        On the CPU, the grid is rebuilt using ``wp.config.cpu_num_threads`` threads.
+
         Args:
             points (:class:`warp.array`): Array of points of type :class:`warp.vec3`
             radius (float): The cell size to use for bucketing points, cells are cubes with edges of this width.
                             For best performance the radius used to construct the grid should match closely to
                             the radius used when performing queries.
+            incremental (bool): If ``True``, CPU grids start from the point order of the previous build when it used
+                                the same number of points and the same radius. Only the points that changed cells
+                                are re-sorted, and the grid is left untouched if no point changed cells, which is
+                                much cheaper than a full rebuild when the points move little between builds.
+                                A full rebuild is performed if many points changed cells. The resulting grid is
+                                identical to the one of a full rebuild. This option has no effect on CUDA devices.
         """
 
         if not warp.types.types_equal(points.dtype, warp.vec3):
@@ -5356,13 +5392,17 @@ class HashGrid:
             points = points.contiguous().flatten()
 
         if self.device.is_cpu:
-            self.runtime.core.hash_grid_update_host(self.id, radius, ctypes.byref(points.__ctype__()))
+            self.runtime.begin_host_operation(self.device, "wp.HashGrid.build()")
+            self.runtime.core.hash_grid_update_host(
+                self.id, radius, ctypes.byref(points.__ctype__()), bool(incremental)
+            )
         else:
             self.runtime.core.hash_grid_update_device(self.id, radius, ctypes.byref(points.__ctype__()))
         self.reserved = True
 
     def reserve(self, num_points):
         if self.device.is_cpu:
+            self.runtime.begin_host_operation(self.device, "wp.HashGrid.reserve()")
             self.runtime.core.hash_grid_reserve_host(self.id, num_points)
         else:
             self.runtime.core.hash_grid_reserve_device(self.id, num_points)
@@ -5387,7 +5427,10 @@ class MarchingCubes:
         return instance
 
     def __init__(self, nx: int, ny: int, nz: int, max_verts: int, max_tris: int, device=None):
-        """CUDA-based Marching Cubes algorithm to extract a 2D surface mesh from a 3D volume.
+        """Marching Cubes algorithm to extract a 2D surface mesh from a 3D volume.
+
+        On CUDA devices the surface is extracted by GPU kernels, on the CPU the extraction is
+        distributed over ``wp.config.cpu_num_threads`` host threads.
 
         Attributes:
             id: Unique identifier for this object.
@@ -5407,10 +5450,7 @@ class MarchingCubes:
             nz: Number of cubes in the z-direction.
             max_verts: Maximum expected number of vertices (used for array preallocation).
             max_tris: Maximum expected number of triangles (used for array preallocation).
-            device (Devicelike): CUDA device on which to run marching cubes and allocate memory.
-
-        Raises:
-            RuntimeError: ``device`` not a CUDA device.
+            device (Devicelike): Device on which to run marching cubes and allocate memory.
 
         .. note::
             The shape of the marching cubes should match the shape of the scalar field being surfaced.
@@ -5423,9 +5463,6 @@ class MarchingCubes:
 
         self.device = self.runtime.get_device(device)
 
-        if not self.device.is_cuda:
-            raise RuntimeError("Only CUDA devices are supported for marching cubes")
-
         self.nx = nx
         self.ny = ny
         self.nz = nz
@@ -5434,10 +5471,20 @@ class MarchingCubes:
         self.max_tris = max_tris
 
         # bindings to warp.so
-        self.alloc = self.runtime.core.marching_cubes_create_device
-        self.alloc.argtypes = [ctypes.c_void_p]
-        self.alloc.restype = ctypes.c_uint64
-        self.free = self.runtime.core.marching_cubes_destroy_device
+        if self.device.is_cpu:
+            self.alloc = self.runtime.core.marching_cubes_create_host
+            self.alloc.argtypes = []
+            self.alloc.restype = ctypes.c_uint64
+            self.free = self.runtime.core.marching_cubes_destroy_host
+            self.surface_func = self.runtime.core.marching_cubes_surface_host
+        else:
+            self.alloc = self.runtime.core.marching_cubes_create_device
+            self.alloc.argtypes = [ctypes.c_void_p]
+            self.alloc.restype = ctypes.c_uint64
+            self.free = self.runtime.core.marching_cubes_destroy_device
+            self.surface_func = self.runtime.core.marching_cubes_surface_device
+
+        self.surface_func.restype = ctypes.c_int
 
         from warp.context import zeros
 
@@ -5445,16 +5492,22 @@ class MarchingCubes:
         self.indices = zeros(max_tris * 3, dtype=warp.int32, device=self.device)
 
         # alloc surfacer
-        self.id = ctypes.c_uint64(self.alloc(self.device.context))
+        if self.device.is_cpu:
+            self.id = ctypes.c_uint64(self.alloc())
+        else:
+            self.id = ctypes.c_uint64(self.alloc(self.device.context))
 
     def __del__(self):
         if not self.id:
             return
 
-        # use CUDA context guard to avoid side effects during garbage collection
-        with self.device.context_guard:
-            # destroy surfacer
+        if self.device.is_cpu:
             self.free(self.id)
+        else:
+            # use CUDA context guard to avoid side effects during garbage collection
+            with self.device.context_guard:
+                # destroy surfacer
+                self.free(self.id)
 
     def resize(self, nx: int, ny: int, nz: int, max_verts: int, max_tris: int) -> None:
         """Update the expected input and maximum output sizes for the marching cubes calculation.
@@ -5489,15 +5542,13 @@ class MarchingCubes:
         Raises:
           ValueError: ``field`` is not a 3D array.
           ValueError: Marching cubes shape does not match the shape of ``field``.
+          ValueError: ``field`` is not on the device of the marching cubes object.
           RuntimeError: :attr:`max_verts` and/or :attr:`max_tris` might be too small to hold the surface mesh.
         """
 
-        # WP_API int marching_cubes_surface_host(const float* field, int nx, int ny, int nz, float threshold, wp::vec3* verts, int* triangles, int max_verts, int max_tris, int* out_num_verts, int* out_num_tris);
         num_verts = ctypes.c_int(0)
         num_tris = ctypes.c_int(0)
 
-        self.runtime.core.marching_cubes_surface_device.restype = ctypes.c_int
-
         # For now we require that input field shape matches nx, ny, nz
         if field.ndim != 3:
             raise ValueError(f"Input field must be a three-dimensional array (got {field.ndim}).")
@@ -5506,8 +5557,15 @@ class MarchingCubes:
                 f"Marching cubes shape ({self.nx}, {self.ny}, {self.nz}) does not match the "
                 f"input array shape {field.shape}."
             )
+        if field.device != self.device:
+            raise ValueError(
+                f"Input field must be on the marching cubes device '{self.device}' (got '{field.device}')."
+            )
+
+        if self.device.is_cpu:
+            self.runtime.begin_host_operation(self.device, "wp.MarchingCubes.surface()")
 
-        error = self.runtime.core.marching_cubes_surface_device(
+        error = self.surface_func(
             self.id,
             ctypes.cast(field.ptr, ctypes.c_void_p),
             self.nx,
@@ -5524,7 +5582,7 @@ class MarchingCubes:
 
         if error:
             raise RuntimeError(
-                f"Buffers may not be large enough, marching cubes required at least {num_verts} vertices, and {num_tris} triangles."
+                f"Buffers may not be large enough, marching cubes required at least {num_verts.value} vertices, and {num_tris.value} triangles."
             )
 
         # resize the geometry arrays
@@ -7,6 +7,7 @@
 
 import cProfile
 import ctypes
+import json
 import os
 import sys
 import time
@@ -101,6 +102,8 @@ def array_scan(in_array, out_array, inclusive=True):
     from warp.context import runtime
 
     if in_array.device.is_cpu:
+        runtime.begin_host_operation(in_array.device, "wp.utils.array_scan()")
+
         if in_array.dtype == wp.int32:
             runtime.core.array_scan_int_host(in_array.ptr, out_array.ptr, in_array.size, inclusive)
         elif in_array.dtype == wp.float32:
@@ -129,8 +132,12 @@ def radix_sort_pairs(keys, values, count: int):
     from warp.context import runtime
 
     if keys.device.is_cpu:
+        runtime.begin_host_operation(keys.device, "wp.utils.radix_sort_pairs()")
+
         if keys.dtype == wp.int32 and values.dtype == wp.int32:
             runtime.core.radix_sort_pairs_int_host(keys.ptr, values.ptr, count)
+        elif keys.dtype == wp.int64 and values.dtype == wp.int32:
+            runtime.core.radix_sort_pairs_int64_host(keys.ptr, values.ptr, count)
         elif keys.dtype == wp.float32 and values.dtype == wp.int32:
             runtime.core.radix_sort_pairs_float_host(keys.ptr, values.ptr, count)
         else:
@@ -138,6 +145,8 @@ def radix_sort_pairs(keys, values, count: int):
     elif keys.device.is_cuda:
         if keys.dtype == wp.int32 and values.dtype == wp.int32:
             runtime.core.radix_sort_pairs_int_device(keys.ptr, values.ptr, count)
+        elif keys.dtype == wp.int64 and values.dtype == wp.int32:
+            runtime.core.radix_sort_pairs_int64_device(keys.ptr, values.ptr, count)
         elif keys.dtype == wp.float32 and values.dtype == wp.int32:
             runtime.core.radix_sort_pairs_float_device(keys.ptr, values.ptr, count)
         else:
@@ -180,6 +189,8 @@ def runlength_encode(values, run_values, run_lengths, run_count=None, value_coun
     from warp.context import runtime
 
     if values.device.is_cpu:
+        runtime.begin_host_operation(values.device, "wp.utils.runlength_encode()")
+
         if values.dtype == wp.int32:
             runtime.core.runlength_encode_int_host(
                 values.ptr, run_values.ptr, run_lengths.ptr, run_count.ptr, value_count
@@ -240,6 +251,7 @@ def array_sum(values, out=None, value_count=None, axis=None):
     from warp.context import runtime
 
     if values.device.is_cpu:
+        runtime.begin_host_operation(values.device, "wp.utils.array_sum()")
         if scalar_type == wp.float32:
             native_func = runtime.core.array_sum_float_host
         elif scalar_type == wp.float64:
@@ -329,6 +341,7 @@ def array_inner(a, b, out=None, count=None, axis=None):
     from warp.context import runtime
 
     if a.device.is_cpu:
+        runtime.begin_host_operation(a.device, "wp.utils.array_inner()")
         if scalar_type == wp.float32:
             native_func = runtime.core.array_inner_float_host
         elif scalar_type == wp.float64:
@@ -676,6 +689,8 @@ class ScopedTimer:
         cuda_filter=0,
         report_func=None,
         skip_tape=False,
+        cpu_filter=0,
+        cpu_counters=False,
     ):
         """Context manager object for a timer
 
@@ -691,11 +706,13 @@ class ScopedTimer:
             cuda_filter (int): Filter flags for CUDA activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
             report_func (Callable): A callback function to print the activity report (``wp.timing_print()`` is used by default)
             skip_tape (bool): If true, the timer will not be recorded in the tape
+            cpu_filter (int): Filter flags for CPU activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
+            cpu_counters (bool): Read the hardware counters of the threads executing CPU kernel launches, see :func:`warp.timing_begin`
 
         Attributes:
             extra_msg (str): Can be set to a string that will be added to the printout at context exit.
             elapsed (float): The duration of the ``with`` block used with this object
-            timing_results (list[TimingResult]): The list of activity timing results, if collection was requested using ``cuda_filter``
+            timing_results (list[TimingResult]): The list of activity timing results, if collection was requested using ``cuda_filter`` or ``cpu_filter``
         """
         self.name = name
         self.active = active and self.enabled
@@ -708,6 +725,8 @@ class ScopedTimer:
         self.skip_tape = skip_tape
         self.elapsed = 0.0
         self.cuda_filter = cuda_filter
+        self.cpu_filter = cpu_filter
+        self.cpu_counters = cpu_counters
         self.report_func = report_func or wp.timing_print
         self.extra_msg = ""  # Can be used to add to the message printed at manager exit
 
@@ -722,9 +741,14 @@ class ScopedTimer:
             if self.synchronize:
                 wp.synchronize()
 
-            if self.cuda_filter:
-                # begin CUDA activity collection, synchronizing if needed
-                timing_begin(self.cuda_filter, synchronize=not self.synchronize)
+            if self.cuda_filter or self.cpu_filter:
+                # begin activity collection, synchronizing if needed
+                timing_begin(
+                    self.cuda_filter,
+                    synchronize=not self.synchronize,
+                    cpu_filter=self.cpu_filter,
+                    cpu_counters=self.cpu_counters,
+                )
 
             if self.detailed:
                 self.cp = cProfile.Profile()
@@ -765,8 +789,8 @@ class ScopedTimer:
                 self.cp.disable()
                 self.cp.print_stats(sort="tottime")
 
-            if self.cuda_filter:
-                # end CUDA activity collection, synchronizing if needed
+            if self.cuda_filter or self.cpu_filter:
+                # end activity collection, synchronizing if needed
                 self.timing_results = timing_end(synchronize=not self.synchronize)
             else:
                 self.timing_results = []
@@ -918,6 +942,24 @@ class timing_result_t(ctypes.Structure):
     ]
 
 
+class cpu_timing_result_t(ctypes.Structure):
+    """CPU timing struct for fetching values from C++"""
+
+    _fields_ = [
+        ("tag", ctypes.c_uint64),
+        ("dim", ctypes.c_uint64),
+        ("filter", ctypes.c_int),
+        ("start", ctypes.c_double),
+        ("elapsed", ctypes.c_double),
+        ("counters", ctypes.c_uint64 * 5),
+        ("counters_mask", ctypes.c_int),
+    ]
+
+
+# names of the hardware counters in the order of the native CpuCounter enum
+CPU_COUNTER_NAMES = ("cycles", "instructions", "cache_references", "cache_misses", "flops")
+
+
 class TimingResult:
     """Timing result for a single activity.
 
@@ -929,27 +971,70 @@ class TimingResult:
         name (str): The activity name.
         filter (int): The type of activity (e.g., ``warp.TIMING_KERNEL``).
         elapsed (float): The elapsed time in milliseconds.
+        dim (int): The number of threads of a CPU kernel launch, ``None`` for other activities.
+        array_bytes (int): The total size in bytes of the array arguments of a CPU kernel launch,
+            ``None`` for other activities.
+        start (float): The start time of a CPU activity in milliseconds relative to the call to
+            :func:`warp.timing_begin`, ``None`` for CUDA activities.
+        bytes_read (int): The size in bytes of the array arguments read by a CPU kernel launch,
+            ``None`` for other activities.
+        bytes_written (int): The size in bytes of the array arguments written by a CPU kernel launch,
+            ``None`` for other activities.
+        counters (dict): The hardware counters read during a CPU kernel launch, keyed by
+            counter name (``"cycles"``, ``"instructions"``, ``"cache_references"``, ``"cache_misses"``, ``"flops"``).
+            Only the counters available on the machine are included.
+            ``None`` if counters were not requested or are not available.
     """
 
-    def __init__(self, device, name, filter, elapsed):
+    def __init__(
+        self,
+        device,
+        name,
+        filter,
+        elapsed,
+        dim=None,
+        array_bytes=None,
+        start=None,
+        bytes_read=None,
+        bytes_written=None,
+        counters=None,
+    ):
         self.device = device
         self.name = name
         self.filter = filter
         self.elapsed = elapsed
+        self.dim = dim
+        self.array_bytes = array_bytes
+        self.start = start
+        self.bytes_read = bytes_read
+        self.bytes_written = bytes_written
+        self.counters = counters
 
 
-def timing_begin(cuda_filter=TIMING_ALL, synchronize=True):
+def timing_begin(cuda_filter=TIMING_ALL, synchronize=True, cpu_filter=TIMING_ALL, cpu_counters=False):
     """Begin detailed activity timing.
 
+    On the CPU, kernel launches (``warp.TIMING_KERNEL``) and graph launches (``warp.TIMING_GRAPH``)
+    are timed, including the launches replayed by CPU graphs and launch sequences.
+
     Parameters:
         cuda_filter (int): Filter flags for CUDA activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
         synchronize (bool): Whether to synchronize all CUDA devices before timing starts
+        cpu_filter (int): Filter flags for CPU activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
+        cpu_counters (bool): Whether to read the hardware counters of the threads executing CPU kernel launches.
+            Counters are read with ``perf_event_open()`` on Linux and are not available on other platforms.
     """
 
     if synchronize:
         warp.synchronize()
 
-    warp.context.runtime.core.cuda_timing_begin(cuda_filter)
+    runtime = warp.context.runtime
+
+    runtime.core.cuda_timing_begin(cuda_filter)
+
+    runtime.core.cpu_timing_begin(cpu_filter, cpu_counters)
+    runtime.cpu_timing_filters.append(cpu_filter)
+    runtime.cpu_timing_flags = cpu_filter
 
 
 def timing_end(synchronize=True):
@@ -960,22 +1045,25 @@ def timing_end(synchronize=True):
 
     Returns:
         list[TimingResult]: A list of ``TimingResult`` objects for all recorded activities.
+        CUDA activities are listed first, followed by CPU activities ordered by their start time.
     """
 
     if synchronize:
         warp.synchronize()
 
+    runtime = warp.context.runtime
+
     # get result count
-    count = warp.context.runtime.core.cuda_timing_get_result_count()
+    count = runtime.core.cuda_timing_get_result_count()
 
     # get result array from C++
     result_buffer = (timing_result_t * count)()
-    warp.context.runtime.core.cuda_timing_end(ctypes.byref(result_buffer), count)
+    runtime.core.cuda_timing_end(ctypes.byref(result_buffer), count)
 
     # prepare Python result list
     results = []
     for r in result_buffer:
-        device = warp.context.runtime.context_map.get(r.context)
+        device = runtime.context_map.get(r.context)
         filter = r.filter
         elapsed = r.elapsed
 
@@ -995,12 +1083,57 @@ def timing_end(synchronize=True):
 
         results.append(TimingResult(device, name, filter, elapsed))
 
+    # get CPU results, kernel launches are identified by tags assigned when they were packed
+    count = runtime.core.cpu_timing_get_result_count()
+
+    cpu_result_buffer = (cpu_timing_result_t * count)()
+    runtime.core.cpu_timing_end(ctypes.byref(cpu_result_buffer), count)
+
+    if runtime.cpu_timing_filters:
+        runtime.cpu_timing_filters.pop()
+    runtime.cpu_timing_flags = runtime.cpu_timing_filters[-1] if runtime.cpu_timing_filters else 0
+
+    cpu_results = []
+    for r in cpu_result_buffer:
+        if r.filter == TIMING_KERNEL:
+            name, array_bytes, bytes_read, bytes_written = runtime.cpu_timing_activities[r.tag]
+
+            counters = None
+            if r.counters_mask:
+                counters = {
+                    counter: r.counters[i] for i, counter in enumerate(CPU_COUNTER_NAMES) if r.counters_mask & (1 << i)
+                }
+
+            cpu_results.append(
+                TimingResult(
+                    runtime.cpu_device,
+                    name,
+                    r.filter,
+                    r.elapsed,
+                    dim=r.dim,
+                    array_bytes=array_bytes,
+                    start=r.start,
+                    bytes_read=bytes_read,
+                    bytes_written=bytes_written,
+                    counters=counters,
+                )
+            )
+        else:
+            cpu_results.append(TimingResult(runtime.cpu_device, "graph", r.filter, r.elapsed, start=r.start))
+
+    # activities are recorded when they complete, graph launches enclose the launches they replay
+    cpu_results.sort(key=lambda r: r.start)
+    results.extend(cpu_results)
+
     return results
 
 
 def timing_print(results, indent=""):
     """Print timing results.
 
+    A summary of the CPU kernel launches, including the average time per launch and the
+    effective bandwidth of the array arguments they read and write, is printed if the results contain any.
+
     Parameters:
         results (list[TimingResult]): List of ``TimingResult`` objects.
         indent (str): Optional indentation for the output.
@@ -1011,12 +1144,14 @@ def timing_print(results, indent=""):
         return
 
     class Aggregate:
-        def __init__(self, count=0, elapsed=0):
+        def __init__(self, count=0, elapsed=0, bytes=0):
             self.count = count
             self.elapsed = elapsed
+            self.bytes = bytes
 
     device_totals = {}
     activity_totals = {}
+    kernel_totals = {}
 
     max_name_len = len("Activity")
     for r in results:
@@ -1026,7 +1161,7 @@ def timing_print(results, indent=""):
     activity_width = max_name_len + 1
     activity_dashes = "-" * activity_width
 
-    print(f"{indent}CUDA timeline:")
+    print(f"{indent}Activity timeline:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Time            | Device  | Activity")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -1045,10 +1180,20 @@ def timing_print(results, indent=""):
             activity_agg.count += 1
             activity_agg.elapsed += r.elapsed
 
+        if r.bytes_read is not None:
+            num_bytes = r.bytes_read + r.bytes_written
+            kernel_agg = kernel_totals.get(r.name)
+            if kernel_agg is None:
+                kernel_totals[r.name] = Aggregate(count=1, elapsed=r.elapsed, bytes=num_bytes)
+            else:
+                kernel_agg.count += 1
+                kernel_agg.elapsed += r.elapsed
+                kernel_agg.bytes += num_bytes
+
         print(f"{indent}{r.elapsed:12.6f} ms | {r.device.alias:7s} | {r.name}")
 
     print()
-    print(f"{indent}CUDA activity summary:")
+    print(f"{indent}Activity summary:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Total time      | Count   | Activity")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -1056,9 +1201,231 @@ def timing_print(results, indent=""):
         print(f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {name}")
 
     print()
-    print(f"{indent}CUDA device summary:")
+    print(f"{indent}Device summary:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Total time      | Count   | Device")
     print(f"{indent}----------------+---------+{activity_dashes}")
     for device, agg in device_totals.items():
         print(f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {device}")
+
+    if kernel_totals:
+        print()
+        print(f"{indent}CPU kernel summary:")
+        print(f"{indent}----------------+---------+-----------------+---------------+{activity_dashes}")
+        print(f"{indent}Total time      | Count   | Average         | Bandwidth     | Kernel")
+        print(f"{indent}----------------+---------+-----------------+---------------+{activity_dashes}")
+        for name, agg in sorted(kernel_totals.items(), key=lambda item: item[1].elapsed, reverse=True):
+            average = agg.elapsed / agg.count
+            bandwidth = agg.bytes / (agg.elapsed * 1.0e6) if agg.elapsed > 0.0 else 0.0
+            print(
+                f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {average:12.6f} ms | {bandwidth:8.3f} GB/s | {name}"
+            )
+
+
+class RooflineResult:
+    """Roofline statistics of the launches of a CPU kernel.
+
+    Attributes:
+        name (str): The kernel activity name.
+        count (int): The number of launches.
+        elapsed (float): The total time of the launches in milliseconds.
+        bytes (int): The total size in bytes of the array arguments read and written by the launches.
+        flops (int): The total number of floating-point operations, ``None`` if the counter is not available.
+        bandwidth (float): The achieved bandwidth in GB/s.
+        flop_rate (float): The achieved floating-point throughput in GFLOP/s, ``None`` if ``flops`` is ``None``.
+        arithmetic_intensity (float): The number of floating-point operations per byte, ``None`` if ``flops`` is ``None``.
+        bandwidth_fraction (float): The fraction of the peak bandwidth achieved, ``None`` if no peak was given.
+        flop_rate_fraction (float): The fraction of the peak floating-point throughput achieved,
+            ``None`` if no peak was given or ``flops`` is ``None``.
+        bound (str): ``"memory"`` or ``"compute"`` depending on which side of the ridge point of the roofline
+            the kernel lies, ``None`` if it cannot be determined.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.elapsed = 0.0
+        self.bytes = 0
+        self.flops = None
+        self.bandwidth = 0.0
+        self.flop_rate = None
+        self.arithmetic_intensity = None
+        self.bandwidth_fraction = None
+        self.flop_rate_fraction = None
+        self.bound = None
+
+
+def timing_roofline(results, peak_bandwidth=None, peak_flops=None):
+    """Compute roofline statistics of the CPU kernel launches in timing results.
+
+    The bytes moved by each launch are the sizes of the array arguments that the kernel reads or writes,
+    as determined when the kernel is compiled. Floating-point operations are only known if the results
+    were collected with ``cpu_counters=True`` on a machine that exposes the corresponding hardware counters.
+
+    Parameters:
+        results (list[TimingResult]): List of ``TimingResult`` objects.
+        peak_bandwidth (float): The peak memory bandwidth of the machine in GB/s.
+        peak_flops (float): The peak floating-point throughput of the machine in GFLOP/s.
+
+    Returns:
+        list[RooflineResult]: The statistics of each kernel, ordered by decreasing total time.
+    """
+
+    kernels = {}
+
+    for r in results:
+        if r.bytes_read is None:
+            continue
+
+        kernel = kernels.get(r.name)
+        if kernel is None:
+            kernel = RooflineResult(r.name)
+            # launches without a flop count make the total unknown
+            kernel.flops = 0
+            kernels[r.name] = kernel
+
+        kernel.count += 1
+        kernel.elapsed += r.elapsed
+        kernel.bytes += r.bytes_read + r.bytes_written
+
+        if kernel.flops is not None and r.counters is not None and "flops" in r.counters:
+            kernel.flops += r.counters["flops"]
+        else:
+            kernel.flops = None
+
+    for kernel in kernels.values():
+        seconds = kernel.elapsed * 1.0e-3
+
+        if seconds > 0.0:
+            kernel.bandwidth = kernel.bytes / seconds * 1.0e-9
+            if kernel.flops is not None:
+                kernel.flop_rate = kernel.flops / seconds * 1.0e-9
+
+        if kernel.flops is not None and kernel.bytes > 0:
+            kernel.arithmetic_intensity = kernel.flops / kernel.bytes
+
+        if peak_bandwidth:
+            kernel.bandwidth_fraction = kernel.bandwidth / peak_bandwidth
+        if peak_flops and kernel.flop_rate is not None:
+            kernel.flop_rate_fraction = kernel.flop_rate / peak_flops
+
+        if peak_bandwidth and peak_flops and kernel.arithmetic_intensity is not None:
+            # arithmetic intensity at which the bandwidth and compute roofs meet
+            ridge = peak_flops / peak_bandwidth
+            kernel.bound = "compute" if kernel.arithmetic_intensity >= ridge else "memory"
+
+    return sorted(kernels.values(), key=lambda kernel: kernel.elapsed, reverse=True)
+
+
+def timing_print_roofline(results, peak_bandwidth=None, peak_flops=None, indent=""):
+    """Print a roofline report of the CPU kernel launches in timing results.
+
+    See :func:`warp.timing_roofline` for the statistics that are reported.
+
+    Parameters:
+        results (list[TimingResult]): List of ``TimingResult`` objects.
+        peak_bandwidth (float): The peak memory bandwidth of the machine in GB/s.
+        peak_flops (float): The peak floating-point throughput of the machine in GFLOP/s.
+        indent (str): Optional indentation for the output.
+    """
+
+    kernels = timing_roofline(results, peak_bandwidth=peak_bandwidth, peak_flops=peak_flops)
+
+    if not kernels:
+        print("No CPU kernel activity")
+        return
+
+    # formats an optional value in a column of the given width
+    def format_value(value, fmt, unit=""):
+        width = len(format(0.0, fmt)) + len(unit)
+        return "n/a".rjust(width) if value is None else f"{value:{fmt}}{unit}"
+
+    def format_percent(fraction):
+        return format_value(fraction * 100.0 if fraction is not None else None, "6.1f", "%")
+
+    kernel_dashes = "-" * (max(len("Kernel"), *(len(kernel.name) for kernel in kernels)) + 1)
+    table_dashes = "----------------+---------------+---------------+-----------+---------+---------+---------+"
+
+    print(f"{indent}CPU kernel roofline:")
+    print(f"{indent}{table_dashes}{kernel_dashes}")
+    print(f"{indent}Total time      | Bandwidth     | FLOP rate     | FLOP/byte | % BW    | % FLOP  | Bound   | Kernel")
+    print(f"{indent}{table_dashes}{kernel_dashes}")
+    for kernel in kernels:
+        flop_rate = format_value(kernel.flop_rate, "8.3f", " GF/s")
+        intensity = format_value(kernel.arithmetic_intensity, "9.3f")
+        bandwidth_pct = format_percent(kernel.bandwidth_fraction)
+        flop_pct = format_percent(kernel.flop_rate_fraction)
+        bound = kernel.bound or "n/a"
+        print(
+            f"{indent}{kernel.elapsed:12.6f} ms | {kernel.bandwidth:8.3f} GB/s | {flop_rate} | {intensity} "
+            f"| {bandwidth_pct} | {flop_pct} | {bound:7s} | {kernel.name}"
+        )
+
+
+def timing_export_trace(results, filename):
+    """Export timing results to a trace file.
+
+    The trace is written in the Chrome Trace Event format and can be opened with ``chrome://tracing``
+    or the `Perfetto UI <https://ui.perfetto.dev>`_. Each device is shown as a separate track.
+    CUDA activities are not timestamped, they are laid out one after the other on the track of their device.
+
+    Parameters:
+        results (list[TimingResult]): List of ``TimingResult`` objects.
+        filename (str): Path of the JSON file to write.
+    """
+
+    categories = {
+        TIMING_KERNEL: "kernel",
+        TIMING_KERNEL_BUILTIN: "builtin kernel",
+        TIMING_MEMCPY: "memcpy",
+        TIMING_MEMSET: "memset",
+        TIMING_GRAPH: "graph",
+    }
+
+    events = [{"name": "process_name", "ph": "M", "pid": 0, "tid": 0, "args": {"name": "Warp"}}]
+
+    tracks = {}
+    track_ends = {}
+
+    for r in results:
+        alias = r.device.alias
+
+        tid = tracks.get(alias)
+        if tid is None:
+            tid = len(tracks)
+            tracks[alias] = tid
+            events.append({"name": "thread_name", "ph": "M", "pid": 0, "tid": tid, "args": {"name": alias}})
+
+        if r.start is not None:
+            start = r.start
+        else:
+            start = track_ends.get(alias, 0.0)
+            track_ends[alias] = start + r.elapsed
+
+        args = {}
+        if r.dim is not None:
+            args["dim"] = r.dim
+        if r.array_bytes is not None:
+            args["array_bytes"] = r.array_bytes
+        if r.bytes_read is not None:
+            args["bytes_read"] = r.bytes_read
+            args["bytes_written"] = r.bytes_written
+        if r.counters is not None:
+            args.update(r.counters)
+
+        # timestamps and durations are in microseconds
+        events.append(
+            {
+                "name": r.name,
+                "cat": categories.get(r.filter, "activity"),
+                "ph": "X",
+                "ts": start * 1000.0,
+                "dur": r.elapsed * 1000.0,
+                "pid": 0,
+                "tid": tid,
+                "args": args,
+            }
+        )
+
+    with open(filename, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)